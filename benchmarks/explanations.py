@@ -0,0 +1,101 @@
+"""Latency and exactness of per-prediction TreeSHAP explanations of the ROI forest.
+
+Builds the forest's path tables once (``core/explanations.py``), then explains
+``--n`` scenarios sampled from the training data (as in ``benchmarks/predict.py``)
+with the explanation cache bypassed. For every scenario it checks that the
+base value plus the Shapley values reproduces ``model.predict`` and that the
+ROI contributions add up to the Predicted ROI. The budget is 50 ms per
+explanation, so one can be shown on every Simulator rerun.
+
+Usage (from the repository root):
+
+    python benchmarks/explanations.py
+    python benchmarks/explanations.py --n 500
+
+Results are written to ``benchmarks/results/explanations-<timestamp>.json``.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.join(REPO_ROOT, "benchmarks"))
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+
+DEFAULT_N = 200
+BUDGET_MS = 50
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=DEFAULT_N, help="scenarios to explain")
+    parser.add_argument("--output", help="results file (default benchmarks/results/explanations-<timestamp>.json)")
+    args = parser.parse_args(argv)
+
+    os.chdir(REPO_ROOT)
+    from core.explanations import ForestPaths, explain_roi, tree_shap
+    from core.features import get_encoder
+    from core.model_registry import load_model_artifacts
+    from core.prediction import predict_roi_batch
+    from predict import sample_scenarios
+
+    artifacts = load_model_artifacts()
+    model, _, model_features = artifacts
+    start = time.perf_counter()
+    paths = ForestPaths(model)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    scenarios = sample_scenarios(args.n)
+    X = get_encoder(model_features).encode_many(scenarios)
+    forest_output = model.predict(X)
+    predicted = predict_roi_batch(X, artifacts)
+
+    times, output_error, roi_error = [], 0.0, 0.0
+    for i, scenario in enumerate(scenarios):
+        start = time.perf_counter()
+        explanation = explain_roi(scenario, artifacts)
+        times.append((time.perf_counter() - start) * 1000)
+        phi = tree_shap(paths, X[i])
+        output_error = max(output_error, abs(paths.base_value + phi.sum() - forest_output[i]))
+        roi_error = max(roi_error, abs(explanation["base_roi"] + sum(explanation["contributions"].values()) - predicted[i]))
+
+    times.sort()
+    result = {
+        "n": args.n,
+        "leaves": paths.n_leaves,
+        "max_path_features": max(paths.groups),
+        "path_build_ms": round(build_ms, 1),
+        "explain_p50_ms": round(statistics.median(times), 2),
+        "explain_p95_ms": round(times[min(len(times) - 1, int(len(times) * 0.95))], 2),
+        "max_forest_output_error": float(output_error),
+        "max_roi_error": float(roi_error),
+    }
+    print(f"Path tables: {result['leaves']:,} leaves, up to {result['max_path_features']} features per path, "
+          f"built in {result['path_build_ms']:.0f} ms")
+    print(f"Explanation: p50 {result['explain_p50_ms']:.1f} ms, p95 {result['explain_p95_ms']:.1f} ms "
+          f"(budget {BUDGET_MS} ms) over {args.n} scenarios")
+    print(f"Max |base + sum(phi) - model.predict|: {output_error:.2e}; "
+          f"max |base ROI + contributions - Predicted ROI|: {roi_error:.2e}")
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "results": [result],
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"explanations-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {os.path.relpath(output)}")
+    return 0 if result["explain_p95_ms"] <= BUDGET_MS else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
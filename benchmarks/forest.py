@@ -0,0 +1,119 @@
+"""Flattened-array forest evaluation (``core/forest.py``) versus ``model.predict``.
+
+Scenarios are sampled from the training data as in ``benchmarks/predict.py``
+and encoded once. For each batch size it times the forest's own ``predict``
+and ``FlatForest.predict`` on the same rows and checks that the two results
+are bit-identical. The flat path is only used in the app for batches up to
+``FLAT_FOREST_MAX_ROWS``; the larger sizes show where sklearn takes over.
+Finally it checks that a batch with a missing (NaN) input is rejected by
+``FlatForest`` and handled by ``forest_predict`` exactly as by the forest.
+
+Usage (from the repository root):
+
+    python benchmarks/forest.py
+    python benchmarks/forest.py --sizes 1 10 100 1000 10000
+
+Results are written to ``benchmarks/results/forest-<timestamp>.json``.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.join(REPO_ROOT, "benchmarks"))
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+
+DEFAULT_SIZES = [1, 10, 100, 1_000, 10_000]
+
+
+def time_call(func, repeats):
+    """Median wall time of ``func()`` in seconds over ``repeats`` calls."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def outcome(predict, X):
+    """``predict(X)`` as a tuple, or the name of the exception it raises."""
+    try:
+        return tuple(predict(X))
+    except ValueError as e:
+        return type(e).__name__
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="batch sizes to time")
+    parser.add_argument("--output", help="results file (default benchmarks/results/forest-<timestamp>.json)")
+    args = parser.parse_args(argv)
+
+    os.chdir(REPO_ROOT)
+    from core.features import get_encoder
+    from core.forest import FLAT_FOREST_MAX_ROWS, FlatForest, forest_predict
+    from core.model_registry import load_model_artifacts
+    from predict import sample_scenarios
+
+    model, _, model_features = load_model_artifacts()
+    start = time.perf_counter()
+    flat = FlatForest.from_model(model)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Flattened {flat.n_trees} trees ({flat.n_nodes:,} nodes, {flat.nbytes / 1024 / 1024:.1f} MB) "
+          f"in {build_ms:.1f} ms; app uses it for batches of up to {FLAT_FOREST_MAX_ROWS} rows\n")
+    model.predict(get_encoder(model_features).encode_many(sample_scenarios(10)))  # Warm up joblib
+
+    results = []
+    print(f"{'N':>8}{'sklearn (ms)':>14}{'flat (ms)':>11}{'speed-up':>10}{'identical':>11}")
+    for n in args.sizes:
+        X = get_encoder(model_features).encode_many(sample_scenarios(n))
+        repeats = 50 if n <= 100 else 5
+        sklearn_s = time_call(lambda: model.predict(X), repeats)
+        flat_s = time_call(lambda: flat.predict(X), repeats)
+        identical = bool(np.array_equal(model.predict(X), flat.predict(X)))
+        result = {
+            "n": n,
+            "sklearn_ms": round(sklearn_s * 1000, 3),
+            "flat_ms": round(flat_s * 1000, 3),
+            "speedup": round(sklearn_s / flat_s, 2),
+            "bit_identical": identical,
+        }
+        results.append(result)
+        print(f"{n:>8}{result['sklearn_ms']:>14.2f}{result['flat_ms']:>11.2f}{result['speedup']:>9.2f}x{str(identical):>11}")
+
+    X = get_encoder(model_features).encode_many(sample_scenarios(10))
+    X[3, 0] = np.nan  # As for a listing without a stand size
+    nan_check = {
+        "flat_raises": outcome(flat.predict, X) == "ValueError",
+        "forest_predict_matches_sklearn": outcome(lambda X: forest_predict(model, X), X) == outcome(model.predict, X),
+    }
+    print(f"\nNaN input: {nan_check}")
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "flatten_ms": round(build_ms, 2),
+        "flat_max_rows": FLAT_FOREST_MAX_ROWS,
+        "results": results,
+        "nan_check": nan_check,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"forest-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {os.path.relpath(output)}")
+    return 0 if all(r["bit_identical"] for r in results) and all(nan_check.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
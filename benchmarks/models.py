@@ -0,0 +1,210 @@
+"""Latency, memory and accuracy of candidate ROI regressors, side by side.
+
+Every candidate is trained the way ``scripts/train_roi_model.py`` trains
+the production forest: on the notebook's 80% split of
+``data/real_estate_data_template.csv`` (``core/training.py``), with the
+Yeo-Johnson transformed ROI as the target. Each one is then measured on:
+
+* test-set R², MAE and RMSE in ROI % (the held-out 20%), the R² in the
+  transformed space the model README reports, and the 5-fold
+  cross-validated R² on the training split, because the test set is small;
+* fit time;
+* single-row latency (median of ``--repeats`` calls) and 10k-row
+  throughput, through ``forest_predict`` as the dashboard calls it (forests
+  of up to ``FLAT_FOREST_MAX_ROWS`` rows go through ``FlatForest``);
+* the size of the joblib artifact, and the time and RSS increase to load it
+  in a fresh interpreter (page-granular: an artifact of a few KB reads 0).
+
+Candidates: ``random_forest`` (the notebook's settings), ``extra_trees``,
+``hist_gradient_boosting`` and ``ridge`` (``RidgeCV`` on standardised
+inputs). The artifacts the dashboard serves now (``served_full`` and
+``served_lite``) are measured alongside them for reference.
+
+Usage (from the repository root):
+
+    python benchmarks/models.py
+    python benchmarks/models.py --models random_forest ridge --repeats 500
+
+Results are written to ``benchmarks/results/models-<timestamp>.json``.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+
+SEED = 42
+CV_FOLDS = 5
+DEFAULT_REPEATS = 200
+BATCH_ROWS = 10_000
+LOAD_REPEATS = 3
+
+# Loads an artifact in a fresh interpreter; numpy, joblib and sklearn are imported first
+_LOAD_PROBE = """
+import sys, time
+sys.path.insert(0, {root!r})
+import joblib, numpy, sklearn.ensemble, sklearn.linear_model, sklearn.pipeline, core.forest
+from core.model_registry import _current_rss_bytes
+rss = _current_rss_bytes()
+start = time.perf_counter()
+artifact = joblib.load({path!r})  # Kept alive until RSS is read
+print(time.perf_counter() - start, _current_rss_bytes() - rss)
+"""
+
+
+def candidates():
+    """Name -> unfitted regressor of every model trained by the benchmark."""
+    from sklearn.ensemble import ExtraTreesRegressor, HistGradientBoostingRegressor, RandomForestRegressor
+    from sklearn.linear_model import RidgeCV
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    return {
+        "random_forest": RandomForestRegressor(n_estimators=100, max_features=1.0, random_state=SEED),
+        "extra_trees": ExtraTreesRegressor(n_estimators=100, max_features=1.0, random_state=SEED),
+        "hist_gradient_boosting": HistGradientBoostingRegressor(max_iter=200, learning_rate=0.05,
+                                                                random_state=SEED),
+        "ridge": make_pipeline(StandardScaler(), RidgeCV(alphas=np.logspace(-3, 3, 13))),
+    }
+
+
+def time_ms(func, repeats):
+    """Median wall time of ``func()`` in milliseconds over ``repeats`` calls."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def measure_load(path, repeats=LOAD_REPEATS):
+    """Median load time (ms) and RSS increase (MB) of ``path`` in fresh interpreters."""
+    times, rss = [], []
+    for _ in range(repeats):
+        result = subprocess.run([sys.executable, "-c", _LOAD_PROBE.format(root=REPO_ROOT, path=path)],
+                                cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+        seconds, rss_bytes = result.stdout.split()
+        times.append(float(seconds) * 1000)
+        rss.append(int(rss_bytes) / 1024 / 1024)
+    return statistics.median(times), statistics.median(rss)
+
+
+def measure(name, model, path, pt, X_test, roi_test, X_batch, repeats):
+    """One row of the table for the fitted ``model`` saved at ``path``."""
+    from core.forest import forest_predict
+    from core.training import regression_metrics
+
+    test = regression_metrics(model, pt, X_test, roi_test)
+    forest_predict(model, X_batch[:1])  # Builds the FlatForest once, as the first request does
+    batch_ms = time_ms(lambda: forest_predict(model, X_batch), 3)
+    load_ms, rss_mb = measure_load(path)
+    return {
+        "Model": name,
+        "Test R²": test["r2"],
+        "Test MAE (ROI %)": test["mae"],
+        "Test RMSE (ROI %)": test["rmse"],
+        "Test R² (transformed)": test["r2_transformed"],
+        "1 Row (ms)": round(time_ms(lambda: forest_predict(model, X_batch[:1]), repeats), 3),
+        "10k Rows/s": round(len(X_batch) / batch_ms * 1000),
+        "Size (KB)": round(os.path.getsize(path) / 1024, 1),
+        "Load (ms)": round(load_ms, 1),
+        "RSS Increase (MB)": round(rss_mb, 1),
+    }
+
+
+def print_table(rows):
+    columns = list(dict.fromkeys(c for row in rows for c in row))
+    widths = {c: max(len(c), *(len(str(r.get(c, ""))) for r in rows)) + 2 for c in columns}
+    print("".join(f"{c:>{widths[c]}}" for c in columns))
+    for row in rows:
+        print("".join(f"{str(row.get(c, '')):>{widths[c]}}" for c in columns))
+
+
+def main(argv=None):
+    names = list(candidates())
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", nargs="+", choices=names, default=names, help="candidates to train")
+    parser.add_argument("--no-served", action="store_true", help="skip the artifacts the dashboard serves now")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="single-row predictions timed")
+    parser.add_argument("--output", help="results file (default benchmarks/results/models-<timestamp>.json)")
+    args = parser.parse_args(argv)
+
+    os.chdir(REPO_ROOT)
+    import joblib
+    import sklearn
+    from sklearn.model_selection import KFold, cross_val_score
+    from sklearn.preprocessing import PowerTransformer
+
+    from core.config import ROI_MODEL_FILES
+    from core.model_registry import ARTIFACT_FILES, get_registry
+    from core.training import load_training_matrix, split
+
+    X, roi, features, _ = load_training_matrix()
+    pt = PowerTransformer(method="yeo-johnson")
+    y = pt.fit_transform(roi.reshape(-1, 1)).ravel()
+    X_train, X_test, y_train, _ = split(X, y)
+    _, _, _, roi_test = split(X, roi)
+    X_batch = X[np.random.default_rng(0).integers(0, len(X), BATCH_ROWS)]
+    print(f"Training data: {len(X_train)} train / {len(X_test)} test rows x {len(features)} features\n")
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in args.models:
+            model = candidates()[name]
+            cv = cross_val_score(model, X_train, y_train, scoring="r2",
+                                 cv=KFold(CV_FOLDS, shuffle=True, random_state=SEED))
+            start = time.perf_counter()
+            model.fit(X_train, y_train)
+            fit_s = time.perf_counter() - start
+            path = os.path.join(tmp, f"{name}.pkl")
+            joblib.dump(model, path)
+            row = measure(name, model, path, pt, X_test, roi_test, X_batch, args.repeats)
+            row["CV R² (transformed)"] = f"{cv.mean():.3f} ± {cv.std():.3f}"
+            row["Fit (s)"] = round(fit_s, 2)
+            rows.append(row)
+            print(f"  {name}: test R² {row['Test R²']:.4f}, 1 row {row['1 Row (ms)']:.3f} ms")
+
+        if not args.no_served:
+            served_dir = get_registry().artifact_dir()  # The current published version, if any
+            served_pt = joblib.load(os.path.join(served_dir, ARTIFACT_FILES["transformer"]))
+            for variant, file_name in ROI_MODEL_FILES.items():
+                path = os.path.join(served_dir, file_name)
+                if os.path.exists(path):
+                    model = joblib.load(path)
+                    rows.append(measure(f"served_{variant}", model, path, served_pt, X_test, roi_test,
+                                        X_batch, args.repeats))
+
+    print()
+    print_table(rows)
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "sklearn": sklearn.__version__,
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "train_rows": len(X_train),
+        "test_rows": len(X_test),
+        "batch_rows": BATCH_ROWS,
+        "results": rows,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"models-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\nResults written to {os.path.relpath(output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""Headless rerun benchmark for every dashboard page.
+
+Drives real_estate_dashboard.py through Streamlit's ``AppTest`` harness. For
+each page it performs one warm-up run, then repeats a typical interaction (a
+Simulator form submit, a ROI Map filter change, Property Browser paging, or a
+plain rerun) and records the wall time of each rerun. A final rerun is traced
+with ``tracemalloc`` to record peak memory, kept separate so that tracing does
+not slow down the timed runs.
+
+Usage (from the repository root):
+
+    python benchmarks/pages.py                          # run, compare with the baseline
+    python benchmarks/pages.py --runs 20 --page "ROI Map"
+    python benchmarks/pages.py --save-baseline          # accept the current numbers
+
+Results are written to ``benchmarks/results/pages-<timestamp>.json``. The run is
+compared with ``benchmarks/baselines/pages.json`` and the script exits with
+status 1 if any page's p50 or p95 regressed by more than ``--tolerance``
+(ignoring differences below ``--min-delta-ms``, which are noise at this scale).
+
+Pages that write to the data files would otherwise grow them on each run, so
+every CSV under data/ and the repository root is restored when the benchmark
+finishes, and the Simulator logs its submits to a throwaway copy of the
+simulation log database (``SIMULATION_LOG_PATH``).
+"""
+import argparse
+import ast
+import glob
+import json
+import math
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_SCRIPT = os.path.join(REPO_ROOT, "real_estate_dashboard.py")
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+BASELINE_PATH = os.path.join(REPO_ROOT, "benchmarks", "baselines", "pages.json")
+
+DEFAULT_RUNS = 10
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MIN_DELTA_MS = 15.0
+
+
+# --- Interactions ---
+# Each takes the AppTest and the iteration number and sets up the next rerun.
+
+def rerun(at, i):
+    pass
+
+
+def submit_simulation(at, i):
+    # Alternate between two inputs so the model is called each time
+    at.sidebar.number_input[0].set_value(150000.0 if i % 2 else 180000.0)
+    at.button(key="FormSubmitter:simulator_form_0-Update Simulation").click()
+
+
+def change_map_filter(at, i):
+    slider = next(s for s in at.sidebar.slider if s.label.startswith("Minimum ROI"))
+    slider.set_value(8.0 if i % 2 else 9.0)
+
+
+def page_properties(at, i):
+    labels = ("Next ➡️", "⬅️ Previous")
+    button = next((b for b in at.button if b.label in labels), None)
+    if button is not None:
+        button.click()
+
+
+# Pages not listed here are benchmarked with a plain rerun
+INTERACTIONS = {
+    "🏠 Simulator": submit_simulation,
+    "🗺️ ROI Map": change_map_filter,
+    "🔍 Property Browser": page_properties,
+}
+
+
+def dashboard_pages():
+    """Page names of ``PAGE_MODULES`` in real_estate_dashboard.py, in sidebar order.
+
+    The dict is read from the script's source, since importing the script
+    would run the dashboard.
+    """
+    with open(APP_SCRIPT, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), APP_SCRIPT)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "PAGE_MODULES" for t in node.targets):
+            return list(ast.literal_eval(node.value))
+    raise RuntimeError(f"PAGE_MODULES not found in {APP_SCRIPT}")
+
+
+PAGES = {page: INTERACTIONS.get(page, rerun) for page in dashboard_pages()}
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of ``values`` (pct in 0..100)."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(len(ordered) * pct / 100))
+    return ordered[rank - 1]
+
+
+def _snapshot_data_files():
+    paths = glob.glob(os.path.join(REPO_ROOT, "data", "*.csv")) + glob.glob(os.path.join(REPO_ROOT, "*.csv"))
+    snapshot = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            snapshot[path] = f.read()
+    return snapshot
+
+
+def _restore_data_files(snapshot):
+    for path, content in snapshot.items():
+        with open(path, "rb") as f:
+            if f.read() == content:
+                continue
+        with open(path, "wb") as f:
+            f.write(content)
+
+
+def _copy_simulation_log(directory):
+    """Path of a copy of the simulation log in ``directory`` (empty if there is none yet)."""
+    source = os.path.join(REPO_ROOT, "data", "simulations.db")
+    target = os.path.join(directory, "simulations.db")
+    if os.path.exists(source):
+        with sqlite3.connect(source) as src, sqlite3.connect(target) as dst:
+            src.backup(dst)  # Consistent copy even while the WAL holds recent rows
+    return target
+
+
+def bench_page(page, interaction, runs):
+    """Benchmark one page and return its result dict."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_SCRIPT, default_timeout=120)
+    at.session_state["page"] = page
+    at.session_state["admin_analytics_logged_in"] = True
+
+    start = time.perf_counter()
+    at.run()
+    first_run_ms = (time.perf_counter() - start) * 1000
+
+    times = []
+    for i in range(runs):
+        interaction(at, i)
+        start = time.perf_counter()
+        at.run()
+        times.append((time.perf_counter() - start) * 1000)
+
+    interaction(at, runs)
+    tracemalloc.start()
+    at.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    errors = [str(e.value)[:200] for e in at.exception]
+    return {
+        "page": page,
+        "interaction": interaction.__name__,
+        "runs": runs,
+        "first_run_ms": round(first_run_ms, 1),
+        "p50_ms": round(statistics.median(times), 1),
+        "p95_ms": round(percentile(times, 95), 1),
+        "max_ms": round(max(times), 1),
+        "peak_mem_mb": round(peak / (1024 * 1024), 2),
+        "errors": errors,
+    }
+
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """Return a list of human-readable regressions against ``baseline``."""
+    previous = {r["page"]: r for r in baseline.get("pages", [])}
+    regressions = []
+    for result in results:
+        base = previous.get(result["page"])
+        if base is None:
+            continue
+        for metric in ("p50_ms", "p95_ms"):
+            new, old = result[metric], base[metric]
+            if new - old > min_delta_ms and new > old * (1 + tolerance):
+                regressions.append(f"{result['page']}: {metric} {old:.0f} -> {new:.0f} ms (+{(new / old - 1) * 100:.0f}%)")
+        if result["errors"] and not base.get("errors"):
+            regressions.append(f"{result['page']}: now raises {result['errors'][0]}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help=f"timed reruns per page (default {DEFAULT_RUNS})")
+    parser.add_argument("--page", action="append", help="only benchmark pages whose name contains this text (repeatable)")
+    parser.add_argument("--output", help="results file (default benchmarks/results/pages-<timestamp>.json)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="write this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"allowed relative slowdown before failing (default {DEFAULT_TOLERANCE})")
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help=f"ignore slowdowns smaller than this (default {DEFAULT_MIN_DELTA_MS})")
+    args = parser.parse_args(argv)
+
+    os.chdir(REPO_ROOT)  # The dashboard opens its data files with relative paths
+    pages = [p for p in PAGES if not args.page or any(f in p for f in args.page)]
+
+    snapshot = _snapshot_data_files()
+    scratch_dir = tempfile.mkdtemp(prefix="westprop-bench-")
+    os.environ["SIMULATION_LOG_PATH"] = _copy_simulation_log(scratch_dir)
+    results = []
+    try:
+        print(f"{'Page':<36}{'first':>9}{'p50':>9}{'p95':>9}{'peak MB':>10}")
+        for page in pages:
+            result = bench_page(page, PAGES[page], args.runs)
+            results.append(result)
+            flag = f"  ERROR: {result['errors'][0]}" if result["errors"] else ""
+            print(f"{page:<36}{result['first_run_ms']:>9.0f}{result['p50_ms']:>9.0f}"
+                  f"{result['p95_ms']:>9.0f}{result['peak_mem_mb']:>10.1f}{flag}")
+    finally:
+        _restore_data_files(snapshot)
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "runs": args.runs,
+        "pages": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"pages-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\nResults written to {os.path.relpath(output)}")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Baseline updated: {os.path.relpath(args.baseline)}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare against (run with --save-baseline to create one)")
+        return 0
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f), args.tolerance, args.min_delta_ms)
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+    if not regressions:
+        print(f"No regressions against {os.path.relpath(args.baseline)}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
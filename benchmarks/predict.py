@@ -0,0 +1,116 @@
+"""Per-row latency of batch ROI prediction versus one model call per scenario.
+
+Scenarios are sampled from the training data (data/real_estate_data_template.csv)
+with the prices and sizes jittered, so the forest sees realistic inputs. For
+each batch size it times ``predict_roi_batch`` end to end (encoding, one
+``model.predict`` per chunk, vectorised inverse transform) and, for the
+smaller sizes, the equivalent loop of single ``predict_roi`` calls.
+
+Usage (from the repository root):
+
+    python benchmarks/predict.py
+    python benchmarks/predict.py --sizes 1 100 10000 100000 --loop-max 1000
+
+Results are written to ``benchmarks/results/predict-<timestamp>.json``.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+
+DEFAULT_SIZES = [1, 100, 10_000, 100_000]
+DEFAULT_LOOP_MAX = 100
+
+
+def sample_scenarios(n, seed=0):
+    """``n`` simulator-style input dicts drawn from the training data."""
+    from core.config import REAL_ESTATE_DATA_PATH
+    from core.features import CATEGORICAL_FEATURES, FLAG_FEATURES, NUMERIC_FEATURES
+
+    rng = np.random.default_rng(seed)
+    source = pd.read_csv(REAL_ESTATE_DATA_PATH).dropna(subset=list(NUMERIC_FEATURES))
+    rows = source.iloc[rng.integers(0, len(source), n)].reset_index(drop=True)
+    frame = pd.DataFrame({name: rows[name].astype(float) for name in NUMERIC_FEATURES})
+    frame *= rng.uniform(0.8, 1.2, size=frame.shape)
+    for name in FLAG_FEATURES + CATEGORICAL_FEATURES:
+        frame[name] = rows[name]
+    return frame.to_dict("records")
+
+
+def time_call(func, repeats):
+    """Median wall time of ``func()`` in seconds over ``repeats`` calls."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="batch sizes to time")
+    parser.add_argument("--loop-max", type=int, default=DEFAULT_LOOP_MAX,
+                        help=f"largest size also timed as a loop of single predictions (default {DEFAULT_LOOP_MAX})")
+    parser.add_argument("--output", help="results file (default benchmarks/results/predict-<timestamp>.json)")
+    args = parser.parse_args(argv)
+
+    os.chdir(REPO_ROOT)
+    from core.model_registry import load_model_artifacts
+    from core.prediction import predict_roi, predict_roi_batch
+
+    artifacts = load_model_artifacts()
+    predict_roi_batch(sample_scenarios(10), artifacts)  # Warm up the forest's thread pool
+
+    results = []
+    print(f"{'N':>8}{'batch total (ms)':>18}{'batch us/row':>14}{'loop us/row':>13}{'speed-up':>10}")
+    for n in args.sizes:
+        scenarios = sample_scenarios(n)
+        repeats = 5 if n <= 10_000 else 1
+        batch_s = time_call(lambda: predict_roi_batch(scenarios, artifacts), repeats)
+        result = {
+            "n": n,
+            "batch_total_ms": round(batch_s * 1000, 3),
+            "batch_us_per_row": round(batch_s / n * 1e6, 2),
+        }
+        if n <= args.loop_max:
+            loop_s = time_call(lambda: [predict_roi(s, artifacts) for s in scenarios], max(1, repeats // 2))
+            batch = predict_roi_batch(scenarios, artifacts)
+            single = np.array([predict_roi(s, artifacts) for s in scenarios])
+            result.update({
+                "loop_total_ms": round(loop_s * 1000, 3),
+                "loop_us_per_row": round(loop_s / n * 1e6, 2),
+                "speedup": round(loop_s / batch_s, 1),
+                "max_abs_diff": float(np.max(np.abs(batch - single))),
+            })
+        results.append(result)
+        loop = f"{result['loop_us_per_row']:>13.1f}{result['speedup']:>9.1f}x" if "loop_us_per_row" in result else f"{'-':>13}{'-':>10}"
+        print(f"{n:>8}{result['batch_total_ms']:>18.2f}{result['batch_us_per_row']:>14.2f}{loop}")
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"predict-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {os.path.relpath(output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
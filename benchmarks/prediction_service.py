@@ -0,0 +1,151 @@
+"""Throughput and latency of the shared prediction service versus in-process prediction.
+
+``--clients`` threads each send single-scenario predictions, the way
+concurrent dashboard sessions do on cache misses, for ``--seconds``:
+
+* in-process: every request calls ``predict_roi_batch`` on its own row;
+* service: every request goes through its own ``PredictionClient``
+  connection to a ``PredictionServer`` started on a temporary socket, which
+  scores concurrent requests in micro-batches.
+
+It reports requests per second, p50/p95 latency and the mean batch size the
+service formed. It also checks that the service returns the in-process
+values and that ``remote_call`` falls back to None once the service stops.
+
+Usage (from the repository root):
+
+    python benchmarks/prediction_service.py
+    python benchmarks/prediction_service.py --clients 1 8 32 --seconds 5 --window-ms 1
+
+Results are written to ``benchmarks/results/prediction_service-<timestamp>.json``.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.join(REPO_ROOT, "benchmarks"))
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+
+DEFAULT_CLIENTS = [1, 4, 16]
+DEFAULT_SECONDS = 3.0
+
+
+def run_clients(n_clients, seconds, make_predict, scenarios):
+    """Requests per second and latency percentiles of ``n_clients`` threads predicting for ``seconds``."""
+    latencies = [[] for _ in range(n_clients)]
+    start_barrier = threading.Barrier(n_clients + 1)
+    stop_at = [0.0]
+
+    def client(i):
+        predict = make_predict()
+        rows = scenarios[i::n_clients]
+        start_barrier.wait()
+        k = 0
+        while time.perf_counter() < stop_at[0]:
+            start = time.perf_counter()
+            predict(rows[k % len(rows)])
+            latencies[i].append(time.perf_counter() - start)
+            k += 1
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(n_clients)]
+    for thread in threads:
+        thread.start()
+    stop_at[0] = time.perf_counter() + seconds
+    start_barrier.wait()
+    for thread in threads:
+        thread.join()
+    all_latencies = np.concatenate([np.array(times) for times in latencies]) * 1000
+    return {
+        "requests": int(all_latencies.size),
+        "requests_per_s": round(all_latencies.size / seconds, 1),
+        "p50_ms": round(float(np.percentile(all_latencies, 50)), 3),
+        "p95_ms": round(float(np.percentile(all_latencies, 95)), 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=DEFAULT_CLIENTS,
+                        help="numbers of concurrent clients to time")
+    parser.add_argument("--seconds", type=float, default=DEFAULT_SECONDS, help="duration of each run")
+    parser.add_argument("--window-ms", type=float, help="batch window of the service (default BATCH_WINDOW_MS)")
+    parser.add_argument("--output", help="results file (default benchmarks/results/prediction_service-<timestamp>.json)")
+    args = parser.parse_args(argv)
+
+    os.chdir(REPO_ROOT)
+    from predict import sample_scenarios
+
+    from core import prediction_client
+    from core.model_registry import get_registry
+    from core.prediction import predict_roi_batch
+    from core.prediction_client import PredictionClient
+    from core.prediction_server import BATCH_WINDOW_MS, start_in_thread
+
+    _, artifacts = get_registry().current()
+    scenarios = sample_scenarios(1000)
+    window_ms = BATCH_WINDOW_MS if args.window_ms is None else args.window_ms
+    socket_path = os.path.join(tempfile.mkdtemp(prefix="westprop-"), "predict.sock")
+    server = start_in_thread(socket_path, window_ms=window_ms)
+
+    client = PredictionClient(socket_path)
+    expected = predict_roi_batch(scenarios[:200], artifacts)
+    remote = np.array([client.predict([s])[0] for s in scenarios[:200]])
+    max_abs_diff = float(np.max(np.abs(remote - expected)))
+    client.close()
+    print(f"Service vs in-process on 200 scenarios: max |diff| {max_abs_diff:.2e} ROI %")
+
+    def in_process():
+        return lambda s: predict_roi_batch([s], artifacts)
+
+    def service():
+        client = PredictionClient(socket_path)
+        return lambda s: client.predict([s])
+
+    results = []
+    print(f"{'clients':>8}{'in-process req/s':>18}{'p95 ms':>9}{'service req/s':>15}{'p95 ms':>9}{'batch rows':>12}")
+    for n in args.clients:
+        local = run_clients(n, args.seconds, in_process, scenarios)
+        before = server.batcher.stats()
+        remote = run_clients(n, args.seconds, service, scenarios)
+        after = server.batcher.stats()
+        batches = after["Batches"] - before["Batches"]
+        remote["mean_batch_rows"] = round((after["Rows"] - before["Rows"]) / batches, 1) if batches else 0.0
+        results.append({"clients": n, "in_process": local, "service": remote})
+        print(f"{n:>8}{local['requests_per_s']:>18.0f}{local['p95_ms']:>9.2f}"
+              f"{remote['requests_per_s']:>15.0f}{remote['p95_ms']:>9.2f}{remote['mean_batch_rows']:>12.1f}")
+
+    server.stop()
+    prediction_client._client = PredictionClient(socket_path)
+    fallback = prediction_client.remote_call("predict", scenarios=scenarios[:1]) is None
+    print(f"\nFalls back in-process once the service is stopped: {fallback}")
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "window_ms": window_ms,
+        "seconds": args.seconds,
+        "max_abs_diff": max_abs_diff,
+        "fallback_when_stopped": fallback,
+        "results": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"prediction_service-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {os.path.relpath(output)}")
+    return 0 if max_abs_diff < 1e-9 and fallback else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""Latency of the simulation log store as the log grows to millions of rows.
+
+Fills a throwaway SQLite database (never ``data/simulations.db``) with
+synthetic simulations spread over ``--sessions`` sessions, then for each size
+times the operations the pages perform on every rerun: a single append, the
+newest page, a deep page by offset and by cursor, one session's newest page,
+its next page by cursor and a price/rent search within it, a count and the
+admin summary.
+
+Usage (from the repository root):
+
+    python benchmarks/simulation_log.py
+    python benchmarks/simulation_log.py --sizes 10000 1000000 --sessions 5000
+
+Results are written to ``benchmarks/results/simulation_log-<timestamp>.json``.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_SESSIONS = 2_000
+FILL_CHUNK_ROWS = 100_000
+
+
+def fill(simulation_log, n, sessions, seed=0):
+    """Bulk-insert ``n`` synthetic simulations (timestamps one second apart)."""
+    from core.simulation_log import _INSERT
+
+    rng = np.random.default_rng(seed)
+    conn = simulation_log._connect()
+    start_ts = time.mktime((2025, 1, 1, 0, 0, 0, 0, 0, -1))
+    for offset in range(0, n, FILL_CHUNK_ROWS):
+        size = min(FILL_CHUNK_ROWS, n - offset)
+        prices = rng.uniform(35_000, 1_500_000, size).round(-3)
+        rents = (prices * rng.uniform(0.004, 0.01, size)).round()
+        flags = rng.integers(0, 2, (size, 6))
+        roi = rng.normal(6, 2, (size, 3)).round(2)
+        session_ids = rng.integers(0, sessions, size)
+        rows = (
+            (f"s{session_ids[i]}",
+             time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(start_ts + offset + i)),
+             prices[i], rents[i], *map(int, flags[i]), *roi[i])
+            for i in range(size)
+        )
+        conn.execute("BEGIN")
+        conn.executemany(_INSERT, rows)
+        conn.execute("COMMIT")
+
+
+def time_ms(func, repeats):
+    """Median and p95 wall time of ``func()`` in milliseconds."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return round(statistics.median(times), 3), round(times[min(len(times) - 1, int(len(times) * 0.95))], 3)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="log sizes to time")
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS, help="distinct sessions in the log")
+    parser.add_argument("--repeats", type=int, default=50, help="timed calls per operation")
+    parser.add_argument("--output", help="results file (default benchmarks/results/simulation_log-<timestamp>.json)")
+    args = parser.parse_args(argv)
+
+    from core.simulation_log import DEFAULT_PAGE_SIZE, SimulationLog, page_cursor
+    from core.timing import reset
+
+    snapshot = {
+        "Timestamp": "2026-01-01 00:00:00", "Market Price": 120000.0, "Monthly Rent": 1000.0,
+        "Has Solar": True, "Has Water Recycling": False, "Has Smart Locks": False,
+        "Has Smart Thermostats": False, "Has Integrated Security": False, "Has EV Charging": False,
+        "Predicted ROI (Model)": 8.7, "Traditional ROI (Calculated)": 6.1, "Smart ROI (Calculated)": 6.9,
+    }
+    scratch_dir = tempfile.mkdtemp(prefix="westprop-simlog-")
+    results = []
+    try:
+        print(f"{'rows':>10}{'append':>9}{'page 1':>9}{'offset':>9}{'cursor':>9}{'session':>9}{'next':>9}"
+              f"{'search':>9}{'count':>9}{'summary':>9}   (p50 ms)")
+        for n in args.sizes:
+            simulation_log = SimulationLog(os.path.join(scratch_dir, f"simulations-{n}.db"), legacy_csv_paths=())
+            fill(simulation_log, n, args.sessions)
+            deep_offset = n // 2
+            deep_cursor = page_cursor(simulation_log.page(limit=1, offset=deep_offset))
+            session_page = simulation_log.page(session_id="s7", limit=DEFAULT_PAGE_SIZE // 5)
+            operations = {
+                "append": lambda: simulation_log.append(snapshot, session_id="s1"),
+                "page_first": lambda: simulation_log.page(),
+                "page_deep_offset": lambda: simulation_log.page(offset=deep_offset),
+                "page_deep_cursor": lambda: simulation_log.page(cursor=deep_cursor),
+                "session_page": lambda: simulation_log.page(session_id="s7"),
+                "session_next_page": lambda: simulation_log.page(session_id="s7", cursor=page_cursor(session_page)),
+                "session_search": lambda: simulation_log.page(session_id="s7", price_range=(200_000, 600_000),
+                                                              rent_range=(1_000, 4_000)),
+                "count": lambda: simulation_log.count(),
+                "summary": lambda: simulation_log.summary(),
+            }
+            result = {"rows": n}
+            for name, func in operations.items():
+                repeats = max(3, args.repeats // 10) if name == "page_deep_offset" else args.repeats
+                result[f"{name}_p50_ms"], result[f"{name}_p95_ms"] = time_ms(func, repeats)
+            result["size_mb"] = simulation_log.stats()["Size (MB)"]
+            results.append(result)
+            reset()  # The store's timed sections would otherwise fill the ring buffer
+            print(f"{n:>10}" + "".join(f"{result[f'{k}_p50_ms']:>9.2f}" for k in operations))
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "sessions": args.sessions,
+        "results": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"simulation_log-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {os.path.relpath(output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+"""Shared, process-wide services for the WestProp dashboard.
+
+Everything in this package is imported once per Streamlit server process and
+reused by every session and every rerun, so module-level state here is the
+place to keep expensive objects (models, parsed datasets, caches).
+"""
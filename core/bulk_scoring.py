@@ -0,0 +1,271 @@
+"""Bulk ROI scoring of listing files in the ``real_estate_data_template.csv`` schema.
+
+``score_csv`` reads the file ``BULK_CHUNK_ROWS`` rows at a time, encodes each
+chunk with one ``FeatureEncoder.encode_many`` call, scores it with one
+``predict_roi_batch`` call, and appends it to the output (CSV or Parquet)
+before reading the next chunk. Memory therefore depends on the chunk size,
+not on the file size. Every row of the input is written out, with three
+columns appended:
+
+* ``Predicted ROI (Model)``: the forest's prediction. Empty when a model
+  input is missing, not numeric or infinite.
+* ``Traditional ROI (Calculated)`` and ``Smart ROI (Calculated)``: the
+  Simulator's net ROI from ``sale_price_usd`` and
+  ``rental_income_usd_monthly (est)``, the second including the smart-feature
+  savings. Empty when the file has no rent column.
+
+The whole file is scored with one model version, even if another version is
+published meanwhile. Bulk scoring always runs in-process, like the other
+batch paths, and does not go through the prediction service.
+"""
+import importlib.util
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.config import (
+    AGENT_FEE_RATE,
+    EV_CHARGING_SAVINGS,
+    INSURANCE_RATE,
+    INTEGRATED_SECURITY_SAVINGS,
+    MAINTENANCE_RATE,
+    PROPERTY_TAX_RATE,
+    SMART_LOCKS_SAVINGS,
+    SMART_THERMOSTATS_SAVINGS,
+    SOLAR_SAVINGS,
+    WATER_RECYCLING_SAVINGS,
+)
+from core.features import CATEGORICAL_FEATURES, FLAG_FEATURES, NUMERIC_FEATURES, get_encoder
+from core.model_registry import get_registry
+from core.prediction import predict_roi_batch
+
+BULK_CHUNK_ROWS = 50_000
+OUTPUT_FORMATS = ("csv", "parquet")
+
+# Scored files of the Bulk Scoring page, removed once they are a day old
+BULK_OUTPUT_DIR = os.path.join(tempfile.gettempdir(), "westprop-bulk-scoring")
+BULK_OUTPUT_MAX_AGE_SECONDS = 24 * 3600
+
+RENT_COLUMN = "rental_income_usd_monthly (est)"
+PREDICTED_COLUMN = "Predicted ROI (Model)"
+TRADITIONAL_COLUMN = "Traditional ROI (Calculated)"
+SMART_COLUMN = "Smart ROI (Calculated)"
+MODEL_INPUTS = NUMERIC_FEATURES + FLAG_FEATURES + CATEGORICAL_FEATURES
+
+# USD per month saved by each smart feature, in FLAG_FEATURES order
+FLAG_MONTHLY_SAVINGS = np.array([
+    SOLAR_SAVINGS, WATER_RECYCLING_SAVINGS, SMART_LOCKS_SAVINGS,
+    SMART_THERMOSTATS_SAVINGS, INTEGRATED_SECURITY_SAVINGS, EV_CHARGING_SAVINGS,
+], dtype=np.float64)
+
+
+def parquet_available():
+    """Whether Parquet output can be written (it needs ``pyarrow``)."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def net_roi(price, monthly_rent, monthly_savings=0.0):
+    """The Simulator's net ROI (%) for arrays of listings.
+
+    Annual rent plus smart-feature savings, minus property tax, maintenance
+    and insurance on the price and the agent fee on the rent, over the price.
+    A price of 0 or less gives 0, as in the Simulator; missing inputs give NaN.
+    """
+    price = np.asarray(price, dtype=np.float64)
+    annual_rent = np.asarray(monthly_rent, dtype=np.float64) * 12
+    expenses = price * (PROPERTY_TAX_RATE + MAINTENANCE_RATE + INSURANCE_RATE) + annual_rent * AGENT_FEE_RATE
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roi = (annual_rent + np.asarray(monthly_savings) * 12 - expenses) / price * 100
+    roi[price <= 0] = 0.0
+    return roi
+
+
+def score_frame(df, artifacts):
+    """Predicted, Traditional and Smart ROI (%) of every row of ``df``, as a DataFrame on its index.
+
+    Raises:
+        ValueError: If a model input column is missing from ``df``.
+    """
+    missing = [name for name in MODEL_INPUTS if name not in df.columns]
+    if missing:
+        raise ValueError(f"Missing column(s) {', '.join(missing)}; expected the real_estate_data_template.csv schema")
+
+    values = {name: pd.to_numeric(df[name], errors="coerce").to_numpy(np.float64)
+              for name in NUMERIC_FEATURES + FLAG_FEATURES}
+    valid = np.logical_and.reduce([np.isfinite(v) for v in values.values()]
+                                  + [df[name].notna().to_numpy() for name in CATEGORICAL_FEATURES])
+    predicted = np.full(len(df), np.nan)
+    if valid.any():
+        columns = {name: v[valid] for name, v in values.items()}
+        columns.update({name: df[name].to_numpy()[valid] for name in CATEGORICAL_FEATURES})
+        _, _, model_features = artifacts
+        predicted[valid] = predict_roi_batch(get_encoder(model_features).encode_many(columns), artifacts)
+
+    traditional = smart = np.full(len(df), np.nan)
+    if RENT_COLUMN in df.columns:
+        price = values["sale_price_usd"]
+        rent = pd.to_numeric(df[RENT_COLUMN], errors="coerce").to_numpy(np.float64)
+        flags = np.column_stack([values[name] for name in FLAG_FEATURES])
+        traditional = net_roi(price, rent)
+        smart = net_roi(price, rent, flags @ FLAG_MONTHLY_SAVINGS)
+
+    return pd.DataFrame({
+        PREDICTED_COLUMN: predicted.round(2),
+        TRADITIONAL_COLUMN: traditional.round(2),
+        SMART_COLUMN: smart.round(2),
+    }, index=df.index)
+
+
+class CSVChunkWriter:
+    """Appends scored chunks to a CSV file, writing the header once."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._header = True
+
+    def write(self, df):
+        df.to_csv(self._file, index=False, header=self._header)
+        self._header = False
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetChunkWriter:
+    """Appends scored chunks to a Parquet file as row groups with the first chunk's schema.
+
+    Integer and boolean columns are stored as float64 and other non-float
+    columns as strings, so a chunk with a missing value or a stray text cell
+    still matches the schema of the first chunk.
+    """
+
+    def __init__(self, path):
+        import pyarrow.parquet as pq
+
+        self.path = path
+        self._pq = pq
+        self._writer = None
+        self._schema = None
+
+    @staticmethod
+    def _normalise(df):
+        df = df.copy()
+        for name, dtype in df.dtypes.items():
+            if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+                df[name] = df[name].astype(np.float64)
+            elif not pd.api.types.is_float_dtype(dtype):
+                df[name] = df[name].astype("string")
+        return df
+
+    def write(self, df):
+        import pyarrow as pa
+
+        df = self._normalise(df)
+        if self._writer is None:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            self._schema = table.schema
+            self._writer = self._pq.ParquetWriter(self.path, self._schema)
+        else:
+            try:
+                table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                raise ValueError(f"A later chunk does not match the columns of the first: {e}") from e
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is None:  # Empty input: still write a valid file
+            import pyarrow as pa
+
+            self._pq.write_table(pa.table({}), self.path)
+        else:
+            self._writer.close()
+
+
+def open_writer(path, fmt):
+    """A chunk writer for ``fmt`` (one of ``OUTPUT_FORMATS``) writing to ``path``."""
+    if fmt == "csv":
+        return CSVChunkWriter(path)
+    if fmt == "parquet":
+        if not parquet_available():
+            raise ValueError("Parquet output needs pyarrow; choose CSV instead")
+        return ParquetChunkWriter(path)
+    raise ValueError(f"Unknown output format {fmt!r}; expected one of {OUTPUT_FORMATS}")
+
+
+def new_output_path(fmt):
+    """A fresh file in ``BULK_OUTPUT_DIR`` for a scored upload, removing day-old ones first."""
+    os.makedirs(BULK_OUTPUT_DIR, exist_ok=True)
+    cutoff = time.time() - BULK_OUTPUT_MAX_AGE_SECONDS
+    for entry in os.scandir(BULK_OUTPUT_DIR):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass  # Removed by another process meanwhile
+    fd, path = tempfile.mkstemp(suffix=f".{fmt}", prefix="scored-", dir=BULK_OUTPUT_DIR)
+    os.close(fd)
+    return path
+
+
+def score_csv(source, output, fmt="csv", chunk_rows=BULK_CHUNK_ROWS, progress=None, artifacts=None):
+    """Score every row of a listings CSV and write the result chunk by chunk.
+
+    Args:
+        source: Path of the CSV, or a binary file object (e.g. a Streamlit upload).
+        output (str): Path of the scored file.
+        fmt (str): ``"csv"`` or ``"parquet"``.
+        chunk_rows (int): Rows read, scored and written at a time.
+        progress (callable, optional): Called after each chunk with
+            ``(fraction of the input read, rows scored so far)``.
+        artifacts (tuple, optional): ``(model, transformer, features)``;
+            defaults to the registry's current version.
+
+    Returns:
+        dict: ``rows``, ``predicted`` (rows with a Predicted ROI), ``chunks``,
+        ``seconds``, ``rows_per_s``, ``model_version`` and ``output``.
+
+    Raises:
+        ValueError: If the file lacks a model input column or cannot be parsed.
+    """
+    if artifacts is None:
+        version, artifacts = get_registry().current()
+    else:
+        version = None
+    start = time.perf_counter()
+    stream = open(source, "rb") if isinstance(source, (str, os.PathLike)) else source
+    try:
+        stream.seek(0, os.SEEK_END)
+        size = stream.tell() or 1
+        stream.seek(0)
+        writer = open_writer(output, fmt)
+        rows = predicted = chunks = 0
+        try:
+            for chunk in pd.read_csv(stream, chunksize=chunk_rows):
+                scores = score_frame(chunk, artifacts)
+                writer.write(pd.concat([chunk, scores], axis=1))
+                rows += len(chunk)
+                predicted += int(scores[PREDICTED_COLUMN].notna().sum())
+                chunks += 1
+                if progress is not None:
+                    progress(min(stream.tell() / size, 1.0), rows)
+        except pd.errors.ParserError as e:
+            raise ValueError(f"Could not parse the CSV after {rows:,} rows: {e}") from e
+        finally:
+            writer.close()
+    finally:
+        if stream is not source:
+            stream.close()
+    seconds = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "predicted": predicted,
+        "chunks": chunks,
+        "seconds": round(seconds, 3),
+        "rows_per_s": round(rows / seconds) if seconds > 0 else 0,
+        "model_version": version,
+        "output": output,
+    }
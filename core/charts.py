@@ -0,0 +1,190 @@
+"""Rendered matplotlib charts, cached as PNG bytes per input hash.
+
+Building a figure with ``plt.subplots()`` on every rerun and handing it to
+``st.pyplot`` leaves the figure registered with pyplot until something closes
+it, so a long-running server accumulates them. ``chart_png`` instead builds a
+standalone ``matplotlib.figure.Figure`` with a drawing function, saves it to
+PNG once per (chart, inputs, DPI) and drops it straight away. The bytes go into
+a process-wide LRU bounded by total size, so the same chart for the same inputs
+(another rerun, another session, the Executive Summary) is served without
+touching matplotlib::
+
+    png = chart_png("roi_comparison", draw_roi_comparison, (roi, smart_roi, predicted_roi))
+    st.image(png, use_container_width=True)
+
+Screen charts use ``CHART_SCREEN_DPI``; ``CHART_EXPORT_DPI`` is only requested
+by exports (the one-pager PDF), the first time an export needs it.
+"""
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from core.explanations import top_contributions
+from core.lazy import lazy_import
+
+mpl_figure = lazy_import("matplotlib.figure")
+
+CHART_SCREEN_DPI = 200  # What st.pyplot used
+CHART_EXPORT_DPI = 300
+CHART_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+ROI_COMPARISON_LABELS = ("Traditional ROI (Net)", "Smart ROI (Net)", "Predicted ROI (Model)")
+ROI_COMPARISON_COLORS = ("#003366", "#FFC72C", "#4A4A4A")
+
+
+class ChartCache:
+    """LRU of PNG bytes bounded by their total size, with hit/miss counters."""
+
+    def __init__(self, max_bytes=CHART_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.renders = 0
+        self._entries = OrderedDict()  # key -> png bytes
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            png = self._entries.get(key)
+            if png is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return png
+
+    def put(self, key, png):
+        with self._lock:
+            self.renders += 1
+            if len(png) > self.max_bytes:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= len(previous)
+            self._entries[key] = png
+            self.bytes += len(png)
+            while self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "Charts": len(self._entries),
+            "Size (MB)": round(self.bytes / 1024 / 1024, 2),
+            "Max Size (MB)": round(self.max_bytes / 1024 / 1024, 1),
+            "Hits": self.hits,
+            "Misses": self.misses,
+            "Hit Ratio (%)": round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            "Renders": self.renders,
+        }
+
+
+_chart_cache = ChartCache()
+
+
+def _update_digest(digest, value):
+    if isinstance(value, np.ndarray):
+        digest.update(f"ndarray{value.dtype.str}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}{len(value)}(".encode())
+        for item in value:
+            _update_digest(digest, item)
+        digest.update(b")")
+    elif isinstance(value, dict):
+        _update_digest(digest, sorted(value.items()))
+    else:
+        digest.update(repr(value).encode())
+        digest.update(b"\x00")
+
+
+def input_hash(*inputs):
+    """Stable digest of chart inputs (numbers, strings, sequences, dicts and arrays)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in inputs:
+        _update_digest(digest, value)
+    return digest.hexdigest()
+
+
+def chart_png(name, draw, *inputs, dpi=CHART_SCREEN_DPI, figsize=None):
+    """PNG bytes of the chart ``draw(fig, *inputs)``, rendered once per input hash.
+
+    Args:
+        name (str): Chart identifier; part of the cache key.
+        draw (callable): Builds the chart on the ``Figure`` it is given.
+        *inputs: Everything the chart depends on; hashed for the cache key.
+        dpi (int): Output resolution.
+        figsize (tuple, optional): Figure size in inches (matplotlib default if None).
+
+    Returns:
+        bytes: The PNG image.
+    """
+    key = (name, dpi, figsize, input_hash(*inputs))
+    png = _chart_cache.get(key)
+    if png is not None:
+        return png
+
+    fig = mpl_figure.Figure(figsize=figsize)
+    try:
+        draw(fig, *inputs)
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", bbox_inches="tight", dpi=dpi)
+    finally:
+        fig.clear()  # Not registered with pyplot, so nothing else holds on to it
+    png = buf.getvalue()
+    _chart_cache.put(key, png)
+    return png
+
+
+def draw_roi_comparison(fig, values):
+    """Bar chart of Traditional, Smart and Predicted ROI (Simulator and Executive Summary)."""
+    ax = fig.subplots()
+    ax.bar(ROI_COMPARISON_LABELS, values, color=ROI_COMPARISON_COLORS)
+    ax.set_ylabel("ROI (%)")
+    ax.set_title("ROI Comparison")
+
+
+def roi_comparison_png(values, dpi=CHART_SCREEN_DPI):
+    """The ROI comparison chart for ``(roi, smart_roi, predicted_roi)``."""
+    return chart_png("roi_comparison", draw_roi_comparison, tuple(float(v) for v in values), dpi=dpi)
+
+
+def draw_roi_contributions(fig, labels, values, base_roi):
+    """Horizontal bars of each input's contribution to the Predicted ROI (Simulator and Executive Summary)."""
+    ax = fig.subplots()
+    y_pos = np.arange(len(labels))
+    ax.barh(y_pos, values, align="center",
+            color=[ROI_COMPARISON_COLORS[1] if v >= 0 else ROI_COMPARISON_COLORS[0] for v in values])
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(labels)
+    ax.invert_yaxis()
+    ax.axvline(0, color="#4A4A4A", linewidth=0.8)
+    ax.set_xlabel(f"Contribution to Predicted ROI (percentage points, from an average of {base_roi:.2f} %)")
+    ax.set_title("What Drives the Predicted ROI")
+
+
+def roi_contributions_png(explanation, dpi=CHART_SCREEN_DPI):
+    """The contribution chart of an ``explain_roi`` result."""
+    labels, values = zip(*top_contributions(explanation))
+    return chart_png("roi_contributions", draw_roi_contributions, list(labels),
+                     np.asarray(values, dtype=np.float64), round(float(explanation["base_roi"]), 2),
+                     dpi=dpi, figsize=(8, 5))
+
+
+def chart_cache_stats():
+    """Size and hit/miss counters of the shared chart cache (for the admin page)."""
+    return _chart_cache.stats()
+
+
+def clear_chart_cache():
+    _chart_cache.clear()
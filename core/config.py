@@ -0,0 +1,59 @@
+"""Settings and constants shared by the dashboard pages."""
+import os
+
+from dotenv import load_dotenv  # For loading environment variables (e.g., email credentials)
+
+# Load environment variables from .env file
+load_dotenv()
+SENDER_EMAIL = os.getenv("SENDER_EMAIL")
+APP_PASSWORD = os.getenv("APP_PASSWORD")
+
+# Define data directory
+DATA_DIR = "data"
+os.makedirs(DATA_DIR, exist_ok=True)
+
+# Load smart feature value proposition table (from original dashboard)
+SMART_VALUE_PATH = os.path.join(DATA_DIR, "smart_feature_value_table.csv")
+
+# Real estate data template with all calculated ROIs
+REAL_ESTATE_DATA_PATH = os.path.join(DATA_DIR, "real_estate_data_template.csv")
+
+# Encoded training matrices cached by scripts/train_roi_model.py
+TRAINING_CACHE_DIR = os.path.join(DATA_DIR, "cache")
+
+# ROI model artifact in models/: the trained forest ("full") or its compacted copy
+# written by scripts/compact_model.py ("lite"), smaller and quicker to load
+ROI_MODEL_FILES = {"full": "roi_prediction_model.pkl", "lite": "roi_prediction_model_lite.pkl"}
+ROI_MODEL_VARIANT = os.getenv("ROI_MODEL_VARIANT", "full")
+
+# Predicted ROI precomputed per suburb x type x smart features (scripts/build_roi_cube.py);
+# ROI_CUBE_MODE is "exact" (reference points only), "interpolate" (also between them) or "off"
+ROI_CUBE_PATH = os.getenv("ROI_CUBE_PATH", os.path.join("models", "roi_cube.npz"))
+ROI_CUBE_MODE = os.getenv("ROI_CUBE_MODE", "exact")
+
+# Unix socket of the shared prediction service (scripts/prediction_server.py); empty predicts in-process
+PREDICTION_SOCKET = os.getenv("PREDICTION_SOCKET", "")
+
+# Simulation log database (SQLite) and the CSV logs it replaced, imported once on first use
+SIMULATION_LOG_PATH = os.getenv("SIMULATION_LOG_PATH", os.path.join(DATA_DIR, "simulations.db"))
+LEGACY_SESSION_LOG_PATHS = (os.path.join(DATA_DIR, "session_log.csv"), "session_log.csv")
+
+# --- Smart Feature Savings (Updated based on research) ---
+SMART_FEATURE_MULTIPLIER = 1.5  # Multiplier for smart feature impact
+SOLAR_SAVINGS = 80  # USD per month
+WATER_RECYCLING_SAVINGS = 25 # USD per month
+SMART_LOCKS_SAVINGS = 10 # USD per month
+SMART_THERMOSTATS_SAVINGS = 15 # USD per month
+INTEGRATED_SECURITY_SAVINGS = 30 # USD per month
+EV_CHARGING_SAVINGS = 20 # USD per month
+
+# --- Annual Expense Rates (from calculate_roi.py) ---
+PROPERTY_TAX_RATE = 0.01  # Share of market price
+MAINTENANCE_RATE = 0.015  # Share of market price
+INSURANCE_RATE = 0.004  # Share of market price
+AGENT_FEE_RATE = 0.10  # Share of annual rent
+
+# --- Monte Carlo ROI Simulation ---
+MONTE_CARLO_PATHS = 100_000  # Default number of simulated paths
+MONTE_CARLO_MAX_PATHS = 1_000_000
+MONTE_CARLO_SEED = 42  # Fixed so that reruns show the same distribution
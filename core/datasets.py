@@ -0,0 +1,201 @@
+"""Shared, mtime-invalidated access to the dashboard's CSV datasets.
+
+Each CSV is parsed once per server process and the resulting frame is shared by
+every session. A file is re-parsed only when its mtime or size changes, so
+appends to the session and vote logs are picked up on the next rerun without
+any TTL.
+
+Frames are dtype-optimised on load (low-cardinality text becomes ``category``,
+64-bit integers that fit become ``int32``) and their numeric arrays are marked
+read-only. Callers receive a shallow copy: replacing or adding columns is safe,
+but in-place cell writes raise ``ValueError`` instead of silently corrupting the
+copy every other session sees. Use ``.copy()`` if you need to edit cells.
+
+Optionally (``DATASET_SNAPSHOTS=1`` in the environment/.env) a Parquet snapshot
+is written next to each CSV, e.g. ``data/real_estate_data_template.parquet``.
+On a cold start the snapshot is read instead of the CSV as long as it was taken
+from a CSV with the same mtime and size, which turns the first parse into a
+columnar read. Snapshots need ``pyarrow``; without it they are skipped.
+"""
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from core.timing import timed
+
+logger = logging.getLogger(__name__)
+
+DATASET_SNAPSHOTS = os.getenv("DATASET_SNAPSHOTS", "0") == "1"
+
+# Text columns with at most this share of distinct values become categoricals
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+_SNAPSHOT_META_KEY = b"westprop_source"
+
+
+@dataclass
+class _CachedFrame:
+    frame: pd.DataFrame
+    mtime: float
+    size_bytes: int
+    load_seconds: float
+    source: str  # "csv" or "snapshot"
+    loaded_at: float
+    hits: int = 0
+
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def optimize_dtypes(df):
+    """Return ``df`` with smaller, lossless dtypes (categoricals, int32)."""
+    int32 = np.iinfo(np.int32)
+    for col in df.columns:
+        series = df[col]
+        if series.dtype == object:
+            if len(series) and series.nunique(dropna=True) <= CATEGORY_MAX_UNIQUE_RATIO * len(series):
+                df[col] = series.astype("category")
+        elif series.dtype == np.int64 and len(series):
+            if int32.min <= series.min() and series.max() <= int32.max:
+                df[col] = series.astype(np.int32)
+    return df
+
+
+def _freeze(df):
+    """Rebuild ``df`` on top of read-only copies of its numpy-backed columns."""
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series.dtype, np.dtype):
+            values = series.to_numpy(copy=True)
+            values.flags.writeable = False
+            columns[col] = values
+        else:
+            columns[col] = series.array
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+def snapshot_path(csv_path):
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+
+def _source_tag(stat):
+    return f"{stat.st_mtime_ns}:{stat.st_size}".encode()
+
+
+def _read_snapshot(csv_path, stat):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+    path = snapshot_path(csv_path)
+    if not os.path.exists(path):
+        return None
+    try:
+        metadata = pq.read_schema(path).metadata or {}
+        if metadata.get(_SNAPSHOT_META_KEY) != _source_tag(stat):
+            return None  # Snapshot was taken from an older version of the CSV
+        return pq.read_table(path).to_pandas()
+    except Exception as e:
+        logger.warning("Ignoring unreadable snapshot %s: %s", path, e)
+        return None
+
+
+def _write_snapshot(csv_path, stat, df):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return
+    path = snapshot_path(csv_path)
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_SNAPSHOT_META_KEY] = _source_tag(stat)
+        pq.write_table(table.replace_schema_metadata(metadata), tmp_path)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning("Could not write snapshot %s: %s", path, e)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def read_csv_shared(path, snapshot=None):
+    """Return the parsed contents of ``path`` from the process-wide cache.
+
+    Args:
+        path (str): CSV file path, as passed to ``pd.read_csv``.
+        snapshot (bool, optional): Use/maintain a Parquet snapshot next to the
+            CSV. Defaults to the ``DATASET_SNAPSHOTS`` setting.
+
+    Returns:
+        DataFrame: A shallow copy of the shared, read-only frame.
+
+    Raises:
+        FileNotFoundError: If ``path`` does not exist (same as ``pd.read_csv``).
+    """
+    with timed(f"csv.read:{os.path.basename(path)}"):
+        return _read_cached(path, DATASET_SNAPSHOTS if snapshot is None else snapshot)
+
+
+def _read_cached(path, snapshot):
+    key = os.path.abspath(path)
+    stat = os.stat(path)
+
+    cached = _cache.get(key)
+    if cached is None or (cached.mtime, cached.size_bytes) != (stat.st_mtime, stat.st_size):
+        with _lock:
+            cached = _cache.get(key)
+            if cached is None or (cached.mtime, cached.size_bytes) != (stat.st_mtime, stat.st_size):
+                start = time.perf_counter()
+                df = _read_snapshot(path, stat) if snapshot else None
+                source = "snapshot"
+                if df is None:
+                    df = optimize_dtypes(pd.read_csv(path))
+                    source = "csv"
+                    if snapshot:
+                        _write_snapshot(path, stat, df)
+                cached = _CachedFrame(
+                    frame=_freeze(df),
+                    mtime=stat.st_mtime,
+                    size_bytes=stat.st_size,
+                    load_seconds=time.perf_counter() - start,
+                    source=source,
+                    loaded_at=time.time(),
+                )
+                _cache[key] = cached
+                logger.info("Loaded %s from %s in %.1f ms", path, source, cached.load_seconds * 1000)
+    cached.hits += 1
+    return cached.frame.copy(deep=False)
+
+
+def invalidate(path=None):
+    """Drop one cached dataset (or all of them) so the next read re-parses it."""
+    with _lock:
+        if path is None:
+            _cache.clear()
+        else:
+            _cache.pop(os.path.abspath(path), None)
+
+
+def dataset_stats():
+    """Return one dict per cached dataset for display on the admin page."""
+    return [
+        {
+            "File": os.path.relpath(key),
+            "Rows": len(c.frame),
+            "Memory (KB)": round(c.frame.memory_usage(deep=True).sum() / 1024, 1),
+            "Source": c.source,
+            "Load Time (ms)": round(c.load_seconds * 1000, 2),
+            "Hits": c.hits,
+            "Loaded At": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(c.loaded_at)),
+        }
+        for key, c in list(_cache.items())
+    ]
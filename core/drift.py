@@ -0,0 +1,316 @@
+"""Drift of Simulator inputs away from the ROI model's training data.
+
+Every Simulator submission updates a streaming summary of each model input,
+kept next to the simulation log in its SQLite database: a count per bin,
+plus the count, sum, min and max of numeric inputs and how often they fell
+outside the training range. An update is one upsert per input in a single
+short transaction, whatever the number of submissions so far, and readers
+never scan the log. Every server process adds to the same counts, and they
+survive restarts.
+
+The bins come from the training data (``data/real_estate_data_template.csv``,
+rows with an ROI, as in ``core/training.py``):
+
+* numeric inputs: ``DRIFT_BINS`` quantile bins of the training values, open
+  at both ends;
+* smart-feature flags: off / on;
+* suburb and property type: one bin per training category, plus one for
+  categories the model has never seen.
+
+``DriftMonitor.report`` compares the live bins with the training proportions. It
+reports the population stability index (PSI) of every input, and for numeric
+inputs the Kolmogorov-Smirnov distance between the two CDFs at the bin
+edges, with its 5% critical value. It also gives the share of submissions
+outside the training range or with an unseen category. There the forest is
+extrapolating: it answers with the nearest leaf or with no category at all.
+
+Counts are stored per reference (a hash of the bins), so retraining on new
+data starts fresh summaries instead of mixing two binnings.
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+from core.config import REAL_ESTATE_DATA_PATH, SIMULATION_LOG_PATH
+from core.datasets import read_csv_shared
+from core.features import CATEGORICAL_FEATURES, FLAG_FEATURES, NUMERIC_FEATURES
+from core.timing import timed
+
+logger = logging.getLogger(__name__)
+
+DRIFT_BINS = 10
+DRIFT_MIN_SAMPLES = 30  # Fewer submissions than this are reported, but not judged
+PSI_MODERATE = 0.1
+PSI_SIGNIFICANT = 0.25
+PSI_FLOOR = 1e-4  # Stands in for empty bins, whose log ratio is undefined
+KS_CRITICAL_COEFFICIENT = 1.358  # Two-sample KS at the 5% level
+UNSEEN = "(unseen)"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS drift_counts (
+    reference TEXT NOT NULL,
+    feature TEXT NOT NULL,
+    bin INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (reference, feature, bin)
+);
+CREATE TABLE IF NOT EXISTS drift_moments (
+    reference TEXT NOT NULL,
+    feature TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    sum REAL NOT NULL,
+    min REAL NOT NULL,
+    max REAL NOT NULL,
+    outside INTEGER NOT NULL,
+    PRIMARY KEY (reference, feature)
+);
+"""
+
+_COUNT = """
+INSERT INTO drift_counts (reference, feature, bin, n) VALUES (?, ?, ?, 1)
+    ON CONFLICT (reference, feature, bin) DO UPDATE SET n = n + 1
+"""
+
+_MOMENTS = """
+INSERT INTO drift_moments (reference, feature, n, sum, min, max, outside) VALUES (?, ?, 1, ?, ?, ?, ?)
+    ON CONFLICT (reference, feature) DO UPDATE SET
+        n = n + 1, sum = sum + excluded.sum,
+        min = MIN(min, excluded.min), max = MAX(max, excluded.max), outside = outside + excluded.outside
+"""
+
+
+def build_reference(df, bins=DRIFT_BINS):
+    """Training bins and proportions of every model input in ``df``.
+
+    Returns:
+        dict: Input name -> ``kind`` ("numeric", "flag" or "category"),
+        ``labels`` of the bins, training ``expected`` proportions and ``n``;
+        numeric inputs also have the interior bin ``edges``, ``min``, ``max``
+        and ``mean``.
+    """
+    df = df[df["ROI_percentage"].notna()]
+    reference = {}
+    for name in NUMERIC_FEATURES:
+        values = df[name].dropna().to_numpy(np.float64)
+        edges = np.unique(np.quantile(values, np.linspace(0, 1, bins + 1)[1:-1]))
+        counts = np.bincount(np.searchsorted(edges, values, side="right"), minlength=len(edges) + 1)
+        bounds = [-np.inf, *edges, np.inf]
+        reference[name] = {
+            "kind": "numeric",
+            "edges": edges.tolist(),
+            "labels": [_bin_label(low, high) for low, high in zip(bounds[:-1], bounds[1:])],
+            "expected": (counts / counts.sum()).tolist(),
+            "n": int(counts.sum()),
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "mean": float(values.mean()),
+        }
+    for name in FLAG_FEATURES:
+        values = df[name].fillna(0).astype(bool).to_numpy()
+        counts = np.bincount(values.astype(int), minlength=2)
+        reference[name] = {"kind": "flag", "labels": ["off", "on"], "expected": (counts / counts.sum()).tolist(),
+                           "n": int(counts.sum())}
+    for name in CATEGORICAL_FEATURES:
+        counts = df[name].dropna().astype(str).value_counts().sort_index()
+        reference[name] = {
+            "kind": "category",
+            "labels": counts.index.tolist() + [UNSEEN],
+            "index": {label: i for i, label in enumerate(counts.index)},
+            "expected": (counts / counts.sum()).tolist() + [0.0],
+            "n": int(counts.sum()),
+        }
+    return reference
+
+
+def _bin_label(low, high):
+    if np.isinf(low):
+        return f"< {high:g}"
+    if np.isinf(high):
+        return f">= {low:g}"
+    return f"{low:g} to < {high:g}"
+
+
+def reference_id(reference):
+    """Short hash identifying the binning of ``reference``."""
+    layout = {name: [ref.get("edges"), ref["labels"]] for name, ref in reference.items()}
+    return hashlib.sha256(json.dumps(layout, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def psi(actual, expected, floor=PSI_FLOOR):
+    """Population stability index of two sets of bin proportions."""
+    actual = np.maximum(np.asarray(actual, dtype=np.float64), floor)
+    expected = np.maximum(np.asarray(expected, dtype=np.float64), floor)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def ks_distance(actual, expected):
+    """Largest gap between the two CDFs at the bin edges (the binned two-sample KS statistic)."""
+    return float(np.max(np.abs(np.cumsum(actual) - np.cumsum(expected))[:-1], initial=0.0))
+
+
+def drift_status(n, psi_value):
+    if n < DRIFT_MIN_SAMPLES:
+        return f"Too few submissions (< {DRIFT_MIN_SAMPLES})"
+    if psi_value >= PSI_SIGNIFICANT:
+        return "Significant drift"
+    if psi_value >= PSI_MODERATE:
+        return "Moderate drift"
+    return "Stable"
+
+
+class DriftMonitor:
+    """Streaming input summaries in the simulation database, with one connection per thread."""
+
+    def __init__(self, path=SIMULATION_LOG_PATH, training_path=REAL_ESTATE_DATA_PATH):
+        self.path = path
+        self.training_path = training_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._ready = False
+        self._reference = None  # (training CSV stat, reference, reference id)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    conn.executescript(_SCHEMA)
+                    self._ready = True
+        return conn
+
+    def reference(self):
+        """``(reference, reference id)`` of the training data, rebuilt when the CSV changes."""
+        stat = os.stat(self.training_path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._reference
+        if cached is None or cached[0] != key:
+            with self._lock:
+                cached = self._reference
+                if cached is None or cached[0] != key:
+                    reference = build_reference(read_csv_shared(self.training_path))
+                    cached = self._reference = (key, reference, reference_id(reference))
+        return cached[1], cached[2]
+
+    def observe(self, inputs):
+        """Add one Simulator submission (a ``predict_roi`` input dict) to the summaries.
+
+        Best effort: if the database cannot be written (locked, read-only,
+        disk full), the submission is logged as a warning and not counted.
+        """
+        try:
+            reference, ref_id = self.reference()
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Input drift not recorded, no training reference: %s", e)
+            return
+        counts, moments = [], []
+        for name, ref in reference.items():
+            value = inputs.get(name)
+            if ref["kind"] == "numeric":
+                try:
+                    x = float(value)
+                except (TypeError, ValueError):
+                    continue
+                if x != x:  # NaN
+                    continue
+                counts.append((ref_id, name, int(np.searchsorted(ref["edges"], x, side="right"))))
+                outside = int(x < ref["min"] or x > ref["max"])
+                moments.append((ref_id, name, x, x, x, outside))
+            elif ref["kind"] == "flag":
+                counts.append((ref_id, name, int(bool(value))))
+            else:
+                counts.append((ref_id, name, ref["index"].get(str(value), len(ref["labels"]) - 1)))
+        with timed("drift.observe"):
+            try:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.executemany(_COUNT, counts)
+                    conn.executemany(_MOMENTS, moments)
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+            except (OSError, sqlite3.Error) as e:  # Telemetry only: never fail the submission
+                logger.warning("Input drift not recorded: %s", e)
+
+    def report(self):
+        """One row per model input: live submissions, PSI, KS, share outside the training data and status."""
+        reference, ref_id = self.reference()
+        conn = self._connect()
+        live = {name: np.zeros(len(ref["labels"])) for name, ref in reference.items()}
+        for name, index, n in conn.execute(
+                "SELECT feature, bin, n FROM drift_counts WHERE reference = ?", (ref_id,)):
+            if name in live and index < len(live[name]):
+                live[name][index] = n
+        moments = {row[0]: row[1:] for row in conn.execute(
+            "SELECT feature, n, sum, min, max, outside FROM drift_moments WHERE reference = ?", (ref_id,))}
+
+        rows = []
+        for name, ref in reference.items():
+            counts = live[name]
+            n = int(counts.sum())
+            actual = counts / n if n else counts
+            row = {"Input": name, "Submissions": n, "PSI": round(psi(actual, ref["expected"]), 4) if n else None}
+            if ref["kind"] == "numeric":
+                m, total, low, high, outside = moments.get(name, (0, 0.0, None, None, 0))
+                row.update({
+                    "KS": round(ks_distance(actual, ref["expected"]), 4) if n else None,
+                    "KS Critical (5%)": round(KS_CRITICAL_COEFFICIENT * np.sqrt((n + ref["n"]) / (n * ref["n"])), 4)
+                    if n else None,
+                    "Outside Training Data (%)": round(outside / m * 100, 1) if m else None,
+                    "Training Range": f"{ref['min']:g} to {ref['max']:g}",
+                    "Live Range": f"{low:g} to {high:g}" if m else None,
+                    "Training Mean": round(ref["mean"], 2),
+                    "Live Mean": round(total / m, 2) if m else None,
+                })
+            elif ref["kind"] == "category":
+                row["Outside Training Data (%)"] = round(counts[-1] / n * 100, 1) if n else None
+            else:
+                row["Live Share On (%)"] = round(actual[1] * 100, 1) if n else None
+                row["Training Share On (%)"] = round(ref["expected"][1] * 100, 1)
+            row["Status"] = drift_status(n, row["PSI"] or 0.0)
+            rows.append(row)
+        return rows
+
+    def bins(self, name):
+        """Training and live share (%) of each bin of one input, for a chart."""
+        reference, ref_id = self.reference()
+        ref = reference[name]
+        counts = np.zeros(len(ref["labels"]))
+        for index, n in self._connect().execute(
+                "SELECT bin, n FROM drift_counts WHERE reference = ? AND feature = ?", (ref_id, name)):
+            if index < len(counts):
+                counts[index] = n
+        total = counts.sum()
+        return {
+            "Bin": ref["labels"],
+            "Training (%)": [round(p * 100, 1) for p in ref["expected"]],
+            "Live (%)": [round(c / total * 100, 1) if total else 0.0 for c in counts],
+        }
+
+    def reset(self):
+        """Forget the live summaries of the current reference."""
+        _, ref_id = self.reference()
+        conn = self._connect()
+        conn.execute("DELETE FROM drift_counts WHERE reference = ?", (ref_id,))
+        conn.execute("DELETE FROM drift_moments WHERE reference = ?", (ref_id,))
+
+
+_monitor = DriftMonitor()
+
+
+def get_drift_monitor():
+    """Return the process-wide drift monitor shared by all sessions."""
+    return _monitor
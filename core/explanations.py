@@ -0,0 +1,276 @@
+"""Per-prediction feature contributions of the ROI forest (path-dependent TreeSHAP).
+
+``explain_roi`` splits one Predicted ROI into a base value (the forest's
+average prediction over its training data) plus one contribution per
+simulator input: the five numeric inputs, each smart feature, the suburb and
+the property type (the one-hot columns of a categorical input are summed).
+
+The Shapley values are exact for the forest. They are computed from the trees'
+own arrays (split features, thresholds, node covers and leaf values), as
+TreeSHAP does. Each root-to-leaf path is reduced once per model to one entry
+per feature it splits on: the interval the feature must fall into to follow
+the path, and the share of the training cover that followed it. For an input,
+a feature either "agrees" with the path (it lies in the interval) or it does
+not. The path's Shapley weights then follow from the polynomial
+``prod(z_j + o_j * t)`` over its features. Paths with the same number of
+features are processed together as NumPy arrays, so an explanation costs a
+few dozen vectorised operations rather than a Python walk of every tree.
+
+The forest predicts in the power-transformed space. Contributions are mapped
+to ROI percentage points by scaling them by the ratio of the ROI difference to
+the transformed difference between the prediction and the base value, so they
+still add up exactly to ``predicted - base``.
+
+Explanations from the shared registry model are cached per input and tagged
+with the model version, like single predictions, and come from the shared
+prediction service when one is configured (``PREDICTION_SOCKET``).
+"""
+import threading
+from math import factorial
+
+import numpy as np
+
+from core.features import CATEGORICAL_FEATURES, FLAG_FEATURES, NUMERIC_FEATURES, get_encoder
+from core.forest import tree_arrays
+from core.model_registry import get_registry
+from core.prediction import PredictionCache, canonical_key
+from core.prediction_client import get_prediction_client, remote_call
+from core.timing import timed
+
+EXPLANATION_INPUTS = NUMERIC_FEATURES + FLAG_FEATURES + CATEGORICAL_FEATURES
+EXPLANATION_LABELS = {
+    "stand_size_sqm": "Stand Size",
+    "building_size_sqm": "Building Size",
+    "bedrooms": "Bedrooms",
+    "bathrooms": "Bathrooms",
+    "sale_price_usd": "Market Price",
+    "has_solar": "Solar Panels",
+    "has_water_recycling": "Water Recycling",
+    "has_smart_locks": "Smart Locks",
+    "has_smart_thermostats": "Smart Thermostats",
+    "has_integrated_security": "Integrated Security",
+    "has_ev_charging": "EV Charging",
+    "location_suburb": "Suburb",
+    "property_type": "Property Type",
+}
+
+EXPLANATION_CACHE_SIZE = 1024
+EXPLANATION_CACHE_TTL_SECONDS = 3600
+
+_explanation_cache = PredictionCache(maxsize=EXPLANATION_CACHE_SIZE, ttl=EXPLANATION_CACHE_TTL_SECONDS)
+
+
+class ForestPaths:
+    """Every root-to-leaf path of a forest, grouped by its number of distinct features.
+
+    Works for a fitted sklearn forest and for a ``CompactForest``.
+
+    ``groups`` maps the path length ``d`` to arrays with one row per leaf:
+    ``features``, ``lower``/``upper`` (the feature must satisfy
+    ``lower < x <= upper`` to follow the path), ``cover`` (the fraction of the
+    node cover that followed the path's splits on that feature) and
+    ``values`` (the leaf value divided by the number of trees).
+    """
+
+    def __init__(self, model):
+        self.n_features = model.n_features_in_
+        trees = list(tree_arrays(model))
+        n_trees = len(trees)
+        self.base_value = 0.0
+        paths = {}
+        for tree in trees:
+            leaves = tree.children_left == -1
+            # The tree's average prediction over its (bootstrapped) training data
+            self.base_value += float(tree.value[leaves] @ tree.cover[leaves]) / tree.cover[0] / n_trees
+            self._collect(tree, paths, n_trees)
+
+        self.groups = {}
+        for d, leaves in paths.items():
+            conditions = [leaf[0] for leaf in leaves]
+            self.groups[d] = {
+                "features": np.array([[f for f, _, _, _ in c] for c in conditions], dtype=np.int64).reshape(-1, d),
+                "lower": np.array([[lo for _, lo, _, _ in c] for c in conditions]).reshape(-1, d),
+                "upper": np.array([[hi for _, _, hi, _ in c] for c in conditions]).reshape(-1, d),
+                "cover": np.array([[z for _, _, _, z in c] for c in conditions]).reshape(-1, d),
+                "values": np.array([leaf[1] for leaf in leaves]),
+            }
+        self.n_leaves = sum(len(g["values"]) for g in self.groups.values())
+
+    @staticmethod
+    def _collect(tree, paths, n_trees):
+        # Iterative depth-first walk; conditions: feature -> (lower, upper, cover share)
+        stack = [(0, {})]
+        left, right, covers = tree.children_left, tree.children_right, tree.cover
+        while stack:
+            node, conditions = stack.pop()
+            if left[node] == -1:
+                leaf = sorted((f, lo, hi, z) for f, (lo, hi, z) in conditions.items())
+                paths.setdefault(len(leaf), []).append((leaf, float(tree.value[node]) / n_trees))
+                continue
+            feature, threshold = int(tree.feature[node]), float(tree.threshold[node])
+            lo, hi, z = conditions.get(feature, (-np.inf, np.inf, 1.0))
+            for child, bounds in ((left[node], (lo, min(hi, threshold))), (right[node], (max(lo, threshold), hi))):
+                child_conditions = dict(conditions)
+                child_conditions[feature] = (*bounds, z * covers[child] / covers[node])
+                stack.append((child, child_conditions))
+
+
+def _shapley_weights(d):
+    """``k! (d - k - 1)! / d!`` for ``k = 0 .. d - 1``."""
+    return np.array([factorial(k) * factorial(d - k - 1) / factorial(d) for k in range(d)])
+
+
+def tree_shap(paths, x):
+    """Shapley values of every model column for one encoded row ``x``.
+
+    Args:
+        paths (ForestPaths): The forest's precomputed paths.
+        x: 1-D encoded row in the model's column order.
+
+    Returns:
+        ndarray: One value per model column, in the forest's output space;
+        ``paths.base_value + values.sum()`` equals the forest's prediction.
+    """
+    # The trees compare float32 inputs against their thresholds
+    x = np.asarray(x, dtype=np.float32).astype(np.float64)
+    phi = np.zeros(paths.n_features)
+    for d, group in paths.groups.items():
+        values = group["values"]
+        if d == 0:
+            continue  # A single-leaf tree only adds to the base value
+        features, z = group["features"], group["cover"]
+        xf = x[features]
+        o = ((xf > group["lower"]) & (xf <= group["upper"])).astype(np.float64)
+
+        # Coefficients of prod_j (z_j + o_j t), lowest degree first
+        poly = np.zeros((len(values), d + 1))
+        poly[:, 0] = 1.0
+        for j in range(d):
+            shifted = np.zeros_like(poly)
+            shifted[:, 1:] = poly[:, :-1] * o[:, j:j + 1]
+            poly = poly * z[:, j:j + 1] + shifted
+
+        # Divide feature j's factor back out and weigh the remaining coefficients:
+        # by (z_j + t) from the top when the input agrees with the path, by z_j otherwise
+        weights = _shapley_weights(d)
+        agrees = o.astype(bool)
+        total = np.zeros((len(values), d))
+        quotient = np.broadcast_to(poly[:, d:d + 1], (len(values), d)).copy()  # q_{d-1}
+        for k in range(d - 1, -1, -1):
+            if k < d - 1:
+                quotient = poly[:, k + 1:k + 2] - z * quotient
+            total += weights[k] * np.where(agrees, quotient, poly[:, k:k + 1] / z)
+        contributions = values[:, None] * (o - z) * total
+        phi += np.bincount(features.ravel(), weights=contributions.ravel(), minlength=paths.n_features)
+    return phi
+
+
+_paths_lock = threading.Lock()
+_paths_by_model = {}  # id(model) -> (model, ForestPaths); one model per registry version
+
+
+def forest_paths(model):
+    """The model's ``ForestPaths``, built once per model object."""
+    entry = _paths_by_model.get(id(model))
+    if entry is not None and entry[0] is model:
+        return entry[1]
+    with _paths_lock:
+        entry = _paths_by_model.get(id(model))
+        if entry is None or entry[0] is not model:
+            with timed("explanations.forest_paths"):
+                paths = ForestPaths(model)
+            _paths_by_model.clear()  # Drop the previous model's paths
+            _paths_by_model[id(model)] = (model, paths)
+            entry = _paths_by_model[id(model)]
+    return entry[1]
+
+
+def _roi_scale(pt, base, prediction):
+    """ROI percentage points per unit of the transformed output between ``base`` and ``prediction``."""
+    if abs(prediction - base) > 1e-9:
+        low, high = pt.inverse_transform(np.array([[base], [prediction]])).ravel()
+        return (high - low) / (prediction - base)
+    step = 1e-4
+    low, high = pt.inverse_transform(np.array([[prediction - step], [prediction + step]])).ravel()
+    return (high - low) / (2 * step)
+
+
+def _explain(inputs, artifacts):
+    model, pt, model_features = artifacts
+    encoder = get_encoder(model_features)
+    paths = forest_paths(model)
+    phi = tree_shap(paths, encoder.encode(inputs))
+
+    prediction = paths.base_value + phi.sum()
+    scale = _roi_scale(pt, paths.base_value, prediction)
+    base_roi = float(pt.inverse_transform(np.array([[paths.base_value]]))[0, 0])
+
+    contributions = {name: float(phi[col]) * scale for name, col in encoder.value_columns.items()}
+    for field, columns in encoder.category_columns.items():
+        contributions[field] = float(phi[list(columns.values())].sum()) * scale
+    return {
+        "base_roi": base_roi,
+        "predicted_roi": base_roi + sum(contributions.values()),
+        "contributions": {name: contributions.get(name, 0.0) for name in EXPLANATION_INPUTS},
+    }
+
+
+def explain_roi(inputs, artifacts=None):
+    """Contribution of each simulator input to the Predicted ROI of one scenario.
+
+    Args:
+        inputs (dict): Simulator-style scenario (as passed to ``predict_roi``).
+        artifacts (tuple, optional): ``(model, transformer, features)``; passing
+            them bypasses the explanation cache.
+
+    Returns:
+        dict: ``base_roi`` (average prediction, %), ``predicted_roi`` (%) and
+        ``contributions`` (input name -> ROI percentage points, in
+        ``EXPLANATION_INPUTS`` order) summing to ``predicted_roi - base_roi``.
+        Shared between sessions; do not modify.
+    """
+    if artifacts is not None:
+        return _explain(inputs, artifacts)
+    key = canonical_key(inputs)
+    if get_prediction_client() is not None:
+        explanation = _explain_remote(inputs, key)
+        if explanation is not None:
+            return explanation
+
+    version, artifacts = get_registry().current()
+    explanation = _explanation_cache.get(key, version)
+    if explanation is None:
+        with timed("explanations.explain_roi"):
+            explanation = _explain(inputs, artifacts)
+        _explanation_cache.put(key, explanation, version)
+    return explanation
+
+
+def _explain_remote(inputs, key):
+    """Explanation from the prediction service, cached under its model version; None if it did not answer."""
+    version = get_prediction_client().version
+    if version is not None:
+        explanation = _explanation_cache.get(key, version)
+        if explanation is not None:
+            return explanation
+    answer = remote_call("explain", inputs=inputs)
+    if answer is None:
+        return None
+    explanation, version = answer
+    _explanation_cache.put(key, explanation, version)
+    return explanation
+
+
+def top_contributions(explanation, n=None):
+    """``(label, percentage points)`` pairs, largest effect first (the ``n`` largest if given)."""
+    ranked = sorted(explanation["contributions"].items(), key=lambda item: -abs(item[1]))
+    return [(EXPLANATION_LABELS[name], value) for name, value in ranked[:n]]
+
+
+def explanation_cache_stats():
+    """Hit/miss counters and size of the shared explanation cache (for the admin page)."""
+    return _explanation_cache.stats()
+
+
+def clear_explanation_cache():
+    _explanation_cache.clear()
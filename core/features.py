@@ -0,0 +1,98 @@
+"""Encoding of simulator inputs into the ROI model's feature matrix.
+
+The model was trained on ``pd.get_dummies(..., drop_first=True)`` output: five
+numeric columns, six smart-feature flags and one-hot ``location_suburb_*`` /
+``property_type_*`` columns, in the order stored in ``model_features.pkl``.
+``FeatureEncoder`` precomputes the column index of every feature and every
+known category once, then writes inputs straight into a preallocated NumPy
+array instead of building, dummy-encoding and re-aligning a DataFrame per
+prediction.
+
+Categories the model has not seen (and the category dropped by
+``drop_first``) leave all of their one-hot columns at 0, as aligning the
+dummies against ``model_features`` did.
+"""
+import functools
+import warnings
+from collections.abc import Mapping
+
+import numpy as np
+
+NUMERIC_FEATURES = ("stand_size_sqm", "building_size_sqm", "bedrooms", "bathrooms", "sale_price_usd")
+FLAG_FEATURES = (
+    "has_solar", "has_water_recycling", "has_smart_locks",
+    "has_smart_thermostats", "has_integrated_security", "has_ev_charging",
+)
+CATEGORICAL_FEATURES = ("location_suburb", "property_type")
+
+# The forest is fitted on a DataFrame, so sklearn warns when it is given a plain array
+# with the columns already in the fitted order. The encoder guarantees that order.
+warnings.filterwarnings("ignore", message="X does not have valid feature names", category=UserWarning)
+
+
+class FeatureEncoder:
+    """Maps simulator input dicts onto rows of the model's feature matrix."""
+
+    def __init__(self, feature_names):
+        self.feature_names = list(feature_names)
+        index = {name: i for i, name in enumerate(self.feature_names)}
+        self.n_features = len(self.feature_names)
+        self.value_columns = {
+            name: index[name] for name in NUMERIC_FEATURES + FLAG_FEATURES if name in index
+        }
+        self.category_columns = {}
+        for field in CATEGORICAL_FEATURES:
+            prefix = f"{field}_"
+            self.category_columns[field] = {
+                name[len(prefix):]: i for name, i in index.items() if name.startswith(prefix)
+            }
+
+    def encode(self, inputs, out=None):
+        """Encode one input dict into a 1-D float64 row (written into ``out`` if given)."""
+        row = np.zeros(self.n_features) if out is None else out
+        if out is not None:
+            row.fill(0.0)
+        for name, col in self.value_columns.items():
+            row[col] = float(inputs[name])
+        for field, columns in self.category_columns.items():
+            col = columns.get(inputs[field])
+            if col is not None:
+                row[col] = 1.0
+        return row
+
+    def encode_many(self, rows):
+        """Encode many inputs into an ``(n, n_features)`` float64 matrix.
+
+        Args:
+            rows: A sequence of input dicts, or a mapping of field name to a
+                sequence of values (e.g. a DataFrame or a dict of columns).
+
+        Returns:
+            ndarray: One encoded row per input, in the model's column order.
+        """
+        if isinstance(rows, Mapping) or hasattr(rows, "columns"):
+            columns = rows
+        else:
+            rows = list(rows)
+            fields = list(self.value_columns) + list(self.category_columns)
+            columns = {field: [r[field] for r in rows] for field in fields}
+
+        n = len(columns[next(iter(self.category_columns))])
+        X = np.zeros((n, self.n_features))
+        for name, col in self.value_columns.items():
+            X[:, col] = np.asarray(columns[name], dtype=np.float64)
+        for field, mapping in self.category_columns.items():
+            cols = np.fromiter((mapping.get(value, -1) for value in columns[field]), dtype=np.int64, count=n)
+            known = cols >= 0
+            X[np.flatnonzero(known), cols[known]] = 1.0
+        return X
+
+
+@functools.lru_cache(maxsize=4)
+def _encoder_for(feature_names):
+    return FeatureEncoder(feature_names)
+
+
+def get_encoder(model_features):
+    """Return the shared encoder for this feature list (built once per feature list)."""
+    return _encoder_for(tuple(model_features))
@@ -0,0 +1,294 @@
+"""Array-backed evaluation of the ROI forest, without sklearn's per-call overhead.
+
+``RandomForestRegressor.predict`` validates its input, dispatches one job per
+tree through joblib and walks every tree in its own call. For the Simulator's
+single scenario that fixed cost is most of the prediction time. ``FlatForest``
+copies every tree's node arrays into one set of contiguous arrays (split
+feature, threshold, left/right child and leaf value, with global node
+indices), then walks all trees for all rows at once. Each step moves every
+(row, tree) pair that has not reached a leaf yet one level down, so the work
+is the total path length rather than rows x trees x maximum depth.
+
+Results are bit-identical to ``model.predict``:
+
+* inputs are cast to float32 and compared against the float64 thresholds
+  with ``<=``, as sklearn's trees do;
+* the per-tree leaf values are summed in estimator order (``np.cumsum`` is a
+  sequential sum), then divided by the number of trees, as the forest does.
+
+Rows with NaN or infinity would be sent right at every split, so
+``FlatForest.predict`` rejects them with a ``ValueError`` and
+``forest_predict`` leaves such batches to ``model.predict`` (which rejects
+them too, or handles missing values itself in scikit-learn versions that do).
+
+The walk is pure NumPy, so it wins while the fixed cost dominates (a few
+rows) and loses to sklearn's compiled, multi-threaded traversal on large
+batches. ``forest_predict`` therefore only takes the flat path for batches of
+up to ``FLAT_FOREST_MAX_ROWS`` rows. Models that are not a
+``RandomForestRegressor`` or ``ExtraTreesRegressor`` of plain trees always
+use their own ``predict``.
+
+``CompactForest`` is the same layout in the smallest dtypes, optionally with
+fewer trees and a depth cap, and nothing but what inference and explanations
+need. ``compact_forest`` builds one from a fitted forest; it is the "lite"
+model artifact written by ``scripts/compact_model.py`` and can be loaded in
+place of the full forest (``ROI_MODEL_VARIANT=lite``).
+"""
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+from core.timing import timed
+
+# Largest batch evaluated with the flat arrays; above it model.predict is faster
+# (see benchmarks/forest.py)
+FLAT_FOREST_MAX_ROWS = 128
+
+# (row, tree) pairs advanced per step at most; bounds the index arrays for large batches
+FLAT_FOREST_CHUNK_PAIRS = 2_000_000
+
+# Default size of the "lite" artifact (scripts/compact_model.py, scripts/train_roi_model.py)
+LITE_TREES = 50
+LITE_MAX_DEPTH = 12
+
+# One tree's node arrays in sklearn's layout: local node ids, children -1 at leaves
+TreeArrays = namedtuple("TreeArrays", "children_left children_right feature threshold cover value")
+
+
+def sklearn_tree_arrays(model):
+    """``TreeArrays`` of every tree of a fitted sklearn forest."""
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        yield TreeArrays(tree.children_left, tree.children_right, tree.feature, tree.threshold,
+                         tree.weighted_n_node_samples, tree.value[:, 0, 0])
+
+
+def tree_arrays(model):
+    """``TreeArrays`` of every tree of a fitted sklearn forest or a ``CompactForest``."""
+    if isinstance(model, CompactForest):
+        return model.tree_arrays()
+    return sklearn_tree_arrays(model)
+
+
+class FlatForest:
+    """A regression forest as contiguous node arrays (global node ids, leaves point at themselves)."""
+
+    def __init__(self, trees, n_features):
+        """Concatenate ``TreeArrays`` into one node table."""
+        trees = list(trees)
+        self.n_trees = len(trees)
+        self.n_features = n_features
+        counts = np.array([len(tree.feature) for tree in trees])
+        offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        self.roots = offsets.astype(np.int64)
+
+        self.feature = np.concatenate([tree.feature for tree in trees]).astype(np.int64)
+        self.threshold = np.concatenate([tree.threshold for tree in trees])
+        self.value = np.concatenate([tree.value for tree in trees]).astype(np.float64)
+        left = np.concatenate([tree.children_left + offset for tree, offset in zip(trees, offsets)])
+        right = np.concatenate([tree.children_right + offset for tree, offset in zip(trees, offsets)])
+        # Leaves (child -1) point at themselves; their feature is irrelevant but must be a valid column
+        node_ids = np.arange(len(self.feature))
+        self.is_leaf = np.concatenate([tree.children_left == -1 for tree in trees])
+        self.left = np.where(self.is_leaf, node_ids, left).astype(np.int64)
+        self.right = np.where(self.is_leaf, node_ids, right).astype(np.int64)
+        self.feature[self.is_leaf] = 0
+        self.n_nodes = len(self.feature)
+
+    @classmethod
+    def from_model(cls, model):
+        if model.n_outputs_ != 1:
+            raise ValueError("FlatForest only supports single-output regression forests")
+        return cls(sklearn_tree_arrays(model), model.n_features_in_)
+
+    @property
+    def nbytes(self):
+        return sum(a.nbytes for a in (self.roots, self.feature, self.threshold, self.value,
+                                      self.left, self.right, self.is_leaf))
+
+    def _leaves(self, X):
+        """Leaf node of every (row, tree) pair, shape ``(len(X), n_trees)``."""
+        n = len(X)
+        nodes = np.tile(self.roots, n)
+        rows = np.repeat(np.arange(n, dtype=np.int64), self.n_trees)
+        active = np.flatnonzero(~self.is_leaf[nodes])
+        flat_X = X.ravel()
+        while len(active):
+            current = nodes[active]
+            x = flat_X[rows[active] * self.n_features + self.feature[current]]
+            current = np.where(x <= self.threshold[current], self.left[current], self.right[current])
+            nodes[active] = current
+            active = active[~self.is_leaf[current]]
+        return nodes.reshape(n, self.n_trees)
+
+    def predict(self, X):
+        """Same as ``model.predict(X)`` for a 2-D array in the model's column order."""
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"Expected an (n, {self.n_features}) feature array, got shape {X.shape}")
+        if not np.isfinite(X).all():
+            raise ValueError("Input X contains NaN or infinity (or a value too large for float32); "
+                             "the forest does not accept missing values")
+        chunk_rows = max(1, FLAT_FOREST_CHUNK_PAIRS // self.n_trees)
+        out = np.empty(len(X))
+        for start in range(0, len(X), chunk_rows):
+            leaf_values = self.value[self._leaves(X[start:start + chunk_rows])]
+            # Sequential sum in estimator order, then the mean, exactly as the forest accumulates
+            out[start:start + chunk_rows] = np.cumsum(leaf_values, axis=1)[:, -1] / self.n_trees
+        return out
+
+
+class CompactForest(FlatForest):
+    """A ``FlatForest`` in compact dtypes that keeps node covers for explanations.
+
+    Thresholds are float32, rounded down to the largest float32 not above the
+    original float64 threshold, so ``x <= threshold`` decides every float32
+    input exactly as the full tree does. Node ids are int32, features int16
+    and covers float32; leaf values stay float64. Impurities, sample counts,
+    estimator parameters and the rest of sklearn's training state are dropped.
+    """
+
+    def __init__(self, trees, n_features, source=None):
+        trees = list(trees)
+        super().__init__(trees, n_features)
+        index_dtype = np.int32 if self.n_nodes < 2 ** 31 else np.int64
+        self.roots = self.roots.astype(index_dtype)
+        self.left = self.left.astype(index_dtype)
+        self.right = self.right.astype(index_dtype)
+        self.feature = self.feature.astype(np.int16 if n_features < 2 ** 15 else np.int32)
+        self.threshold = _float32_floor(self.threshold)
+        self.cover = np.concatenate([tree.cover for tree in trees]).astype(np.float32)
+        self.n_features_in_ = n_features
+        self.source = dict(source or {})  # How it was built (for the model report)
+
+    @property
+    def nbytes(self):
+        return super().nbytes + self.cover.nbytes
+
+    @property
+    def max_depth(self):
+        depth = np.zeros(self.n_nodes, dtype=np.int64)
+        for node in range(self.n_nodes):  # Children always come after their parent
+            if not self.is_leaf[node]:
+                depth[self.left[node]] = depth[self.right[node]] = depth[node] + 1
+        return int(depth.max())
+
+    def tree_arrays(self):
+        """``TreeArrays`` of every tree, in sklearn's layout (local ids, -1 at leaves)."""
+        ends = np.append(self.roots[1:], self.n_nodes)
+        for start, end in zip(self.roots, ends):
+            leaf = self.is_leaf[start:end]
+            yield TreeArrays(
+                np.where(leaf, -1, self.left[start:end] - start),
+                np.where(leaf, -1, self.right[start:end] - start),
+                np.where(leaf, -2, self.feature[start:end]),
+                self.threshold[start:end].astype(np.float64),
+                self.cover[start:end].astype(np.float64),
+                self.value[start:end],
+            )
+
+
+def _float32_floor(values):
+    """The largest float32 not above each float64 value."""
+    rounded = values.astype(np.float32)
+    above = rounded.astype(np.float64) > values
+    rounded[above] = np.nextafter(rounded[above], np.float32(-np.inf))
+    return rounded
+
+
+def _prune_tree(tree, max_depth):
+    """``TreeArrays`` of ``tree`` cut at ``max_depth`` (deeper subtrees become leaves), pre-order ids."""
+    old_ids, parents, depths = [], [], []
+    stack = [(0, -1, 0)]
+    while stack:
+        node, parent, depth = stack.pop()
+        old_ids.append(node)
+        parents.append(parent)
+        depths.append(depth)
+        if tree.children_left[node] != -1 and (max_depth is None or depth < max_depth):
+            new_id = len(old_ids) - 1
+            # Right pushed first so the left child gets the next id, as in sklearn's trees
+            stack.append((tree.children_right[node], new_id, depth + 1))
+            stack.append((tree.children_left[node], new_id, depth + 1))
+
+    old_ids = np.array(old_ids)
+    left = np.full(len(old_ids), -1)
+    right = np.full(len(old_ids), -1)
+    for new_id, (old_id, parent) in enumerate(zip(old_ids, parents)):
+        if parent >= 0:
+            if tree.children_left[old_ids[parent]] == old_id:
+                left[parent] = new_id
+            else:
+                right[parent] = new_id
+    leaf = left == -1
+    return TreeArrays(
+        left, right,
+        np.where(leaf, -2, tree.feature[old_ids]),
+        np.where(leaf, -2.0, tree.threshold[old_ids]),
+        tree.cover[old_ids],
+        tree.value[old_ids],  # Internal nodes hold the mean of their samples
+    )
+
+
+def compact_forest(model, n_trees=None, max_depth=None):
+    """A ``CompactForest`` of a fitted forest's first ``n_trees`` trees, cut at ``max_depth``.
+
+    The trees of a random forest are exchangeable, so dropping the last ones
+    only removes averaging. A node at ``max_depth`` becomes a leaf predicting
+    the mean of its training samples, which sklearn already stores.
+    """
+    trees = list(tree_arrays(model))
+    n_trees = len(trees) if n_trees is None else int(n_trees)
+    if not 1 <= n_trees <= len(trees):
+        raise ValueError(f"n_trees must be between 1 and {len(trees)}, got {n_trees}")
+    if max_depth is not None and max_depth < 1:
+        raise ValueError(f"max_depth must be at least 1, got {max_depth}")
+    pruned = [_prune_tree(tree, max_depth) for tree in trees[:n_trees]]
+    return CompactForest(pruned, model.n_features_in_,
+                         source={"n_trees": n_trees, "max_depth": max_depth, "source_trees": len(trees)})
+
+
+def _is_flattenable(model):
+    from sklearn.ensemble import ExtraTreesRegressor, RandomForestRegressor
+    from sklearn.tree import DecisionTreeRegressor, ExtraTreeRegressor
+
+    # Both average their trees' leaf values; only the way the splits were chosen differs
+    return (isinstance(model, (RandomForestRegressor, ExtraTreesRegressor))
+            and all(type(estimator) in (DecisionTreeRegressor, ExtraTreeRegressor)
+                    for estimator in model.estimators_))
+
+
+_flat_lock = threading.Lock()
+_flat_by_model = {}  # id(model) -> (model, FlatForest or None); one model per registry version
+
+
+def flat_forest(model):
+    """The model's ``FlatForest`` (built once per model object), or None if it cannot be flattened."""
+    if isinstance(model, FlatForest):
+        return model
+    entry = _flat_by_model.get(id(model))
+    if entry is not None and entry[0] is model:
+        return entry[1]
+    with _flat_lock:
+        entry = _flat_by_model.get(id(model))
+        if entry is None or entry[0] is not model:
+            with timed("forest.flatten"):
+                flat = FlatForest.from_model(model) if _is_flattenable(model) else None
+            _flat_by_model.clear()  # Drop the previous model's arrays
+            _flat_by_model[id(model)] = (model, flat)
+            entry = _flat_by_model[id(model)]
+    return entry[1]
+
+
+def forest_predict(model, X, max_flat_rows=FLAT_FOREST_MAX_ROWS):
+    """``model.predict(X)``, through the model's ``FlatForest`` for small batches.
+
+    A ``CompactForest`` has no sklearn fallback and always predicts itself.
+    Batches with NaN or infinity always go to ``model.predict``.
+    """
+    if isinstance(model, FlatForest):
+        return model.predict(X)
+    small = len(X) <= max_flat_rows and np.isfinite(np.asarray(X, dtype=np.float32)).all()
+    flat = flat_forest(model) if small else None
+    return flat.predict(X) if flat is not None else model.predict(X)
@@ -0,0 +1,77 @@
+"""Deferred imports for the dashboard's heavy optional libraries.
+
+Most pages need at most one or two of matplotlib, folium, altair, reportlab
+and friends, yet a module-level ``import`` pays for them as soon as the page
+module is imported. ``lazy_import`` returns a stand-in that performs the real
+import the first time an attribute is accessed::
+
+    plt = lazy_import("matplotlib.pyplot")
+    ...
+    fig, ax = plt.subplots()   # matplotlib is imported here, once per process
+
+The wall time of each first import is recorded so the admin page (and
+``scripts/import_report.py``) can show what a cold page actually cost.
+"""
+import importlib
+import sys
+import threading
+import time
+
+_import_times = {}
+_lock = threading.Lock()
+
+
+class LazyModule:
+    """Module stand-in that imports ``name`` on first attribute access."""
+
+    def __init__(self, name):
+        self.__dict__["_lazy_name"] = name
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = load_module(self.__dict__["_lazy_name"])
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module {self.__dict__['_lazy_name']!r} ({state})>"
+
+
+def load_module(name):
+    """Import ``name`` now, recording how long the first import took."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    with _lock:
+        already_loaded = name in sys.modules
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        if not already_loaded and name not in _import_times:
+            _import_times[name] = time.perf_counter() - start
+    return module
+
+
+def lazy_import(name):
+    """Return a stand-in for module ``name`` that is imported when first used."""
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
+
+
+def import_stats():
+    """Return one dict per deferred import that has happened in this process."""
+    return [
+        {"Module": name, "First Import (ms)": round(seconds * 1000, 1)}
+        for name, seconds in sorted(_import_times.items(), key=lambda item: -item[1])
+    ]
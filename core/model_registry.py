@@ -0,0 +1,403 @@
+"""Process-wide registry for the ROI model artifacts.
+
+Streamlit re-executes the dashboard script on every widget interaction, so
+calling ``joblib.load`` at the top of the script re-reads and re-unpickles the
+RandomForest on every rerun of every session. The registry keeps a single copy
+of each artifact per server process and only reloads an artifact when its
+content on disk actually changes.
+
+Change detection is two-staged to keep the per-rerun cost negligible:
+``os.stat`` (mtime + size) is checked on every access, and only when that
+changes is the file re-hashed. The artifact is reloaded only if the SHA-256
+differs, so a plain ``touch`` does not trigger an unpickle.
+
+Artifacts can also be published as versions: ``MODEL_DIR/versions/<id>/``
+holds one complete artifact set and a ``manifest.json`` (file hashes, feature
+list, metrics), and ``MODEL_DIR/CURRENT`` names the version in use. A version
+directory is written under a temporary name and renamed into place, and the
+pointer is replaced with ``os.replace``, so a reader sees either the old or
+the new version, never a partial one. Without ``CURRENT`` the files directly
+in ``MODEL_DIR`` are used.
+
+The registry swaps whole artifact sets. ``current()`` returns the version and
+the ``(model, transformer, features)`` of one set, so nothing mixes the old
+model with the new feature list. When the pointer moves, the next rerun
+of any session loads the new set, checking every file against the manifest,
+and then swaps it in with a single assignment. Sessions keep running, and
+the caches tagged with the old version (``PredictionCache``) empty themselves
+on their next lookup. A version that fails to load or verify is logged and
+skipped, and the previous set stays in use until the pointer moves again.
+"""
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+
+from core.config import ROI_MODEL_FILES, ROI_MODEL_VARIANT
+
+logger = logging.getLogger(__name__)
+
+MODEL_DIR = "models"
+
+if ROI_MODEL_VARIANT not in ROI_MODEL_FILES:
+    raise ValueError(f"ROI_MODEL_VARIANT must be one of {sorted(ROI_MODEL_FILES)}, got {ROI_MODEL_VARIANT!r}")
+
+# Logical artifact name -> file name inside MODEL_DIR
+ARTIFACT_FILES = {
+    "model": ROI_MODEL_FILES[ROI_MODEL_VARIANT],  # RandomForestRegressor, or CompactForest (lite)
+    "transformer": "roi_transformer.pkl",       # PowerTransformer for inverse transformation
+    "features": "model_features.pkl",           # List of features the model was trained on
+}
+
+# Versioned layout inside MODEL_DIR
+VERSIONS_DIR = "versions"
+CURRENT_FILE = "CURRENT"
+MANIFEST_FILE = "manifest.json"
+# Every file a version may hold (both model variants)
+VERSION_FILES = sorted(set(ROI_MODEL_FILES.values()) | {ARTIFACT_FILES["transformer"], ARTIFACT_FILES["features"]})
+
+
+def _current_rss_bytes():
+    """Return the resident set size of this process in bytes (best effort)."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        # ru_maxrss is the peak RSS (KiB on Linux), the closest portable fallback
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except ImportError:
+        return 0
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """Return the hex SHA-256 digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class LoadedArtifact:
+    """A loaded artifact plus the bookkeeping needed to detect changes."""
+    name: str
+    path: str
+    obj: object
+    sha256: str
+    size_bytes: int
+    mtime: float
+    load_seconds: float
+    rss_delta_bytes: int
+    loaded_at: float = field(default_factory=time.time)
+    reloads: int = 0
+
+
+class ModelRegistry:
+    """Loads each model artifact once per process and hot-swaps the set on change."""
+
+    def __init__(self, model_dir=MODEL_DIR, artifact_files=None):
+        self.model_dir = model_dir
+        self.artifact_files = dict(artifact_files or ARTIFACT_FILES)
+        self._artifacts = {}  # name -> LoadedArtifact; replaced as a whole, never mutated
+        self._pointer_state = (None, None)  # (stat key of CURRENT, version id)
+        self._failed_dir = None  # Version directory that failed to load; not retried
+        self._swaps = 0
+        self._lock = threading.RLock()
+
+    @property
+    def version_id(self):
+        """Version named by ``CURRENT``, or None when the flat layout is used."""
+        path = os.path.join(self.model_dir, CURRENT_FILE)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        pointer_key, version_id = self._pointer_state
+        if key != pointer_key:
+            with open(path) as f:
+                version_id = f.read().strip() or None
+            self._pointer_state = (key, version_id)
+        return version_id
+
+    def artifact_dir(self):
+        """Directory of the artifact set currently selected on disk."""
+        version_id = self.version_id
+        return self.model_dir if version_id is None else os.path.join(self.model_dir, VERSIONS_DIR, version_id)
+
+    def path_for(self, name):
+        return os.path.join(self.artifact_dir(), self.artifact_files[name])
+
+    def _load(self, name, path, stat, sha256, previous=None):
+        import joblib  # Pulled in with the first model load, not with every page that imports the registry
+
+        rss_before = _current_rss_bytes()
+        start = time.perf_counter()
+        obj = joblib.load(path)
+        load_seconds = time.perf_counter() - start
+        artifact = LoadedArtifact(
+            name=name,
+            path=path,
+            obj=obj,
+            sha256=sha256,
+            size_bytes=stat.st_size,
+            mtime=stat.st_mtime,
+            load_seconds=load_seconds,
+            rss_delta_bytes=max(0, _current_rss_bytes() - rss_before),
+            reloads=previous.reloads + 1 if previous else 0,
+        )
+        logger.info("Loaded %s from %s in %.1f ms (sha256 %s)",
+                    name, path, load_seconds * 1000, sha256[:12])
+        return artifact
+
+    def _unchanged(self, artifacts, artifact_dir):
+        """Whether ``artifacts`` is a complete set loaded from ``artifact_dir`` whose files did not change."""
+        if len(artifacts) != len(self.artifact_files):
+            return False
+        for name, file_name in self.artifact_files.items():
+            artifact = artifacts[name]
+            path = os.path.join(artifact_dir, file_name)
+            if artifact.path != path:
+                return False
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                return False
+            if (artifact.mtime, artifact.size_bytes) != (stat.st_mtime, stat.st_size):
+                return False
+        return True
+
+    def _load_set(self, artifact_dir, previous):
+        """Load the artifact set in ``artifact_dir``, reusing objects whose content is unchanged."""
+        manifest = read_manifest(artifact_dir) if artifact_dir != self.model_dir else None
+        loaded = {}
+        for name, file_name in self.artifact_files.items():
+            path = os.path.join(artifact_dir, file_name)
+            stat = os.stat(path)
+            artifact = previous.get(name)
+            if artifact is not None and artifact.path == path and (artifact.mtime, artifact.size_bytes) == (
+                    stat.st_mtime, stat.st_size):
+                loaded[name] = artifact
+                continue
+            sha256 = file_sha256(path)
+            if manifest is not None and manifest["files"].get(file_name, {}).get("sha256") != sha256:
+                raise ValueError(f"{path} does not match the SHA-256 in its version manifest")
+            if artifact is not None and artifact.sha256 == sha256:
+                # Touched, or the same file in another version: remember the new location, keep the object
+                loaded[name] = dataclasses.replace(artifact, path=path, mtime=stat.st_mtime,
+                                                   size_bytes=stat.st_size)
+            else:
+                loaded[name] = self._load(name, path, stat, sha256, previous=artifact)
+        return loaded
+
+    def _current_set(self):
+        """The loaded artifact set of the current version, swapping in a new one if it changed."""
+        artifacts = self._artifacts
+        artifact_dir = self.artifact_dir()
+        # Fast path: same version and nothing changed on disk since the last check
+        if artifact_dir == self._failed_dir or self._unchanged(artifacts, artifact_dir):
+            return artifacts
+
+        with self._lock:
+            artifacts = self._artifacts
+            artifact_dir = self.artifact_dir()
+            if artifact_dir == self._failed_dir or self._unchanged(artifacts, artifact_dir):
+                return artifacts
+            try:
+                loaded = self._load_set(artifact_dir, artifacts)
+            except Exception:
+                if len(artifacts) != len(self.artifact_files):
+                    raise  # Nothing to fall back to
+                logger.exception("Could not load the model artifacts in %s; keeping %s",
+                                 artifact_dir, os.path.dirname(artifacts["model"].path))
+                if artifact_dir != self.model_dir:
+                    self._failed_dir = artifact_dir  # Versions are immutable; retry only once the pointer moves
+                return artifacts
+            if artifacts and any(loaded[name] is not artifacts.get(name) for name in loaded):
+                self._swaps += 1
+                logger.info("Switched model artifacts to %s", artifact_dir)
+            self._failed_dir = None
+            self._artifacts = loaded  # One assignment: readers see the old set or the new one
+            return loaded
+
+    @staticmethod
+    def _version_of(artifacts):
+        digest = hashlib.sha256()
+        for name in sorted(artifacts):
+            digest.update(artifacts[name].sha256.encode())
+        return digest.hexdigest()[:16]
+
+    def current(self):
+        """``(version, (model, transformer, features))`` of one consistent artifact set.
+
+        Use this rather than ``version`` followed by ``load_all`` when the
+        version tags something computed from the artifacts, so that both come
+        from the same set even if a swap happens in between.
+        """
+        artifacts = self._current_set()
+        return self._version_of(artifacts), (
+            artifacts["model"].obj, artifacts["transformer"].obj, artifacts["features"].obj)
+
+    def get(self, name):
+        """Return the loaded object for ``name`` from the current artifact set."""
+        return self._current_set()[name].obj
+
+    def load_all(self):
+        """Return ``(model, transformer, features)`` in the order the dashboard uses them."""
+        return self.current()[1]
+
+    @property
+    def version(self):
+        """Combined content hash of the current artifact set; changes whenever any artifact does."""
+        return self._version_of(self._current_set())
+
+    @property
+    def swaps(self):
+        """Artifact sets swapped in since the process started."""
+        return self._swaps
+
+    def stats(self):
+        """Return one dict per loaded artifact for display on the admin page."""
+        return [
+            {
+                "Artifact": a.name,
+                "File": a.path,
+                "SHA-256": a.sha256[:12],
+                "Size (KB)": round(a.size_bytes / 1024, 1),
+                "Load Time (ms)": round(a.load_seconds * 1000, 1),
+                "RSS Increase (MB)": round(a.rss_delta_bytes / (1024 * 1024), 2),
+                "Loaded At": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(a.loaded_at)),
+                "Reloads": a.reloads,
+            }
+            for a in self._artifacts.values()
+        ]
+
+
+def read_manifest(version_dir):
+    """The ``manifest.json`` of a version directory."""
+    with open(os.path.join(version_dir, MANIFEST_FILE)) as f:
+        return json.load(f)
+
+
+def list_versions(model_dir=MODEL_DIR):
+    """Manifests of the published versions, newest first, with ``active`` set on the current one."""
+    versions_dir = os.path.join(model_dir, VERSIONS_DIR)
+    try:
+        names = os.listdir(versions_dir)
+    except FileNotFoundError:
+        return []
+    current = ModelRegistry(model_dir).version_id
+    versions = []
+    for name in names:
+        try:
+            manifest = read_manifest(os.path.join(versions_dir, name))
+        except (OSError, ValueError):
+            continue  # A version still being written, or not a version
+        manifest["active"] = name == current
+        versions.append(manifest)
+    return sorted(versions, key=lambda m: m["version"], reverse=True)  # Ids start with the timestamp
+
+
+def activate_version(version_id, model_dir=MODEL_DIR):
+    """Point ``CURRENT`` at ``version_id`` (atomically); running dashboards switch on their next rerun."""
+    version_dir = os.path.join(model_dir, VERSIONS_DIR, version_id)
+    if read_manifest(version_dir).get("version") != version_id:
+        raise ValueError(f"{version_dir} is not the published version {version_id!r}")
+    # A temporary file of its own per call: sessions of one server may activate concurrently
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{CURRENT_FILE}.", suffix=".tmp", dir=model_dir)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(version_id + "\n")
+        os.replace(tmp_path, os.path.join(model_dir, CURRENT_FILE))
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    logger.info("Activated model version %s", version_id)
+
+
+def publish_version(source_dir, model_dir=MODEL_DIR, metadata=None, activate=True):
+    """Copy the artifacts in ``source_dir`` into a new version directory, optionally activating it.
+
+    Args:
+        source_dir (str): Directory holding ``model_features.pkl``, the
+            transformer and at least one model variant (``VERSION_FILES``).
+        model_dir (str): Registry directory the version is published in.
+        metadata (dict, optional): Extra manifest fields (e.g. ``metrics``).
+        activate (bool): Point ``CURRENT`` at the new version.
+
+    Returns:
+        str: The new version id (``<timestamp>-<hash>``).
+    """
+    import joblib
+
+    files = [name for name in VERSION_FILES if os.path.exists(os.path.join(source_dir, name))]
+    required = {ARTIFACT_FILES["transformer"], ARTIFACT_FILES["features"]}
+    if not required <= set(files) or not set(files) & set(ROI_MODEL_FILES.values()):
+        raise FileNotFoundError(f"{source_dir} needs {sorted(required)} and a model file "
+                                f"({', '.join(ROI_MODEL_FILES.values())})")
+
+    versions_dir = os.path.join(model_dir, VERSIONS_DIR)
+    os.makedirs(versions_dir, exist_ok=True)
+    tmp_dir = os.path.join(versions_dir, f".tmp{os.getpid()}-{time.time_ns()}")
+    os.makedirs(tmp_dir)
+    try:
+        hashes = {}
+        for name in files:
+            shutil.copyfile(os.path.join(source_dir, name), os.path.join(tmp_dir, name))
+            hashes[name] = file_sha256(os.path.join(tmp_dir, name))
+        combined = hashlib.sha256("".join(hashes[name] for name in files).encode()).hexdigest()
+        version_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{combined[:8]}"
+        manifest = {
+            **(metadata or {}),
+            "version": version_id,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "files": {name: {"sha256": hashes[name], "bytes": os.path.getsize(os.path.join(tmp_dir, name))}
+                      for name in files},
+            "features": list(joblib.load(os.path.join(tmp_dir, ARTIFACT_FILES["features"]))),
+        }
+        with open(os.path.join(tmp_dir, MANIFEST_FILE), "w") as f:
+            json.dump(manifest, f, indent=2, default=str)
+        version_dir = os.path.join(versions_dir, version_id)
+        if os.path.exists(version_dir):
+            raise FileExistsError(f"Version {version_id} already exists")
+        os.rename(tmp_dir, version_dir)  # Also fails rather than overwrite one published meanwhile
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    logger.info("Published model version %s from %s", version_id, source_dir)
+    if activate:
+        activate_version(version_id, model_dir)
+    return version_id
+
+
+_registry = ModelRegistry()
+
+
+def get_registry():
+    """Return the process-wide registry shared by all sessions."""
+    return _registry
+
+
+def load_model_artifacts():
+    """Return ``(model, transformer, features)`` from the shared registry."""
+    return _registry.load_all()
+
+
+def process_rss_mb():
+    """Current resident memory of the server process in MB."""
+    return _current_rss_bytes() / (1024 * 1024)
@@ -0,0 +1,199 @@
+"""ROI predictions from the shared model, one scenario or many at a time.
+
+``predict_roi_batch`` is the entry point for anything that scores more than one
+scenario (sensitivity sweeps, grid explorers, bulk uploads): it encodes every
+scenario in one pass, calls ``model.predict`` once per chunk and applies the
+inverse power transform to the whole result vector, instead of paying the
+per-call overhead of the forest and the transformer for every row. Single rows
+and small batches skip sklearn's per-call overhead altogether: they are scored
+by the forest's flattened node arrays (``core/forest.py``), which give
+bit-identical results.
+
+Single predictions from the shared model go through a process-wide LRU/TTL
+cache keyed on the canonicalised inputs, so the Simulator's repeated
+prediction within a rerun and identical scenarios from other sessions (e.g.
+the same WestProp unit picked via project auto-fill) skip the forest. Entries
+are tagged with the model registry version, so the cache empties itself as
+soon as a new model artifact is loaded. A cache miss is answered from the
+precomputed ROI cube (``core/roi_cube.py``) when the scenario lies on or
+inside its grid, and from the forest otherwise.
+
+With ``PREDICTION_SOCKET`` set, cache misses are sent to the shared
+prediction service instead (``core/prediction_client.py``), and answered
+in-process only when the service is unavailable.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from core.features import CATEGORICAL_FEATURES, FLAG_FEATURES, NUMERIC_FEATURES, get_encoder
+from core.forest import forest_predict
+from core.model_registry import get_registry, load_model_artifacts
+from core.prediction_client import get_prediction_client, remote_call
+from core.roi_cube import cube_predict
+
+# Rows per model.predict call. Bounds the float32 copy sklearn makes of the
+# input (~400 bytes per row for the current 98 features).
+PREDICT_CHUNK_ROWS = 50_000
+
+PREDICTION_CACHE_SIZE = 4096
+PREDICTION_CACHE_TTL_SECONDS = 3600
+
+
+class PredictionCache:
+    """Bounded LRU cache with per-entry expiry and hit/miss counters."""
+
+    def __init__(self, maxsize=PREDICTION_CACHE_SIZE, ttl=PREDICTION_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()  # key -> (value, expires_at)
+        self._lock = threading.Lock()
+
+    def _check_version(self, version):
+        if version != self.version:
+            if self.version is not None:
+                self.invalidations += 1
+            self._entries.clear()
+            self.version = version
+
+    def get(self, key, version):
+        """Return the cached value for ``key`` or None, counting the hit or miss."""
+        with self._lock:
+            self._check_version(version)
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]  # Expired
+            self.misses += 1
+            return None
+
+    def put(self, key, value, version):
+        with self._lock:
+            self._check_version(version)
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "Entries": len(self._entries),
+            "Max Entries": self.maxsize,
+            "TTL (s)": self.ttl,
+            "Hits": self.hits,
+            "Misses": self.misses,
+            "Hit Ratio (%)": round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            "Model Changes": self.invalidations,
+        }
+
+
+_prediction_cache = PredictionCache()
+
+
+def canonical_key(inputs):
+    """Hashable, normalised form of a scenario: numbers as floats, categories as strings."""
+    return (
+        tuple(float(inputs[name]) for name in NUMERIC_FEATURES + FLAG_FEATURES)
+        + tuple(str(inputs[name]) for name in CATEGORICAL_FEATURES)
+    )
+
+
+def predict_roi_batch(scenarios, artifacts=None, chunk_rows=PREDICT_CHUNK_ROWS):
+    """Predict ROI (%) for many scenarios with one model call per chunk.
+
+    Args:
+        scenarios: Simulator-style input dicts (a list), a DataFrame or dict of
+            columns with the same fields, or an already encoded 2-D array in
+            the model's feature order.
+        artifacts (tuple, optional): ``(model, transformer, features)``;
+            defaults to the shared model registry.
+        chunk_rows (int): Maximum rows passed to ``model.predict`` at once.
+
+    Returns:
+        ndarray: Predicted ROI percentage for every scenario, in input order.
+    """
+    model, pt, model_features = artifacts or load_model_artifacts()
+    if isinstance(scenarios, np.ndarray):
+        X = scenarios
+        if X.ndim != 2 or X.shape[1] != len(model_features):
+            raise ValueError(f"Expected an (n, {len(model_features)}) feature array, got shape {X.shape}")
+    else:
+        X = get_encoder(model_features).encode_many(scenarios)
+
+    if len(X) == 0:
+        return np.empty(0)
+    transformed = np.concatenate([
+        forest_predict(model, X[start:start + chunk_rows]) for start in range(0, len(X), chunk_rows)
+    ])
+    return pt.inverse_transform(transformed.reshape(-1, 1)).ravel()
+
+
+def _predict_one(inputs, artifacts):
+    model, pt, model_features = artifacts
+    row = get_encoder(model_features).encode(inputs).reshape(1, -1)
+    return float(pt.inverse_transform(forest_predict(model, row).reshape(-1, 1))[0, 0])
+
+
+def predict_roi(inputs, artifacts=None):
+    """Predict ROI (%) for a single scenario dict.
+
+    Predictions from the shared registry model are served from the
+    process-wide prediction cache or the ROI cube when possible. Passing
+    ``artifacts`` explicitly bypasses both and always asks the forest.
+    """
+    if artifacts is not None:
+        return _predict_one(inputs, artifacts)
+    if get_prediction_client() is not None:
+        value = _predict_remote(inputs)
+        if value is not None:
+            return value
+
+    version, artifacts = get_registry().current()  # Also picks up a new artifact set before the lookup
+    key = canonical_key(inputs)
+    cached = _prediction_cache.get(key, version)
+    if cached is not None:
+        return cached
+    value = cube_predict(inputs, version)
+    if value is None:
+        value = _predict_one(inputs, artifacts)
+    _prediction_cache.put(key, value, version)
+    return value
+
+
+def _predict_remote(inputs):
+    """Predicted ROI from the prediction service, cached under its model version; None if it did not answer."""
+    key = canonical_key(inputs)
+    version = get_prediction_client().version
+    if version is not None:
+        cached = _prediction_cache.get(key, version)
+        if cached is not None:
+            return cached
+    answer = remote_call("predict", scenarios=[inputs])
+    if answer is None:
+        return None
+    (value,), version = answer
+    _prediction_cache.put(key, value, version)
+    return value
+
+
+def prediction_cache_stats():
+    """Hit/miss counters and size of the shared prediction cache (for the admin page)."""
+    return _prediction_cache.stats()
+
+
+def clear_prediction_cache():
+    _prediction_cache.clear()
@@ -0,0 +1,141 @@
+"""Thin client of the local prediction service (``core/prediction_server.py``).
+
+With ``PREDICTION_SOCKET`` set, ``predict_roi`` and ``explain_roi`` send their
+cache misses to the service on that Unix socket, instead of loading the
+forest into every dashboard process. Each thread keeps one persistent
+connection. Requests and responses are single JSON lines.
+
+The service is optional. If it cannot be reached, times out or answers with
+an error, ``remote_call`` returns None and the caller predicts in-process
+(where an invalid scenario raises its usual error). An unreachable service
+is then left alone for ``PREDICTION_RETRY_SECONDS``, so a stopped service
+costs one failed connect per interval, not one per rerun.
+"""
+import json
+import logging
+import socket
+import threading
+import time
+
+from core.config import PREDICTION_SOCKET
+
+logger = logging.getLogger(__name__)
+
+PREDICTION_TIMEOUT_SECONDS = 2.0
+PREDICTION_RETRY_SECONDS = 5.0
+
+
+class PredictionServiceError(Exception):
+    """The prediction service could not answer a request."""
+
+
+class PredictionServiceUnavailable(PredictionServiceError):
+    """The prediction service could not be reached or did not answer in time."""
+
+
+class PredictionClient:
+    """JSON-lines client of the prediction service, one connection per thread."""
+
+    def __init__(self, socket_path, timeout=PREDICTION_TIMEOUT_SECONDS):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.version = None  # Model version of the last answer
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+            except OSError:
+                sock.close()
+                raise
+            conn = self._local.conn = (sock, sock.makefile("rb"))
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None:
+            conn[1].close()
+            conn[0].close()
+
+    def call(self, op, **payload):
+        """Send one request and return its ``result``, updating ``version``."""
+        request = (json.dumps({"op": op, **payload}, default=float) + "\n").encode()
+        try:
+            sock, reader = self._connection()
+            sock.sendall(request)
+            line = reader.readline()
+            if not line:
+                raise ConnectionError("The prediction service closed the connection")
+            response = json.loads(line)
+        except (OSError, ValueError) as e:
+            self.close()  # The connection may hold a half-read answer
+            raise PredictionServiceUnavailable(f"{op} via {self.socket_path}: {e}") from e
+        if "error" in response:
+            raise PredictionServiceError(f"{op} via {self.socket_path}: {response['error']}")
+        self.version = response.get("version", self.version)
+        return response["result"]
+
+    def predict(self, scenarios):
+        """Predicted ROI (%) of each scenario dict."""
+        return self.call("predict", scenarios=list(scenarios))
+
+    def explain(self, inputs):
+        """``explain_roi`` of one scenario dict."""
+        return self.call("explain", inputs=inputs)
+
+    def stats(self):
+        return self.call("stats")
+
+
+_client = PredictionClient(PREDICTION_SOCKET) if PREDICTION_SOCKET else None
+_state = {"retry_at": 0.0, "failures": 0, "last_error": None}
+
+
+def get_prediction_client():
+    """The shared client, or None when no service is configured or it is resting after a failure."""
+    if _client is None or time.monotonic() < _state["retry_at"]:
+        return None
+    return _client
+
+
+def remote_call(op, **payload):
+    """``(result, version)`` from the service, or None if the caller should answer in-process."""
+    client = get_prediction_client()
+    if client is None:
+        return None
+    try:
+        result = client.call(op, **payload)
+    except PredictionServiceUnavailable as e:
+        if _state["last_error"] is None:  # Once per outage
+            logger.warning("Prediction service unavailable, predicting in-process: %s", e)
+        _state.update(retry_at=time.monotonic() + PREDICTION_RETRY_SECONDS, last_error=str(e))
+        _state["failures"] += 1
+        return None
+    except PredictionServiceError as e:
+        logger.info("Prediction service rejected the request, answering in-process: %s", e)
+        return None
+    if _state["last_error"] is not None:
+        logger.info("Prediction service reachable again at %s", client.socket_path)
+    _state.update(retry_at=0.0, last_error=None)
+    return result, client.version
+
+
+def prediction_service_status():
+    """Configuration and health of the prediction service connection (for the admin page)."""
+    status = {
+        "Socket": PREDICTION_SOCKET or "not configured (in-process)",
+        "Failures": _state["failures"],
+        "Last Error": _state["last_error"],
+    }
+    client = get_prediction_client()
+    if client is not None:
+        try:
+            status.update(client.stats())
+        except PredictionServiceError as e:
+            status["Last Error"] = str(e)
+    return status
@@ -0,0 +1,260 @@
+"""Local prediction service: one model copy, micro-batched, on a Unix socket.
+
+Every Streamlit process otherwise loads its own forest and scores one row per
+request. The service keeps a single copy (``get_registry()``, so published
+versions are swapped in as in the dashboard) and answers any number of
+dashboard processes through ``core/prediction_client.py``.
+
+Requests are JSON lines on a persistent connection:
+
+* ``{"op": "predict", "scenarios": [...]}`` -> ``{"result": [roi, ...], "version": ...}``
+* ``{"op": "explain", "inputs": {...}}`` -> ``{"result": <explain_roi dict>, "version": ...}``
+* ``{"op": "stats"}`` -> counters of the batcher.
+
+``predict`` requests go through ``MicroBatcher``. Every request that arrives
+while the model is idle (within ``BATCH_WINDOW_MS``, by default the current
+turn of the event loop) or while a batch is being scored, up to
+``MAX_BATCH_ROWS`` rows, is scored with a single ``predict_roi_batch`` call
+on a worker thread. So a lone request is answered at once, and under load
+batches grow with the number of waiting requests. If a batch fails, its requests
+are retried one at a time, so one bad scenario only fails its own request.
+
+The server is built on ``asyncio`` from the standard library, so it needs no
+web framework and can be started in-process (``start_in_thread``) by
+benchmarks and tests. Run it with ``scripts/prediction_server.py``.
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.explanations import explain_roi
+from core.model_registry import get_registry
+from core.prediction import predict_roi_batch
+
+logger = logging.getLogger(__name__)
+
+# Extra wait for company when the model is idle; under load batches form while the previous one is scored
+BATCH_WINDOW_MS = 0.0
+MAX_BATCH_ROWS = 256
+# Longest request line accepted (asyncio's default is 64 KiB, about 150 scenarios)
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+
+class MicroBatcher:
+    """Collects concurrent ``predict`` requests and scores each batch with one model call."""
+
+    def __init__(self, executor, window_ms=BATCH_WINDOW_MS, max_rows=MAX_BATCH_ROWS):
+        self.executor = executor
+        self.window = window_ms / 1000
+        self.max_rows = max_rows
+        self._pending = []  # (scenarios, future)
+        self._pending_rows = 0
+        self._timer = None
+        self._busy = False  # A batch is being scored
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.largest_batch = 0
+        self.errors = 0
+
+    async def predict(self, scenarios):
+        """``(roi values, model version)`` of ``scenarios``, scored together with concurrent requests."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((scenarios, future))
+        self._pending_rows += len(scenarios)
+        self.requests += 1
+        if self._pending_rows >= self.max_rows:
+            self._flush()
+        elif self._timer is None and not self._busy:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._busy or not self._pending:
+            return  # The running batch flushes what collected meanwhile when it finishes
+        batch, self._pending, self._pending_rows = self._pending, [], 0
+        self._busy = True
+        asyncio.get_running_loop().create_task(self._run(batch))
+
+    async def _run(self, batch):
+        try:
+            await self._score_batch(batch)
+        finally:
+            self._busy = False
+            self._flush()
+
+    async def _score_batch(self, batch):
+        loop = asyncio.get_running_loop()
+        scenarios = [row for request, _ in batch for row in request]
+        self.batches += 1
+        self.rows += len(scenarios)
+        self.largest_batch = max(self.largest_batch, len(scenarios))
+        try:
+            values, version = await loop.run_in_executor(self.executor, _score, scenarios)
+        except Exception as e:
+            if len(batch) == 1:
+                self.errors += 1
+                batch[0][1].set_exception(e)
+                return
+            for request, future in batch:  # One at a time, so only the failing request fails
+                try:
+                    future.set_result(await loop.run_in_executor(self.executor, _score, request))
+                except Exception as e:
+                    self.errors += 1
+                    future.set_exception(e)
+            return
+        start = 0
+        for request, future in batch:
+            future.set_result((values[start:start + len(request)], version))
+            start += len(request)
+
+    def stats(self):
+        return {
+            "Requests": self.requests,
+            "Rows": self.rows,
+            "Batches": self.batches,
+            "Mean Batch Rows": round(self.rows / self.batches, 1) if self.batches else 0.0,
+            "Largest Batch": self.largest_batch,
+            "Errors": self.errors,
+        }
+
+
+def _score(scenarios):
+    version, artifacts = get_registry().current()
+    return predict_roi_batch(scenarios, artifacts).tolist(), version
+
+
+def _explain(inputs):
+    version, artifacts = get_registry().current()
+    return explain_roi(inputs, artifacts), version
+
+
+class PredictionServer:
+    """The asyncio Unix-socket server around one ``MicroBatcher``."""
+
+    def __init__(self, socket_path, window_ms=BATCH_WINDOW_MS, max_rows=MAX_BATCH_ROWS):
+        self.socket_path = socket_path
+        # One worker: batches are scored one after another while the next one collects
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prediction")
+        self.batcher = MicroBatcher(self.executor, window_ms, max_rows)
+        self.started_at = time.time()
+        self.connections = 0
+        self._server = None
+        self._handlers = {}  # Connection task -> its writer
+
+    async def _answer(self, request):
+        op = request.get("op")
+        if op == "predict":
+            scenarios = request["scenarios"]
+            if not isinstance(scenarios, list):
+                raise ValueError("scenarios must be a list of input dicts")
+            values, version = await self.batcher.predict(scenarios)
+            return {"result": values, "version": version}
+        if op == "explain":
+            explanation, version = await asyncio.get_running_loop().run_in_executor(
+                self.executor, _explain, request["inputs"])
+            return {"result": explanation, "version": version}
+        if op == "stats":
+            return {"result": {**self.batcher.stats(), "Connections": self.connections,
+                               "Uptime (s)": round(time.time() - self.started_at)}}
+        raise ValueError(f"Unknown op {op!r}")
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        self._handlers[asyncio.current_task()] = writer
+        try:
+            while line := await reader.readline():
+                try:
+                    response = await self._answer(json.loads(line))
+                except Exception as e:  # Reported to the client, which falls back in-process
+                    logger.warning("Prediction request failed: %s", e)
+                    response = {"error": f"{type(e).__name__}: {e}"}
+                writer.write((json.dumps(response) + "\n").encode())
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            self._handlers.pop(asyncio.current_task(), None)
+            writer.close()
+
+    async def start(self):
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)  # Left behind by a previous run
+        get_registry().load_all()  # Load the model before the first request
+        self._server = await asyncio.start_unix_server(self._handle, path=self.socket_path,
+                                                        limit=MAX_REQUEST_BYTES)
+        logger.info("Prediction service listening on %s", self.socket_path)
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def shutdown(self):
+        """Stop accepting connections and drop the open ones (clients then predict in-process)."""
+        if self._server is not None:
+            self._server.close()
+        handlers = dict(self._handlers)
+        for writer in handlers.values():
+            writer.close()  # The handler reads end of file and returns
+        if handlers:
+            await asyncio.wait(handlers, timeout=1.0)
+
+    def close(self):
+        if self._server is not None:
+            self._server.close()
+        self.executor.shutdown(wait=False)
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+def start_in_thread(socket_path, **kwargs):
+    """Run a ``PredictionServer`` on a daemon thread; returns it once it accepts connections.
+
+    Call ``stop()`` on the result to shut it down. If the server cannot start
+    (socket directory missing or not writable, bind or model load failure),
+    the error is raised here.
+    """
+    server = PredictionServer(socket_path, **kwargs)
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    errors = []
+
+    def run():
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(server.start())
+        except Exception as e:  # Raised in the caller's thread
+            errors.append(e)
+        finally:
+            ready.set()
+        if errors:
+            server.executor.shutdown(wait=False)
+            loop.close()
+            return
+        loop.run_forever()
+        server.close()
+        loop.close()
+
+    thread = threading.Thread(target=run, name="prediction-server", daemon=True)
+    thread.start()
+    ready.wait()
+    if errors:
+        thread.join()
+        raise errors[0]
+
+    def stop():
+        asyncio.run_coroutine_threadsafe(server.shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+    server.stop = stop
+    return server
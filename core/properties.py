@@ -0,0 +1,544 @@
+"""Static WestProp project and property data used across the dashboard pages.
+
+Built once per server process on first import instead of on every rerun.
+"""
+import pandas as pd
+
+
+# Property details mapping
+property_details = {
+    # Radisson Aparthotel
+    'radisson_details': {
+        'name': 'Radisson Aparthotel',
+        'type': 'Serviced Apartments',
+        'price': 'From $120,000',
+        'roi': '10-12% p.a.',
+        'rental_yield': '8.5%',
+        'location': 'Borrowdale, Harare',
+        'status': 'Ready for Occupation',
+        'description': 'Luxury serviced apartments with premium amenities and hotel services.',
+        'images': ['project_images/radisson_apartments.webp'],
+        'highlights': [
+            '24/7 Security and Concierge',
+            'Swimming Pool and Gym',
+            'Housekeeping Services',
+            'High-Speed Internet',
+            'Restaurant and Bar',
+            'Conference Facilities'
+        ],
+        'amenities': [
+            'Air Conditioning',
+            'Fully Equipped Kitchen',
+            'Smart TV',
+            'Laundry Services',
+            'Underground Parking',
+            'Backup Solar'
+            'State of the art Gym',
+            'Concierge Services',
+            'Swimming Pool & Spa',
+            'On-site Restaurant & Kitchen'
+        ],
+        'specs': {
+            'Unit Sizes': '45-120 sqm',
+            'Bedrooms': 'Studio, 1, 2, 3 Bed',
+            'Bathrooms': '1-3',
+            'Floors': '3',
+            'Completion': 'Before thend of 2026',
+            'Developer': 'WestProp Holdings',
+            'Units': '148',
+            'Parking': '2 per unit',
+            'Security': '24/7 Armed Response',
+            'Backup Power': 'Yes',
+            'Water': 'Borehole + Mains'
+        },
+        'developer': 'WestProp Holdings',
+        'completion': 'Before the end of 2026',
+        'units': '120',
+        'floors': '15',
+        'yield': '8.5%',
+        'payment_plan': 'Low-entry ownership from just $500 per unit',
+        'contact': 'sales@westprop.com | +263 837 701 0170'
+    },
+    # Add other property details here...
+    'pomona_details': {
+        'name': 'Pomona City Flats',
+        'type': '1-3 Bed Apartments',
+        'price': 'From $70,000',
+        'roi': '8-10% p.a.',
+        'rental_yield': '7.5%',
+        'location': 'Pomona, Harare',
+        'status': 'Under Construction',
+        'description': 'Modern, affordable apartments in a growing neighborhood with smart home features.',
+        'images': ['project_images/pomona_city_flats.jpeg'],
+        'highlights': [
+            'Smart Home Features',
+            'Gated Community',
+            'Swimming Pool',
+            'Children\'s Play Area',
+            '24/7 Security',
+            'Backup Power'
+        ],
+        'amenities': [
+            'Gym',
+            'Clubhouse',
+            'Visitor Parking',
+            'Landscaped Gardens',
+            'CCTV',
+            'Borehole Water'
+        ],
+        'specs': {
+            'Unit Sizes': '45-90 sqm',
+            'Bedrooms': '1-2',
+            'Bathrooms': '1-2',
+            'Floors': '8',
+            'Completion': 'TBA',
+            'Developer': 'WestProp Holdings',
+            'Units': '380',
+            'Parking': '1-2 per unit',
+            'Security': '24/7 Guarded',
+            'Backup Power': 'Yes',
+            'Water': 'Borehole + Mains'
+        },
+        'developer': 'WestProp Holdings',
+        'completion': 'TBA',
+        'units': '200',
+        'floors': '4',
+        'yield': '7.5%',
+        'payment_plan': '30% upfront deposit, Balance payable over 18 months, 1.25% monthly interest from Month 3',
+        'early_bird_discounts': {
+            '3% Discount': '30% deposit, 12-month plan (interest starts Month 6)',
+            '5% Discount': '50% deposit, 6-month plan (no interest)'
+        },
+        'contact': 'sales@westprop.com | +263 837 701 0170'
+    },
+    'millennium_details': {
+        'name': 'Millennium Heights',
+        'type': 'Luxury Apartments',
+        'price': 'From $65,000 to $310,000',
+        'roi': '9-11% p.a.',
+        'rental_yield': '8.2%',
+        'location': 'Borrowdale, Harare',
+        'status': 'Ready for Occupation',
+        'description': 'Premium luxury apartments with high-end finishes and panoramic city views.',
+        'images': ['project_images/millennium_heights_b4.jpeg'],
+        'highlights': [
+            'Premium Finishes',
+            'Panoramic Views',
+            'Swimming Pool',
+            'Fitness Center',
+            'Biometric security, & 24/7 Security',
+            'Backup Power & Water',
+            'Gym, ttennis, & basketball courts'
+        ],
+        'amenities': [
+            'Concierge',
+            'Visitor Parking',
+            'Landscaped Gardens',
+            'CCTV',
+            'Elevators',
+            'Borehole Water'
+        ],
+        'specs': {
+            'Unit Sizes': '60-200 sqm',
+            'Bedrooms': '1-3',
+            'Bathrooms': '1-3',
+            'Floors': '4',
+            'Completion': 'TBA-ongoing progress',
+            'Developer': 'WestProp Holdings',
+            'Units': '148',
+            'Parking': '2 per unit',
+            'Security': '24/7 Armed Response',
+            'Backup Power': 'Yes',
+            'Water': 'Borehole + Mains'
+        },
+        'developer': 'WestProp Holdings',
+        'completion': 'TBA-ongoing progress',
+        'units': '86',
+        'floors': '6',
+        'yield': '8.2%',
+        'payment_plan': 'Flexible payment plans available',
+        'contact': 'sales@westprop.com | +263 837 701 0170'
+    },
+    'pokugara_details': {
+        'name': 'Pokugara Townhouses',
+        'type': '3-4 Bed Townhouses',
+        'price': 'From $357,000 to $409,000',
+        'roi': '9-11% p.a.',
+        'rental_yield': '8.0%',
+        'location': 'Borrowdale, Harare',
+        'status': 'Ready for Occupation',
+        'description': 'Spacious townhouses with private gardens in an exclusive gated community.',
+        'images': ['project_images/pokugara_townhouses.jpeg'],
+        'highlights': [
+            'Private Gardens',
+            'Double Garage',
+            'Maid\'s Quarters',
+            '24/7 Security with CCTV',
+            'Solar Backup Powere',
+            'Borehole Water'
+            'Metered LBG central gas connection'
+            'Private Parking'
+            'Turnkey handover with full fittings and finishes (Gas Stove, Tiled, Built In Cupboards, Fitted Kitchen, Walled/Fenced, Veranda, Landscaped Garden)'
+
+        ],
+        'amenities': [
+            'Swimming Pool',
+            'Clubhouse',
+            'Children\'s Play Area',
+            'Jogging Trails',
+            'CCTV',
+            'Visitor Parking'
+            'Braai & Picnic area'
+            'Tennis courts'
+            'Clubhouse for social gatherings'
+        ],
+        'specs': {
+            'Unit Sizes': '200-300 sqm',
+            'Bedrooms': '3-4',
+            'Bathrooms': '3-4',
+            'Floors': '2',
+            'Completion': '2023',
+            'Developer': 'WestProp Holdings',
+            'Units': '50',
+            'Parking': '2-3 per unit',
+            'Security': '24/7 Guarded',
+            'Backup Power': 'Yes',
+            'Water': 'Borehole + Mains',
+            'Land Size': '300-500 sqm'
+        },
+        'developer': 'WestProp Holdings',
+        'completion': 'Final stages, scheduled for handover in 2025',
+        'units': '50',
+        'floors': '2',
+        'yield': '8.0%',
+        'payment_plan': 'Flexible payment plans available',
+        'contact': 'sales@westprop.com | +263 837 701 0170'
+    },
+    'hills_retirement': {
+        'name': 'The Hills Lifestyle Estate',
+        'type': '1-2 Bedroom Retirement Units',
+        'price': 'From $100,000',
+        'roi': '7-9% p.a.',
+        'rental_yield': '6.5%',
+        'location': 'The Hills, Harare',
+        'status': 'Available',
+        'description': 'Exclusive retirement living with premium amenities and healthcare services.',
+        'images': ['project_images/the_hills_estate.png'],
+        'highlights': [
+            '24/7 Security',
+            'Medical Alert System',
+            'Community Center',
+            'Healthcare Services',
+            'Maintenance Included',
+            'Social Activities'
+        ],
+        'amenities': [
+            'Swimming Pool',
+            'Fitness Center',
+            'Library',
+            'Dining Hall',
+            'Gardens',
+            'Emergency Response'
+            'Art studios'
+            'Peaceful gardens'
+            'Spa'
+        ],
+        'specs': {
+            'Unit Sizes': '60-100 sqm',
+            'Bedrooms': '1-2',
+            'Bathrooms': '1-2',
+            'Floors': '1-2 (differs)',
+            'Completion': 'Golf Course (mid-2026) & Overall Estate (by 2050 for the billion brick vision)',
+            'Developer': 'WestProp Holdings',
+            'Units': '119',
+            'Parking': '1-2 per unit',
+            'Security': '24/7 Guarded + CCTV',
+            'Backup Power': 'Yes',
+            'Water': 'Borehole + Mains',
+            'Age Restriction': '55+'
+        },
+        'developer': 'WestProp Holdings',
+        'completion': 'By 2050',
+        'units': '119',
+        'floors': '1-2 (differs)',
+        'yield': '6.5%',
+        'payment_plan': 'Flexible payment plans available',
+        'contact': 'sales@westprop.com | +263 837 701 0170'
+    },
+    'hills_villas_details': {
+        'name': 'The Hills Family Villas',
+        'type': '4-5 Bed Villas',
+        'price': 'From $350,000',
+        'roi': '8-10% p.a.',
+        'rental_yield': '7.5%',
+        'location': 'The Hills, Harare',
+        'status': 'Under Construction',
+        'description': 'Luxury family villas with modern amenities and spacious living areas.',
+        'images': ['project_images/the_hills_villas.jpeg'],
+        'highlights': [
+            'Spacious Layouts',
+            'Private Gardens',
+            'Maid\'s Quarters',
+            'Double Garage',
+            '24/7 Security',
+            'Backup Power & Water'
+        ],
+        'amenities': [
+            'Swimming Pool',
+            'Clubhouse',
+            'Tennis Court',
+            'Children\'s Play Area',
+            'Jogging Trails',
+            'Visitor Parking'
+        ],
+        'specs': {
+            'Unit Sizes': '250-350 sqm',
+            'Bedrooms': '4-5',
+            'Bathrooms': '3-4',
+            'Floors': '2',
+            'Completion': 'By 2050',
+            'Developer': 'WestProp Holdings',
+            'Units': '30',
+            'Parking': '2-3 per unit',
+            'Security': '24/7 Guarded + CCTV',
+            'Backup Power': 'Yes',
+            'Water': 'Borehole + Mains',
+            'Land Size': '500-800 sqm'
+        },
+        'developer': 'WestProp Holdings',
+        'completion': 'By 2050',
+        'units': '30',
+        'floors': '1-2 (differs)',
+        'yield': '7.5%',
+        'payment_plan': 'Flexible payment plans available',
+        'contact': 'sales@westprop.com | +263 837 701 0170'
+    },
+    'pomona_stands_details': {
+        'name': 'Pomona City Stands',
+        'type': 'Residential Stands',
+        'price': 'From $92,950',
+        'roi': 'N/A',
+        'rental_yield': 'N/A',
+        'location': 'Pomona, Harare',
+        'status': 'Available',
+        'description': 'Prime residential stands in a well-planned development with all necessary infrastructure.',
+        'images': ['pomona_city_stands.jpeg'],
+        'highlights': [
+            'Fully Serviced',
+            'Tarred Roads',
+            'Water & Sewer',
+            'Electricity',
+            'Security',
+            'Prime Location'
+        ],
+        'amenities': [
+            'Shopping Center',
+            'Schools',
+            'Medical Facilities',
+            'Recreational Parks',
+            'Easy Access to CBD',
+            'Public Transport'
+        ],
+        'specs': {
+            'Stand Sizes': '300-1000 sqm',
+            'Zoning': 'Residential',
+            'Serviced': 'Yes',
+            'Title Deeds': 'Available',
+            'Development': 'Ongoing',
+            'Completion': 'Ongoing'
+        },
+        'developer': 'WestProp Holdings',
+        'completion': 'N/A',
+        'units': '29',
+        'floors': 'N/A',
+        'yield': 'N/A',
+        'payment_plan': 'Flexible payment plans available',
+        'contact': 'sales@westprop.com | +263 837 701 0170'
+    }
+}
+
+# --- Property Data Structure (from original dashboard) ---
+# This data is now primarily for the Project Profiles page, as the Property Browser
+# and ROI Map use the real_estate_df loaded from CSV.
+properties_data = [
+    {
+        "project": "The Hills Lifestyle Estate",
+        "property_type": "Villa - 4 Bed",
+        "price": 380000, # Starting price might vary
+        "size_sqm": None, # Add if known
+        "bedrooms": 4,
+        "status": "Selling",
+        "amenities": ["Golf Access", "Mall Access", "Wellness Center", "Security", "Scenic Views"],
+        "payment_terms": "30% Deposit, $10k Commit, 24mo Balance (Interest from Mo 6)",
+        "roi_projected": None, # Placeholder
+        "url": "https://www.westprop.com/developments/the-hills/"
+    },
+    {
+        "project": "The Hills Lifestyle Estate",
+        "property_type": "Villa - 5 Bed",
+        "price": 500000, # Example starting price
+        "size_sqm": None, # Add if known
+        "bedrooms": 5,
+        "status": "Selling",
+        "amenities": ["Golf Access", "Mall Access", "Wellness Center", "Security", "Scenic Views"],
+        "payment_terms": "30% Deposit, $10k Commit, 24mo Balance (Interest from Mo 6)",
+        "roi_projected": None,
+        "url": "https://www.westprop.com/developments/the-hills/"
+    },
+     {
+        "project": "The Hills Lifestyle Estate",
+        "property_type": "Residential Stand",
+        "price": 70000, # Starting price
+        "size_sqm": 2000, # Example size
+        "bedrooms": None,
+        "status": "Selling",
+        "amenities": ["Golf Access", "Mall Access", "Wellness Center", "Security", "Scenic Views"],
+        "payment_terms": "30% Deposit, $10k Commit, 24mo Balance (Interest from Mo 6)",
+        "roi_projected": None,
+        "url": "https://www.westprop.com/developments/the-hills/"
+    },
+    {
+        "project": "Radisson Serviced Apartments",
+        "property_type": "Serviced Apartment (REIT)",
+        "price": 500, # Minimum REIT investment
+        "size_sqm": None,
+        "bedrooms": None, # Varies (Studio, 1/2 Bed, Penthouse)
+        "status": "Selling via REIT",
+        "amenities": ["Hotel Services", "Pool", "Gym", "Conference Facilities", "Security"],
+        "payment_terms": "REIT Investment (Seatrite 5 Trust)",
+        "roi_projected": 8.0, # Guaranteed USD return
+        "url": "https://www.westprop.com/developments/millenium-serviced-apartments/" # Note: Link might be broken
+    },
+    {
+        "project": "Millennium Heights Block 4",
+        "property_type": "Apartment - Studio",
+        "price": 65000, # Text price, table shows Sold Out
+        "size_sqm": None,
+        "bedrooms": 0,
+        "status": "Sold Out", # Based on table
+        "amenities": ["Pool", "Gym", "Clubhouse", "Security", "Solar", "Backup Water", "Lock-up Shell"],
+        "payment_terms": "Flexible Payment Plan",
+        "roi_projected": None,
+        "url": "https://www.westprop.com/developments/millenium-heights/apartments-block-4/"
+    },
+    {
+        "project": "Millennium Heights Block 4",
+        "property_type": "Apartment - 1 Bed",
+        "price": 110000, # Table price
+        "size_sqm": 73,
+        "bedrooms": 1,
+        "status": "Selling",
+        "amenities": ["Pool", "Gym", "Clubhouse", "Security", "Solar", "Backup Water", "Lock-up Shell"],
+        "payment_terms": "Flexible Payment Plan",
+        "roi_projected": None,
+        "url": "https://www.westprop.com/developments/millenium-heights/apartments-block-4/"
+    },
+    {
+        "project": "Millennium Heights Block 4",
+        "property_type": "Apartment - 2 Bed",
+        "price": 189000,
+        "size_sqm": 116,
+        "bedrooms": 2,
+        "status": "Selling",
+        "amenities": ["Pool", "Gym", "Clubhouse", "Security", "Solar", "Backup Water", "Lock-up Shell"],
+        "payment_terms": "Flexible Payment Plan",
+        "roi_projected": None,
+        "url": "https://www.westprop.com/developments/millenium-heights/apartments-block-4/"
+    },
+    {
+        "project": "Millennium Heights Block 4",
+        "property_type": "Apartment - 3 Bed",
+        "price": 310000,
+        "size_sqm": None,
+        "bedrooms": 3,
+        "status": "Selling",
+        "amenities": ["Pool", "Gym", "Clubhouse", "Security", "Solar", "Backup Water", "Lock-up Shell"],
+        "payment_terms": "Flexible Payment Plan",
+        "roi_projected": None,
+        "url": "https://www.westprop.com/developments/millenium-heights/apartments-block-4/"
+    },
+    {
+        "project": "Pokugara Townhouses",
+        "property_type": "Townhouse - Garden",
+        "price": 357000,
+        "size_sqm": 190,
+        "bedrooms": 4,
+        "status": "Selling Off-Plan (Limited Units)",
+        "amenities": ["Clubhouse", "Pool", "Gym", "Security", "Solar Provision", "Backup Water", "Private Garden"],
+        "payment_terms": "30% Deposit, $1k Commit, 3-6mo Interest-Free",
+        "roi_projected": None,
+        "url": "https://www.westprop.com/developments/pokugara/"
+    },
+    {
+        "project": "Pokugara Townhouses",
+        "property_type": "Townhouse - Manor",
+        "price": 409000,
+        "size_sqm": 203,
+        "bedrooms": 4,
+        "status": "Selling Off-Plan (Final Unit)",
+        "amenities": ["Clubhouse", "Pool", "Gym", "Security", "Solar Provision", "Backup Water", "Landscaping Space"],
+        "payment_terms": "30% Deposit, $1k Commit, 3-6mo Interest-Free",
+        "roi_projected": None,
+        "url": "https://www.westprop.com/developments/pokugara/"
+    },
+    {
+        "project": "Pomona City",
+        "property_type": "Flat",
+        "price": 125000,  # Example for 1,000 sqm stand (adjust as needed)
+        "size_sqm": 69.72,
+        "bedrooms": None,
+        "status": "Selling",
+        "amenities": [
+            "Gated Community", "24/7 Security", "Smart Tech", "Solar Street Lighting",
+            "Fiber Internet", "Tarred Roads", "Parks", "Water Reticulation", "Playgrounds"
+        ],
+        "payment_terms": "30% Deposit, Balance payable over 18 months, 1.25% monthly interest from Month 3, 3% Discount: 30% deposit, 12-month plan (interest starts Month 6), 5% Discount: 50% deposit, 6-month plan (no interest)",
+        "roi_projected": None,
+        "url": "https://www.westprop.com/developments/pomona-city-flats/"
+    }
+    # 
+]
+
+# Convert to DataFrame for easier filtering
+properties_df = pd.DataFrame(properties_data)
+
+# Extract unique values for filters
+projects = sorted(properties_df["project"].unique())
+property_types = sorted(properties_df["property_type"].unique())
+statuses = sorted(properties_df["status"].unique())
+
+# Get all unique amenities from the lists in the DataFrame
+all_amenities = set()
+for amenities_list in properties_df["amenities"].dropna():
+    all_amenities.update(amenities_list)
+amenities_options = sorted(list(all_amenities))
+
+# --- Project Profiles Data (Images & Descriptions) ---
+project_profiles_info = {
+    "The Hills Lifestyle Estate": {
+        "image": "project_images/the_hills_estate.png", # Adjusted path
+        "description": "Zimbabwe's first integrated luxury golf estate offering villas and residential stands. Features include golf access, mall access, wellness center, and high security.",
+        "url": "https://www.westprop.com/developments/the-hills/"
+    },
+    "Radisson Serviced Apartments": {
+        "image": "project_images/radisson_apartments.webp", # Adjusted path
+        "description": "Luxury serviced apartments managed by Radisson, available through the Seatrite 5 REIT. Offers hotel services, pool, gym, and conference facilities with guaranteed returns.",
+        "url": "https://www.westprop.com/developments/millenium-heights/radisson-serviced-apartments-harare-zimbabwe/"
+    },
+    "Millennium Heights Block 4": {
+        "image": "project_images/millennium_heights_b4.jpeg", # Adjusted path
+        "description": "Dubai-inspired luxury apartments in Borrowdale West. Offers studio to 3-bed units with amenities like pool, gym, clubhouse, solar, and backup water. Lock-up shell options available.",
+        "url": "https://www.westprop.com/developments/millenium-heights/apartments-block-4/"
+    },
+    "Pokugara Townhouses": {
+        "image": "project_images/pokugara_townhouses.jpeg", # Adjusted path
+        "description": "Modern 4-bedroom townhouses (Garden & Manor types) in a secure gated community in Borrowdale West. Features include clubhouse, pool, gym, solar provision, and private gardens/landscaping space.",
+        "url": "https://www.westprop.com/developments/pokugara/"
+    },
+    "Pomona City": {
+        "image": "project_images/pomona_city_flats.jpeg",
+        "description": "A city within a city offering residential stands (800m² - 1,000m²) in a smart, gated community. Blends technology, modern luxury, and nature.",
+        "url": "https://www.westprop.com/developments/residential-stands-in-pomona-city/"
+    }
+    # Add profiles for Pomona City, Warren Hills etc. when data is available
+}
@@ -0,0 +1,102 @@
+"""Predicted-ROI surfaces: the model scored over a 2-D grid of two inputs.
+
+The Simulator's surface explorer holds every input at the current scenario
+except two (e.g. ``sale_price_usd`` x ``building_size_sqm`` or
+``location_suburb`` x ``bedrooms``), expands them into a grid of up to
+``MAX_GRID_STEPS`` x ``MAX_GRID_STEPS`` scenarios and scores the whole grid
+with one ``predict_roi_batch`` call. Finished surfaces are kept in a small
+process-wide cache keyed on the grid spec (base scenario, axes and their
+values) and tagged with the model version, like single predictions.
+"""
+import numpy as np
+
+from core.features import CATEGORICAL_FEATURES, NUMERIC_FEATURES
+from core.model_registry import get_registry
+from core.prediction import PredictionCache, canonical_key, predict_roi_batch
+
+SURFACE_AXES = NUMERIC_FEATURES + CATEGORICAL_FEATURES
+INTEGER_AXES = ("bedrooms", "bathrooms")
+MAX_GRID_STEPS = 200
+
+# A 200 x 200 surface is ~320 KB of float64
+SURFACE_CACHE_SIZE = 32
+SURFACE_CACHE_TTL_SECONDS = 3600
+
+_surface_cache = PredictionCache(maxsize=SURFACE_CACHE_SIZE, ttl=SURFACE_CACHE_TTL_SECONDS)
+
+
+def axis_values(feature, low, high, steps):
+    """Evenly spaced grid values of a numeric axis (whole numbers for room counts)."""
+    steps = int(min(max(steps, 2), MAX_GRID_STEPS))
+    values = np.linspace(float(low), float(high), steps)
+    if feature in INTEGER_AXES:
+        values = np.unique(np.round(values))
+    return values
+
+
+def _normalise(feature, values):
+    if feature in CATEGORICAL_FEATURES:
+        return tuple(str(v) for v in values)
+    return tuple(float(v) for v in values)
+
+
+def grid_scenarios(base_inputs, x_feature, x_values, y_feature, y_values):
+    """Columns of the ``len(y_values) * len(x_values)`` grid scenarios, row-major in y."""
+    nx, ny = len(x_values), len(y_values)
+    n = nx * ny
+    columns = {
+        name: np.full(n, base_inputs[name], dtype=object if name in CATEGORICAL_FEATURES else np.float64)
+        for name in base_inputs
+    }
+    columns[x_feature] = np.tile(np.asarray(x_values, dtype=columns[x_feature].dtype), ny)
+    columns[y_feature] = np.repeat(np.asarray(y_values, dtype=columns[y_feature].dtype), nx)
+    return columns
+
+
+def predict_surface(base_inputs, x_feature, x_values, y_feature, y_values, artifacts=None):
+    """Predicted ROI (%) over the grid of ``x_values`` x ``y_values``.
+
+    Args:
+        base_inputs (dict): Simulator-style scenario supplying every other input.
+        x_feature (str): Input varied along the columns (one of ``SURFACE_AXES``).
+        x_values: Values of ``x_feature`` (numbers, or category names).
+        y_feature (str): Input varied along the rows; must differ from ``x_feature``.
+        y_values: Values of ``y_feature``.
+        artifacts (tuple, optional): ``(model, transformer, features)``; passing
+            them bypasses the surface cache.
+
+    Returns:
+        ndarray: Shape ``(len(y_values), len(x_values))``.
+    """
+    for feature, values in ((x_feature, x_values), (y_feature, y_values)):
+        if feature not in SURFACE_AXES:
+            raise ValueError(f"{feature!r} cannot be used as a surface axis; expected one of {SURFACE_AXES}")
+        if not 1 <= len(values) <= MAX_GRID_STEPS:
+            raise ValueError(f"{feature!r} needs between 1 and {MAX_GRID_STEPS} grid values, got {len(values)}")
+    if x_feature == y_feature:
+        raise ValueError("The two surface axes must be different inputs")
+
+    x_values = _normalise(x_feature, x_values)
+    y_values = _normalise(y_feature, y_values)
+    if artifacts is not None:
+        scenarios = grid_scenarios(base_inputs, x_feature, x_values, y_feature, y_values)
+        return predict_roi_batch(scenarios, artifacts).reshape(len(y_values), len(x_values))
+
+    version, artifacts = get_registry().current()
+    key = (canonical_key(base_inputs), x_feature, x_values, y_feature, y_values)
+    surface = _surface_cache.get(key, version)
+    if surface is None:
+        scenarios = grid_scenarios(base_inputs, x_feature, x_values, y_feature, y_values)
+        surface = predict_roi_batch(scenarios, artifacts).reshape(len(y_values), len(x_values))
+        surface.setflags(write=False)  # Shared between sessions
+        _surface_cache.put(key, surface, version)
+    return surface
+
+
+def surface_cache_stats():
+    """Hit/miss counters and size of the shared surface cache (for the admin page)."""
+    return _surface_cache.stats()
+
+
+def clear_surface_cache():
+    _surface_cache.clear()
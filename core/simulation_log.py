@@ -0,0 +1,365 @@
+"""Append-only store of logged Simulator runs (SQLite in WAL mode).
+
+Simulator snapshots used to be appended to ``session_log.csv`` with
+``to_csv(mode='a')`` from every session at once, with no locking, and every
+reader re-parsed the whole file. They now go into one SQLite table:
+
+* appends are a single-row ``INSERT`` in their own short transaction; WAL mode
+  lets readers carry on while a session writes, and ``busy_timeout`` makes
+  concurrent writers queue instead of failing;
+* rows are indexed on timestamp and on (session, timestamp), and readers only
+  ever fetch one page of rows (``page``); counts, averages, feature usage and
+  the most simulated price come from running totals that triggers update on
+  every insert and delete, so the cost of a rerun does not grow with the size
+  of the log;
+* each thread (Streamlit runs every session in its own) keeps its own
+  connection.
+
+On first use the legacy CSV logs (``LEGACY_SESSION_LOG_PATHS``) are imported
+once; the import is recorded in the database, so the CSVs are left untouched
+and never imported twice.
+
+Frames returned to the pages use the CSV's column names ("Market Price",
+"Has Solar", ...) plus ``ID`` and ``Session``.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+from core.config import LEGACY_SESSION_LOG_PATHS, SIMULATION_LOG_PATH
+from core.timing import timed
+
+logger = logging.getLogger(__name__)
+
+# Table column -> column name in the legacy CSV and in returned frames
+COLUMNS = {
+    "timestamp": "Timestamp",
+    "market_price": "Market Price",
+    "monthly_rent": "Monthly Rent",
+    "has_solar": "Has Solar",
+    "has_water_recycling": "Has Water Recycling",
+    "has_smart_locks": "Has Smart Locks",
+    "has_smart_thermostats": "Has Smart Thermostats",
+    "has_integrated_security": "Has Integrated Security",
+    "has_ev_charging": "Has EV Charging",
+    "predicted_roi": "Predicted ROI (Model)",
+    "traditional_roi": "Traditional ROI (Calculated)",
+    "smart_roi": "Smart ROI (Calculated)",
+}
+FLAG_COLUMNS = tuple(name for name in COLUMNS if name.startswith("has_"))
+
+DEFAULT_PAGE_SIZE = 50
+MIGRATION_CHUNK_ROWS = 10_000
+
+# Running totals kept up to date by triggers, so that counting and summarising the
+# log reads one row instead of scanning millions
+_TOTALS = ("market_price", "monthly_rent", "predicted_roi", "smart_roi")
+
+
+def _totals_schema():
+    columns = ",\n    ".join(
+        [f"{c}_n INTEGER NOT NULL DEFAULT 0,\n    {c}_sum REAL NOT NULL DEFAULT 0" for c in _TOTALS]
+        + [f"{c} INTEGER NOT NULL DEFAULT 0" for c in FLAG_COLUMNS]
+    )
+
+    def changes(row, sign):
+        return ", ".join(
+            ["rows = rows " + sign + " 1"]
+            + [f"{c}_n = {c}_n {sign} ({row}.{c} IS NOT NULL), {c}_sum = {c}_sum {sign} COALESCE({row}.{c}, 0)"
+               for c in _TOTALS]
+            + [f"{c} = {c} {sign} {row}.{c}" for c in FLAG_COLUMNS]
+        )
+
+    return f"""
+CREATE TABLE IF NOT EXISTS simulation_totals (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    rows INTEGER NOT NULL DEFAULT 0,
+    {columns}
+);
+INSERT OR IGNORE INTO simulation_totals (id) VALUES (1);
+CREATE TABLE IF NOT EXISTS price_counts (
+    market_price REAL PRIMARY KEY,
+    n INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_price_counts_n ON price_counts (n DESC, market_price);
+CREATE TRIGGER IF NOT EXISTS simulations_totals_insert AFTER INSERT ON simulations BEGIN
+    UPDATE simulation_totals SET {changes("NEW", "+")} WHERE id = 1;
+    INSERT INTO price_counts (market_price, n) SELECT NEW.market_price, 1 WHERE NEW.market_price IS NOT NULL
+        ON CONFLICT (market_price) DO UPDATE SET n = n + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS simulations_totals_delete AFTER DELETE ON simulations BEGIN
+    UPDATE simulation_totals SET {changes("OLD", "-")} WHERE id = 1;
+    UPDATE price_counts SET n = n - 1 WHERE market_price = OLD.market_price;
+    DELETE FROM price_counts WHERE market_price = OLD.market_price AND n <= 0;
+END;
+"""
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS simulations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT,
+    timestamp TEXT NOT NULL,
+    market_price REAL,
+    monthly_rent REAL,
+    has_solar INTEGER NOT NULL DEFAULT 0,
+    has_water_recycling INTEGER NOT NULL DEFAULT 0,
+    has_smart_locks INTEGER NOT NULL DEFAULT 0,
+    has_smart_thermostats INTEGER NOT NULL DEFAULT 0,
+    has_integrated_security INTEGER NOT NULL DEFAULT 0,
+    has_ev_charging INTEGER NOT NULL DEFAULT 0,
+    predicted_roi REAL,
+    traditional_roi REAL,
+    smart_roi REAL
+);
+CREATE INDEX IF NOT EXISTS idx_simulations_timestamp ON simulations (timestamp);
+CREATE INDEX IF NOT EXISTS idx_simulations_session ON simulations (session_id, timestamp);
+CREATE TABLE IF NOT EXISTS migrations (
+    source TEXT PRIMARY KEY,
+    rows INTEGER NOT NULL,
+    migrated_at TEXT NOT NULL
+);
+""" + _totals_schema()
+
+_INSERT = (
+    f"INSERT INTO simulations (session_id, {', '.join(COLUMNS)}) "
+    f"VALUES (?, {', '.join('?' for _ in COLUMNS)})"
+)
+
+
+def _flag(value):
+    if isinstance(value, str):
+        return int(value.strip().lower() in ("true", "1", "yes"))
+    return int(bool(value)) if pd.notna(value) else 0
+
+
+def _number(value):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if value == value else None  # NaN -> NULL
+
+
+def _row(snapshot, session_id):
+    """Parameters of one INSERT from a snapshot keyed by CSV column names."""
+    values = [session_id, str(snapshot["Timestamp"])]
+    for column, label in list(COLUMNS.items())[1:]:
+        value = snapshot.get(label)
+        values.append(_flag(value) if column in FLAG_COLUMNS else _number(value))
+    return values
+
+
+class SimulationLog:
+    """The simulation log database, with one connection per thread."""
+
+    def __init__(self, path=SIMULATION_LOG_PATH, legacy_csv_paths=LEGACY_SESSION_LOG_PATHS):
+        self.path = path
+        self.legacy_csv_paths = tuple(legacy_csv_paths)
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._ready = False
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")  # Durable across app crashes; fsync on checkpoint
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        if not self._ready:
+            with self._init_lock:
+                if not self._ready:
+                    conn.executescript(_SCHEMA)
+                    for csv_path in self.legacy_csv_paths:
+                        self._migrate_csv(conn, csv_path)
+                    self._ready = True
+        return conn
+
+    def _migrate_csv(self, conn, csv_path):
+        """Import one legacy CSV log, once."""
+        source = os.path.abspath(csv_path)
+        if not os.path.exists(csv_path):
+            return 0
+        if conn.execute("SELECT 1 FROM migrations WHERE source = ?", (source,)).fetchone():
+            return 0
+        start = time.perf_counter()
+        rows = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("SELECT 1 FROM migrations WHERE source = ?", (source,)).fetchone():
+                conn.execute("ROLLBACK")  # Another process got there first
+                return 0
+            for chunk in pd.read_csv(csv_path, chunksize=MIGRATION_CHUNK_ROWS):
+                chunk = chunk.dropna(subset=["Timestamp"])
+                conn.executemany(_INSERT, (_row(r, None) for r in chunk.to_dict("records")))
+                rows += len(chunk)
+            conn.execute(
+                "INSERT INTO migrations (source, rows, migrated_at) VALUES (?, ?, ?)",
+                (source, rows, time.strftime("%Y-%m-%d %H:%M:%S")),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            logger.exception("Could not migrate %s into the simulation log", csv_path)
+            return 0
+        logger.info("Migrated %d simulations from %s in %.1f ms", rows, csv_path, (time.perf_counter() - start) * 1000)
+        return rows
+
+    def append(self, snapshot, session_id=None):
+        """Log one simulation and return its ID.
+
+        Args:
+            snapshot (dict): Values keyed by the CSV column names ("Timestamp",
+                "Market Price", "Has Solar", ...).
+            session_id (str, optional): The Streamlit session that ran it.
+        """
+        with timed("simulation_log.append"):
+            conn = self._connect()
+            return conn.execute(_INSERT, _row(snapshot, session_id)).lastrowid
+
+    def _where(self, session_id=None, cursor=None, price_range=None, rent_range=None):
+        clauses, params = [], []
+        if session_id is not None:
+            clauses.append("session_id = ?")
+            params.append(session_id)
+        if cursor is not None:
+            timestamp, last_id = cursor
+            if session_id is not None:
+                # Same order as the (session_id, timestamp) index, ties broken by id
+                clauses.append("(timestamp, id) < (?, ?)")
+                params.extend([timestamp, last_id])
+            else:
+                clauses.append("id < ?")
+                params.append(last_id)
+        for column, bounds in (("market_price", price_range), ("monthly_rent", rent_range)):
+            if bounds is not None:
+                clauses.append(f"{column} BETWEEN ? AND ?")
+                params.extend(float(b) for b in bounds)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def page(self, limit=DEFAULT_PAGE_SIZE, offset=0, session_id=None, cursor=None,
+             price_range=None, rent_range=None):
+        """One page of simulations, newest first.
+
+        Args:
+            limit (int): Maximum rows returned.
+            offset (int): Rows to skip; fine for the first few pages only.
+            session_id (str, optional): Only this session's simulations,
+                ordered by timestamp (the whole log is ordered by ID).
+            cursor (tuple, optional): ``page_cursor()`` of the previous page;
+                seeks straight to the next page however deep it is.
+            price_range (tuple, optional): Inclusive ``(min, max)`` market price.
+            rent_range (tuple, optional): Inclusive ``(min, max)`` monthly rent.
+
+        Returns:
+            DataFrame: At most ``limit`` rows with the CSV column names plus
+            ``ID`` and ``Session``.
+        """
+        where, params = self._where(session_id, cursor, price_range, rent_range)
+        order = "timestamp DESC, id DESC" if session_id is not None else "id DESC"
+        sql = (f"SELECT id, session_id, {', '.join(COLUMNS)} FROM simulations{where} "
+               f"ORDER BY {order} LIMIT ? OFFSET ?")
+        with timed("simulation_log.page"):
+            rows = self._connect().execute(sql, params + [int(limit), int(offset)]).fetchall()
+        df = pd.DataFrame(rows, columns=["ID", "Session"] + list(COLUMNS.values()))
+        for column in FLAG_COLUMNS:
+            df[COLUMNS[column]] = df[COLUMNS[column]].astype(bool)
+        return df
+
+    def count(self, session_id=None, price_range=None, rent_range=None):
+        conn = self._connect()
+        if session_id is None and price_range is None and rent_range is None:
+            return conn.execute("SELECT rows FROM simulation_totals").fetchone()[0]
+        where, params = self._where(session_id, None, price_range, rent_range)
+        return conn.execute(f"SELECT COUNT(*) FROM simulations{where}", params).fetchone()[0]
+
+    def summary(self):
+        """Totals, averages, feature usage and the most simulated price.
+
+        Read from the trigger-maintained running totals, so the cost does not
+        depend on the size of the log.
+        """
+        conn = self._connect()
+        with timed("simulation_log.summary"):
+            totals = conn.execute(
+                "SELECT rows, "
+                + ", ".join(f"{c}_n, {c}_sum" for c in _TOTALS) + ", "
+                + ", ".join(FLAG_COLUMNS)
+                + " FROM simulation_totals"
+            ).fetchone()
+            mode = conn.execute("SELECT market_price FROM price_counts ORDER BY n DESC, market_price LIMIT 1").fetchone()
+        averages = {
+            c: totals[1 + 2 * i + 1] / totals[1 + 2 * i] if totals[1 + 2 * i] else None
+            for i, c in enumerate(_TOTALS)
+        }
+        return {
+            "total": totals[0],
+            "avg_market_price": averages["market_price"],
+            "avg_monthly_rent": averages["monthly_rent"],
+            "avg_predicted_roi": averages["predicted_roi"],
+            "avg_smart_roi": averages["smart_roi"],
+            "feature_usage": {COLUMNS[c]: n for c, n in zip(FLAG_COLUMNS, totals[1 + 2 * len(_TOTALS):])},
+            "most_simulated_price": mode[0] if mode else None,
+        }
+
+    def export_csv(self, session_id=None, chunk_rows=MIGRATION_CHUNK_ROWS):
+        """All matching simulations as CSV bytes (oldest first), read in chunks."""
+        where, params = self._where(session_id)
+        cursor = self._connect().execute(
+            f"SELECT {', '.join(COLUMNS)} FROM simulations{where} ORDER BY id", params
+        )
+        parts = []
+        header = True
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                break
+            df = pd.DataFrame(rows, columns=list(COLUMNS.values()))
+            for column in FLAG_COLUMNS:
+                df[COLUMNS[column]] = df[COLUMNS[column]].astype(bool)
+            parts.append(df.to_csv(index=False, header=header))
+            header = False
+        if header:
+            parts.append(",".join(COLUMNS.values()) + "\n")
+        return "".join(parts).encode("utf-8")
+
+    def clear(self, session_id=None):
+        """Delete all simulations (or one session's). Migrated CSVs stay migrated."""
+        where, params = self._where(session_id)
+        return self._connect().execute(f"DELETE FROM simulations{where}", params).rowcount
+
+    def stats(self):
+        """Row count and on-disk size, for the admin page."""
+        size = sum(
+            os.path.getsize(self.path + suffix)
+            for suffix in ("", "-wal", "-shm") if os.path.exists(self.path + suffix)
+        )
+        migrated = self._connect().execute("SELECT source, rows FROM migrations").fetchall()
+        return {
+            "Database": os.path.relpath(self.path),
+            "Simulations": self.count(),
+            "Size (MB)": round(size / 1024 / 1024, 2),
+            "Migrated CSV Rows": sum(rows for _, rows in migrated),
+        }
+
+
+def page_cursor(page):
+    """Cursor continuing after the last row of ``page`` (None if it is empty)."""
+    if page.empty:
+        return None
+    return str(page["Timestamp"].iloc[-1]), int(page["ID"].iloc[-1])
+
+
+_log = SimulationLog()
+
+
+def get_simulation_log():
+    """Return the process-wide simulation log shared by all sessions."""
+    return _log
@@ -0,0 +1,42 @@
+"""Per-session state defaults shared by all dashboard pages."""
+import uuid
+
+import streamlit as st
+
+# Core session state variables
+SESSION_DEFAULTS = {
+    'is_admin': False,
+    'form_submitted': False,
+    'pending_email': None,
+    'property_page': 1,
+    'filters': {},
+    # Simulator inputs; all smart features are initialised
+    'market_price': 120000,
+    'monthly_rent': 1000,
+    'has_solar': True,
+    'has_water_recycling': False,
+    'has_smart_locks': False,
+    'has_smart_thermostats': False,
+    'has_integrated_security': False,
+    'has_ev_charging': False,
+    'selected_session_idx': 0,
+    # ROI-related results read by the Executive Summary
+    'roi': 0.0,
+    'smart_roi': 0.0,
+    'predicted_roi_original': 0.0,
+    'annual_savings_total': 0.0,
+    'roi_chart_values': None,  # (roi, smart_roi, predicted_roi) of the last ROI chart
+    'roi_explanation': None,  # explain_roi() of the last Predicted ROI
+}
+
+
+# Initialize and optimize session state variables
+def init_session_state():
+    # Only set defaults if they don't exist
+    for key, value in SESSION_DEFAULTS.items():
+        if key not in st.session_state:
+            # Copy mutable defaults so sessions never share the same dict
+            st.session_state[key] = value.copy() if isinstance(value, dict) else value
+    # Identifies this session's rows in the simulation log
+    if 'session_id' not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
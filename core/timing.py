@@ -0,0 +1,173 @@
+"""Lightweight section timing for the dashboard's hot paths.
+
+``timed`` works as a context manager or a decorator::
+
+    with timed("simulator.predict"):
+        ...
+
+    @timed("pdf.generate")
+    def generate_pdf(...):
+        ...
+
+Every measurement goes into a bounded, process-wide ring buffer (the newest
+``TIMING_BUFFER_SIZE`` entries) and, unless ``TIMING_LOG`` is set to an empty
+string, into a rotating log file (``logs/timings.log`` by default). The router
+wraps each page render in ``rerun_trace`` so that the sections timed during a
+rerun are kept together; the slowest reruns are retained with their section
+breakdown for the admin performance tab.
+"""
+import functools
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from collections import deque
+from logging.handlers import RotatingFileHandler
+
+TIMING_BUFFER_SIZE = 5000
+SLOWEST_RERUNS_KEPT = 20
+TIMING_LOG = os.getenv("TIMING_LOG", os.path.join("logs", "timings.log"))
+TIMING_LOG_MAX_BYTES = 1024 * 1024
+TIMING_LOG_BACKUPS = 3
+
+# (timestamp, section, milliseconds, page)
+_records = deque(maxlen=TIMING_BUFFER_SIZE)
+# Min-heap of (total_ms, sequence, trace dict) holding the slowest reruns
+_slowest = []
+_sequence = itertools.count()
+_lock = threading.Lock()
+_local = threading.local()  # Streamlit runs each session's script in its own thread
+
+_log = logging.getLogger("westprop.timings")
+_log.propagate = False
+_log_ready = False
+
+
+def _ensure_log_handler():
+    global _log_ready
+    if _log_ready:
+        return
+    with _lock:
+        if _log_ready:
+            return
+        _log_ready = True
+        if not TIMING_LOG:
+            return
+        try:
+            os.makedirs(os.path.dirname(TIMING_LOG) or ".", exist_ok=True)
+            handler = RotatingFileHandler(TIMING_LOG, maxBytes=TIMING_LOG_MAX_BYTES,
+                                          backupCount=TIMING_LOG_BACKUPS, encoding="utf-8")
+        except OSError as e:
+            logging.getLogger(__name__).warning("Timing log disabled: %s", e)
+            return
+        handler.setFormatter(logging.Formatter("%(asctime)s\t%(message)s"))
+        _log.addHandler(handler)
+        _log.setLevel(logging.INFO)
+
+
+def record(section, ms, page=None):
+    """Store one measurement of ``section`` taking ``ms`` milliseconds."""
+    trace = getattr(_local, "trace", None)
+    if page is None:
+        page = trace["page"] if trace is not None else ""
+    _records.append((time.time(), section, ms, page))
+    if trace is not None:
+        trace["sections"].append((section, ms))
+    _ensure_log_handler()
+    _log.info("%s\t%.3f\t%s", section, ms, page)
+
+
+class timed:
+    """Time a block (``with timed(name):``) or every call of a function (``@timed(name)``)."""
+
+    def __init__(self, section):
+        self.section = section
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        record(self.section, (time.perf_counter() - self._start) * 1000)
+        return False
+
+    def __call__(self, func):
+        section = self.section
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(section):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+class rerun_trace:
+    """Collect the sections timed while rendering ``page`` into one rerun trace."""
+
+    def __init__(self, page):
+        self.page = page
+
+    def __enter__(self):
+        self._trace = {"page": self.page, "started_at": time.time(), "sections": []}
+        self._previous = getattr(_local, "trace", None)
+        _local.trace = self._trace
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # st.stop()/st.rerun() end a render by raising, which still counts as a rerun
+        total_ms = (time.perf_counter() - self._start) * 1000
+        _local.trace = self._previous
+        self._trace["total_ms"] = total_ms
+        record(f"rerun:{self.page}", total_ms, page=self.page)
+        entry = (total_ms, next(_sequence), self._trace)
+        with _lock:
+            if len(_slowest) < SLOWEST_RERUNS_KEPT:
+                heapq.heappush(_slowest, entry)
+            elif total_ms > _slowest[0][0]:
+                heapq.heapreplace(_slowest, entry)
+        return False
+
+
+def timing_records(section=None):
+    """Return the buffered measurements as dicts, optionally for one section."""
+    return [
+        {"Timestamp": ts, "Section": name, "Milliseconds": ms, "Page": page}
+        for ts, name, ms, page in list(_records)
+        if section is None or name == section
+    ]
+
+
+def section_summary():
+    """Count, p50, p95, max and total time per section in the ring buffer."""
+    by_section = {}
+    for _, name, ms, _ in list(_records):
+        by_section.setdefault(name, []).append(ms)
+    summary = []
+    for name, values in by_section.items():
+        values.sort()
+        summary.append({
+            "Section": name,
+            "Count": len(values),
+            "p50 (ms)": round(values[len(values) // 2], 2),
+            "p95 (ms)": round(values[min(len(values) - 1, int(len(values) * 0.95))], 2),
+            "Max (ms)": round(values[-1], 2),
+            "Total (ms)": round(sum(values), 1),
+        })
+    return sorted(summary, key=lambda row: -row["Total (ms)"])
+
+
+def slowest_reruns():
+    """The slowest reruns seen by this process, slowest first."""
+    with _lock:
+        entries = sorted(_slowest, reverse=True)
+    return [trace for _, _, trace in entries]
+
+
+def reset():
+    """Clear the ring buffer and the slowest-rerun traces."""
+    with _lock:
+        _records.clear()
+        _slowest.clear()
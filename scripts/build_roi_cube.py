@@ -0,0 +1,167 @@
+"""Precompute the ROI cube and report how closely it reproduces the model.
+
+Scores every suburb x property type x smart-feature combination of the
+training data at the numeric reference grid (``core/roi_cube.py``) with the
+current model version, and writes the cube to ``models/roi_cube.npz``
+(``ROI_CUBE_PATH``). The cube is tied to that model version. After publishing
+a new version, rebuild it; until then the dashboard asks the forest.
+
+The report (``models/roi_cube.json``) compares cube answers with the forest:
+
+* reference points: random cells at grid points (should equal the forest's prediction rounded to
+  float32);
+* interpolation: random scenarios inside the grid, and the training rows
+  that fall inside it;
+* lookup time of an exact and an interpolated answer versus ``predict_roi``
+  without caches.
+
+Usage (from the repository root):
+
+    python scripts/build_roi_cube.py
+    python scripts/build_roi_cube.py --check 5000 --output /tmp/roi_cube.npz
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+DEFAULT_CHECK = 2000
+
+
+def errors(cube, scenarios, expected):
+    """Share of ``scenarios`` the cube answers and the absolute error of those answers.
+
+    ``float32_exact`` is whether every answer equals the forest's value
+    rounded to float32, compared unrounded.
+    """
+    answered, diffs, float32_exact = 0, [], True
+    for inputs, value in zip(scenarios, expected):
+        cube_value, kind = cube.lookup(inputs)
+        if kind is not None:
+            answered += 1
+            diffs.append(abs(cube_value - value))
+            float32_exact &= cube_value == float(np.float32(value))
+    diffs = np.array(diffs) if diffs else np.zeros(1)
+    return {
+        "scenarios": len(scenarios),
+        "answered": answered,
+        "float32_exact": bool(float32_exact),
+        "mean_abs_error": round(float(diffs.mean()), 4),
+        "p95_abs_error": round(float(np.percentile(diffs, 95)), 4),
+        "max_abs_error": round(float(diffs.max()), 4),
+    }
+
+
+def time_us(func, repeats=200):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1e6)
+    return round(statistics.median(times), 1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="cube file (default ROI_CUBE_PATH, models/roi_cube.npz)")
+    parser.add_argument("--check", type=int, default=DEFAULT_CHECK,
+                        help=f"random scenarios compared with the forest (default {DEFAULT_CHECK})")
+    args = parser.parse_args(argv)
+
+    output = os.path.abspath(args.output) if args.output else None
+    os.chdir(REPO_ROOT)
+    import pandas as pd
+
+    from core.config import REAL_ESTATE_DATA_PATH, ROI_CUBE_PATH
+    from core.features import FLAG_FEATURES, NUMERIC_FEATURES
+    from core.model_registry import get_registry
+    from core.prediction import predict_roi_batch
+    from core.roi_cube import ROICube, build_roi_cube
+
+    output = output or ROI_CUBE_PATH
+    version, artifacts = get_registry().current()
+    data = pd.read_csv(REAL_ESTATE_DATA_PATH).dropna(subset=list(NUMERIC_FEATURES) + ["ROI_percentage"])
+    suburbs = sorted(data["location_suburb"].dropna().unique())
+    property_types = sorted(data["property_type"].dropna().unique())
+
+    start = time.perf_counter()
+    cube = build_roi_cube(artifacts, version, suburbs, property_types)
+    build_s = time.perf_counter() - start
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    cube.save(output)
+    start = time.perf_counter()
+    cube = ROICube.load(output)
+    load_ms = (time.perf_counter() - start) * 1000
+    print(f"Cube: {len(suburbs)} suburbs x {len(property_types)} types x 64 feature combinations x "
+          f"{cube.n_cells // (len(suburbs) * len(property_types) * 64)} reference points = {cube.n_cells:,} cells")
+    print(f"Built in {build_s:.1f} s; {os.path.getsize(output) / 1024 / 1024:.1f} MB on disk, "
+          f"memory-mapped in {load_ms:.1f} ms")
+
+    rng = np.random.default_rng(0)
+
+    def random_scenarios(n, on_grid):
+        scenarios = []
+        for _ in range(n):
+            inputs = {
+                "location_suburb": suburbs[rng.integers(len(suburbs))],
+                "property_type": property_types[rng.integers(len(property_types))],
+            }
+            inputs.update({name: int(rng.integers(2)) for name in FLAG_FEATURES})
+            for name in NUMERIC_FEATURES:
+                grid = cube.grids[name]
+                inputs[name] = grid[rng.integers(len(grid))] if on_grid else rng.uniform(grid[0], grid[-1])
+            scenarios.append(inputs)
+        return scenarios
+
+    training = data.to_dict("records")
+    checks = {}
+    for name, scenarios in (("reference_points", random_scenarios(args.check, True)),
+                            ("interpolated", random_scenarios(args.check, False)),
+                            ("training_rows", training)):
+        checks[name] = errors(cube, scenarios, predict_roi_batch(scenarios, artifacts))
+        c = checks[name]
+        print(f"  {name:>16}: {c['answered']:>5} of {c['scenarios']:>5} answered, |cube - forest| mean "
+              f"{c['mean_abs_error']:.4f}, p95 {c['p95_abs_error']:.4f}, max {c['max_abs_error']:.4f} ROI %")
+
+    from core.prediction import _predict_one
+
+    exact, inside = random_scenarios(1, True)[0], random_scenarios(1, False)[0]
+    timings = {
+        "exact_lookup_us": time_us(lambda: cube.lookup(exact)),
+        "interpolated_lookup_us": time_us(lambda: cube.lookup(inside)),
+        "forest_predict_us": time_us(lambda: _predict_one(inside, artifacts)),
+    }
+    print(f"Lookup: exact {timings['exact_lookup_us']:.0f} µs, interpolated {timings['interpolated_lookup_us']:.0f} µs; "
+          f"forest {timings['forest_predict_us']:.0f} µs")
+
+    report = {
+        "created_at": cube.created_at,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "model_version": version,
+        "cube": output,
+        "grids": cube.grids,
+        "cells": cube.n_cells,
+        "file_mb": round(os.path.getsize(output) / 1024 / 1024, 2),
+        "build_s": round(build_s, 1),
+        "load_ms": round(load_ms, 1),
+        "checks": checks,
+        "timings": timings,
+    }
+    report_path = os.path.splitext(output)[0] + ".json"
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\nWrote {os.path.relpath(output)} and {os.path.relpath(report_path)}")
+    return 0 if checks["reference_points"]["float32_exact"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""Write the compact "lite" ROI model artifact and a size/accuracy report.
+
+Turns ``models/roi_prediction_model.pkl`` into a ``CompactForest``
+(``core/forest.py``). It keeps the first ``--trees`` trees, cuts them at
+``--max-depth``, stores thresholds as float32 and node ids, features and covers
+in compact dtypes, and drops sklearn's training-only state. Both artifacts are
+then compared on:
+
+* file size, the RAM its node arrays take, and load time and RSS increase
+  when loaded in a fresh process;
+* R² and MAE on the training notebook's test split (``core/training.py``),
+  in ROI % and in the transformed space the notebook reported;
+* how far the lite predictions are from the full model's;
+* single-row and 10k-row prediction time.
+
+``--sweep`` adds a grid of tree counts and depths to the report (nothing is
+written for them) to show the trade-off before picking one.
+
+Usage (from the repository root):
+
+    python scripts/compact_model.py
+    python scripts/compact_model.py --trees 50 --max-depth 12 --sweep
+
+Select the lite artifact in the dashboard with ``ROI_MODEL_VARIANT=lite``.
+The report is written next to it (``models/roi_prediction_model_lite.json``).
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+SWEEP_TREES = [100, 50, 25, 10]
+SWEEP_DEPTHS = [None, 16, 12, 8]
+
+# Loads an artifact in a fresh interpreter; numpy, joblib and the classes it needs are imported first
+_LOAD_PROBE = """
+import sys, time
+sys.path.insert(0, {root!r})
+import joblib, numpy, sklearn.ensemble, core.forest
+from core.model_registry import _current_rss_bytes
+rss = _current_rss_bytes()
+start = time.perf_counter()
+artifact = joblib.load({path!r})  # Kept alive until RSS is read
+print(time.perf_counter() - start, _current_rss_bytes() - rss)
+"""
+
+
+def measure_load(path, repeats=3):
+    """Median load time (ms) and RSS increase (MB) of ``path`` in fresh interpreters.
+
+    The RSS increase is page-granular and can read 0 for an artifact small
+    enough to fit in memory the allocator already holds.
+    """
+    times, rss = [], []
+    for _ in range(repeats):
+        result = subprocess.run([sys.executable, "-c", _LOAD_PROBE.format(root=REPO_ROOT, path=path)],
+                                cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+        seconds, rss_bytes = result.stdout.split()
+        times.append(float(seconds) * 1000)
+        rss.append(int(rss_bytes) / 1024 / 1024)
+    return statistics.median(times), statistics.median(rss)
+
+
+def model_nbytes(model):
+    """Bytes of node and value arrays the model keeps in memory."""
+    if hasattr(model, "nbytes"):
+        return model.nbytes
+    return sum(e.tree_.__getstate__()["nodes"].nbytes + e.tree_.value.nbytes for e in model.estimators_)
+
+
+def time_ms(func, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def evaluate(name, model, path, pt, X_test, y_test, full_pred, X_batch, load=True):
+    """One row of the report for ``model`` saved at ``path``."""
+    from sklearn.metrics import mean_absolute_error, r2_score
+
+    from core.forest import forest_predict
+
+    pred_t = forest_predict(model, X_test)
+    pred = pt.inverse_transform(pred_t.reshape(-1, 1)).ravel()
+    y_t = pt.transform(y_test.reshape(-1, 1)).ravel()
+    row = {
+        "Model": name,
+        "Trees": getattr(model, "n_trees", None) or len(model.estimators_),
+        "Max Depth": getattr(model, "max_depth", None) or max(e.tree_.max_depth for e in model.estimators_),
+        "Nodes": getattr(model, "n_nodes", None) or sum(e.tree_.node_count for e in model.estimators_),
+        "Size (KB)": round(os.path.getsize(path) / 1024, 1),
+        "RAM (KB)": round(model_nbytes(model) / 1024, 1),
+        "Test R²": round(r2_score(y_test, pred), 4),
+        "Test MAE (ROI %)": round(mean_absolute_error(y_test, pred), 4),
+        "Test R² (transformed)": round(r2_score(y_t, pred_t), 4),
+        "Test MAE (transformed)": round(mean_absolute_error(y_t, pred_t), 4),
+        "Max |Δ| vs Full (ROI %)": round(float(np.abs(pred - full_pred).max()), 4),
+        "Mean |Δ| vs Full (ROI %)": round(float(np.abs(pred - full_pred).mean()), 4),
+        "1 Row (ms)": round(time_ms(lambda: forest_predict(model, X_batch[:1]), 50), 3),
+        "10k Rows (ms)": round(time_ms(lambda: forest_predict(model, X_batch), 3), 1),
+    }
+    if load:
+        row["Load (ms)"], row["RSS Increase (MB)"] = (round(v, 2) for v in measure_load(path))
+    return row
+
+
+def print_table(rows):
+    columns = list(rows[0])
+    widths = {c: max(len(c), *(len(str(r.get(c, ""))) for r in rows)) + 2 for c in columns}
+    print("".join(f"{c:>{widths[c]}}" for c in columns))
+    for row in rows:
+        print("".join(f"{str(row.get(c, '')):>{widths[c]}}" for c in columns))
+
+
+def main(argv=None):
+    from core.forest import LITE_MAX_DEPTH, LITE_TREES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trees", type=int, default=LITE_TREES, help=f"trees kept (default {LITE_TREES})")
+    parser.add_argument("--max-depth", type=int, default=LITE_MAX_DEPTH,
+                        help=f"depth cap, 0 for none (default {LITE_MAX_DEPTH})")
+    parser.add_argument("--output", help="lite artifact (default models/<ROI_MODEL_FILES['lite']>)")
+    parser.add_argument("--sweep", action="store_true", help="also report a grid of tree counts and depths")
+    args = parser.parse_args(argv)
+
+    os.chdir(REPO_ROOT)
+    import joblib
+
+    from core.config import ROI_MODEL_FILES
+    from core.forest import compact_forest
+    from core.model_registry import MODEL_DIR, ModelRegistry
+    from core.training import load_training_data, split
+
+    full_path = os.path.join(MODEL_DIR, ROI_MODEL_FILES["full"])
+    output = args.output or os.path.join(MODEL_DIR, ROI_MODEL_FILES["lite"])
+    registry = ModelRegistry(artifact_files={"model": ROI_MODEL_FILES["full"], "transformer": "roi_transformer.pkl",
+                                             "features": "model_features.pkl"})
+    model, pt, model_features = registry.load_all()
+
+    X, roi = load_training_data(feature_names=model_features)
+    _, X_test, _, y_test = split(X.to_numpy(), roi.to_numpy())
+    rng = np.random.default_rng(0)
+    X_batch = X.to_numpy()[rng.integers(0, len(X), 10_000)]
+    full_pred = pt.inverse_transform(model.predict(X_test).reshape(-1, 1)).ravel()
+
+    max_depth = args.max_depth or None
+    lite = compact_forest(model, args.trees, max_depth)
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    joblib.dump(lite, output)
+
+    rows = [
+        evaluate("Full", model, full_path, pt, X_test, y_test, full_pred, X_batch),
+        evaluate(f"Lite ({args.trees} trees, depth {max_depth or 'uncapped'})", lite, output,
+                 pt, X_test, y_test, full_pred, X_batch),
+    ]
+    print(f"Test set: {len(X_test)} of {len(X)} rows (notebook split)\n")
+    print_table(rows)
+    print(f"\nWrote {os.path.relpath(output)}")
+
+    sweep = []
+    if args.sweep:
+        with tempfile.TemporaryDirectory() as tmp:
+            for n_trees in SWEEP_TREES:
+                for depth in SWEEP_DEPTHS:
+                    candidate = compact_forest(model, n_trees, depth)
+                    path = os.path.join(tmp, f"lite-{n_trees}-{depth}.pkl")
+                    joblib.dump(candidate, path)
+                    sweep.append(evaluate(f"{n_trees} trees, depth {depth or 'uncapped'}", candidate, path,
+                                          pt, X_test, y_test, full_pred, X_batch, load=False))
+        print("\nTrade-off sweep (not written):")
+        print_table(sweep)
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "source": full_path,
+        "artifact": output,
+        "trees": args.trees,
+        "max_depth": max_depth,
+        "test_rows": len(X_test),
+        "results": rows,
+        "sweep": sweep,
+    }
+    report_path = os.path.splitext(output)[0] + ".json"
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Report written to {os.path.relpath(report_path)}")
+
+    # Sanity check: the written artifact loads and predicts like the in-memory one
+    if not np.array_equal(joblib.load(output).predict(X_test), lite.predict(X_test)):
+        print("FAIL: the written artifact does not reproduce the compacted forest")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
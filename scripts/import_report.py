@@ -0,0 +1,152 @@
+"""Import-time report and cold-start budget check for the dashboard.
+
+Runs ``python -X importtime`` in a fresh interpreter for the modules the
+dashboard imports on a cold start (the router plus the default page), then
+aggregates the per-module timings by top-level package. With ``--pages`` it
+also reports what importing each page module adds on top of the cold start.
+
+The router's top-level imports and its ``PAGE_MODULES`` (the first one is
+the default page) are read from real_estate_dashboard.py, so the report
+follows the dashboard as it changes.
+
+Usage (from the repository root):
+
+    python scripts/import_report.py
+    python scripts/import_report.py --budget-ms 1500 --pages --top 15
+
+Exits with status 1 if the median cold-start import time exceeds the budget or
+if one of the deferred heavy libraries is imported during the cold start.
+"""
+import argparse
+import ast
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_SCRIPT = os.path.join(REPO_ROOT, "real_estate_dashboard.py")
+
+# Libraries that must only be imported by the code that uses them (see core/lazy.py)
+DEFERRED_LIBRARIES = [
+    "matplotlib", "seaborn", "folium", "streamlit_folium", "altair",
+    "reportlab", "joblib", "sklearn", "smtplib",
+]
+
+DEFAULT_BUDGET_MS = 2500
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)\s*$")
+
+
+def read_router():
+    """``(startup imports, page modules)`` of real_estate_dashboard.py.
+
+    The startup imports are the script's top-level import statements (what
+    runs before the first page renders), as source. The page modules are
+    the values of ``PAGE_MODULES``, in sidebar order. The script is parsed
+    rather than imported, since importing it would run the dashboard.
+    """
+    with open(APP_SCRIPT, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), APP_SCRIPT)
+    imports = [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "PAGE_MODULES" for t in node.targets):
+            return imports, list(ast.literal_eval(node.value).values())
+    raise RuntimeError(f"PAGE_MODULES not found in {APP_SCRIPT}")
+
+
+def run_importtime(statements, preload=()):
+    """Run the import ``statements`` in a fresh interpreter and return the parsed timings.
+
+    Statements in ``preload`` run first so that their cost is excluded from
+    the measurement (their modules show up as already imported).
+
+    Returns:
+        list[tuple]: ``(module, self_us, cumulative_us, depth)`` for each import
+        triggered by ``statements``, in the order the interpreter reported them.
+    """
+    code = "".join(f"{line}\n" for line in preload)
+    code += "import sys; sys.stderr.write('--- measure ---\\n')\n"
+    code += "".join(f"{line}\n" for line in statements)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Running {statements} failed:\n{result.stderr[-2000:]}")
+    _, _, measured = result.stderr.partition("--- measure ---\n")
+    rows = []
+    for line in measured.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def total_ms(rows):
+    """Total wall time of an import run: the sum of the top-level cumulative times."""
+    return sum(cumulative for _, _, cumulative, depth in rows if depth == 0) / 1000
+
+
+def by_package(rows):
+    """Aggregate self time (ms) and module count per top-level package."""
+    totals = defaultdict(lambda: [0.0, 0])
+    for name, self_us, _, _ in rows:
+        entry = totals[name.split(".")[0]]
+        entry[0] += self_us / 1000
+        entry[1] += 1
+    return sorted(((pkg, ms, count) for pkg, (ms, count) in totals.items()), key=lambda t: -t[1])
+
+
+def deferred_hits(rows):
+    """Deferred libraries that were imported anyway."""
+    imported = {name.split(".")[0] for name, _, _, _ in rows}
+    return [lib for lib in DEFERRED_LIBRARIES if lib in imported]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"cold-start import budget in ms (default {DEFAULT_BUDGET_MS})")
+    parser.add_argument("--repeat", type=int, default=3, help="cold-start runs to take the median of")
+    parser.add_argument("--top", type=int, default=10, help="packages to list in the breakdown")
+    parser.add_argument("--pages", action="store_true", help="also report the import cost of every page")
+    args = parser.parse_args(argv)
+
+    startup_imports, page_modules = read_router()
+    cold_imports = startup_imports + [f"import {page_modules[0]}"]  # The default page
+    runs = [run_importtime(cold_imports) for _ in range(max(1, args.repeat))]
+    cold_ms = statistics.median(total_ms(rows) for rows in runs)
+    rows = runs[-1]
+
+    print(f"Cold start ({'; '.join(cold_imports)}): {cold_ms:.0f} ms median of {len(runs)}, "
+          f"{len(rows)} modules, budget {args.budget_ms:.0f} ms")
+    print(f"\n{'Package':<28}{'Self (ms)':>12}{'Modules':>10}")
+    for pkg, ms, count in by_package(rows)[:args.top]:
+        print(f"{pkg:<28}{ms:>12.1f}{count:>10}")
+
+    if args.pages:
+        print(f"\n{'Page module':<28}{'Import (ms)':>12}{'Modules':>10}  Deferred libraries loaded")
+        for page in page_modules:
+            page_rows = run_importtime([f"import {page}"], preload=startup_imports)
+            hits = ", ".join(deferred_hits(page_rows)) or "-"
+            print(f"{page:<28}{total_ms(page_rows):>12.1f}{len(page_rows):>10}  {hits}")
+
+    failures = []
+    if cold_ms > args.budget_ms:
+        failures.append(f"cold start took {cold_ms:.0f} ms, over the {args.budget_ms:.0f} ms budget")
+    eager = deferred_hits(rows)
+    if eager:
+        failures.append(f"deferred libraries imported during cold start: {', '.join(eager)}")
+    for failure in failures:
+        print(f"\nFAIL: {failure}")
+    if not failures:
+        print("\nOK: cold start is within budget and no deferred library was imported")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""List, publish and activate versions of the ROI model artifacts.
+
+A version is a directory ``models/versions/<id>/`` holding one complete
+artifact set and its ``manifest.json``; ``models/CURRENT`` names the version
+the dashboard serves (``core/model_registry.py``). Activating a version
+replaces ``CURRENT`` atomically, and running dashboards switch to it on their
+next rerun without a restart.
+
+Usage (from the repository root):
+
+    python scripts/model_versions.py list
+    python scripts/model_versions.py publish /tmp/roi-model     # e.g. from train_roi_model.py --output-dir
+    python scripts/model_versions.py publish models --no-activate
+    python scripts/model_versions.py activate 20261018-151200-1a2b3c4d
+"""
+import argparse
+import json
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# Written next to the plain artifacts by scripts/train_roi_model.py --output-dir
+TRAINING_MANIFEST = "model_manifest.json"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="published versions, newest first")
+    publish = commands.add_parser("publish", help="copy a directory of artifacts into a new version")
+    publish.add_argument("source_dir", help="directory with the .pkl artifacts")
+    publish.add_argument("--no-activate", action="store_true", help="publish without making it current")
+    activate = commands.add_parser("activate", help="make a published version current")
+    activate.add_argument("version", help="version id (see list)")
+    args = parser.parse_args(argv)
+
+    source_dir = os.path.abspath(args.source_dir) if args.command == "publish" else None
+    os.chdir(REPO_ROOT)
+    from core.model_registry import activate_version, list_versions, publish_version
+
+    if args.command == "list":
+        versions = list_versions()
+        if not versions:
+            print("No published versions; the dashboard uses the files directly in models/")
+        for manifest in versions:
+            test = (manifest.get("metrics") or {}).get("test", {})
+            r2 = f"test R² {test['r2']:.4f}" if "r2" in test else "no metrics"
+            print(f"{'*' if manifest['active'] else ' '} {manifest['version']}  {manifest['created_at']}  "
+                  f"{r2}  {', '.join(manifest['files'])}")
+    elif args.command == "publish":
+        metadata = {}
+        if os.path.exists(os.path.join(source_dir, TRAINING_MANIFEST)):
+            with open(os.path.join(source_dir, TRAINING_MANIFEST)) as f:
+                metadata = json.load(f)
+            for key in ("created_at", "artifacts"):  # Replaced by the version's own
+                metadata.pop(key, None)
+        version_id = publish_version(source_dir, metadata=metadata, activate=not args.no_activate)
+        print(f"Published {version_id}" + ("" if args.no_activate else " and made it current"))
+    else:
+        try:
+            activate_version(args.version)
+        except (OSError, ValueError) as e:
+            print(f"Cannot activate {args.version}: {e}")
+            return 1
+        print(f"Activated {args.version}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
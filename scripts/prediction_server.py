@@ -0,0 +1,57 @@
+"""Run the local ROI prediction service shared by all dashboard processes.
+
+The service (``core/prediction_server.py``) holds one copy of the current
+model version and scores the concurrent requests of every Streamlit process
+in micro-batches. Point the dashboards at it with ``PREDICTION_SOCKET``:
+
+    python scripts/prediction_server.py --socket /tmp/westprop-predict.sock
+    PREDICTION_SOCKET=/tmp/westprop-predict.sock streamlit run real_estate_dashboard.py
+
+Dashboards predict in-process whenever the service is not running.
+
+Usage (from the repository root):
+
+    python scripts/prediction_server.py
+    python scripts/prediction_server.py --socket /run/westprop/predict.sock --window-ms 1 --max-batch 512
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+DEFAULT_SOCKET = "/tmp/westprop-predict.sock"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--socket", default=os.getenv("PREDICTION_SOCKET") or DEFAULT_SOCKET,
+                        help=f"Unix socket to listen on (default PREDICTION_SOCKET or {DEFAULT_SOCKET})")
+    parser.add_argument("--window-ms", type=float, help="how long an idle service waits for more requests (default 0)")
+    parser.add_argument("--max-batch", type=int, help="rows that close a batch early (default 256)")
+    args = parser.parse_args(argv)
+
+    socket_path = os.path.abspath(args.socket)
+    os.chdir(REPO_ROOT)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    from core.prediction_server import BATCH_WINDOW_MS, MAX_BATCH_ROWS, PredictionServer
+
+    server = PredictionServer(socket_path,
+                              window_ms=BATCH_WINDOW_MS if args.window_ms is None else args.window_ms,
+                              max_rows=args.max_batch or MAX_BATCH_ROWS)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # Remove the socket on a plain kill too
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
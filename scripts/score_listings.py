@@ -0,0 +1,52 @@
+"""Score a listings CSV with Predicted, Traditional and Smart ROI, chunk by chunk.
+
+The input follows the schema of ``data/real_estate_data_template.csv``. The
+output holds every input row with three ROI columns appended
+(``core/bulk_scoring.py``). The file is read, scored and written
+``--chunk-rows`` rows at a time, so memory stays the same for any file size.
+The output format follows the extension of ``output`` (``.csv`` or
+``.parquet``) unless ``--format`` is given.
+
+Usage (from the repository root):
+
+    python scripts/score_listings.py listings.csv listings_scored.csv
+    python scripts/score_listings.py listings.csv listings_scored.parquet --chunk-rows 100000
+"""
+import argparse
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="listings CSV")
+    parser.add_argument("output", help="scored file to write (.csv or .parquet)")
+    parser.add_argument("--format", choices=("csv", "parquet"), help="output format (default: from the extension)")
+    parser.add_argument("--chunk-rows", type=int, help="rows read, scored and written at a time (default 50000)")
+    args = parser.parse_args(argv)
+
+    source, output = os.path.abspath(args.input), os.path.abspath(args.output)
+    fmt = args.format or ("parquet" if output.endswith(".parquet") else "csv")
+    os.chdir(REPO_ROOT)
+    from core.bulk_scoring import BULK_CHUNK_ROWS, score_csv
+
+    def report(fraction, rows):
+        print(f"\r{fraction:6.1%}  {rows:,} rows", end="", file=sys.stderr, flush=True)
+
+    try:
+        result = score_csv(source, output, fmt, chunk_rows=args.chunk_rows or BULK_CHUNK_ROWS, progress=report)
+    except (OSError, ValueError) as e:
+        print(f"\nCannot score {args.input}: {e}", file=sys.stderr)
+        return 1
+    print(file=sys.stderr)
+    print(f"Scored {result['rows']:,} rows ({result['predicted']:,} with a Predicted ROI) in "
+          f"{result['seconds']:.1f} s: {result['rows_per_s']:,} rows/second with model {result['model_version']}")
+    print(f"Wrote {os.path.relpath(output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""Train the ROI model from the training CSV and write its artifacts and a metrics manifest.
+
+The steps of ``models/train_roi_model.ipynb`` as a reproducible command:
+
+1. load and encode ``data/real_estate_data_template.csv`` (``core/training.py``);
+   the encoded matrix is cached under ``data/cache/`` and reused while the CSV
+   is unchanged;
+2. fit the Yeo-Johnson ``PowerTransformer`` on the ROI values and split 80/20
+   with ``random_state=42``, as the notebook does;
+3. search forest settings on the training split with successive halving
+   (every config starts with 25 trees; weak configs are discarded before more
+   trees are grown), with the (config, fold) fits spread over ``--n-jobs`` cores;
+4. refit the best config on the training split and score it on both splits.
+
+The result is ``roi_prediction_model.pkl``, its compact copy
+``roi_prediction_model_lite.pkl`` (``core/forest.py``), ``roi_transformer.pkl``
+and ``model_features.pkl``, each written to a temporary file and moved into
+place with ``os.replace``. The metrics manifest is written last. It holds the
+data hash, chosen settings, search summary, metrics, artifact hashes, library
+versions and timings.
+
+By default the set is published as a new version in ``models/versions/``
+(``core/model_registry.py``) and made current, which running dashboards pick up
+on their next rerun; ``--no-activate`` only publishes it. ``--output-dir``
+writes the plain files and ``model_manifest.json`` to a directory instead.
+
+Usage (from the repository root):
+
+    python scripts/train_roi_model.py
+    python scripts/train_roi_model.py --output-dir /tmp/roi-model --n-jobs 4
+    python scripts/train_roi_model.py --no-search    # the notebook's forest (100 trees, defaults)
+    python scripts/model_versions.py list            # published versions; activate one to roll back
+
+Every fit is seeded (``--seed``), so the same data gives the same model for
+any ``--n-jobs``.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+MANIFEST_FILE = "model_manifest.json"
+# The notebook's forest, used with --no-search
+NOTEBOOK_PARAMS = {"n_estimators": 100, "max_depth": None, "min_samples_leaf": 1, "max_features": 1.0}
+SEARCH_TOP = 10
+
+
+def atomic_dump(obj, path):
+    """``joblib.dump`` to a temporary file next to ``path``, then move it into place."""
+    import joblib
+
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    try:
+        joblib.dump(obj, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def search_summary(search):
+    """Rounds and the top configs of a ``HalvingGridSearchCV``, best first."""
+    results = search.cv_results_
+    final_round = results["iter"] == results["iter"].max()
+    order = sorted(range(len(results["params"])),
+                   key=lambda i: (-results["iter"][i], results["rank_test_score"][i]))
+    return {
+        "candidates": int(search.n_candidates_[0]),
+        "rounds": [{"trees": int(trees), "candidates": int(n)}
+                   for trees, n in zip(search.n_resources_, search.n_candidates_)],
+        "fits": int(len(results["params"]) * search.cv.get_n_splits()),
+        "finalists": int(final_round.sum()),
+        "top": [
+            {
+                "params": dict(results["params"][i]),
+                "trees": int(results["n_resources"][i]),
+                "cv_r2_mean": round(float(results["mean_test_score"][i]), 4),
+                "cv_r2_std": round(float(results["std_test_score"][i]), 4),
+            }
+            for i in order[:SEARCH_TOP]
+        ],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", help="training CSV (default data/real_estate_data_template.csv)")
+    parser.add_argument("--output-dir", help="write plain files here instead of publishing a model version")
+    parser.add_argument("--no-activate", action="store_true", help="publish the version without making it current")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="parallel fits during the search (default all cores)")
+    parser.add_argument("--seed", type=int, default=42, help="seed of the forests and CV folds (default 42)")
+    parser.add_argument("--no-cache", action="store_true", help="re-encode the CSV instead of using data/cache/")
+    parser.add_argument("--no-search", action="store_true", help="skip the search and fit the notebook's forest")
+    args = parser.parse_args(argv)
+
+    os.chdir(REPO_ROOT)
+    import joblib
+    import numpy as np
+    import sklearn
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.preprocessing import PowerTransformer
+
+    from core.config import REAL_ESTATE_DATA_PATH, ROI_MODEL_FILES, TRAINING_CACHE_DIR
+    from core.forest import LITE_MAX_DEPTH, LITE_TREES, compact_forest
+    from core.model_registry import ARTIFACT_FILES, file_sha256, publish_version
+    from core.training import (
+        PREPARATION_VERSION, load_training_matrix, regression_metrics, search_hyperparameters, split,
+    )
+
+    data_path = args.data or REAL_ESTATE_DATA_PATH
+    timings = {}
+
+    start = time.perf_counter()
+    X, roi, features, from_cache = load_training_matrix(data_path, None if args.no_cache else TRAINING_CACHE_DIR)
+    timings["load_s"] = round(time.perf_counter() - start, 3)
+    print(f"Training data: {len(X)} rows x {len(features)} features "
+          f"({'cached matrix' if from_cache else 'encoded from CSV'}, {timings['load_s']:.2f} s)")
+
+    pt = PowerTransformer(method="yeo-johnson")
+    y = pt.fit_transform(roi.reshape(-1, 1)).ravel()
+    X_train, X_test, y_train, y_test = split(X, y)
+    _, _, roi_train, roi_test = split(X, roi)
+
+    summary = None
+    if args.no_search:
+        params = dict(NOTEBOOK_PARAMS)
+    else:
+        start = time.perf_counter()
+        search = search_hyperparameters(X_train, y_train, n_jobs=args.n_jobs, seed=args.seed)
+        timings["search_s"] = round(time.perf_counter() - start, 3)
+        summary = search_summary(search)
+        params = dict(search.best_params_)
+        rounds = " -> ".join(f"{r['candidates']} x {r['trees']} trees" for r in summary["rounds"])
+        print(f"Search: {rounds}, {summary['fits']} fits in {timings['search_s']:.1f} s")
+        for rank, config in enumerate(summary["top"][:5], 1):
+            print(f"  {rank}. CV R² {config['cv_r2_mean']:.4f} ± {config['cv_r2_std']:.4f}  "
+                  f"{config['params']} ({config['trees']} trees)")
+
+    start = time.perf_counter()
+    model = RandomForestRegressor(random_state=args.seed, n_jobs=args.n_jobs, **params)
+    model.fit(X_train, y_train)
+    model.n_jobs = None  # Prediction threading is decided by the app, not the training machine
+    timings["fit_s"] = round(time.perf_counter() - start, 3)
+
+    metrics = {
+        "train": regression_metrics(model, pt, X_train, roi_train),
+        "test": regression_metrics(model, pt, X_test, roi_test),
+    }
+    print(f"Model: {params}, fitted in {timings['fit_s']:.2f} s")
+    for name, m in metrics.items():
+        print(f"  {name:>5}: R² {m['r2']:.4f}  MAE {m['mae']:.3f}  RMSE {m['rmse']:.3f} (ROI %)   "
+              f"R² {m['r2_transformed']:.4f} (transformed)")
+
+    artifacts = {
+        ROI_MODEL_FILES["full"]: ("model", model),
+        ROI_MODEL_FILES["lite"]: ("lite", compact_forest(model, min(LITE_TREES, len(model.estimators_)),
+                                                         LITE_MAX_DEPTH)),
+        ARTIFACT_FILES["transformer"]: ("transformer", pt),
+        ARTIFACT_FILES["features"]: ("features", features),
+    }
+    manifest = {
+        "data": {
+            "path": os.path.relpath(os.path.abspath(data_path), REPO_ROOT),
+            "sha256": file_sha256(data_path),
+            "rows": len(X),
+            "features": len(features),
+            "preparation_version": PREPARATION_VERSION,
+            "train_rows": len(X_train),
+            "test_rows": len(X_test),
+        },
+        "seed": args.seed,
+        "params": params,
+        "search": summary,
+        "metrics": metrics,
+        "versions": {
+            "python": platform.python_version(),
+            "sklearn": sklearn.__version__,
+            "numpy": np.__version__,
+            "joblib": joblib.__version__,
+        },
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "timings": timings,
+    }
+
+    with tempfile.TemporaryDirectory() as staging:
+        output_dir = args.output_dir or staging
+        os.makedirs(output_dir, exist_ok=True)
+        written = {}
+        for file_name, (name, obj) in artifacts.items():
+            path = os.path.join(output_dir, file_name)
+            atomic_dump(obj, path)
+            written[name] = {"file": file_name, "sha256": file_sha256(path), "bytes": os.path.getsize(path)}
+
+        # Sanity check before anything is published: the written model predicts like the fitted one
+        reloaded = joblib.load(os.path.join(output_dir, written["model"]["file"]))
+        if not np.array_equal(reloaded.predict(X_test), model.predict(X_test)):
+            print("FAIL: the written model does not reproduce the fitted one")
+            return 1
+
+        if args.output_dir:
+            manifest = {"created_at": time.strftime("%Y-%m-%dT%H:%M:%S"), **manifest, "artifacts": written}
+            manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+            tmp_path = f"{manifest_path}.tmp{os.getpid()}"
+            with open(tmp_path, "w") as f:
+                json.dump(manifest, f, indent=2, default=str)
+            os.replace(tmp_path, manifest_path)
+            print(f"\nWrote {', '.join(a['file'] for a in written.values())} and {MANIFEST_FILE} "
+                  f"to {os.path.relpath(os.path.abspath(output_dir))}")
+        else:
+            version_id = publish_version(output_dir, metadata=manifest, activate=not args.no_activate)
+            print(f"\nPublished model version {version_id}"
+                  + (" (not activated)" if args.no_activate else " and made it current"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
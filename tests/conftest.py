@@ -0,0 +1,15 @@
+"""Run the tests from the repository root, as the dashboard and scripts are."""
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    """The data and model files are opened with paths relative to the repository root."""
+    monkeypatch.chdir(REPO_ROOT)
+    return REPO_ROOT
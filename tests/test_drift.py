@@ -0,0 +1,45 @@
+"""Input drift recording is telemetry: a failing drift database must not break a Simulator submit."""
+import logging
+import os
+import sqlite3
+
+import pytest
+
+from conftest import REPO_ROOT
+
+APP_SCRIPT = os.path.join(REPO_ROOT, "real_estate_dashboard.py")
+SUBMIT_KEY = "FormSubmitter:simulator_form_0-Update Simulation"
+
+
+@pytest.fixture
+def failing_drift_db(tmp_path, monkeypatch):
+    """Point the simulation log at a scratch database and make every drift write fail."""
+    import core.drift
+    import core.simulation_log
+
+    log = core.simulation_log.SimulationLog(str(tmp_path / "simulations.db"), legacy_csv_paths=())
+    monitor = core.drift.DriftMonitor(str(tmp_path / "simulations.db"))
+
+    def locked():
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(monitor, "_connect", locked)
+    monkeypatch.setattr(core.simulation_log, "_log", log)
+    monkeypatch.setattr(core.drift, "_monitor", monitor)
+    return log
+
+
+def test_submit_renders_when_drift_database_fails(failing_drift_db, caplog):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_SCRIPT, default_timeout=120)
+    at.run()
+    at.sidebar.number_input[0].set_value(150000.0)
+    at.button(key=SUBMIT_KEY).click()
+    with caplog.at_level(logging.WARNING, logger="core.drift"):
+        at.run()
+
+    assert not at.exception
+    assert any(m.label == "Predicted ROI (Model)" for m in at.metric)
+    assert failing_drift_db.count() == 1  # The submission itself is still logged
+    assert "Input drift not recorded: database is locked" in caplog.text
@@ -0,0 +1,59 @@
+"""The flattened forests predict exactly as the sklearn forests they replace."""
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="module")
+def training_matrix():
+    from core.training import load_training_matrix
+
+    X, roi, _, _ = load_training_matrix(cache_dir=None)
+    return X, roi
+
+
+def fit(kind, X, roi):
+    from sklearn.ensemble import ExtraTreesRegressor, RandomForestRegressor
+
+    forest = {"random_forest": RandomForestRegressor, "extra_trees": ExtraTreesRegressor}[kind]
+    return forest(n_estimators=25, max_features=1.0, random_state=42).fit(X, roi)
+
+
+@pytest.mark.parametrize("kind", ["random_forest", "extra_trees"])
+def test_flat_forest_is_bit_identical(kind, training_matrix):
+    from core.forest import FlatForest, flat_forest
+
+    X, roi = training_matrix
+    model = fit(kind, X, roi)
+    assert flat_forest(model) is not None  # forest_predict takes the flat path for small batches
+    assert np.array_equal(FlatForest.from_model(model).predict(X), model.predict(X))
+
+
+@pytest.mark.parametrize("kind", ["random_forest", "extra_trees"])
+def test_uncut_compact_forest_is_bit_identical(kind, training_matrix):
+    from core.forest import compact_forest
+
+    X, roi = training_matrix
+    model = fit(kind, X, roi)
+    assert np.array_equal(compact_forest(model).predict(X), model.predict(X))
+
+
+def test_nan_row_goes_to_model_predict(training_matrix, monkeypatch):
+    from core.forest import FlatForest, forest_predict
+
+    X, roi = training_matrix
+    model = fit("random_forest", X, roi)
+    row = X[:1].copy()
+    row[0, 0] = np.nan  # As for a listing without a stand size
+
+    with pytest.raises(ValueError):
+        FlatForest.from_model(model).predict(row)  # Not sent right at every split
+
+    calls = []
+
+    def predict(X):
+        calls.append(X)
+        return np.full(len(X), -1.0)
+
+    monkeypatch.setattr(model, "predict", predict)
+    assert forest_predict(model, row).tolist() == [-1.0]
+    assert len(calls) == 1
@@ -0,0 +1,74 @@
+"""The prediction service answers as in-process prediction, and clients fall back when it is gone."""
+import os
+
+import pytest
+
+
+@pytest.fixture
+def scenarios():
+    from benchmarks.predict import sample_scenarios
+
+    return sample_scenarios(5, seed=1)  # Sizes and prices off the ROI cube's grid
+
+
+@pytest.fixture
+def server(tmp_path):
+    from core.prediction_server import start_in_thread
+
+    server = start_in_thread(str(tmp_path / "predict.sock"))
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def client_of(monkeypatch):
+    """Configure the shared client for a socket path, with a clean failure state."""
+    import core.prediction_client as prediction_client
+    from core.prediction import clear_prediction_cache
+
+    def configure(socket_path):
+        client = prediction_client.PredictionClient(socket_path)
+        monkeypatch.setattr(prediction_client, "_client", client)
+        monkeypatch.setattr(prediction_client, "_state", {"retry_at": 0.0, "failures": 0, "last_error": None})
+        clear_prediction_cache()
+        return client
+
+    yield configure
+    clear_prediction_cache()
+
+
+def test_service_prediction_equals_in_process(server, client_of, scenarios):
+    from core.model_registry import get_registry
+    from core.prediction import predict_roi
+
+    client = client_of(server.socket_path)
+    _, artifacts = get_registry().current()
+    assert client.predict(scenarios) == [predict_roi(inputs, artifacts) for inputs in scenarios]
+    assert [predict_roi(inputs) for inputs in scenarios] == [predict_roi(inputs, artifacts) for inputs in scenarios]
+    assert client.version == get_registry().version
+
+
+def test_start_in_thread_raises_when_server_cannot_start(tmp_path):
+    from core.prediction_server import start_in_thread
+
+    with pytest.raises(OSError):
+        start_in_thread(str(tmp_path / "missing" / "predict.sock"))
+
+
+@pytest.mark.parametrize("outage", ["missing", "stopped"])
+def test_client_falls_back_to_in_process(outage, tmp_path, client_of, scenarios):
+    import core.prediction_client as prediction_client
+    from core.model_registry import get_registry
+    from core.prediction import predict_roi
+    from core.prediction_server import start_in_thread
+
+    socket_path = str(tmp_path / "predict.sock")
+    if outage == "stopped":
+        start_in_thread(socket_path).stop()
+    assert not os.path.exists(socket_path)
+    client_of(socket_path)
+
+    _, artifacts = get_registry().current()
+    assert predict_roi(scenarios[0]) == predict_roi(scenarios[0], artifacts)
+    assert prediction_client._state["failures"] == 1
+    assert prediction_client.get_prediction_client() is None  # Resting before the next attempt
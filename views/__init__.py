@@ -0,0 +1 @@
+"""Dashboard pages. Each module exposes ``render()`` and is imported only when its page is selected."""
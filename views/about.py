@@ -0,0 +1,94 @@
+""""ℹ️ About" page."""
+import streamlit as st
+
+
+def render():
+    st.title("ℹ️ About This Dashboard")
+    st.markdown("""
+    **Welcome to the Smart Real Estate ROI Simulator by WestProp.**  
+    This dashboard helps evaluate return on investment (ROI) on smart-enabled properties and promotes data-driven property development.
+
+    ---
+
+    ## 🚀 What’s New
+
+   - 📉 **Market Trends & Analytics:** Explore national and regional price trends, rental yields, and smart feature adoption.
+   - 🔔 **Alerts Tab:** Subscribe for email updates on new projects, price changes, and investment opportunities.
+   - 🏆 **Community Insights:** See most simulated projects, top ROI locations, and investor sentiment trends.
+   - 🌀 **ROI Sensitivity Analysis:** Run what-if scenarios in the Simulator tab to see how changes in rent, price, or features affect ROI.
+   - 🗂️ **My Simulations:** Instantly review and reload your past simulation sessions.
+   - 🛡️ **Admin Analytics Dashboard:** Secure, staff-only analytics for simulation trends, sentiment heatmaps, and raw data downloads.
+                        
+    ---
+                
+    ### Key Features:
+    - 💰 ROI comparison: Traditional vs Smart
+    - 🤖 AI-powered ROI predictions
+    - 🗺️ Interactive ROI Map across WestProp projects
+    - 🗳️ \'Would You Invest?\' voting system
+    - 📄 Executive Summary downloads (PDF/CSV)
+    - 📈 View project-specific ROI analytics for strategic insights  
+    - ♻️ Smart Feature Value insights
+    - 🧬 Investor-Profile matching
+    - 💸 Payment plan calculators for Pokugara & The Hills
+    ### Powered by:
+    - **Streamlit**, **scikit-learn**, **Python**, **folium**, **Reportlab**, and **WestProp project data**
+    
+    👨‍💻 Built by Adonis Chiruka
+                
+     ## 🏢 About WestProp Holdings
+                
+    **Who We Are:**
+     WestProp Holdings Limited is a multi-award-winning luxury properties developer and has been leading the property development industry in Harare, Zimbabwe, since 2007. We made history by becoming the first property development company to list on the Victoria Falls Stock Exchange on the 29th of April 2023.
+
+    We have over sixteen years of experience in real estate development in Zimbabwe with a portfolio of completed and under-construction projects. Our strategic plan to develop real estate worth over US$5 billion is now in full swing with more than 1,000 residential units namely, Homeland 263, Pokugara Clusters Phase 1 and 2, Pokugara Residential homes/stands, Gunhill Rise, Pomona City stands phase 1A and phase 1B and C, Millennium Heights Apartments Block 1, 2,3 and 4. Our retail development, Mbudzi
+    We are developing the land bank to establish a lasting legacy of valuable real estate in Zimbabwe. We aim to become the leading real estate developer for tomorrow’s market in Zimbabwe and Africa as a whole.
+
+    In future, we plan to develop the Mall of Zimbabwe, which promises to be one of Africa’s largest shopping centres, a hub where people can eat, shop, work, and play. We also plan to elevate the tourism and hospitality sector with the development of a first-ever PGA Championship standard golf course, along with luxurious residential and hotel properties, as part of the US$280 million Golf Estate project          
+                
+    **Our Vision:**  
+    Our Vision is to become the leading customer-centric developer of exceptional properties in Zimbabwe.
+
+    **Our Mission:**  
+    Our Mission is to delight our customers with the latest sustainable innovations incorporating modern designs in our residential and commercial offerings in Zimbabwe.
+
+   
+
+    **Core Values:**
+
+    - 🛡️ **Integrity**  
+      Be a trusted and reputable real estate company that meets all stakeholder requirements whilst offering significant returns by maximising investment opportunities in our premium projects.
+
+    - 🌍 **Innovation / Sustainability**  
+      Redefine market trends by focusing on customer needs, improving their quality of life while upholding our environmental responsibility.
+
+    - 📣 **Accountability**  
+      Empower our team to deliver best-in-class service and investment opportunities through a culture of mutual respect, transparency, and responsibility.
+
+    - 🏆 **Excellence**  
+      Lead the premium real estate industry with top-tier value propositions and unmatched product quality.
+
+    **Notable Achievements:**
+    - 🏆 Best High-Rise Development – African Property Awards  
+    - 🌱 Environmental & Sustainability Award – National Property Expo  
+    - 🥇 VFEX-listed pioneering lifestyle developer  
+    - 🏘️ Flagship Projects: Millennium Heights, Pokugara, Pomona City, The Hills Lifestyle Estate, Radisson Serviced Apartments
+""")
+    
+    st.image("ken_sharpe.jpg", width=300, caption="Ken Sharpe – CEO of WestProp Holdings")        
+    st.markdown("""
+    ## 👨🏽‍💼 About the CEO – Ken Sharpe
+
+    Ken Sharpe is the visionary Executive Chairman and CEO of WestProp Holdings. Known for bold innovation and forward-thinking urban design, his mission is to:
+    
+    > “Build communities, not just properties.”  
+    > “Make Zimbabwe a shining example of lifestyle real estate development in Africa.”
+    
+    Ken Sharpe founded WestProp in 2007 and has steered the company over the last fifteen years into a master planner, financier and largest property developer in Zimbabwe. He has a vision for the development of premium lifestyle communities in Harare and is a pioneer in the establishment of a public private partnership with the City of Harare to create commercial, industrial and residential estates.
+    Through his stewardship, Ken has brought to life Pomona City, a 270-hectare mixed-use lifestyle estate that will offer its residents a trusted customer-centric ecosystem to live, work, play & shop. Most prestigious amongst his numerous awards is the Forbes Best of Africa Most Innovative CEO of the Year which Ken was awarded in 2021. He has also been awarded the ZNCC Businessman of the Year Award and numerous others. He has led landmark projects like Millennium Heights, The Hills Lifestyle Estate, Pokugara Residential Estate, Radisson Serviced Apartments, and Pomona City, while championing digital transformation and smart infrastructure in housing.
+
+    📌 Featured in:
+    - ZimReal Summit
+    - Global Africa Business Initiative
+    - Property Magazine Africa
+""")
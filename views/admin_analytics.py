@@ -0,0 +1,222 @@
+""""🛡️ Admin Analytics" page: staff-only usage statistics and system insights."""
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from core.charts import chart_cache_stats, clear_chart_cache
+from core.datasets import dataset_stats
+from core.drift import DRIFT_MIN_SAMPLES, PSI_MODERATE, PSI_SIGNIFICANT, get_drift_monitor
+from core.lazy import import_stats
+from core.model_registry import activate_version, get_registry, list_versions, process_rss_mb
+from core.explanations import clear_explanation_cache, explanation_cache_stats
+from core.prediction import clear_prediction_cache, prediction_cache_stats
+from core.prediction_client import prediction_service_status
+from core.roi_cube import roi_cube_stats
+from core.roi_surface import clear_surface_cache, surface_cache_stats
+from core.simulation_log import get_simulation_log
+from core.timing import TIMING_BUFFER_SIZE, TIMING_LOG, reset, section_summary, slowest_reruns, timing_records
+
+# Most recent simulations listed on the usage tab
+ADMIN_LOG_ROWS = 100
+
+
+def render_model_versions():
+    """Published model versions with their test metrics, and switching the current one."""
+    versions = list_versions()
+    if not versions:
+        return
+    st.dataframe(pd.DataFrame([
+        {
+            "Version": v["version"],
+            "Created": v["created_at"],
+            "Current": "✅" if v["active"] else "",
+            "Test R²": (v.get("metrics") or {}).get("test", {}).get("r2"),
+            "Test MAE (ROI %)": (v.get("metrics") or {}).get("test", {}).get("mae"),
+            "Features": len(v["features"]),
+            "Files": ", ".join(v["files"]),
+        }
+        for v in versions
+    ]), use_container_width=True)
+    selected = st.selectbox("Model version", [v["version"] for v in versions], key="model_version_select")
+    if st.button("Activate Version", key="activate_model_version_btn"):
+        activate_version(selected)
+        st.success(f"Version {selected} is now current; every session switches on its next rerun.")
+
+
+def render_input_drift():
+    st.subheader("Input Drift")
+    st.caption(f"Simulator submissions compared with the model's training data. PSI below {PSI_MODERATE} is stable, "
+               f"{PSI_SIGNIFICANT} or more is significant drift; KS above its critical value is a significant shift "
+               f"at 5%. Inputs outside the training data are where the model extrapolates. Judged from "
+               f"{DRIFT_MIN_SAMPLES} submissions per input.")
+    monitor = get_drift_monitor()
+    try:
+        report = pd.DataFrame(monitor.report())
+    except (OSError, ValueError, KeyError) as e:
+        st.warning(f"Input drift is unavailable: {e}")
+        return
+    st.dataframe(report.set_index("Input"), use_container_width=True)
+    drifting = report[report["Status"].isin(["Moderate drift", "Significant drift"])]
+    if not drifting.empty:
+        st.warning(f"Drifting inputs: {', '.join(drifting['Input'])}")
+    name = st.selectbox("Compare bins of", report["Input"], key="drift_input_select")
+    st.dataframe(pd.DataFrame(monitor.bins(name)).set_index("Bin"), use_container_width=True)
+    if st.button("Reset Drift Summaries", key="reset_drift_btn"):
+        monitor.reset()
+        st.success("Drift summaries reset.")
+        st.rerun()
+
+
+def render_performance():
+    """Per-section latency summary, histograms and the slowest rerun traces."""
+    st.subheader("Section Latency")
+    st.caption(f"The last {TIMING_BUFFER_SIZE:,} timed sections in this server process"
+               + (f", also logged to `{TIMING_LOG}`." if TIMING_LOG else "."))
+    summary = section_summary()
+    if not summary:
+        st.info("No timings recorded yet. Use the dashboard and come back.")
+        return
+    st.dataframe(pd.DataFrame(summary), use_container_width=True)
+
+    section = st.selectbox("Latency histogram for", [row["Section"] for row in summary], key="perf_section")
+    values = np.array([r["Milliseconds"] for r in timing_records(section)])
+    counts, edges = np.histogram(values, bins=min(20, max(1, len(np.unique(values)))))
+    histogram_df = pd.DataFrame({
+        "Latency (ms)": [f"{lo:.1f}–{hi:.1f}" for lo, hi in zip(edges[:-1], edges[1:])],
+        "Count": counts,
+    })
+    st.bar_chart(histogram_df.set_index("Latency (ms)"))
+
+    st.subheader("Slowest Reruns")
+    for trace in slowest_reruns()[:10]:
+        started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(trace["started_at"]))
+        with st.expander(f"{trace['page']} — {trace['total_ms']:,.0f} ms ({started})"):
+            if trace["sections"]:
+                sections_df = pd.DataFrame(trace["sections"], columns=["Section", "Milliseconds"])
+                sections_df["Share of Rerun (%)"] = (sections_df["Milliseconds"] / trace["total_ms"] * 100).round(1)
+                st.dataframe(sections_df.round(2), use_container_width=True)
+            else:
+                st.caption("No timed sections ran during this rerun.")
+
+    if st.button("Clear Timings", key="clear_timings_btn"):
+        reset()
+        st.rerun()
+
+
+def render():
+    st.title("🛡️ Admin Analytics")
+    st.markdown("Admin-only access to detailed usage statistics and system insights.")
+
+    # Initialize admin analytics login state if not exists
+    if "admin_analytics_logged_in" not in st.session_state:
+        st.session_state.admin_analytics_logged_in = False
+        st.session_state.admin_logged_in = False  # For backward compatibility
+
+    # Show login form if not logged in
+    if not st.session_state.admin_analytics_logged_in:
+        with st.form("admin_login_form"):
+            st.subheader("Admin Login")
+            password = st.text_input("Enter Admin Password", type="password", key="admin_password")
+            if st.form_submit_button("Login"):
+                if password == "westprop2025":
+                    st.session_state.admin_analytics_logged_in = True
+                    st.session_state.admin_logged_in = True  # For backward compatibility
+                    st.rerun()
+                else:
+                    st.error("❌ Incorrect password. Please try again.")
+        st.stop()  # Stop execution here if not logged in
+    
+    # Only show this content if logged in
+    usage_tab, performance_tab = st.tabs(["📊 Usage & System", "⏱️ Performance"])
+
+    with usage_tab:
+        st.subheader("Session Log Analysis")
+        try:
+            simulation_log = get_simulation_log()
+            summary = simulation_log.summary()
+            st.write(f"Total Simulations Recorded: {summary['total']}")
+            st.caption(f"Latest {ADMIN_LOG_ROWS} simulations")
+            st.dataframe(simulation_log.page(limit=ADMIN_LOG_ROWS))
+
+            st.subheader("Key Metrics from Simulations")
+            if summary["total"]:
+                st.write(f"Average Market Price Simulated: ${summary['avg_market_price'] or 0:,.2f}")
+                st.write(f"Average Monthly Rent Simulated: ${summary['avg_monthly_rent'] or 0:,.2f}")
+                st.write(f"Average Predicted ROI (Model): {summary['avg_predicted_roi'] or 0:.2f}%")
+                st.write(f"Average Smart ROI (Calculated): {summary['avg_smart_roi'] or 0:.2f}%")
+
+            st.subheader("Smart Feature Usage")
+            usage_data = summary["feature_usage"]
+            if summary["total"]:
+                usage_df = pd.DataFrame(usage_data.items(), columns=["Smart Feature", "Times Used"])
+                st.dataframe(usage_df.sort_values(by="Times Used", ascending=False))
+            else:
+                st.info("No smart feature usage data available.")
+            st.dataframe(pd.DataFrame([simulation_log.stats()]), use_container_width=True)
+        except Exception as e:
+            st.error(f"An error occurred during admin analytics: {e}")
+
+        render_input_drift()
+
+        st.subheader("Model Artifacts")
+        st.caption("Loaded once per server process and swapped in automatically when the files or the current version change on disk.")
+        registry = get_registry()
+        st.write(f"Model Version: `{registry.version}`"
+                 + (f" (published version `{registry.version_id}`)" if registry.version_id else " (files in `models/`)"))
+        st.write(f"Server Process Memory (RSS): {process_rss_mb():,.1f} MB · Artifact swaps: {registry.swaps}")
+        st.dataframe(pd.DataFrame(registry.stats()), use_container_width=True)
+        render_model_versions()
+
+        st.subheader("Prediction Cache")
+        st.caption("Simulator predictions and ROI surfaces shared across sessions; emptied automatically when the model version changes.")
+        cache_df = pd.DataFrame([prediction_cache_stats(), surface_cache_stats(), explanation_cache_stats()],
+                                index=["Predictions", "ROI Surfaces", "Explanations"])
+        st.dataframe(cache_df, use_container_width=True)
+        if st.button("Clear Prediction Cache", key="clear_prediction_cache_btn"):
+            clear_prediction_cache()
+            clear_surface_cache()
+            clear_explanation_cache()
+            st.success("Prediction cache cleared.")
+
+        st.subheader("ROI Cube")
+        st.caption("Predictions precomputed for every suburb, property type and smart-feature combination at reference "
+                   "sizes and prices (`scripts/build_roi_cube.py`); used only while built from the current model.")
+        st.dataframe(pd.DataFrame([roi_cube_stats(registry.version)]), use_container_width=True)
+
+        st.subheader("Prediction Service")
+        st.caption("Shared micro-batching service (`scripts/prediction_server.py`) that answers cache misses for every "
+                   "server process when `PREDICTION_SOCKET` is set; predictions run in-process while it is unreachable.")
+        st.dataframe(pd.DataFrame([prediction_service_status()]), use_container_width=True)
+
+        st.subheader("Chart Cache")
+        st.caption("Rendered matplotlib charts kept as PNG bytes, one entry per chart, inputs and resolution.")
+        st.dataframe(pd.DataFrame([chart_cache_stats()]), use_container_width=True)
+        if st.button("Clear Chart Cache", key="clear_chart_cache_btn"):
+            clear_chart_cache()
+            st.success("Chart cache cleared.")
+
+        st.subheader("Shared Datasets")
+        st.caption("CSV files parsed once per server process and re-parsed only when they change on disk.")
+        st.dataframe(pd.DataFrame(dataset_stats()), use_container_width=True)
+
+        st.subheader("Deferred Imports")
+        st.caption("Heavy libraries imported the first time a page used them, with the time that first import took.")
+        st.dataframe(pd.DataFrame(import_stats()), use_container_width=True)
+
+    with performance_tab:
+        render_performance()
+
+    if st.button("Logout Admin", key="admin_logout_btn"):
+        # Clear all admin-related session state
+        st.session_state.admin_analytics_logged_in = False
+        st.session_state.admin_logged_in = False
+        # Clear any navigation flags
+        if 'go_to_roi_map' in st.session_state:
+            del st.session_state['go_to_roi_map']
+            
+        # Show logout message
+        st.success("Successfully logged out!")
+        # Force a rerun to update the UI
+        st.rerun()
@@ -0,0 +1,596 @@
+"""🔔 Alerts page: alert subscriptions and the admin subscriber manager."""
+import csv
+import os
+from datetime import datetime as dt
+
+import pandas as pd
+import streamlit as st
+
+from core.timing import timed
+
+
+def render():
+    st.title("🔔 Alerts & Notifications")
+    st.markdown("Stay updated with important market changes, new listings, and personalized alerts.")
+    
+    # Subscription form for all users
+    st.subheader("📩 Subscribe to Alerts")
+    with st.form("email_subscription"):
+        email = st.text_input("Your Email")
+        frequency = st.selectbox("Alert Frequency", ["Daily", "Weekly", "Monthly"], index=1)
+        interests = st.multiselect("Areas of Interest", 
+                                ["New Listings", "Price Drops", "Market Trends", "Project Updates", "Investment Opportunities"])
+        
+        if st.form_submit_button("Subscribe"):
+            if email and "@" in email:
+                try:
+                    # Ensure data directory exists
+                    os.makedirs('data', exist_ok=True)
+                    subscribers_file = 'data/email_alert_subscribers.csv'
+                    
+                    # Create or update the subscribers file
+                    if not os.path.exists(subscribers_file):
+                        with open(subscribers_file, 'w', newline='', encoding='utf-8') as f:
+                            writer = csv.writer(f)
+                            writer.writerow(['email', 'frequency', 'interests', 'subscribed_at', 'last_sent', 'status'])
+                    
+                    # Read existing data
+                    with timed("csv.read:email_alert_subscribers.csv"):
+                        df = pd.read_csv(subscribers_file) if os.path.exists(subscribers_file) else pd.DataFrame()
+                    
+                    # Ensure the DataFrame has the required columns
+                    required_columns = ['email', 'frequency', 'interests', 'subscribed_at', 'last_sent', 'status']
+                    for col in required_columns:
+                        if col not in df.columns:
+                            df[col] = ''
+                    
+                    # Update or add subscriber
+                    if not df.empty and 'email' in df.columns and email in df['email'].values:
+                        df.loc[df['email'] == email, 'frequency'] = frequency
+                        df.loc[df['email'] == email, 'interests'] = ', '.join(interests)
+                        df.loc[df['email'] == email, 'status'] = 'Active'
+                        st.success("Your subscription preferences have been updated!")
+                    else:
+                        new_row = {
+                            'email': email,
+                            'frequency': frequency,
+                            'interests': ', '.join(interests) if interests else '',
+                            'subscribed_at': dt.now().strftime('%Y-%m-%d %H:%M:%S'),
+                            'last_sent': '',
+                            'status': 'Active'
+                        }
+                        df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
+                        st.success("Thank you for subscribing to our alerts!")
+                    
+                    # Save back to file
+                    with timed("csv.write:email_alert_subscribers.csv"):
+                        df.to_csv(subscribers_file, index=False)
+                except Exception as e:
+                    st.error(f"An error occurred: {str(e)}")
+            else:
+                st.error("Please enter a valid email address.")
+    
+    # Admin section (only visible to admins)
+    if st.session_state.get("is_admin", False):
+        st.markdown("---")
+        st.subheader("🔒 Admin: Manage Subscribers")
+        st.success("🛡️ ADMIN MODE ACTIVE - You have full access to subscriber management")
+        st.info("You can view and manage all subscribers below.")
+        
+        # Ensure data directory exists
+        os.makedirs('data', exist_ok=True)
+        
+        # Define subscribers file path
+        subscribers_path = os.path.join('data', 'email_alert_subscribers.csv')
+        
+        # Create empty subscribers file if it doesn't exist
+        if not os.path.exists(subscribers_path):
+            with timed("csv.write:email_alert_subscribers.csv"):
+                pd.DataFrame(columns=['email', 'name', 'frequency', 'interests', 'subscribed_at', 'last_sent', 'status']).to_csv(subscribers_path, index=False)
+            st.warning("Created a new subscribers file as none existed.")
+        
+        # Load and display subscribers data
+        st.write("### Current Subscribers")
+        
+        # Define required columns
+        required_columns = ['email', 'name', 'frequency', 'interests', 'subscribed_at', 'last_sent', 'status']
+        
+        try:
+            # Try to load existing subscribers
+            with timed("csv.read:email_alert_subscribers.csv"):
+                subscribers_df = pd.read_csv(subscribers_path)
+        
+            # Ensure required columns exist
+            for col in required_columns:
+                if col not in subscribers_df.columns:
+                    subscribers_df[col] = ''
+            
+            # Ensure name column exists and fill any missing values
+            if 'name' not in subscribers_df.columns:
+                subscribers_df['name'] = ''
+            subscribers_df['name'] = subscribers_df['name'].fillna('')
+            
+            # Set default status for new entries
+            if 'status' not in subscribers_df.columns:
+                subscribers_df['status'] = 'Active'
+            subscribers_df['status'] = subscribers_df['status'].fillna('Active')
+        
+        except FileNotFoundError:
+            # If file doesn't exist, create an empty DataFrame with required columns
+            subscribers_df = pd.DataFrame(columns=required_columns)
+            subscribers_df['status'] = 'Active'  # Set default status for new entries
+        except Exception as e:
+            st.error(f"Error loading subscribers: {str(e)}")
+            subscribers_df = pd.DataFrame(columns=required_columns)
+            subscribers_df['status'] = 'Active'  # Set default status for new entries
+        
+        # Initialize editing state if not exists
+        if 'editing_subscriber' not in st.session_state:
+            st.session_state.editing_subscriber = None
+            
+        # Display subscribers with edit buttons
+        for idx, subscriber in subscribers_df.iterrows():
+            with st.expander(f"📧 {subscriber['email']}", expanded=False):
+                # Show edit form when edit button is clicked
+                if st.button(f"✏️ Edit {subscriber['email']}", key=f"edit_{idx}"):
+                    st.session_state['editing_subscriber'] = idx
+                
+                if st.session_state.get('editing_subscriber') == idx:
+                    # Show edit form
+                    with st.form(key=f"edit_subscriber_{idx}"):
+                        edited_email = st.text_input("Email", value=subscriber.get('email', ''))
+                        edited_name = st.text_input("Name", value=subscriber.get('name', ''))
+                        edited_frequency = st.selectbox(
+                            "Frequency",
+                            ["Daily", "Weekly", "Monthly"],
+                            index=["Daily", "Weekly", "Monthly"].index(subscriber.get('frequency', 'Weekly'))
+                        )
+                        current_interests = [i.strip() for i in str(subscriber.get('interests', '')).split(',') if i.strip()]
+                        edited_interests = st.multiselect(
+                            "Interests",
+                            ["New Listings", "Price Drops", "Market Trends", "Project Updates"],
+                            default=[i for i in current_interests if i in ["New Listings", "Price Drops", "Market Trends", "Project Updates"]]
+                        )
+                        edited_status = st.selectbox(
+                            "Status",
+                            ["Active", "Inactive", "Unsubscribed"],
+                            index=["Active", "Inactive", "Unsubscribed"].index(subscriber.get('status', 'Active'))
+                        )
+                        
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            if st.form_submit_button("💾 Save Changes"):
+                                # Update the subscriber data
+                                subscribers_df.at[idx, 'email'] = edited_email
+                                subscribers_df.at[idx, 'name'] = edited_name
+                                subscribers_df.at[idx, 'frequency'] = edited_frequency
+                                subscribers_df.at[idx, 'interests'] = ", ".join(edited_interests)
+                                subscribers_df.at[idx, 'status'] = edited_status
+                                # Save changes
+                                os.makedirs('data', exist_ok=True)
+                                with timed("csv.write:email_alert_subscribers.csv"):
+                                    subscribers_df.to_csv("data/email_alert_subscribers.csv", index=False)
+                                st.success("✅ Subscriber updated successfully!")
+                                st.session_state.editing_subscriber = None
+                                st.rerun()
+                        with col2:
+                            if st.form_submit_button("❌ Cancel"):
+                                st.session_state.editing_subscriber = None
+                                st.rerun()
+                
+                # Display subscriber details
+                st.write(f"**Name:** {subscriber.get('name', 'N/A')}")
+                st.write(f"**Frequency:** {subscriber.get('frequency', 'N/A')}")
+                st.write(f"**Interests:** {subscriber.get('interests', 'N/A')}")
+                st.write(f"**Status:** {subscriber.get('status', 'N/A')}")
+                st.write(f"**Subscribed On:** {subscriber.get('subscribed_at', 'N/A')}")
+                if subscriber.get('last_sent'):
+                    st.write(f"**Last Email Sent:** {subscriber['last_sent']}")
+                
+                # Add delete button
+                if st.button(f"🗑️ Delete {subscriber['email']}", key=f"delete_{idx}"):
+                    subscribers_df = subscribers_df.drop(index=idx)
+                    os.makedirs('data', exist_ok=True)
+                    with timed("csv.write:email_alert_subscribers.csv"):
+                        subscribers_df.to_csv("data/email_alert_subscribers.csv", index=False)
+                    st.success("✅ Subscriber deleted successfully!")
+                    st.rerun()
+            
+        # Add new subscriber form
+        with st.expander("➕ Add New Subscriber", expanded=False):
+            with st.form("add_subscriber_form"):
+                st.write("### Add New Subscriber")
+                new_email = st.text_input("Email")
+                new_name = st.text_input("Name")
+                new_frequency = st.selectbox("Frequency", ["Daily", "Weekly", "Monthly"])
+                new_interests = st.multiselect(
+                    "Interests",
+                    ["New Listings", "Price Drops", "Market Trends", "Project Updates"],
+                    default=["New Listings"]
+                )
+                
+                if st.form_submit_button("Add Subscriber"):
+                    if new_email and "@" in new_email:
+                        # Check if email already exists
+                        if new_email in subscribers_df['email'].values:
+                            st.warning("This email is already subscribed.")
+                        else:
+                            # Add new subscriber
+                            new_subscriber = pd.DataFrame([{
+                                'email': new_email,
+                                'name': new_name,
+                                'frequency': new_frequency,
+                                'interests': ", ".join(new_interests),
+                                'subscribed_at': dt.now().strftime("%Y-%m-%d %H:%M:%S"),
+                                'last_sent': '',
+                                'status': 'Active'
+                            }])
+                            
+                            # Append to existing data and save
+                            subscribers_df = pd.concat([subscribers_df, new_subscriber], ignore_index=True)
+                            os.makedirs('data', exist_ok=True)
+                            with timed("csv.write:email_alert_subscribers.csv"):
+                                subscribers_df.to_csv("data/email_alert_subscribers.csv", index=False)
+                            st.success(f"✅ {new_email} has been added as a subscriber!")
+                            st.rerun()
+                    else:
+                        st.error("Please enter a valid email address.")
+                        
+        # Bulk Email Section
+        st.markdown("### 📧 Send Bulk Email to Subscribers")
+        
+        # Use a form key that persists between reruns
+        form_key = "bulk_email_form"
+        
+        # Initialize form data in session state if not exists
+        if 'email_form_data' not in st.session_state:
+            st.session_state.email_form_data = {
+                'subject': '',
+                'body': """Dear {name},\n\n[Your message here]\n\nBest regards,\nWestProp Team""",
+                'status_filter': ["Active"],
+                'frequency_filter': ["Weekly"]
+            }
+
+        # Show email status if available
+        if 'email_sent' in st.session_state and st.session_state.email_sent:
+            st.balloons()
+            with st.container():
+                st.success("✅ Email sent successfully! You can find a copy in your Sent folder.")
+                st.balloons()
+                
+                # Add a button to send another email
+                if st.button("✉️ Send Another Email"):
+                    del st.session_state.email_sent
+                    st.rerun()
+                    
+                st.markdown("---")
+                # Clear the sent status after showing the message
+                del st.session_state.email_sent
+        else:
+            # Show email composition form
+            with st.expander("✏️ Compose Email", expanded=True):
+                with st.form("email_compose_form"):
+                    # Subject and body inputs
+                    subject = st.text_input(
+                        "Subject", 
+                        value=st.session_state.email_form_data['subject'],
+                        key="email_subject"
+                    )
+                    
+                    body = st.text_area(
+                        "Email Body", 
+                        value=st.session_state.email_form_data['body'],
+                        key="email_body"
+                    )
+                    
+                    # Filter options
+                    st.markdown("**Filters**")
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        status_options = ["Active", "Paused", "Unsubscribed"]
+                        if 'status' in subscribers_df:
+                            existing_statuses = [s for s in subscribers_df['status'].dropna().unique().tolist() 
+                                              if s and s not in status_options]
+                            status_options.extend(existing_statuses)
+                        
+                        status_filter = st.multiselect(
+                            "Status",
+                            options=status_options,
+                            default=st.session_state.email_form_data['status_filter'],
+                            key="status_filter"
+                        )
+                    
+                    with col2:
+                        frequency_options = ["Daily", "Weekly", "Monthly"]
+                        if 'frequency' in subscribers_df:
+                            existing_freqs = [f for f in subscribers_df['frequency'].unique().tolist() 
+                                           if f and f not in frequency_options]
+                            frequency_options.extend(existing_freqs)
+                        
+                        frequency_filter = st.multiselect(
+                            "Frequency",
+                            options=frequency_options,
+                            default=st.session_state.email_form_data['frequency_filter'],
+                            key="frequency_filter"
+                        )
+                    
+                    # Send button with confirmation
+                    if st.form_submit_button("Send Email"):
+                        if not st.session_state.get('email_subject') or not st.session_state.get('email_body'):
+                            st.error("Please fill in both subject and email body.")
+                            st.stop()
+                        
+                        # Save form data to session state
+                        st.session_state.email_form_data = {
+                            'subject': st.session_state.email_subject,
+                            'body': st.session_state.email_body,
+                            'status_filter': st.session_state.get('status_filter', ["Active"]),
+                            'frequency_filter': st.session_state.get('frequency_filter', ["Weekly"])
+                        }
+                        
+                        # Filter subscribers based on selected filters
+                        filtered_subs = subscribers_df.copy()
+                        if st.session_state.email_form_data['status_filter']:
+                            filtered_subs = filtered_subs[filtered_subs['status'].isin(st.session_state.email_form_data['status_filter'])]
+                        if st.session_state.email_form_data['frequency_filter']:
+                            filtered_subs = filtered_subs[filtered_subs['frequency'].isin(st.session_state.email_form_data['frequency_filter'])]
+                        
+                        if len(filtered_subs) == 0:
+                            st.warning("No subscribers match the selected filters.")
+                            st.stop()
+                        
+                        # Send the emails with a spinner
+                        with st.spinner(f"Sending emails to {len(filtered_subs)} subscribers..."):
+                            from email_service import send_bulk_email
+                            success_count, error_count = send_bulk_email(
+                                filtered_subs,
+                                st.session_state.email_form_data['subject'],
+                                st.session_state.email_form_data['body']
+                            )
+                            
+                            if success_count > 0:
+                                st.session_state.email_sent = True
+                                st.session_state.email_sent_count = success_count
+                                st.session_state.email_error_count = error_count
+                                st.rerun()
+                            elif error_count > 0:
+                                st.error(f" Failed to send to all {error_count} subscribers. Please try again.")
+            
+            # Update the filtered subscribers count in the form
+            filtered_subs = subscribers_df.copy()
+            if 'status_filter' in st.session_state and st.session_state.status_filter:
+                filtered_subs = filtered_subs[filtered_subs['status'].isin(st.session_state.status_filter)]
+            if 'frequency_filter' in st.session_state and st.session_state.frequency_filter:
+                filtered_subs = filtered_subs[filtered_subs['frequency'].isin(st.session_state.frequency_filter)]
+            
+            # Update the recipients count in the form
+            st.session_state.recipients_count = len(filtered_subs)
+        
+        # Show email status if available
+        if 'email_sent' in st.session_state and st.session_state.email_sent:
+            st.balloons()
+            with st.container():
+                st.success("Email sent successfully! You can find a copy in your Sent folder.")
+                st.balloons()
+                
+                # Add a button to send another email
+                if st.button("Send Another Email"):
+                    del st.session_state.email_sent
+                    st.rerun()
+                    
+                st.markdown("---")
+        
+        # Show summary stats
+        st.write("### Subscriber Statistics")
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Total Subscribers", len(subscribers_df))
+            
+        with col2:
+            active_count = len(subscribers_df[subscribers_df['status'].str.lower() == 'active']) if 'status' in subscribers_df else 0
+            st.metric("Active Subscribers", active_count)
+            
+        with col3:
+            st.metric("Last Updated", dt.now().strftime("%Y-%m-%d %H:%M"))
+            
+        with col4:
+            if not subscribers_df.empty and 'frequency' in subscribers_df and not subscribers_df['frequency'].empty:
+                freq = subscribers_df['frequency'].mode()[0] if not subscribers_df['frequency'].empty else 'N/A'
+            else:
+                freq = 'N/A'
+            st.metric("Most Common Frequency", freq)
+            
+            # Make a copy and reset index to avoid MultiIndex issues
+            editable_df = subscribers_df.copy().reset_index(drop=True)
+            
+            # Convert datetime columns to string for editing
+            datetime_cols = ['subscribed_at', 'last_sent']
+            for col in datetime_cols:
+                if col in editable_df.columns:
+                    # Convert datetime to string for display
+                    if pd.api.types.is_datetime64_any_dtype(editable_df[col]):
+                        editable_df[col] = editable_df[col].dt.strftime('%Y-%m-%d %H:%M:%S')
+                    else:
+                        # If not datetime, ensure it's a string
+                        editable_df[col] = editable_df[col].astype(str)
+                        
+                        # Try to convert to datetime and back to string
+                        try:
+                            editable_df[col] = pd.to_datetime(editable_df[col], errors='coerce')
+                            editable_df[col] = editable_df[col].dt.strftime('%Y-%m-%d %H:%M:%S')
+                        except:
+                            pass
+            
+            # Show data editor for managing subscribers
+            edited_df = st.data_editor(
+                editable_df,
+                column_config={
+                    "email": st.column_config.TextColumn(
+                        "Email",
+                        help="Subscriber's email address",
+                        required=True
+                    ),
+                    "name": st.column_config.TextColumn(
+                        "Name",
+                        help="Subscriber's name"
+                    ),
+                    "frequency": st.column_config.SelectboxColumn(
+                        "Frequency",
+                        help="How often to send updates",
+                        options=["Daily", "Weekly", "Monthly"],
+                        required=True
+                    ),
+                    "interests": st.column_config.TextColumn(
+                        "Interests",
+                        help="Comma-separated list of interests"
+                    ),
+                    "status": st.column_config.SelectboxColumn(
+                        "Status",
+                        help="Subscription status",
+                        options=["Active", "Inactive", "Unsubscribed"],
+                        required=True
+                    ),
+                    "subscribed_at": st.column_config.TextColumn(
+                        "Subscribed On",
+                        help="Date of subscription"
+                    ),
+                    "last_sent": st.column_config.TextColumn(
+                        "Last Email Sent",
+                        help="Date of last email sent"
+                    )
+                },
+                hide_index=True,
+                use_container_width=True,
+                key="subscribers_editor_advanced"
+            )
+            
+            # Handle saving changes
+            if st.button(" Save All Changes"):
+                try:
+                    # Get edited data
+                    edited_data = st.session_state.subscribers_editor_advanced["edited_rows"]
+                    
+                    # Apply changes to the dataframe
+                    for idx, changes in edited_data.items():
+                        for col, value in changes.items():
+                            editable_df.at[idx, col] = value
+                    
+                    # Save the changes back to the CSV in the data directory
+                    os.makedirs('data', exist_ok=True)
+                    with timed("csv.write:email_alert_subscribers.csv"):
+                        editable_df.to_csv("data/email_alert_subscribers.csv", index=False)
+                    st.success(" Changes saved successfully!")
+                    st.rerun()
+                except Exception as e:
+                    st.error(f" Error saving changes: {str(e)}")
+            
+            # Confirmation dialog for sending emails
+            if 'pending_email' in st.session_state and st.session_state.pending_email is not None:
+                pending = st.session_state.pending_email
+                filtered_subs = pending.get('subs', pd.DataFrame())
+                email_subject = pending.get('subject', '')
+                email_body = pending.get('body', '')
+                
+                with st.container():
+                    st.markdown("---")
+                    st.subheader(" Email Confirmation")
+                    
+                    # Confirmation section
+                    st.markdown("###  Confirmation")
+                    st.markdown(f"**Recipients:** {len(filtered_subs)} subscribers")
+                    
+                    # Show a sample of recipients (first 3)
+                    if not filtered_subs.empty:
+                        sample_recipients = filtered_subs['email'].head(3).tolist()
+                        if len(filtered_subs) > 3:
+                            sample_recipients.append("...")
+                        st.markdown(f"**Sample recipients:**  \n{', '.join(sample_recipients)}")
+                        
+                    st.markdown("**Sending to:**")
+                    if pending.get('filter_type', 'all') == 'all':
+                        st.markdown("✅ All subscribers")
+                    else:
+                        st.markdown(f"✅ {pending.get('filter_type', '').title()} subscribers")
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    if st.button(f"✅ Confirm & Send to {len(filtered_subs)} Subscribers", key=f"confirm_send_{len(filtered_subs)}_{pd.Timestamp.now().value}"):
+                        with st.spinner(f"Sending to {len(filtered_subs)} subscribers..."):
+                            try:
+                                # Initialize progress bar and status text
+                                progress_bar = st.progress(0)
+                                status_text = st.empty()
+                                
+                                def update_progress(progress, current, total, success, error):
+                                    progress_bar.progress(progress)
+                                    status_text.text(f"Sending... {current}/{total} ({success} sent, {error} failed)")
+                                
+                                # Send the emails with a spinner
+                                with st.spinner(f"Sending emails to {len(filtered_subs)} subscribers..."):
+                                    from email_service import send_bulk_email
+                                    success_count, error_count = send_bulk_email(
+                                        filtered_subs, 
+                                        email_subject, 
+                                        email_body,
+                                        progress_callback=update_progress
+                                    )
+                                
+                                # Update subscriber last_sent timestamps
+                                if not filtered_subs.empty and 'email' in filtered_subs.columns:
+                                    subscribers_df.loc[subscribers_df['email'].isin(filtered_subs['email']), 'last_sent'] = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+                                    with timed("csv.write:email_alert_subscribers.csv"):
+                                        subscribers_df.to_csv("data/email_alert_subscribers.csv", index=False)
+                                
+                                # Show success message
+                                st.success(f"✅ Successfully sent {success_count} emails!")
+                                if error_count > 0:
+                                    st.warning(f"⚠️ Failed to send {error_count} emails")
+                                
+                                # Clear the pending email state
+                                del st.session_state.pending_email
+                                st.rerun()
+                                
+                            except Exception as e:
+                                st.error(f"❌ Failed to send emails: {str(e)}")
+                
+                with col2:
+                    if st.button("❌ Cancel", key=f"cancel_send_email_{pd.Timestamp.now().value}"):
+                        del st.session_state.pending_email
+                        st.rerun()
+                
+                st.markdown("---")
+                st.balloons()
+                
+                # Clear the pending email after successful send
+                if 'pending_email' in st.session_state:
+                    del st.session_state.pending_email
+                
+                # Show success message and refresh
+                st.success("✅ Email sent successfully!")
+                st.rerun()
+            
+            st.markdown("### ✉️ Test Email System")
+            test_recipient = st.text_input("Recipient Email Address", 
+                                        value=st.session_state.get("user_email", ""),
+                                        key="test_recipient")
+            
+            if st.button("✉️ Send Test Email", key="send_test_email"):
+                if not test_recipient or "@" not in test_recipient:
+                    st.error("Please enter a valid email address")
+                else:
+                    with st.spinner("Sending test email..."):
+                        try:
+                            from send_alerts import send_email
+                            test_subject = "✅ WestProp Alerts: Test Email"
+                            test_body = "This is a test email from the WestProp Alerts system.\n\nIf you received this, the email system is working correctly!"
+                            
+                            if send_email(test_recipient, test_subject, test_body):
+                                st.success(f"✅ Test email sent to {test_recipient}")
+                                st.balloons()
+                            else:
+                                st.error("Failed to send test email. Please check the logs for more details.")
+                        except Exception as e:
+                            st.error(f"Failed to send test email: {str(e)}")
+                            st.error("Please ensure the email service is properly configured with valid credentials.")
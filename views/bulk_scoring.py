@@ -0,0 +1,96 @@
+""""📥 Bulk Scoring" page: Predicted, Traditional and Smart ROI for a whole spreadsheet of listings."""
+import os
+
+import pandas as pd
+import streamlit as st
+
+from core.bulk_scoring import (
+    BULK_CHUNK_ROWS,
+    PREDICTED_COLUMN,
+    SMART_COLUMN,
+    TRADITIONAL_COLUMN,
+    new_output_path,
+    parquet_available,
+    score_csv,
+)
+
+PREVIEW_ROWS = 20
+MIME_TYPES = {"csv": "text/csv", "parquet": "application/octet-stream"}
+
+
+def read_preview(path, fmt):
+    """The first ``PREVIEW_ROWS`` rows of a scored file, without reading the rest."""
+    if fmt == "csv":
+        return pd.read_csv(path, nrows=PREVIEW_ROWS)
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    if parquet_file.num_row_groups == 0:
+        return pd.DataFrame()
+    return next(parquet_file.iter_batches(batch_size=PREVIEW_ROWS)).to_pandas()
+
+
+def render():
+    st.title("📥 Bulk Scoring")
+    st.markdown("Upload listings in the format of `real_estate_data_template.csv` to get the Predicted, "
+                "Traditional and Smart ROI of every row as a downloadable file.")
+    st.caption(f"The file is read, scored and written {BULK_CHUNK_ROWS:,} rows at a time. Rows with a "
+               "missing, infinite or non-numeric model input get no Predicted ROI; files without "
+               "`rental_income_usd_monthly (est)` get no Traditional or Smart ROI.")
+
+    upload = st.file_uploader("Listings CSV", type=["csv"], key="bulk_scoring_upload")
+    formats = ["CSV"] + (["Parquet"] if parquet_available() else [])
+    output_format = st.radio("Output format", formats, horizontal=True, key="bulk_scoring_format")
+
+    if upload is not None and st.button("Score Listings", key="bulk_scoring_btn"):
+        previous = st.session_state.get("bulk_scoring_result")
+        if previous and os.path.exists(previous["output"]):
+            os.remove(previous["output"])
+        st.session_state.bulk_scoring_result = None
+
+        fmt = output_format.lower()
+        output = new_output_path(fmt)
+        progress_bar = st.progress(0.0, text="Scoring listings...")
+
+        def update_progress(fraction, rows):
+            progress_bar.progress(fraction, text=f"{rows:,} rows scored")
+
+        try:
+            result = score_csv(upload, output, fmt, progress=update_progress)
+        except ValueError as e:
+            os.remove(output)
+            progress_bar.empty()
+            st.error(f"Could not score {upload.name}: {e}")
+            return
+        progress_bar.progress(1.0, text=f"{result['rows']:,} rows scored")
+        stem = os.path.splitext(upload.name)[0]
+        st.session_state.bulk_scoring_result = {**result, "format": fmt, "file_name": f"{stem}_scored.{fmt}"}
+
+    result = st.session_state.get("bulk_scoring_result")
+    if not result or not os.path.exists(result["output"]):
+        return
+
+    st.success(f"Scored {result['rows']:,} listings in {result['seconds']:.1f} s "
+               f"({result['rows_per_s']:,} rows/second).")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Listings", f"{result['rows']:,}")
+    col2.metric("With Predicted ROI", f"{result['predicted']:,}")
+    col3.metric("Throughput", f"{result['rows_per_s']:,} rows/s")
+    if result["model_version"]:
+        st.caption(f"Model version: `{result['model_version']}`")
+
+    preview = read_preview(result["output"], result["format"])
+    score_columns = [c for c in (PREDICTED_COLUMN, TRADITIONAL_COLUMN, SMART_COLUMN) if c in preview.columns]
+    other_columns = [c for c in ("property_id", "location_suburb", "property_type", "sale_price_usd")
+                     if c in preview.columns]
+    st.subheader(f"Preview (first {len(preview)} rows)")
+    st.dataframe(preview[other_columns + score_columns], use_container_width=True)
+
+    with open(result["output"], "rb") as f:
+        st.download_button(
+            label=f"Download Scored Listings ({result['format'].upper()})",
+            data=f,
+            file_name=result["file_name"],
+            mime=MIME_TYPES[result["format"]],
+            key="bulk_scoring_download",
+        )
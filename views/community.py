@@ -0,0 +1,56 @@
+""""🏆 Community Insights" page: most simulated projects and investor sentiment."""
+import os
+
+import streamlit as st
+
+from core.datasets import read_csv_shared
+from core.lazy import lazy_import
+from core.simulation_log import get_simulation_log
+
+plt = lazy_import("matplotlib.pyplot")
+
+
+def render():
+    st.title("🏆 Community Insights & Investor Leaderboard")
+
+    # --- Most Simulated Project ---
+    st.subheader("📈 Most Simulated Project")
+    most_sim_price = get_simulation_log().summary()["most_simulated_price"]
+    if most_sim_price is not None:
+        st.metric("Most Simulated Market Price", f"${most_sim_price:,.0f}")
+    else:
+        st.info("No simulation data yet.")
+
+    # --- Top ROI Location (from voting data) ---
+    st.subheader("📍 Top ROI Location (by Simulated ROI)")
+    if os.path.exists("vote_results.csv"):
+        vote_df = read_csv_shared("vote_results.csv")
+        if not vote_df.empty and "ROI (%)" in vote_df.columns:
+            top_roi = vote_df.loc[vote_df["ROI (%)"].idxmax()]
+            st.metric("Top ROI", f"{top_roi['ROI (%)']:.2f}%")
+            st.markdown(f"**Project:** {top_roi.get('Project', 'N/A')}  \n**Location:** ({top_roi.get('Latitude', 0):.5f}, {top_roi.get('Longitude', 0):.5f})")
+        else:
+            st.info("No voting data yet.")
+    else:
+        st.info("No voting data yet.")
+
+    # --- Investor Sentiment Trends ---
+    st.subheader("🗳️ Investor Sentiment Trends")
+    if os.path.exists("vote_results.csv"):
+        vote_df = read_csv_shared("vote_results.csv")
+        if not vote_df.empty and "Vote" in vote_df.columns:
+            sentiment = vote_df["Vote"].value_counts(normalize=True) * 100
+            yes_pct = sentiment.get("Yes", 0)
+            no_pct = sentiment.get("No", 0)
+            st.metric("Yes Votes", f"{yes_pct:.1f}%")
+            st.metric("No Votes", f"{no_pct:.1f}%")
+            # Optional: Pie chart
+            fig, ax = plt.subplots()
+            ax.pie([yes_pct, no_pct], labels=["Yes", "No"], autopct="%1.1f%%", colors=["#4CAF50", "#F44336"])
+            ax.set_title("Investor Sentiment")
+            st.pyplot(fig)
+            plt.close(fig)
+        else:
+            st.info("No sentiment data yet.")
+    else:
+        st.info("No sentiment data yet.")
@@ -0,0 +1,514 @@
+"""📈 Executive Summary page: ROI recap, PDF/CSV downloads and email delivery."""
+import io
+from datetime import datetime as dt
+from io import BytesIO  # For PDF generation
+
+import pandas as pd
+import streamlit as st
+
+from core.charts import CHART_EXPORT_DPI, roi_comparison_png
+from core.config import (
+    APP_PASSWORD,
+    EV_CHARGING_SAVINGS,
+    INTEGRATED_SECURITY_SAVINGS,
+    SENDER_EMAIL,
+    SMART_LOCKS_SAVINGS,
+    SMART_THERMOSTATS_SAVINGS,
+    SOLAR_SAVINGS,
+    WATER_RECYCLING_SAVINGS,
+)
+from core.explanations import top_contributions
+from core.timing import timed
+
+
+# Largest Predicted ROI contributions listed in the PDF
+PDF_ROI_DRIVERS = 8
+
+
+# --- Dynamic PDF Generation ---
+@timed("pdf.generate")
+def generate_pdf(market_price, monthly_rent, smart_features_status, roi, smart_roi, predicted_roi, annual_savings, roi_chart_buf,
+                 roi_explanation=None):
+    # reportlab is only needed here, so it is imported on the first PDF rather than with the page
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfgen import canvas
+
+    buffer = BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
+
+    # Define layout constants
+    MARGIN = 40
+    COL1_WIDTH = 240
+    COL2_WIDTH = 250
+    LINE_HEIGHT = 14
+    SECTION_SPACING = 25
+    PAGE_WIDTH, PAGE_HEIGHT = A4
+
+    # --- Helper Functions ---
+    def draw_section_header(text, y):
+        c.setFont("Helvetica-Bold", 12)
+        c.setFillColorRGB(0.2, 0.4, 0.6)  # Dark blue color for headers
+        c.drawString(MARGIN, y, text.upper())
+        c.setLineWidth(1.5)
+        c.line(MARGIN, y - 3, MARGIN + 100, y - 3)
+        c.setFillColorRGB(0, 0, 0)  # Reset to black
+        return y - SECTION_SPACING
+
+    def draw_metric(label, value, x, y, bold_label=True, value_format='${:,.2f}'):
+        if bold_label:
+            c.setFont("Helvetica-Bold", 10)
+        else:
+            c.setFont("Helvetica", 10)
+        c.drawString(x, y, f"{label}:")
+
+        # Format value based on type
+        if isinstance(value, (int, float)):
+            if '%' in label.upper():
+                value_str = f"{value:.2f}%"
+            else:
+                value_str = value_format.format(value)
+        else:
+            value_str = str(value)
+
+        c.setFont("Helvetica", 10)
+        c.drawRightString(x + 200, y, value_str)
+        return y - 18
+
+    def draw_text_box(text, x, y, width, height, title=None, font_size=10, line_height=12):
+        # Draw box
+        c.rect(x, y - height, width, height)
+
+        # Add title if provided
+        if title:
+            c.setFont("Helvetica-Bold", font_size)
+            c.drawString(x + 5, y - 15, title)
+            y -= 20
+            c.line(x, y, x + width, y)
+            y -= 5
+
+        # Add text with wrapping
+        c.setFont("Helvetica", font_size)
+        text_object = c.beginText(x + 5, y - 5)
+
+        # Simple text wrapping
+        words = text.split()
+        line = []
+        for word in words:
+            test_line = ' '.join(line + [word])
+            if c.stringWidth(test_line, "Helvetica", font_size) < (width - 10):
+                line.append(word)
+            else:
+                text_object.textLine(' '.join(line))
+                line = [word]
+        if line:
+            text_object.textLine(' '.join(line))
+
+        c.drawText(text_object)
+        return y - height - 10
+
+    # --- Page 1: Summary ---
+    # Header with logo and title
+    try:
+        c.drawImage("westprop_logo.png", MARGIN, 770, width=100, preserveAspectRatio=True, mask='auto')
+    except:
+        pass
+
+    # Main title
+    c.setFont("Helvetica-Bold", 18)
+    c.setFillColorRGB(0.2, 0.4, 0.6)  # Dark blue
+    c.drawString(MARGIN, 800, "WESTPROP")
+    c.setFont("Helvetica-Bold", 16)
+    c.drawString(MARGIN, 775, "SMART REAL ESTATE ANALYSIS")
+
+    # Date and page info
+    c.setFont("Helvetica", 8)
+    c.setFillColorRGB(0.5, 0.5, 0.5)  # Gray
+    c.drawString(MARGIN, 760, f"Generated: {dt.now().strftime('%B %d, %Y')}")
+    c.drawRightString(PAGE_WIDTH - MARGIN, 760, "Page 1 of 2")
+    c.setFillColorRGB(0, 0, 0)  # Reset to black
+
+    # Divider line
+    c.line(MARGIN, 755, PAGE_WIDTH - MARGIN, 755)
+
+    # --- Section 1: Key Metrics ---
+    y_position = 730
+    y_position = draw_section_header("Key Investment Metrics", y_position)
+
+    # Left column - Financials
+    x_left = MARGIN
+    y_position = draw_metric("Market Price", market_price, x_left, y_position)
+    y_position = draw_metric("Monthly Rental Income", monthly_rent, x_left, y_position)
+    y_position = draw_metric("Annual Savings", annual_savings, x_left, y_position)
+
+    # Right column - ROI Metrics
+    x_right = MARGIN + COL1_WIDTH + 20
+    y_right = 730 - SECTION_SPACING
+    y_right = draw_metric("Traditional ROI", roi, x_right, y_right, value_format='{:.2f}%')
+    y_right = draw_metric("Smart ROI", smart_roi, x_right, y_right, value_format='{:.2f}%')
+    y_right = draw_metric("Predicted ROI", predicted_roi, x_right, y_right, value_format='{:.2f}%')
+
+    # ROI Chart
+    if roi_chart_buf is not None:
+        try:
+            roi_chart_buf.seek(0)
+            img = ImageReader(roi_chart_buf)
+            chart_width = 400
+            chart_height = 200
+            chart_x = (PAGE_WIDTH - chart_width) / 2  # Center the chart
+            c.drawImage(img, chart_x, y_position - chart_height - 20, width=chart_width, height=chart_height, preserveAspectRatio=True, mask='auto')
+            y_position -= chart_height + 40
+        except Exception as e:
+            print(f"Error drawing ROI chart: {e}")
+
+    # --- Section 2: Smart Features ---
+    y_position = draw_section_header("Smart Features", y_position)
+
+    # Create list of active features
+    features = []
+    if smart_features_status.get('has_solar', False): features.append("✓ Solar Panels")
+    if smart_features_status.get('has_water_recycling', False): features.append("✓ Water Recycling")
+    if smart_features_status.get('has_smart_locks', False): features.append("✓ Smart Locks")
+    if smart_features_status.get('has_smart_thermostats', False): features.append("✓ Smart Thermostats")
+    if smart_features_status.get('has_integrated_security', False): features.append("✓ Integrated Security")
+    if smart_features_status.get('has_ev_charging', False): features.append("✓ EV Charging")
+
+    if not features:
+        features = ["No smart features enabled"]
+
+    # Draw features in 3 columns
+    col_height = (len(features) + 2) // 3  # Distribute features in 3 columns
+    col_width = (PAGE_WIDTH - 2 * MARGIN) / 3 - 10
+
+    for i, feature in enumerate(features):
+        col = i // col_height
+        row = i % col_height
+        x = MARGIN + col * (col_width + 10)
+        y = y_position - (row * 18)
+        c.drawString(x, y, feature)
+
+    y_position -= (col_height * 18) + 20
+
+    # --- Section 3: Financial Projections ---
+    y_position = draw_section_header("Financial Projections", y_position)
+
+    # Left column - Savings
+    y_savings = y_position
+    y_savings = draw_metric("5-Year Savings", annual_savings * 5, MARGIN, y_savings)
+    y_savings = draw_metric("10-Year Savings", annual_savings * 10, MARGIN, y_savings)
+
+    # Right column - Additional metrics
+    y_metrics = y_position
+    y_metrics = draw_metric("Monthly Cash Flow", monthly_rent * 0.8, MARGIN + COL1_WIDTH + 20, y_metrics)  # Example metric
+    y_metrics = draw_metric("Cap Rate", smart_roi * 0.8, MARGIN + COL1_WIDTH + 20, y_metrics, value_format='{:.2f}%')  # Example metric
+
+    y_position = min(y_savings, y_metrics) - 20
+
+    # --- Section 4: Analysis ---
+    y_position = draw_section_header("Investment Analysis", y_position)
+
+    analysis_text = """This analysis highlights the financial benefits of smart home features in your real estate investment. 
+    The enhanced ROI is achieved through multiple value drivers that contribute to both income growth and expense reduction.
+
+    Key Benefits:
+    • Energy Efficiency: Smart thermostats and solar panels reduce utility costs
+    • Higher Rental Premium: Tech-savvy tenants pay more for smart features
+    • Lower Vacancy: Smart homes attract and retain quality tenants
+    • Increased Property Value: Smart features boost resale value
+    • Tax Benefits: Potential deductions for energy-efficient upgrades
+
+    Recommendation: Implementing the suggested smart features can significantly enhance your investment returns. 
+    The projected ROI of {:.2f}% demonstrates strong potential for value creation.""".format(smart_roi)
+
+    # Draw text box with analysis
+    y_position = draw_text_box(
+        analysis_text, 
+        MARGIN, 
+        y_position, 
+        PAGE_WIDTH - 2 * MARGIN, 
+        180,
+        "Investment Insights",
+        font_size=9,
+        line_height=11
+    )
+
+    # Footer
+    c.setFont("Helvetica-Oblique", 7)
+    c.setFillColorRGB(0.5, 0.5, 0.5)  # Gray
+    c.drawString(MARGIN, 30, "*This is an auto-generated summary using real-time inputs. All values are estimates and should be verified by a financial advisor.*")
+
+    # --- Page 2: Additional Details ---
+    c.showPage()
+
+    # Page 2 Header
+    c.setFont("Helvetica-Bold", 14)
+    c.drawString(MARGIN, 800, "DETAILED ANALYSIS & METHODOLOGY")
+    c.setFont("Helvetica", 8)
+    c.drawRightString(PAGE_WIDTH - MARGIN, 800, "Page 2 of 2")
+    c.line(MARGIN, 795, PAGE_WIDTH - MARGIN, 795)
+
+    y_position = 770
+
+    # Predicted ROI drivers (explain_roi of the last Simulator run), two columns
+    if roi_explanation is not None:
+        y_position = draw_section_header("Predicted ROI Drivers", y_position)
+        c.setFont("Helvetica", 9)
+        c.drawString(MARGIN, y_position,
+                     f"Contribution of each input to the Predicted ROI of {roi_explanation['predicted_roi']:.2f}%, "
+                     f"starting from the model's average prediction of {roi_explanation['base_roi']:.2f}%.")
+        y_position -= 20
+        drivers = top_contributions(roi_explanation, PDF_ROI_DRIVERS)
+        rows = (len(drivers) + 1) // 2
+        for i, (label, value) in enumerate(drivers):
+            x = MARGIN if i < rows else MARGIN + COL1_WIDTH + 20
+            draw_metric(label, f"{value:+.2f} pp", x, y_position - (i % rows) * 18, bold_label=False)
+        y_position -= rows * 18 + 15
+
+    # Methodology Section
+    y_position = draw_section_header("Methodology", y_position)
+
+    methodology_text = """This analysis is based on the following assumptions and calculations:
+
+    1. Traditional ROI: (Annual Rental Income - Operating Expenses) / Property Price
+    2. Smart ROI: Adjusts for increased rental income and reduced operating expenses from smart features
+    3. Predicted ROI: Machine learning model based on historical data from similar properties; its drivers are the model's Shapley values
+    4. Annual Savings: Estimated from utility savings, insurance discounts, and maintenance reductions
+
+    The analysis assumes a 5-year holding period and accounts for:
+    • 2% annual rent increase
+    • 2.5% annual operating expense growth
+    • 3% annual property appreciation
+    • 5% vacancy rate
+    • 8% property management fees"""
+
+    y_position = draw_text_box(
+        methodology_text,
+        MARGIN,
+        y_position,
+        PAGE_WIDTH - 2 * MARGIN,
+        200,
+        "Calculation Methodology",
+        font_size=9,
+        line_height=11
+    )
+
+    # Next Steps Section
+    y_position = draw_section_header("Next Steps", y_position)
+
+    next_steps = """1. Schedule a consultation with our real estate investment team
+    2. Tour available properties with smart features
+    3. Review financing options and tax benefits
+    4. Finalize investment strategy and timeline
+
+    Contact our team today to discuss how we can help you maximize your real estate investment returns."""
+
+    y_position = draw_text_box(
+        next_steps,
+        MARGIN,
+        y_position,
+        PAGE_WIDTH - 2 * MARGIN,
+        120,
+        "Your Next Steps",
+        font_size=9,
+        line_height=11
+    )
+
+    # Finalize PDF
+    c.save()
+    buffer.seek(0)
+    return buffer
+
+    c.showPage()
+    c.save()
+    buffer.seek(0)
+    return buffer
+
+
+def render():
+    st.title("💼 Executive Summary: Smart Real Estate ROI Analysis")
+    st.markdown("""
+    This Executive Summary provides a high-level overview of the financial benefits and strategic implications
+    of investing in smart, sustainable real estate, based on your simulation inputs.
+    """)
+
+    # Pull from session state with proper defaults
+    market_price = st.session_state.get("market_price", 0.0)
+    monthly_rent = st.session_state.get("monthly_rent", 0.0)
+    roi = st.session_state.get("roi", 0.0)
+    smart_roi = st.session_state.get("smart_roi", 0.0)
+    predicted_roi = st.session_state.get("predicted_roi_original", 0.0)
+    annual_savings = st.session_state.get("annual_savings_total", 0.0)
+    roi_chart_values = st.session_state.get("roi_chart_values", None)
+    roi_explanation = st.session_state.get("roi_explanation", None)
+    
+    # Smart features with defaults
+    has_solar = st.session_state.get("has_solar", False)
+    has_water_recycling = st.session_state.get("has_water_recycling", False)
+    has_smart_locks = st.session_state.get("has_smart_locks", False)
+    has_smart_thermostats = st.session_state.get("has_smart_thermostats", False)
+    has_integrated_security = st.session_state.get("has_integrated_security", False)
+    has_ev_charging = st.session_state.get("has_ev_charging", False)
+    
+    # Calculate annual_savings_total using the same constants as the Simulator tab
+    annual_savings_total = (
+        (SOLAR_SAVINGS if has_solar else 0)
+        + (WATER_RECYCLING_SAVINGS if has_water_recycling else 0)
+        + (SMART_LOCKS_SAVINGS if has_smart_locks else 0)
+        + (SMART_THERMOSTATS_SAVINGS if has_smart_thermostats else 0)
+        + (INTEGRATED_SECURITY_SAVINGS if has_integrated_security else 0)
+        + (EV_CHARGING_SAVINGS if has_ev_charging else 0)
+    ) * 12
+
+    # --- Visual Recap ---
+    st.subheader("📊 Performance Overview")
+    st.caption("This chart compares the estimated ROI under different scenarios based on your latest simulation.")
+
+    # Display the ROI chart of the last Simulator run; it comes from the shared chart cache,
+    # so the values the Simulator drew are not rendered again
+    if roi_chart_values is not None:
+        try:
+            st.image(roi_comparison_png(roi_chart_values), use_container_width=True)
+        except Exception as e:
+            st.warning(f"Could not display ROI chart: {str(e)}. Please run a simulation first.")
+    else:
+        st.warning("Run a simulation in the Simulator tab first to see the ROI comparison chart.")
+
+    # --- Financial Metrics ---
+    st.subheader("Financial Impact")
+    
+    # Calculate 5-year and 10-year savings
+    five_year_savings = annual_savings_total * 5
+    ten_year_savings = annual_savings_total * 10
+    
+    # Display metrics in columns for better visual organization
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Estimated Annual Savings", f"${annual_savings_total:,.2f}")
+    with col2:
+        st.metric("5-Year Savings", f"${five_year_savings:,.2f}")
+    with col3:
+        st.metric("10-Year Savings", f"${ten_year_savings:,.2f}")
+
+    # --- Smart Feature Impact ---
+    st.subheader("Smart Feature Impact")
+    
+    # Create a list of active smart features
+    active_features = []
+    if has_solar: active_features.append("Solar Panels")
+    if has_water_recycling: active_features.append("Water Recycling")
+    if has_smart_locks: active_features.append("Smart Locks")
+    if has_smart_thermostats: active_features.append("Smart Thermostats")
+    if has_integrated_security: active_features.append("Integrated Security")
+    if has_ev_charging: active_features.append("EV Charging")
+    
+    if active_features:
+        st.write("Active smart features contributing to your savings:")
+        for feature in active_features:
+            st.write(f" {feature}")
+    else:
+        st.info("No smart features are currently active. Enable features above to see potential savings.")
+
+    # Add some interpretation
+    if smart_roi > roi:
+        st.success(f" Smart features increase your ROI by {smart_roi - roi:.2f} percentage points!")
+    else:
+        st.info(" Enabling more smart features could potentially increase your ROI.")
+
+    # Store values in session state
+    st.session_state.roi = float(roi) if roi is not None else 0.0
+    st.session_state.smart_roi = float(smart_roi) if smart_roi is not None else 0.0
+    st.session_state.predicted_roi_original = float(predicted_roi) if predicted_roi is not None else 0.0
+    st.session_state.annual_savings_total = float(annual_savings_total) if annual_savings_total is not None else 0.0
+
+    # Prepare smart_features_status dictionary for PDF generation
+    smart_features_status = {
+        "has_solar": has_solar,
+        "has_water_recycling": has_water_recycling,
+        "has_smart_locks": has_smart_locks,
+        "has_smart_thermostats": has_smart_thermostats,
+        "has_integrated_security": has_integrated_security,
+        "has_ev_charging": has_ev_charging
+    }
+
+    # Get ROI values from session state to ensure we have the latest values
+    roi = st.session_state.get('roi', 0.0)
+    smart_roi = st.session_state.get('smart_roi', 0.0)
+    predicted_roi = st.session_state.get('predicted_roi_original', 0.0)
+    
+    # Generate the PDF data before using it
+    pdf_data = generate_pdf(
+        market_price,
+        monthly_rent,
+        smart_features_status,
+        float(roi),  # Ensure these are float values
+        float(smart_roi),
+        float(predicted_roi),
+        float(annual_savings_total),
+        # The high-resolution chart is only rendered for the PDF, once per set of values
+        io.BytesIO(roi_comparison_png(roi_chart_values, dpi=CHART_EXPORT_DPI)) if roi_chart_values is not None else None,
+        roi_explanation,
+    )
+
+    st.download_button(
+        label=" Download Full One-Pager PDF",
+        data=pdf_data,
+        file_name="WestProp_Smart_ROI_Summary.pdf",
+        mime="application/pdf",
+        key="download_pdf_1"
+    )
+
+    # --- CSV Download ---
+    summary_df = pd.DataFrame({
+        "Metric": ["Traditional ROI", "Smart ROI", "Predicted ROI", "Annual Savings", "5Y Savings", "10Y Savings"],
+        "Value": [roi, smart_roi, predicted_roi, annual_savings, annual_savings * 5, annual_savings * 10]
+    })
+    csv = summary_df.to_csv(index=False).encode("utf-8")
+    st.download_button(
+        label="📊 Download ROI Summary (CSV)",
+        data=csv,
+        file_name="roi_summary.csv",
+        mime="text/csv",
+        key="download_csv_1"
+    )
+
+    # --- EMAIL SUMMARY FEATURE (ONLY IN EXECUTIVE SUMMARY TAB) ---
+    st.markdown("### 📧 Email Your Executive Summary")
+    email_address = st.text_input(
+        "Enter your email address to receive the summary (PDF & CSV):",
+        key="exec_summary_email_1"
+    )
+    if st.button("Send Summary to Email"):
+        if email_address:
+            with st.spinner("Preparing and sending your executive summary..."):
+                try:
+                    # --- Prepare PDF and CSV ---
+                    pdf_data.seek(0)
+                    csv_data = summary_df.to_csv(index=False).encode("utf-8")
+
+                    import smtplib
+                    from email.message import EmailMessage
+
+                    # --- Compose Email ---
+                    msg = EmailMessage()
+                    msg["Subject"] = "Your WestProp Smart ROI Executive Summary"
+                    msg["From"] = SENDER_EMAIL
+                    msg["To"] = email_address
+                    msg.set_content(
+                        "Attached is your Smart ROI Executive Summary from WestProp.\n\n"
+                        "Thank you for using our dashboard!"
+                    )
+                    msg.add_attachment(pdf_data.read(), maintype="application", subtype="pdf", filename="WestProp_Smart_ROI_Summary.pdf")
+                    msg.add_attachment(csv_data, maintype="text", subtype="csv", filename="roi_summary.csv")
+
+                    # --- Send Email (Gmail SMTP example) ---
+                    with smtplib.SMTP_SSL("smtp.gmail.com", 465) as smtp:
+                        smtp.login(SENDER_EMAIL, APP_PASSWORD)
+                        smtp.send_message(msg)
+                    
+                    st.success("✅ Summary sent to your email!")
+                    st.balloons()
+                except Exception as e:
+                    st.error(f"❌ Failed to send email: {e}")
+                    st.error("Please check your internet connection and try again.")
+        else:
+            st.warning("⚠️ Please enter a valid email address.")
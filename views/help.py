@@ -0,0 +1,202 @@
+""""❓ Help" page: user guide for every tab."""
+import streamlit as st
+
+
+def render():
+    st.title("❓ Help & User Guide")
+    st.markdown("""
+Welcome to the **Smart Real Estate ROI Simulator**.
+
+This dashboard helps you simulate and predict the **Return on Investment (ROI)** for WestProp properties, including:
+
+- **Millennium Heights**
+- **Pomona City**
+- **The Hills Lifestyle Estate**
+- **Pokugara Residential Estate**
+
+---
+
+## 🧭 How to Use
+
+1. **Go to the Simulator tab**
+2. Enter your property's market price and expected rent.
+3. Toggle smart features (solar, recycling, smart locks).
+4. See dynamic ROI results, savings, financial breakdowns, and predictions.
+5. **Load Past Simulations** - Access previously saved simulations from the sidebar to review or modify them.
+
+---
+
+## 📈 ROI Metrics Explained
+
+- **Traditional ROI (Net):** Calculated based on annual rental income minus estimated annual expenses (property tax, maintenance, insurance, agent fees), divided by the market price.
+- **Smart ROI (Net):** Similar to Traditional ROI, but includes the estimated annual savings from smart features, increasing the net income.
+- **Predicted ROI (Model):** An ROI forecast generated by our machine learning model, considering various property attributes and smart features. The "What drives the Predicted ROI?" chart under the result shows how much each input moved it.
+
+## 🏙️ About Location & Property Type
+
+In the Simulator, you'll notice fields for Location Suburb and Property Type. Here's what you should know:
+
+- These fields are collected for future enhancements and data collection
+- Currently, they have minimal impact on the ROI calculations
+- The model primarily focuses on property characteristics (size, features) and smart technology
+- We're working to enhance location-based predictions in future updates
+
+For the most accurate results, focus on adjusting the property specifications and smart features that directly impact energy savings and operational efficiency.
+
+---
+
+## 🗂️ My Simulations
+
+- Instantly review and reload your past simulation sessions.
+
+---
+
+## 🗺️ ROI Map Tips
+
+- Use the **ROI Map** to explore project locations and ROI heat levels.
+- Click any location to simulate potential ROI at that point.
+- After clicking, you can cast a **"Would You Invest?" vote** to help us understand investor sentiment.
+
+---
+
+## 📍 Project Profiles
+
+Explore detailed profiles of WestProp developments:
+
+- The Hills Lifestyle Estate
+- Millennium Heights
+- Pomona City
+- Pokugara Townhouses
+- Radisson Apartments
+
+Includes images, amenities, status, and direct links to official pages.
+
+---
+
+## 📊 Investment Models
+
+- Compare **Direct Purchase** vs **Radisson REIT**.
+- Simulate returns, risk, and income.
+- Designed for both retail investors and institutional buyers.
+
+---
+
+## 💸 Payment Plan Calculator
+
+- Pokugara and Hills-specific calculators.
+- See deposit, commitment fees, monthly payment timelines.
+- Includes interest simulation for Hills' 24-month plan.
+
+---
+
+## 🔍 Property Browser
+
+- Advanced filters by project, type, price, status, amenities.
+- Compare properties side-by-side.
+- Based on real WestProp listing data.
+
+---
+
+## 📥 Bulk Scoring
+
+- Upload a spreadsheet of listings in the `real_estate_data_template.csv` format.
+- Every row gets a Predicted, Traditional and Smart ROI, with a progress bar while the file is scored.
+- Download the result as CSV or Parquet; large files can also be scored with `scripts/score_listings.py`.
+
+---
+
+## 🧬 Investor Match
+
+- Pick your profile (Diaspora Investor, Retiree, First-Time Buyer, etc.).
+- Get auto-matched to best-fit projects + rationale.
+- Uses curated logic from WestProp's research & buyer personas.
+
+---
+
+## 🔧 Shell Unit Customizer
+
+- Specifically for Millennium Heights Block 4
+- Estimate total cost to finish shell units using:
+  - Standard
+  - Premium
+  - Custom finishing
+
+---
+
+## ♻️ Smart Feature Value Proposition
+
+- Highlights ROI uplift, resale value, and sustainability impact of smart features:
+  - Solar Power
+  - Water Recycling
+  - Smart Locks
+- Backed by Zimbabwean market data
+
+---
+
+## 🛡️ Admin Analytics Dashboard (Staff Only)
+
+WestProp staff can access a dedicated Admin Analytics Dashboard for deeper insights:
+
+- View simulation activity trends
+- See the most popular simulated market prices
+- Explore investor sentiment heatmaps
+- Check whether Simulator inputs drift away from the training data
+- Download raw simulation and voting data
+
+**To access:**  
+Log in as admin via the Admin Analytics tab.
+
+> _Note: These features are restricted to authorized staff for data privacy and business security._
+
+---
+
+### ℹ️ About Tab
+
+- Learn about the dashboard's purpose and structure
+- Read about WestProp's mission, CEO Ken Sharpe, and values.
+- Get context for how each tool supports investor insights and smart growth.
+
+---
+
+## 📉 Market Trends & Analytics
+
+- Explore national and regional price trends, rental yields, and smart feature adoption.
+
+## 🔔 Alerts Tab
+
+- Subscribe for email updates on new projects, price changes, and investment opportunities.
+
+## 🏆 Community Insights
+
+- See the most simulated projects, top ROI locations, and investor sentiment trends.
+
+## 🌀 ROI Sensitivity Analysis (Simulator Tab)
+
+- Run what-if scenarios to see how changes in rent, price, or smart feature adoption affect ROI.
+- Use the **Tornado Chart Mode** toggle to switch between:
+  - **Tornado Chart Mode:** Shows the impact of individual features on ROI
+  - **Full Impact (0%→100%)**: See the maximum possible ROI impact for each variable.
+  - **What-If (Current→100%)**: See the ROI impact of increasing each variable from its current value to 100%.
+  - **Feature Comparison Mode:** Compares the ROI impact of all smart features side by side
+- The tornado chart and table below it will update to show which factors have the biggest effect on your returns.
+
+## 💡 Tooltips
+
+Hover over any sidebar element, slider, or checkbox to get quick explanations.
+
+---
+
+## Data & Assumptions
+
+The simulator uses a dataset of real estate properties in Harare, Zimbabwe. All ROI calculations are estimates and are based on the provided input parameters and predefined expense rates.
+
+Smart feature savings are based on general market research and may vary based on actual usage and local conditions.
+
+## 📬 Need Support?
+
+For questions, feedback, or collaboration inquiries, please email [tutu@westprop.com](mailto:tutu@westprop.com)
+
+---
+""")
+
+    st.info("This platform was built to align with WestProp's tech-forward real estate vision. Thank you for exploring it!")
@@ -0,0 +1,85 @@
+""""📊 Investment Models" page: strategy overview and return simulators."""
+import streamlit as st
+
+
+def render():
+    st.title("📊 Investment Models")
+    st.markdown("Explore various investment models and strategies applicable to real estate.")
+
+    st.subheader("1. Buy-to-Let Strategy")
+    st.write("**Description:** Purchasing a property with the intention of renting it out to generate rental income and benefit from capital appreciation.")
+    st.write("**Key Metrics:** Rental Yield, ROI, Vacancy Rate.")
+    st.write("**Applicability:** Ideal for stable markets and investors seeking passive income.")
+
+    st.subheader("2. Fix and Flip Strategy")
+    st.write("**Description:** Buying undervalued properties, renovating them, and selling them for a profit in a short period.")
+    st.write("**Key Metrics:** Renovation Costs, After Repair Value (ARV), Holding Costs.")
+    st.write("**Applicability:** Requires strong market knowledge, renovation expertise, and access to capital.")
+
+    st.subheader("3. Real Estate Investment Trusts (REITs)")
+    st.write("**Description:** Companies that own, operate, or finance income-producing real estate. They are publicly traded like stocks.")
+    st.write("**Key Metrics:** Dividend Yield, Funds From Operations (FFO).")
+    st.write("**Applicability:** Offers liquidity and diversification without direct property ownership. Suitable for passive investors.")
+
+    st.subheader("4. Property Development")
+    st.write("**Description:** Acquiring land and constructing new buildings or redeveloping existing ones for sale or rent.")
+    st.write("**Key Metrics:** Development Costs, Sales Revenue, Project Timeline.")
+    st.write("**Applicability:** High capital requirement and risk, but potential for significant returns.")
+
+    st.subheader("5. Short-Term Rentals (e.g., Airbnb)")
+    st.write("**Description:** Renting out properties for short durations, often to tourists or business travelers.")
+    st.write("**Key Metrics:** Occupancy Rate, Average Daily Rate (ADR), Management Fees.")
+    st.write("**Applicability:** Can generate higher income than long-term rentals but requires more active management and is subject to tourism trends.")
+
+    st.markdown("--- ")
+    st.info("**Disclaimer:** This information is for educational purposes only and does not constitute financial advice. Always consult with a financial professional before making investment decisions.")
+
+    st.title("📊 Compare Investment Models")
+
+    model_choice = st.selectbox("Choose an Investment Type", ["Direct Purchase", "Radisson REIT (Seatrite 5)"])
+
+    if model_choice == "Direct Purchase":
+        st.subheader("🏠 Direct Property Purchase")
+
+        st.markdown("""
+        **🔹 Entry Point:** Varies by project ($70k – $1.6M)
+        **🔹 Payment Terms:** 20–30% deposit, balance over 6–24 months
+        **🔹 Return Type:** Rental income + Capital appreciation
+        **🔹 Risks:** Market volatility, maintenance costs
+        **🔹 Benefits:** Full ownership, resale flexibility, value growth
+        """)
+
+        st.markdown("### 📈 Simulate Returns (Direct Purchase)")
+
+        purchase_price = st.number_input("Purchase Price (USD)", 50000, 2000000, 110000, step=1000, help="Total amount paid to acquire the property." )
+        annual_rent = st.number_input("Expected Annual Rental Income (USD)", 1000, 100000, 12000, step=500, help="Estimated rental income per year.")
+        appreciation = st.slider("Estimated Annual Appreciation (%)", 0, 20, 10, help="Expected % increase in property value per year." )
+        years = st.slider("Investment Duration (Years)", 1, 30, 5, help="How long you plan to hold the investment." )
+
+        total_rental = annual_rent * years
+        # Corrected capital gain calculation
+        capital_gain = purchase_price * ((1 + appreciation / 100) ** years) - purchase_price
+        total_return = total_rental + capital_gain
+        annualized_roi = ((total_return / purchase_price) ** (1/years) - 1) * 100 if years > 0 and purchase_price > 0 else 0
+
+        st.metric("Total Estimated Return", f"${total_return:,.0f}")
+        st.metric("Annualized ROI", f"{annualized_roi:.2f}%")
+
+    elif model_choice == "Radisson REIT (Seatrite 5)":
+        st.subheader("🏨 Radisson REIT (Seatrite 5 Trust)")
+        st.markdown("""
+        **🔹 Entry Point:** From $500
+        **🔹 Payment Terms:** Upfront investment
+        **🔹 Return Type:** Guaranteed 8% USD annual return (paid quarterly)
+        **🔹 Risks:** Lower potential upside vs direct ownership, liquidity constraints
+        **🔹 Benefits:** Hassle-free, professional management (Radisson), guaranteed return, capital protection (buy-back)
+        """)
+        st.markdown("### 📈 Simulate Returns (REIT)")
+        investment_amount = st.number_input("Investment Amount (USD)", 500, 1000000, 10000, step=100, help="How much you’re investing in the REIT.")
+        reit_years = st.slider("Investment Duration (Years)", 1, 10, 5, key="reit_years", help="Duration you plan to hold the REIT investment.")
+
+        annual_return_reit = investment_amount * 0.08
+        total_return_reit = annual_return_reit * reit_years
+
+        st.metric("Annual Return (8% Guaranteed)", f"${annual_return_reit:,.2f}")
+        st.metric(f"Total Return over {reit_years} Years", f"${total_return_reit:,.2f}")
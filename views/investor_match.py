@@ -0,0 +1,72 @@
+""""🧬 Investor Match" page: property recommendations per investor profile."""
+import streamlit as st
+
+from core.properties import property_details
+from views.property_browser import create_property_card, get_profile_recommendations
+
+
+def render():
+    st.title("🧬 Smart Property Match")
+    st.markdown("Find properties that match your investment goals and lifestyle needs")
+    
+    # Profile Selection
+    profile = st.selectbox("Select Your Investor Profile", [
+        "Diaspora Investor",
+        "Local First-Time Buyer",
+        "Family Upsizing",
+        "Retiree",
+        "Passive Income Seeker"
+    ])
+    
+    # Get matches
+    matched_properties = get_profile_recommendations(profile, list(property_details.values()))
+    
+    # Display profile-specific insights
+    st.subheader(f"🏆 Best Matches for {profile}")
+    if not matched_properties:
+        st.warning("No properties match your current criteria. Try adjusting your profile.")
+    else:
+        st.info(f"✨ Found {len(matched_properties)} properties matching your profile")
+    
+    # Display profile summary
+    profile_summary = {
+        "Diaspora Investor": {
+            "description": "Low-maintenance units, REIT access, strong rental income",
+            "budget": "$5,000 – $150,000",
+            "focus": "Income over appreciation"
+        },
+        "Local First-Time Buyer": {
+            "description": "Affordable units with installment options",
+            "budget": "$50,000 – $130,000",
+            "focus": "Long-term ownership and equity building"
+        },
+        "Family Upsizing": {
+            "description": "Spacious units, secure gated estates, schools nearby",
+            "budget": "$300,000 – $600,000",
+            "focus": "Lifestyle + capital preservation"
+        },
+        "Retiree": {
+            "description": "Peaceful environments, easy access, low stairs, security",
+            "budget": "$100,000 – $350,000",
+            "focus": "Lifestyle, not yield"
+        },
+        "Passive Income Seeker": {
+            "description": "High rental demand, serviced models, professional management",
+            "budget": "$5,000 – $300,000",
+            "focus": "Yield, dividends, low effort"
+        }
+    }
+    
+    with st.expander("📊 Profile Summary", expanded=True):
+        summary = profile_summary.get(profile, {})
+        st.markdown(f"""
+        **Investment Strategy:** {summary.get('description', 'N/A')}  
+        **Suggested Budget:** {summary.get('budget', 'N/A')}  
+        **ROI Focus:** {summary.get('focus', 'N/A')}
+        """)
+    
+    # Display property cards
+    st.subheader("🏠 Recommended Properties")
+    for prop in matched_properties:
+        st.markdown("---")  # Divider between cards
+        create_property_card(prop, show_contact=True)
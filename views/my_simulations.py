@@ -0,0 +1,47 @@
+""""🗂️ My Simulations" page: review, download and clear saved simulations."""
+import math
+
+import streamlit as st
+
+from core.simulation_log import get_simulation_log
+
+PAGE_SIZE = 50
+
+
+def render():
+    st.title("🗂️ My Saved Simulations")
+    st.markdown("Review and manage your past ROI simulations.")
+
+    # Scoped to this session; the admin page sees the whole log
+    simulation_log = get_simulation_log()
+    session_id = st.session_state.session_id
+    total = simulation_log.count(session_id=session_id)
+    if total:
+        # Only the requested page is read from the simulation log
+        pages = math.ceil(total / PAGE_SIZE)
+        page = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, value=1, step=1,
+                               key="my_simulations_page")
+        session_df = simulation_log.page(limit=PAGE_SIZE, offset=(page - 1) * PAGE_SIZE, session_id=session_id)
+        st.caption(f"Showing {len(session_df):,} of {total:,} simulations, newest first.")
+        # Display the dataframe, showing all columns from the updated log
+        st.dataframe(session_df.drop(columns=["ID", "Session"]))
+
+        st.subheader("Download Simulations")
+        if st.button("Prepare CSV Download"):
+            st.session_state.my_simulations_csv = simulation_log.export_csv(session_id=session_id)
+        if st.session_state.get("my_simulations_csv") is not None:
+            st.download_button(
+                label="Download as CSV",
+                data=st.session_state.my_simulations_csv,
+                file_name="my_simulations.csv",
+                mime="text/csv",
+            )
+
+        st.subheader("Clear All Simulations")
+        if st.button("Clear Data"):
+            simulation_log.clear(session_id=session_id)
+            st.session_state.my_simulations_csv = None
+            st.success("All simulations from this session cleared!")
+            st.rerun()
+    else:
+        st.info("No simulations saved yet. Run a simulation on the \'Simulator\' page!")
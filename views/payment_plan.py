@@ -0,0 +1,38 @@
+""""💸 Payment Plan Calculator" page."""
+import streamlit as st
+
+
+def render():
+    st.title("💸 Payment Plan Calculator")
+    st.markdown("Estimate your monthly payments for a property.")
+
+    st.subheader("Loan Details")
+    property_price = st.number_input("Property Price (USD)", min_value=10000, value=150000, step=1000)
+    down_payment_percentage = st.slider("Down Payment (%)", 0, 100, 20, step=1)
+    interest_rate = st.number_input("Annual Interest Rate (%)", min_value=0.1, value=7.0, step=0.1, format="%.1f")
+    loan_term_years = st.slider("Loan Term (Years)", 5, 30, 15, step=1)
+
+    down_payment_amount = property_price * (down_payment_percentage / 100)
+    loan_amount = property_price - down_payment_amount
+
+    # Calculate monthly interest rate and number of payments
+    monthly_interest_rate = interest_rate / 100 / 12
+
+    number_of_payments = loan_term_years * 12
+
+    if monthly_interest_rate > 0:
+        monthly_payment = loan_amount * (monthly_interest_rate * (1 + monthly_interest_rate)**number_of_payments) / ((1 + monthly_interest_rate)**number_of_payments - 1)
+    else:
+        monthly_payment = loan_amount / number_of_payments
+
+    st.subheader("Payment Summary")
+    st.write(f"**Property Price:** ${property_price:,.2f}")
+    st.write(f"**Down Payment ({down_payment_percentage}%):** ${down_payment_amount:,.2f}")
+    st.write(f"**Loan Amount:** ${loan_amount:,.2f}")
+    st.write(f"**Monthly Payment:** ${monthly_payment:,.2f}")
+    st.write(f"**Total Payments:** ${monthly_payment * number_of_payments:,.2f}")
+    st.write(f"**Total Interest Paid:** ${monthly_payment * number_of_payments - loan_amount:,.2f}")
+    st.write("**Applicability:** Can generate higher income than long-term rentals but requires more active management and is subject to tourism trends.")
+
+    st.markdown("--- ")
+    st.info("**Disclaimer:** This calculator provides estimates only. Actual loan terms and payments may vary. Consult with a financial institution for precise figures.")
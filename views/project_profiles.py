@@ -0,0 +1,51 @@
+""""📍 Project Profiles" page."""
+import os
+
+import streamlit as st
+
+from core.properties import project_profiles_info
+
+
+def render():
+    st.title("📍 WestProp Project Profiles")
+
+    # Get project names that have profile info
+    available_projects = list(project_profiles_info.keys())
+
+    selected_project = st.selectbox("Select a Project to View Profile", options=available_projects)
+
+    if selected_project:
+        profile = project_profiles_info[selected_project]
+
+        st.subheader(selected_project)
+
+        # Display Image
+        if profile.get("image") and os.path.exists(profile["image"]):
+            st.image(profile["image"], use_container_width=True)
+        else:
+            # Check if the key exists but path is wrong, or if key is missing
+            if profile.get("image"):
+                 st.warning(f"Image file not found at path: {profile['image']}")
+            else:
+                 st.info(f"Image not available for {selected_project}.")
+
+        # Display Description
+        if profile.get("description"):
+            st.markdown(profile["description"])
+        else:
+            st.info("Description not available.")
+
+        # Display Link
+        if profile.get("url"):
+            # Basic check if URL seems valid (starts with http)
+            if profile["url"].startswith("http"):
+                 st.markdown(f"[➡️ Visit Official Project Page]({profile['url']})", unsafe_allow_html=True)
+                 # Add specific note for potentially broken link
+                 if "millenium-serviced-apartments" in profile["url"]:
+                     st.caption("_Note: This specific link may be outdated based on recent checks._")
+            else:
+                 st.warning("Project URL seems invalid or missing.")
+        else:
+            st.info("Official project link not available.")
+
+    st.markdown("---")
@@ -0,0 +1,386 @@
+"""🔍 Property Browser page plus the property card/detail views shared with Investor Match."""
+from datetime import datetime as dt
+
+import pandas as pd
+import streamlit as st
+from PIL import Image
+
+from core.properties import amenities_options, projects, properties_df, property_types, statuses
+from core.timing import timed
+
+
+# --- Image Optimization ---
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_image(image_path, width=300):
+    """Load and resize image with caching"""
+    try:
+        img = Image.open(image_path)
+        # Resize image to optimize loading
+        img.thumbnail((width, width))
+        return img
+    except Exception as e:
+        return None
+
+
+def create_property_card(property_data, show_contact=False):
+    """Create a property card with optimized image loading"""
+    with st.container():
+        col1, col2 = st.columns([1, 2])
+
+        with col1:
+            # Use placeholder while loading
+            with st.spinner(''):
+                img_placeholder = st.empty()
+                img = None
+
+                # Load image in background
+                if property_data.get('images') and len(property_data['images']) > 0:
+                    img = load_image(property_data['images'][0])
+
+                # Display image or placeholder
+                if img:
+                    img_placeholder.image(
+                        img,
+                        use_column_width=True,
+                        caption=property_data['name']
+                    )
+                else:
+                    img_placeholder.image(
+                        "westprop_logo.png",
+                        use_column_width=True,
+                        caption="Image not available",
+                        width=150
+                    )
+
+        with col2:
+            st.subheader(property_data['name'])
+            st.caption(f"Type: {property_data['type']}")
+            st.write(f"**Price:** {property_data['price']}")
+            st.write(f"**ROI:** {property_data['roi']}")
+            st.write(f"**Status:** {property_data['status']}")
+
+
+def listing_card_data(row):
+    """Map a properties_df row onto the keys create_property_card expects."""
+    roi = row.get('roi_projected')
+    return {
+        'name': row['project'],
+        'type': row['property_type'],
+        'price': f"${row['price']:,}",
+        'roi': f"{roi:g}%" if pd.notna(roi) else 'N/A',
+        'status': row['status'],
+    }
+
+
+def get_profile_recommendations(profile_type, properties_data):
+    """Get property recommendations based on investor profile type"""
+    profile_mapping = {
+        "Diaspora Investor": {
+            "filters": lambda x: x['name'] in ['Radisson Aparthotel', 'Pomona City Flats', 'Millennium Heights'],
+            "sort_key": lambda x: -float(x.get('roi', '0%').replace('%', '').split('-')[0]) if x.get('roi', '0%') != 'N/A' else 0
+        },
+        "Local First-Time Buyer": {
+            "filters": lambda x: x['name'] in ['Pomona City Flats', 'Pokugara Townhouses', 'Millennium Heights'] and \
+                               (x['name'] != 'Millennium Heights' or (float(x.get('price', '$0').replace('$', '').replace('From ', '').replace(',', '').split(' ')[0]) >= 50000 and \
+                                                                      float(x.get('price', '$0').replace('$', '').replace('From ', '').replace(',', '').split(' ')[0]) <= 130000)) and \
+                               (any(size in x.get('type', '') for size in ['Studio', '1 Bed', '2 Bed', '3 Bed']) or \
+                                (x['name'] == 'Millennium Heights' and x.get('specs', {}).get('Bedrooms', '') in ['1-3', '1 Bed', '2 Bed'])),
+            "sort_key": lambda x: float(x.get('price', '$0').replace('$', '').replace('From ', '').replace(',', '').split(' ')[0])
+        },
+        "Family Upsizing": {
+            "filters": lambda x: x['name'] in ['Pokugara Townhouses', 'The Hills Lifestyle Estate'],
+            "sort_key": lambda x: -float(x.get('price', '$0').replace('$', '').replace('From ', '').replace(',', '').split(' ')[0])
+        },
+        "Retiree": {
+            "filters": lambda x: x['name'] in ['The Hills Lifestyle Estate'] or any(keyword in x.get('description', '').lower() for keyword in ['peaceful', 'secure', 'low maintenance', 'retirement', 'lifestyle']),
+            "sort_key": lambda x: float(x.get('price', '$0').replace('$', '').replace('From ', '').replace(',', '').split(' ')[0])
+        },
+        "Passive Income Seeker": {
+            "filters": lambda x: x['name'] in ['Radisson Aparthotel', 'Millennium Heights'] or any(keyword in x.get('description', '').lower() for keyword in ['rental', 'income', 'yield', 'investment', 'aparthotel', 'serviced']),
+            "sort_key": lambda x: -float(x.get('roi', '0%').replace('%', '').split('-')[0]) if x.get('roi', '0%') != 'N/A' else 0
+        }
+    }
+
+    filters = profile_mapping.get(profile_type, {})
+    if not filters:
+        return []
+
+    matched = [p for p in properties_data if filters['filters'](p)]
+
+    try:
+        matched.sort(key=filters['sort_key'])
+    except (ValueError, AttributeError, IndexError):
+        # If sorting fails, return as is
+        pass
+
+    return matched[:5]  # Return top 5 matches
+
+
+def show_property_details(property_data):
+    """Show detailed view of a selected property"""
+    # Back button at the top
+    if st.button("← Back to Properties", key="back_to_properties_btn"):
+        if 'selected_property' in st.session_state:
+            del st.session_state.selected_property
+        if 'show_booking_form' in st.session_state:
+            del st.session_state.show_booking_form
+        st.rerun()
+        
+    st.title(property_data.get('name', 'Property Details'))
+    
+    # Image gallery
+    if property_data.get('images'):
+        st.image(property_data['images'][0], use_container_width=True)
+    
+    # Main details
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Price", property_data.get('price', 'N/A'))
+        st.metric("ROI", property_data.get('roi', 'N/A'))
+        st.metric("Status", property_data.get('status', 'N/A'))
+    with col2:
+        st.metric("Location", property_data.get('location', 'N/A'))
+        st.metric("Type", property_data.get('type', 'N/A'))
+        st.metric("Completion", property_data.get('completion', 'N/A'))
+    
+    # Tabs for different sections
+    tab1, tab2, tab3 = st.tabs(["📝 Description", "🏗️ Specifications", "💡 Features"])
+    
+    with tab1:
+        st.write(property_data.get('description', 'No description available'))
+    
+    with tab2:
+        if 'specs' in property_data:
+            for key, value in property_data['specs'].items():
+                st.markdown(f"**{key}:** {value}")
+    
+    with tab3:
+        if 'highlights' in property_data:
+            st.subheader("Highlights")
+            for item in property_data['highlights']:
+                st.markdown(f"- {item}")
+                
+        if 'amenities' in property_data:
+            st.subheader("Amenities")
+            cols = st.columns(3)
+            for i, amenity in enumerate(property_data['amenities']):
+                cols[i%3].markdown(f"✓ {amenity}")
+    
+    # Contact and action buttons
+    st.divider()
+    st.subheader("Interested?")
+    st.markdown(f"📞 {property_data.get('contact', 'Contact sales for more information')}")
+    
+    if st.button("Schedule a Viewing", type="primary"):
+        st.session_state.show_booking_form = True
+    
+    if st.session_state.get('show_booking_form', False):
+        with st.form("viewing_form"):
+            st.write("### Schedule a Viewing")
+            name = st.text_input("Full Name")
+            email = st.text_input("Email")
+            phone = st.text_input("Phone Number")
+            date = st.date_input("Preferred Date")
+            submitted = st.form_submit_button("Request Viewing")
+            if submitted and name and email and phone and date:
+                # Create viewing request data
+                import csv
+                from datetime import datetime
+                import os
+                
+                request_data = {
+                    'timestamp': dt.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'property_name': property_data.get('name', 'N/A'),
+                    'name': name,
+                    'email': email,
+                    'phone': phone,
+                    'preferred_date': date.strftime('%Y-%m-%d'),
+                    'status': 'New'
+                }
+                
+                # Define CSV file path
+                csv_file = 'viewing_requests.csv'
+                file_exists = os.path.isfile(csv_file)
+                
+                # Write to CSV
+                with timed("csv.write:viewing_requests.csv"), open(csv_file, mode='a', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=request_data.keys())
+                    if not file_exists:
+                        writer.writeheader()
+                    writer.writerow(request_data)
+                
+                st.success("Viewing request submitted! Our team will contact you shortly.")
+                st.session_state.show_booking_form = False
+            elif submitted:
+                st.error("Please fill in all required fields.")
+
+        if st.button("← Back to Matches"):
+            if 'selected_property' in st.session_state:
+                del st.session_state.selected_property
+            if 'show_booking_form' in st.session_state:
+                del st.session_state.show_booking_form
+            st.rerun()
+
+
+def render():
+    st.title("🔍 Advanced Property Browser & Comparison")
+    st.markdown("Filter WestProp properties based on your criteria and compare selections.")
+
+    # --- Add Filter Widgets to Sidebar ---
+    st.sidebar.markdown("---")
+    st.sidebar.header("🔍 Filter Properties")
+
+    # Project Filter
+    selected_projects = st.sidebar.multiselect("Select Project(s)", options=projects, default=projects)
+
+    # Property Type Filter
+    selected_types = st.sidebar.multiselect("Select Property Type(s)", options=property_types, default=property_types)
+
+    # Price Range Filter
+    min_price, max_price = int(properties_df["price"].min()), int(properties_df["price"].max())
+    selected_price = st.sidebar.slider("Price Range (USD)", min_value=min_price, max_value=max_price, value=(min_price, max_price))
+
+    # Amenities Filter
+    selected_amenities = st.sidebar.multiselect("Required Amenities", options=amenities_options, help="Select the features you want in a property, like pool or gym.")
+
+    # Status Filter
+    selected_statuses = st.sidebar.multiselect("Select Status(es)", options=statuses, default=statuses)
+
+    # --- Filtering Logic ---
+    filtered_properties = properties_df.copy()
+
+    # Apply filters
+    if selected_projects:
+        filtered_properties = filtered_properties[filtered_properties["project"].isin(selected_projects)]
+
+    if selected_types:
+        filtered_properties = filtered_properties[filtered_properties["property_type"].isin(selected_types)]
+
+    filtered_properties = filtered_properties[
+        (filtered_properties["price"] >= selected_price[0]) & (filtered_properties["price"] <= selected_price[1])
+    ]
+
+    if selected_amenities:
+        # Check if all selected amenities are present in the property's amenity list
+        def check_amenities(prop_amenities):
+            if isinstance(prop_amenities, list):
+                return all(amenity in prop_amenities for amenity in selected_amenities)
+
+    if selected_statuses:
+        filtered_properties = filtered_properties[filtered_properties["status"].isin(selected_statuses)]
+
+    # Lazy load property listings
+    items_per_page = 9
+    page = st.session_state.get('property_page', 1)
+
+    def show_properties(page, items_per_page):
+        start_idx = (page - 1) * items_per_page
+        end_idx = min(start_idx + items_per_page, len(filtered_properties))
+        
+        # Show current page of properties
+        for i in range(0, end_idx - start_idx, 3):
+            cols = st.columns(3)
+            for j in range(3):
+                idx = start_idx + i + j
+                if idx < end_idx:
+                    with cols[j]:
+                        create_property_card(listing_card_data(filtered_properties.iloc[idx].to_dict()))
+        
+        return end_idx
+
+    # Show pagination controls
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        if page > 1 and st.button("⬅️ Previous"):
+            st.session_state.property_page = page - 1
+            st.rerun()
+
+    with col3:
+        total_pages = (len(filtered_properties) + items_per_page - 1) // items_per_page
+        if page < total_pages and st.button("Next ➡️"):
+            st.session_state.property_page = page + 1
+            st.rerun()
+
+    # Show current page of properties
+    show_properties(page, items_per_page)
+
+    # --- Display Filtered Results & Comparison Selection ---
+    st.subheader(f"🔎 Found {len(filtered_properties)} Properties Matching Filters")
+
+    compare_list = []
+    if not filtered_properties.empty:
+        # Initialize the compare list in session state if it doesn't exist
+        if 'compare_indices' not in st.session_state:
+            st.session_state.compare_indices = []
+
+        for index, row in filtered_properties.iterrows():
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                st.markdown(f"**{row['project']} - {row['property_type']}**")
+                st.markdown(f"Price: ${row['price']:,} | Status: {row['status']}")
+                # Show amenities concisely
+                if isinstance(row['amenities'], list):
+                    st.markdown(f"_Amenities:_ {', '.join(row['amenities'][:3])}{'...' if len(row['amenities']) > 3 else ''}")
+                if row['url'] and isinstance(row['url'], str) and row['url'].startswith('http'):
+                    st.markdown(f"[More Details]({row['url']})", unsafe_allow_html=True)
+                else:
+                    st.caption("More Details: Link unavailable")
+            with col2:
+                # Use a unique key for each checkbox based on the DataFrame index
+                # Check if index is already in the comparison list (persists across reruns)
+                is_checked = index in st.session_state.compare_indices
+                if st.checkbox("Compare", value=is_checked, key=f"compare_{index}"):
+                    if index not in st.session_state.compare_indices:
+                         st.session_state.compare_indices.append(index) # Add index if checked and not already there
+                else:
+                    if index in st.session_state.compare_indices:
+                        st.session_state.compare_indices.remove(index) # Remove index if unchecked
+
+            st.markdown("---")
+        # Use the session state list for comparison
+        compare_list = st.session_state.compare_indices
+    else:
+        st.warning("No properties match the selected filters.")
+        # Clear comparison list if filters result in empty set
+        if 'compare_indices' in st.session_state:
+            st.session_state.compare_indices = []
+
+    # --- Comparison Section ---
+    st.subheader("⚖️ Property Comparison")
+
+    if len(compare_list) >= 2:
+        properties_to_compare = properties_df.loc[compare_list]
+        num_columns = len(properties_to_compare)
+        cols = st.columns(num_columns)
+
+        # Define attributes to compare
+        attributes_to_show = ["project", "property_type", "price", "size_sqm", "bedrooms", "status", "amenities", "payment_terms"]
+
+        for i, index in enumerate(properties_to_compare.index):
+            with cols[i]:
+                st.markdown(f"#### {properties_to_compare.loc[index, 'project']}")
+                st.markdown(f"##### {properties_to_compare.loc[index, 'property_type']}")
+                for attr in attributes_to_show:
+                    value = properties_to_compare.loc[index, attr]
+
+                    # Handle list type first (amenities)
+                    if attr == "amenities" and isinstance(value, list):
+                        if value: # Check if the list is not empty
+                            st.markdown(f"**{attr.replace('_', ' ').title()}:**")
+                            for amenity in value:
+                                st.markdown(f"- {amenity}")
+                        # else: optionally handle empty list case if needed
+
+                    # Handle other types (non-lists)
+                    elif not isinstance(value, list) and pd.notna(value):
+                        if attr == "price":
+                            st.markdown(f"**{attr.replace('_', ' ').title()}:** ${value:,}")
+                        elif attr == "size_sqm":
+                             st.markdown(f"**{attr.replace('_', ' ').title()}:** {value:.1f}") # Format float
+                        elif attr == "bedrooms":
+                             st.markdown(f"**{attr.replace('_', ' ').title()}:** {int(value)}") # Format as int
+                        else:
+                            st.markdown(f"**{attr.replace('_', ' ').title()}:** {value}")
+                    # Optionally handle NaN/None cases for non-list types if needed
+                    elif pd.isna(value) and not isinstance(value, list):
+                         st.markdown(f"**{attr.replace('_', ' ').title()}:** Not Available")
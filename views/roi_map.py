@@ -0,0 +1,807 @@
+"""🗺️ ROI Map page: interactive ROI map, location voting and the voting admin panel."""
+import io
+import logging
+import os
+import random
+import tempfile
+from datetime import datetime as dt
+
+import pandas as pd
+import streamlit as st
+
+from core.datasets import read_csv_shared
+from core.lazy import lazy_import
+from core.timing import timed
+
+logger = logging.getLogger(__name__)
+
+# The map and chart libraries are only imported once this page actually draws something
+folium = lazy_import("folium")
+folium_plugins = lazy_import("folium.plugins")
+plt = lazy_import("matplotlib.pyplot")
+streamlit_folium = lazy_import("streamlit_folium")
+
+
+# --- MAP VIEW ---
+# No st.cache_data here: read_csv_shared already parses the file once per process
+# and picks up edits immediately instead of after a TTL
+def load_map_data():
+    try:
+        # Load and preprocess map data
+        df = read_csv_shared("westprop_streamlit_dataset.csv")
+        
+        # Convert ROI to numeric, handling any non-numeric values
+        if 'ROI (%)' in df.columns:
+            df['ROI (%)'] = pd.to_numeric(df['ROI (%)'], errors='coerce')
+            
+        # Ensure required columns exist, add if missing with default values
+        required_columns = ['Project', 'Latitude', 'Longitude', 'ROI (%)']
+        for col in required_columns:
+            if col not in df.columns:
+                if col == 'ROI (%)':
+                    df[col] = 0.0  # Default ROI if missing
+                else:
+                    df[col] = ''  # Empty string for other missing columns
+        
+        # Drop any rows with missing coordinates or project names
+        df = df.dropna(subset=['Project', 'Latitude', 'Longitude'])
+        
+        return df
+        
+    except Exception as e:
+        st.error(f"Error loading map data: {str(e)}")
+        # Return a minimal valid dataframe if there's an error
+        return pd.DataFrame({
+            'Project': ['Sample Project'],
+            'Latitude': [-17.8],
+            'Longitude': [31.0],
+            'ROI (%)': [0.0]
+        })
+
+
+# Cache the filtered data
+@st.cache_data(ttl=300)  # Cache for 5 minutes
+def get_filtered_data(_df, min_roi):
+    return _df[_df["ROI (%)"] >= min_roi].copy()
+
+
+# Match a clicked map location to the nearest project name
+def match_project_name(lat_clicked, lon_clicked, dataset, threshold=0.0005):
+    for _, row in dataset.iterrows():
+        if abs(row["Latitude"] - lat_clicked) <= threshold and abs(row["Longitude"] - lon_clicked) <= threshold:
+            return row["Project"]
+    return "Unknown Location"
+
+
+# Cache the map creation
+@st.cache_data(ttl=300)
+def create_base_map():
+    return folium.Map(
+        location=[-17.8, 31.0],  # Default to Harare
+        zoom_start=12,
+        tiles="cartodbpositron",
+        control_scale=True,
+        prefer_canvas=True,  # Better performance with many markers
+        min_zoom=10,
+        max_zoom=18
+    )
+
+
+def render():
+    st.title("🗺️ Interactive ROI Map with Heatmap View")
+    
+    # Add loading state for better UX
+    with st.spinner("Loading map data..."):
+        df = load_map_data()
+    
+    st.sidebar.markdown("---")
+    min_roi = st.sidebar.slider("Minimum ROI to display (%)", 0.0, 20.0, 9.0, step=0.1)
+    
+    filtered_df = get_filtered_data(df, min_roi)
+    show_heatmap = st.sidebar.checkbox("Show Heatmap Layer", value=True)
+    show_markers = st.sidebar.checkbox("Show ROI Markers", value=True)
+
+    # Load data safely with explicit path
+    try:
+        df = read_csv_shared("data/westprop_streamlit_dataset.csv")
+        # Ensure required columns exist and have proper data types
+        required_columns = ["Project", "Latitude", "Longitude", "ROI (%)"]
+        for col in required_columns:
+            if col not in df.columns:
+                st.error(f"Error: Required column '{col}' not found in the dataset.")
+                st.stop()
+        
+        # Convert numeric columns to appropriate types
+        df["Latitude"] = pd.to_numeric(df["Latitude"], errors='coerce')
+        df["Longitude"] = pd.to_numeric(df["Longitude"], errors='coerce')
+        df["ROI (%)"] = pd.to_numeric(df["ROI (%)"], errors='coerce')
+        
+        # Drop rows with missing coordinates or ROI
+        df = df.dropna(subset=["Latitude", "Longitude", "ROI (%)"])
+        
+        if df.empty:
+            st.error("Error: No valid data found in the dataset after cleaning.")
+            st.stop()
+            
+    except FileNotFoundError:
+        st.error("Error: data/westprop_streamlit_dataset.csv not found. Please ensure the file exists in the data/ directory.")
+        st.stop()
+    except Exception as e:
+        st.error(f"Error loading data: {str(e)}")
+        st.stop()
+
+    # Filter data based on minimum ROI
+    filtered_df = df[df["ROI (%)"] >= min_roi].copy()
+    
+    with timed("roi_map.build_map"):
+        m = create_base_map()
+
+        if show_markers and not filtered_df.empty:
+            # Add markers with clustering for better performance
+            # Create a marker cluster
+            marker_cluster = folium_plugins.MarkerCluster(
+                name="Properties",
+                overlay=True,
+                control=True,
+                icon_create_function=None
+            ).add_to(m)
+        
+            # Add markers to the cluster
+            for idx, row in filtered_df.iterrows():
+                # Create popup with available data
+                popup_content = f"<b>{row['Project']}</b><br>"
+                popup_content += f"ROI: {row['ROI (%)']:.1f}%<br>"
+            
+                # Only add type if the column exists
+                if 'Project Type' in row and pd.notna(row['Project Type']):
+                    popup_content += f"Type: {row['Project Type']}"
+                
+                popup = folium.Popup(popup_content, max_width=250)
+                folium.Marker(
+                    [row['Latitude'], row['Longitude']],
+                    popup=popup,
+                    tooltip=row['Project'],
+                    icon=folium.Icon(color='blue', icon='home')
+                ).add_to(marker_cluster)
+
+        if show_heatmap and not filtered_df.empty:
+            # Only include valid coordinates in heatmap
+            heat_data = [
+                [row["Latitude"], row["Longitude"], row["ROI (%)"]] 
+                for _, row in filtered_df.iterrows() 
+                if pd.notna(row["Latitude"]) and pd.notna(row["Longitude"])
+            ]
+            if heat_data:  # Only add heatmap if we have valid data points
+                folium_plugins.HeatMap(heat_data, radius=25).add_to(m)
+
+    # Display the map with optimized rendering and capture interactions
+    with timed("roi_map.render_map"):
+        map_interaction = streamlit_folium.st_folium(
+            m,
+            width='100%',
+            height=600,
+            use_container_width=True,
+            returned_objects=["last_clicked", "bounds", "zoom"],
+            zoom=12,
+            center=[-17.8, 31.0],
+            key="map"
+        )
+    
+    # Initialize simulation data in session state if not exists
+    if 'simulation_data' not in st.session_state:
+        st.session_state.simulation_data = {
+            'clicked': False
+        }
+    
+    # Handle map clicks and ROI simulation
+    if map_interaction and map_interaction.get("last_clicked"):
+        lat = map_interaction["last_clicked"]["lat"]
+        lon = map_interaction["last_clicked"]["lng"]
+
+        # Store the click data in session state
+        st.session_state.last_click = {
+            'lat': lat,
+            'lon': lon,
+            'clicked': True
+        }
+
+        # Match to project name with a larger threshold
+        matched_project = match_project_name(lat, lon, df)
+        
+        # Find the nearest project within a reasonable distance
+        nearest_project = None
+        if lat is not None and lon is not None:
+            df['distance'] = ((df['Latitude'] - lat) ** 2 + (df['Longitude'] - lon) ** 2) ** 0.5
+            nearest_project = df.sort_values('distance').iloc[0] if not df.empty else None
+        
+        # Handle ROI calculation if we have a valid nearest project
+        max_distance = 0.02  # ~2km at the equator
+        
+        # Initialize default values
+        base_roi = 5.0  # Default base ROI for undeveloped areas
+        simulated_roi = max(0.1, base_roi + (random.random() * 4 - 2))  # Random value between base_roi±2%
+        project_name = "Undeveloped Area"
+        distance = None
+        distance_km = 0
+        
+        # Check if nearest_project exists and has required attributes
+        if (nearest_project is not None and 
+            'distance' in nearest_project and 
+            'ROI (%)' in nearest_project and 
+            'Project' in nearest_project):
+            
+            distance = nearest_project['distance']
+            
+            if distance < max_distance:
+                # If close to a project, use its ROI with slight distance-based adjustment
+                base_roi = nearest_project['ROI (%)']
+                # Reduce ROI slightly based on distance (further = lower ROI)
+                distance_factor = 1 - (distance / max_distance) * 0.3  # Up to 30% reduction
+                simulated_roi = max(0.1, base_roi * distance_factor)
+                project_name = nearest_project['Project']
+        
+        # Calculate distance in kilometers if available
+        distance_km = distance * 111 if distance is not None else 0
+        is_developed = project_name != "Undeveloped Area"
+        
+        # Update session state with simulation data
+        st.session_state.simulation_data = {
+            'is_developed': is_developed,
+            'project_name': project_name,
+            'distance_km': distance_km,
+            'base_roi': base_roi,
+            'simulated_roi': simulated_roi,
+            'clicked': True
+        }
+    
+    # Only show ROI information if the user has clicked on the map
+    if st.session_state.simulation_data.get('clicked', False):
+        project_name = st.session_state.simulation_data['project_name']
+        is_developed = st.session_state.simulation_data['is_developed']
+        simulated_roi = st.session_state.simulation_data['simulated_roi']
+        base_roi = st.session_state.simulation_data['base_roi']
+        distance_km = st.session_state.simulation_data.get('distance_km', 0)
+        
+        # Display information to the user
+        st.markdown(f"📍 **You clicked near:** `{project_name}`")
+        if is_developed and distance_km > 0:
+            st.markdown(f"📏 **Distance from project center:** ~{distance_km:.2f} km")
+            st.markdown(f"📈 **Estimated ROI:** {simulated_roi:.2f}% (Base: {base_roi:.2f}%)")
+        else:
+            st.markdown(f"📊 **Estimated ROI for undeveloped area:** {simulated_roi:.2f}%")
+        
+        st.markdown(f"🏢 **Nearest Project:** `{project_name if project_name != 'Unknown Location' else 'No nearby projects'}`")
+        st.markdown(f"💡 **Estimated ROI at this location:** `{simulated_roi:.2f}%")
+
+        # Voting section
+        st.subheader("🗳️ Would You Invest In This Location?")
+        vote = st.radio("Your Vote", ["Yes", "No"], horizontal=True, 
+                       help="Would you consider investing in a property at this location?",
+                       key="vote_radio_main")
+
+        if st.button("Submit Vote", key="submit_vote_main"):
+            try:
+                # Create new vote record
+                new_vote = pd.DataFrame([{
+                    "Project": project_name,
+                    "Latitude": lat,
+                    "Longitude": lon,
+                    "ROI (%)": round(simulated_roi, 2),
+                    "Vote": vote,
+                    "Timestamp": dt.now().isoformat()
+                }])
+                
+                # Try to read existing votes
+                try:
+                    existing_votes = read_csv_shared("vote_results.csv")
+                    vote_data = pd.concat([existing_votes, new_vote], ignore_index=True)
+                except FileNotFoundError:
+                    vote_data = new_vote
+                
+                # Save to CSV
+                with timed("csv.write:vote_results.csv"):
+                    vote_data.to_csv("vote_results.csv", index=False)
+                st.success("✅ Your vote has been recorded for this project!")
+                
+            except Exception as e:
+                st.error(f"❌ Error recording vote: {str(e)}")
+
+        # This section was removed to prevent duplicate voting UI
+    
+    # Voting admin login section
+    if "voting_admin_logged_in" not in st.session_state:
+        st.session_state.voting_admin_logged_in = False
+
+    if not st.session_state.voting_admin_logged_in:
+        with st.form("voting_admin_login_form"):
+            st.subheader("Voting Admin Login")
+            password_input = st.text_input("Enter voting admin password:", type="password")
+            if st.form_submit_button("Login as Voting Admin"):
+                if password_input == "westprop2025":
+                    st.session_state.voting_admin_logged_in = True
+                    st.rerun()
+                else:
+                    st.error("❌ Incorrect password. Please try again.")
+
+
+    if st.session_state.get("voting_admin_logged_in", False):
+        st.subheader("🔒 Admin Panel — Voting Data")
+        
+        # Load votes data
+        try:
+            recent_votes = read_csv_shared("vote_results.csv")
+            if recent_votes.empty:
+                st.warning("No votes recorded yet.")
+            else:
+                st.dataframe(recent_votes.tail(10))
+                
+                # Display voting statistics
+                st.subheader("📊 Voting Statistics")
+                
+                # Calculate overall vote distribution
+                vote_counts = recent_votes['Vote'].value_counts()
+                
+                # Tab layout for different views
+                tab1, tab2 = st.tabs(["Overall Results", "By Location"])
+                
+                with tab1:
+                    # Overall vote distribution
+                    st.markdown("### Overall Vote Distribution")
+                    col1, col2 = st.columns([2, 1])
+                    
+                    with col1:
+                        # Create bar chart for overall votes
+                        fig1, ax1 = plt.subplots(figsize=(8, 4))
+                        vote_counts.plot(kind='bar', color=['#4CAF50', '#F44336'], ax=ax1)
+                        ax1.set_title('Vote Distribution (Overall)')
+                        ax1.set_xlabel('Vote')
+                        ax1.set_ylabel('Number of Votes')
+                        ax1.set_xticklabels(ax1.get_xticklabels(), rotation=0)
+                        
+                        # Add count labels on top of bars
+                        for i, v in enumerate(vote_counts):
+                            ax1.text(i, v + 0.2, str(v), ha='center', va='bottom')
+                        
+                        st.pyplot(fig1)
+                        plt.close(fig1)
+                    
+                    with col2:
+                        # Display summary statistics
+                        st.metric("Total Votes", len(recent_votes))
+                        if 'Yes' in vote_counts:
+                            st.metric("👍 Yes Votes", f"{vote_counts['Yes']} ({(vote_counts['Yes']/len(recent_votes)*100):.1f}%)")
+                        if 'No' in vote_counts:
+                            st.metric("👎 No Votes", f"{vote_counts['No']} ({(vote_counts['No']/len(recent_votes)*100):.1f}%)")
+                
+                with tab2:
+                    # Location-based analysis
+                    st.markdown("### 🗺️ Votes by Location")
+                    
+                    # Group by Project and Vote
+                    if 'Project' in recent_votes.columns and not recent_votes.empty:
+                        # Calculate votes by location
+                        location_votes = recent_votes.groupby(['Project', 'Vote']).size().unstack(fill_value=0)
+                        
+                        # Add any missing vote columns
+                        for vote in ['Yes', 'No']:
+                            if vote not in location_votes.columns:
+                                location_votes[vote] = 0
+                        
+                        # Calculate totals and percentages
+                        location_votes['Total'] = location_votes.sum(axis=1)
+                        location_votes = location_votes.sort_values('Total', ascending=False)
+                        
+                        # Create a figure with subplots
+                        fig2, (ax2, ax3) = plt.subplots(2, 1, figsize=(12, 12), 
+                                                      gridspec_kw={'height_ratios': [3, 1]},
+                                                      facecolor='#f8f9fa')
+                        
+                        # Set style
+                        plt.style.use('ggplot')
+                        
+                        # Plot location-based results with better formatting
+                        bars = location_votes[['Yes', 'No']].plot(
+                            kind='barh',  # Horizontal bars for better project name display
+                            stacked=True,
+                            color=['#4CAF50', '#F44336'],
+                            ax=ax2,
+                            width=0.7,  # Slightly thinner bars
+                            edgecolor='white',
+                            linewidth=0.7
+                        )
+                        
+                        # Customize the chart
+                        ax2.set_title('Votes by Project', fontsize=14, pad=20, fontweight='bold')
+                        ax2.set_xlabel('Number of Votes', fontsize=12, labelpad=10)
+                        ax2.set_ylabel('Project', fontsize=12, labelpad=10)
+                        ax2.legend(title='Vote', bbox_to_anchor=(1.02, 1), loc='upper left')
+                        ax2.grid(axis='x', linestyle='--', alpha=0.7)
+                        
+                        # Add value and percentage labels on the bars
+                        for i, (idx, row) in enumerate(location_votes.iterrows()):
+                            total = row['Total']
+                            y_pos = i  # Current y-position for the bar segment
+                            
+                            # Add Yes votes label
+                            if row.get('Yes', 0) > 0:
+                                yes_pct = (row['Yes'] / total) * 100
+                                ax2.text(
+                                    row['Yes']/2, y_pos,
+                                    f"{row['Yes']} ({yes_pct:.1f}%)",
+                                    ha='center', va='center',
+                                    color='white', fontweight='bold',
+                                    fontsize=9
+                                )
+                            
+                            # Add No votes label
+                            if row.get('No', 0) > 0:
+                                no_pct = (row['No'] / total) * 100
+                                ax2.text(
+                                    row['Yes'] + row['No']/2, y_pos,
+                                    f"{row['No']} ({no_pct:.1f}%)",
+                                    ha='center', va='center',
+                                    color='white', fontweight='bold',
+                                    fontsize=9
+                                )
+                        
+                        # Create a donut chart for overall distribution
+                        wedges, texts, autotexts = ax3.pie(
+                            vote_counts,
+                            labels=vote_counts.index,
+                            autopct='%1.1f%%',
+                            colors=['#4CAF50', '#F44336'],
+                            startangle=90,
+                            wedgeprops=dict(width=0.4),  # Create donut chart
+                            textprops={'fontsize': 10}
+                        )
+                        
+                        # Style the donut chart
+                        centre_circle = plt.Circle((0,0), 0.6, fc='white')
+                        ax3.add_artist(centre_circle)
+                        ax3.set_title('Overall Vote Distribution', fontsize=12, pad=20, fontweight='bold')
+                        ax3.axis('equal')
+                        
+                        # Add total votes in the center of the donut
+                        total_votes = vote_counts.sum()
+                        ax3.text(0, 0, f"Total\n{total_votes} votes", 
+                                ha='center', va='center', 
+                                fontsize=12, fontweight='bold')
+                        
+                        # Adjust layout and display
+                        plt.tight_layout()
+                        plt.subplots_adjust(hspace=0.4)  # Add some space between subplots
+                        st.pyplot(fig2)
+                        plt.close(fig2)
+                        
+                        # Show detailed breakdown in an expandable section
+                        with st.expander("📊 View Detailed Vote Breakdown"):
+                            # Calculate percentages for the table
+                            display_df = location_votes.copy()
+                            display_df['Yes %'] = (display_df['Yes'] / display_df['Total'] * 100).round(1)
+                            display_df['No %'] = (display_df['No'] / display_df['Total'] * 100).round(1)
+                            
+                            # Reorder columns for better readability
+                            display_df = display_df[['Total', 'Yes', 'Yes %', 'No', 'No %']]
+                            
+                            # Style the dataframe
+                            styled_df = display_df.style\
+                                .background_gradient(subset=['Yes %', 'No %'], cmap='YlGn')\
+                                .format({
+                                    'Yes %': '{:.1f}%',
+                                    'No %': '{:.1f}%',
+                                    'Total': '{:,.0f}'
+                                })
+                            
+                            st.dataframe(styled_df)
+                    else:
+                        st.warning("No location data available in the voting records.")
+                
+                st.markdown("---")
+                
+                # Reset Votes Section
+                st.subheader("⚠️ Reset All Votes")
+                st.warning("This action will permanently delete all voting records and cannot be undone.")
+                
+                # Confirmation dialog for reset
+                if st.checkbox("I understand this action cannot be undone"):
+                    if st.button("🔴 Reset All Votes", 
+                              help="Permanently delete all voting records",
+                              type="primary"):
+                        try:
+                            # Delete the vote results file
+                            if os.path.exists("vote_results.csv"):
+                                os.remove("vote_results.csv")
+                                st.success("All votes have been successfully reset.")
+                                st.rerun()
+                            else:
+                                st.warning("No vote records found to delete.")
+                        except Exception as e:
+                            st.error(f"Error resetting votes: {str(e)}")
+                
+                st.markdown("---")
+                st.subheader("Export Data")
+                
+                # Add export buttons in a single row
+                col1, col2 = st.columns(2)
+                with col1:
+                    # CSV Download
+                    csv = recent_votes.to_csv(index=False).encode('utf-8')
+                    st.download_button(
+                        "💾 Download Votes (CSV)",
+                        data=csv,
+                        file_name="westprop_vote_results.csv",
+                        mime="text/csv",
+                        help="Download all voting data as a CSV file"
+                    )
+                
+                with col2:
+                    # Email Export
+                    with st.form("email_vote_report_form"):
+                        email = st.text_input("Recipient Email", "admin@westprop.com")
+                        submit_button = st.form_submit_button("📧 Send Report")
+                        
+                        if submit_button:
+                            # Create a status container for the spinner and messages
+                            status_container = st.empty()
+                            with status_container:
+                                with st.spinner("📤 Preparing and sending report..."):
+                                    try:
+                                        from email_service import send_email
+                                        
+                                        # Generate vote statistics
+                                        total_votes = len(recent_votes)
+                                        yes_votes = len(recent_votes[recent_votes['Vote'] == 'Yes'])
+                                        no_votes = len(recent_votes[recent_votes['Vote'] == 'No'])
+                                        yes_pct = (yes_votes / total_votes * 100) if total_votes > 0 else 0
+                                        
+                                        # Group by project
+                                        project_votes = recent_votes.groupby('Project')['Vote'].value_counts().unstack(fill_value=0)
+                                        project_votes['Total'] = project_votes.get('Yes', 0) + project_votes.get('No', 0)
+                                        project_votes['Yes %'] = (project_votes.get('Yes', 0) / project_votes['Total'] * 100).round(1)
+                                        
+                                        # Create email content
+                                        subject = f"WestProp Voting Report - {dt.now().strftime('%Y-%m-%d')}"
+                                        
+                                        # Create styled HTML for project votes table
+                                        styled_project_votes = project_votes.style\
+                                            .set_table_attributes('class="dataframe" style="border-collapse: collapse; width: 100%;"')\
+                                            .set_properties(**{'text-align': 'center', 'border': '1px solid #ddd'})\
+                                            .set_table_styles([
+                                                {'selector': 'th', 'props': [('background-color', '#f2f2f2'), 
+                                                                          ('padding', '12px'),
+                                                                          ('text-align', 'center'),
+                                                                          ('border-bottom', '1px solid #ddd')]},
+                                                {'selector': 'tr:nth-child(even)', 'props': [('background-color', '#f9f9f9')]},
+                                                {'selector': 'tr:hover', 'props': [('background-color', '#f1f1f1')]},
+                                                {'selector': 'td', 'props': [('padding', '8px'), ('border-bottom', '1px solid #ddd')]},
+                                                {'selector': 'th:first-child, td:first-child', 'props': [('text-align', 'left')]}
+                                            ])
+                                        
+                                        # Format the email body with better styling
+                                        now = dt.now().strftime('%Y-%m-%d %H:%M:%S')
+                                        yes_percent = (yes_votes / total_votes * 100) if total_votes > 0 else 0
+                                        no_percent = (no_votes / total_votes * 100) if total_votes > 0 else 0
+                                        
+                                        email_body = f"""
+                                        <div style="font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto;">
+                                            <h2 style="color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px;">
+                                                WestProp Voting Activity Report
+                                            </h2>
+                                            <p style="color: #555; font-size: 14px; margin-bottom: 20px;">
+                                                Generated on: {now}<br>
+                                                Total Votes: {total_votes}<br>
+                                                Yes: {yes_votes} ({yes_percent:.1f}%) | No: {no_votes} ({no_percent:.1f}%)
+                                            </p>
+                                        """.format(
+                                            date=now,
+                                            total_votes=total_votes,
+                                            yes_votes=yes_votes,
+                                            no_votes=no_votes,
+                                            yes_percent=yes_percent,
+                                            no_percent=no_percent
+                                        )
+                                        
+                                        with tempfile.TemporaryDirectory() as temp_dir:
+                                            # Save visualizations to files
+                                            img_paths = []
+                                            
+                                            try:
+                                                # Save overall distribution chart
+                                                fig1, ax1 = plt.subplots(figsize=(8, 4))
+                                                vote_counts = recent_votes['Vote'].value_counts()
+                                                vote_counts.plot(kind='bar', color=['#4CAF50', '#F44336'], ax=ax1)
+                                                ax1.set_title('Vote Distribution')
+                                                ax1.set_xlabel('Vote')
+                                                ax1.set_ylabel('Count')
+                                                
+                                                # Save the figure
+                                                vote_chart_path = os.path.join(temp_dir, 'vote_distribution.png')
+                                                plt.tight_layout()
+                                                plt.savefig(vote_chart_path, dpi=100, bbox_inches='tight')
+                                                plt.close()
+                                                
+                                                # Add chart to email
+                                                email_body += """
+                                                <div style='margin-bottom: 30px;'>
+                                                    <h4>Vote Distribution</h4>
+                                                    <img src='cid:votechart' style='max-width: 100%; border: 1px solid #ddd; border-radius: 4px;'/>
+                                                </div>
+                                                """
+                                                
+                                                # Create and save the overall distribution donut chart
+                                                fig_donut, ax_donut = plt.subplots(figsize=(8, 8))
+                                                wedges, texts, autotexts = ax_donut.pie(
+                                                    vote_counts,
+                                                    labels=vote_counts.index,
+                                                    autopct='%1.1f%%',
+                                                    colors=['#4CAF50', '#F44336'],
+                                                    startangle=90,
+                                                    wedgeprops=dict(width=0.4, edgecolor='white'),
+                                                    textprops={'fontsize': 10, 'weight': 'bold'}
+                                                )
+                                                centre_circle = plt.Circle((0,0), 0.6, fc='white')
+                                                ax_donut.add_artist(centre_circle)
+                                                ax_donut.axis('equal')
+                                                ax_donut.set_title('Overall Vote Distribution', fontsize=12, pad=20, fontweight='bold')
+                                                
+                                                # Add total votes in center
+                                                ax_donut.text(0, 0, f"Total\n{total_votes} votes", 
+                                                           ha='center', va='center', 
+                                                           fontsize=12, fontweight='bold')
+                                                
+                                                donut_chart_path = os.path.join(temp_dir, 'donut_chart.png')
+                                                plt.tight_layout()
+                                                plt.savefig(donut_chart_path, dpi=100, bbox_inches='tight')
+                                                plt.close()
+                                                
+                                                # Add donut chart to email
+                                                email_body += """
+                                                <div style='margin: 30px 0; text-align: center;'>
+                                                    <h4>Overall Vote Distribution</h4>
+                                                    <img src='cid:donutchart' style='max-width: 100%; max-height: 400px; border: 1px solid #ddd; border-radius: 8px;'/>
+                                                </div>
+                                                """
+                                                
+                                                # If we have location data, add a location-based chart
+                                                if 'Project' in recent_votes.columns:
+                                                    # Calculate location votes
+                                                    location_votes = recent_votes.groupby('Project')['Vote'].value_counts().unstack(fill_value=0)
+                                                    location_votes['Total'] = location_votes.get('Yes', 0) + location_votes.get('No', 0)
+                                                    location_votes = location_votes.sort_values('Total', ascending=False)
+                                                    
+                                                    # Create location chart
+                                                    fig2, ax2 = plt.subplots(figsize=(10, 6))
+                                                    location_votes[['Yes', 'No']].plot(kind='bar', stacked=True, 
+                                                                                   color=['#4CAF50', '#F44336'], ax=ax2)
+                                                    ax2.set_title('Votes by Project')
+                                                    ax2.set_xlabel('Project')
+                                                    ax2.set_ylabel('Number of Votes')
+                                                    ax2.legend(title='Vote')
+                                                    plt.xticks(rotation=45, ha='right')
+                                                    
+                                                    # Save the figure
+                                                    location_chart_path = os.path.join(temp_dir, 'location_votes.png')
+                                                    plt.tight_layout()
+                                                    plt.savefig(location_chart_path, dpi=100, bbox_inches='tight')
+                                                    plt.close()
+                                                    
+                                                    # Add location chart to email
+                                                    if 'Project' in recent_votes.columns:
+                                                        email_body += """
+                                                        <div style='margin-top: 30px;'>
+                                                            <h4>Votes by Project</h4>
+                                                            <img src='cid:bylocation' style='max-width: 100%; border: 1px solid #ddd; border-radius: 4px;'/>
+                                                        </div>
+                                                        """
+                                                
+                                                # Add the data table
+                                                email_body += """
+                                                <div style='margin-top: 30px;'>
+                                                    <h4>Recent Votes</h4>
+                                                    {}
+                                                </div>
+                                                """.format(recent_votes.tail(10).to_html(index=False, classes='dataframe', border=0, 
+                                                                                     table_id='voteTable'))
+                                                
+                                                # Close the HTML
+                                                email_body += """
+                                                    <p style='margin-top: 30px; color: #777; font-size: 12px;'>
+                                                        This is an automated message. Please do not reply to this email.
+                                                    </p>
+                                                </div>
+                                                """
+                                                
+                                                # Prepare attachments and image paths
+                                                image_paths = [vote_chart_path, donut_chart_path]
+                                                image_cids = ['votechart', 'donutchart']
+                                                
+                                                if 'Project' in recent_votes.columns and os.path.exists(location_chart_path):
+                                                    image_paths.append(location_chart_path)
+                                                    image_cids.append('bylocation')
+                                                
+                                                # Send the email with proper image attachments
+                                                if send_email(
+                                                    recipient=email,
+                                                    subject=subject,
+                                                    body=email_body,
+                                                    is_html=True,
+                                                    image_paths=image_paths,
+                                                    image_cids=image_cids
+                                                ):
+                                                    status_container.success("✅ Report sent successfully!")
+                                                else:
+                                                    status_container.error("❌ Failed to send email. Please check the email configuration.")
+                                                    logger.error(f"Failed to send email to {email}")
+                                                
+                                            except Exception as e:
+                                                status_container.error("❌ Error generating visualizations. Sending text-only report...")
+                                                if send_email(email, subject, email_body, is_html=True):
+                                                    status_container.success("✅ Text-only report sent successfully!")
+                                                else:
+                                                    status_container.error("❌ Failed to send text-only email.")
+                                    except Exception as e:
+                                        status_container.error(f"❌ Error sending email: {str(e)}")
+                                        st.error("Please check the logs for more details.")
+                                        import traceback
+                                        st.error(traceback.format_exc())
+        
+        except FileNotFoundError:
+            st.warning("No votes recorded yet.")
+        except Exception as e:
+            st.error(f"Error loading vote data: {str(e)}")
+
+    # Always show logout button when logged in
+    if st.session_state.voting_admin_logged_in:
+        if st.button("🔓 Logout", key="logout_btn"):
+            # Clear all voting admin related session state
+            st.session_state.voting_admin_logged_in = False
+            # Clear any navigation flags
+            if 'go_to_roi_map' in st.session_state:
+                del st.session_state['go_to_roi_map']
+            # Force a rerun to update the UI
+            st.rerun()
+
+    # === Optional Vote Summary Chart ===
+    if st.session_state.get("admin_analytics_logged_in", False):
+        st.subheader("📊 Vote Summary by Project")
+    
+    # ... rest of the code remains the same ...
+        try:
+            vote_df = read_csv_shared("vote_results.csv")
+            if vote_df.empty:
+                st.info("No votes yet. Chart will appear once votes are recorded.")
+            else:
+                # Count Yes/No votes per project
+                vote_counts = vote_df.groupby(["Project", "Vote"]).size().unstack(fill_value=0)
+                if "Yes" not in vote_counts.columns:
+                    vote_counts["Yes"] = 0
+                if "No" not in vote_counts.columns:
+                    vote_counts["No"] = 0
+                vote_counts = vote_counts[["Yes", "No"]]
+
+                # Plot as grouped bar chart
+                fig, ax = plt.subplots(figsize=(8, 5))
+                vote_counts[["Yes", "No"]].plot(kind="bar", ax=ax, color=["#4CAF50", "#F44336"])
+                ax.set_title("Would You Invest? — Votes per Project")
+                ax.set_ylabel("Number of Votes")
+                ax.set_xlabel("Project")
+                plt.xticks(rotation=45, ha="right")
+                st.pyplot(fig)
+
+                # --- Add download button for the chart ---
+                buf = io.BytesIO()
+                fig.savefig(buf, format="png")
+                plt.close(fig)
+                buf.seek(0)
+                st.download_button(
+                    label="📥 Download Vote Summary Chart (PNG)",
+                    data=buf,
+                    file_name="vote_summary_chart.png",
+                    mime="image/png"
+                )
+        except FileNotFoundError:
+            st.warning("No votes recorded yet. Cast some votes to populate this chart.")
+        except pd.errors.EmptyDataError:
+            st.info("Voting file is empty. No votes have been recorded yet.")
+        except Exception as e:
+            st.error(f"An error occurred while generating the chart: {e}")
@@ -0,0 +1,69 @@
+""""🔧 Shell Unit Customizer" page: shell unit cost estimator."""
+import streamlit as st
+
+
+def render():
+    st.title("🔧 Shell Unit Customizer")
+    st.markdown("Design your ideal shell unit and see potential costs.")
+
+    st.subheader("Unit Specifications")
+    num_bedrooms = st.slider("Number of Bedrooms", 1, 5, 3)
+    num_bathrooms = st.slider("Number of Bathrooms", 1, 4, 2)
+    unit_size_sqm = st.number_input("Unit Size (sqm)", min_value=50, value=150, step=10)
+
+    st.subheader("Finishing Options")
+    kitchen_finish = st.selectbox("Kitchen Finish", ["Basic", "Standard", "Premium"])
+    bathroom_finish = st.selectbox("Bathroom Finish", ["Basic", "Standard", "Premium"])
+    flooring_type = st.selectbox("Flooring Type", ["Tiles", "Laminate", "Hardwood"])
+
+    st.subheader("Smart Feature Add-ons")
+    add_solar = st.checkbox("Add Solar Panels")
+    add_water_recycling = st.checkbox("Add Water Recycling System")
+    add_smart_locks = st.checkbox("Add Smart Locks")
+    add_smart_thermostats = st.checkbox("Add Smart Thermostats")
+    add_integrated_security = st.checkbox("Add Integrated Security System")
+    add_ev_charging = st.checkbox("Add EV Charging Station")
+
+    # --- Cost Estimation Logic (Simplified Example) ---
+    base_cost_per_sqm = 800  # USD per sqm for basic shell
+    total_cost = unit_size_sqm * base_cost_per_sqm
+
+    # Adjust for bedrooms/bathrooms (simplified)
+    total_cost += (num_bedrooms - 1) * 5000  # Each additional bedroom adds cost
+    total_cost += (num_bathrooms - 1) * 3000  # Each additional bathroom adds cost
+
+    # Finishing costs
+    if kitchen_finish == "Standard":
+        total_cost += 7000
+    elif kitchen_finish == "Premium":
+        total_cost += 15000
+
+    if bathroom_finish == "Standard":
+        total_cost += 5000
+    elif bathroom_finish == "Premium":
+        total_cost += 10000
+
+    if flooring_type == "Laminate":
+        total_cost += unit_size_sqm * 10
+    elif flooring_type == "Hardwood":
+        total_cost += unit_size_sqm * 20
+
+    # Smart feature costs (example figures)
+    if add_solar:
+        total_cost += 8000
+    if add_water_recycling:
+        total_cost += 3000
+    if add_smart_locks:
+        total_cost += 500
+    if add_smart_thermostats:
+        total_cost += 700
+    if add_integrated_security:
+        total_cost += 2500
+    if add_ev_charging:
+        total_cost += 4000
+
+    st.subheader("Estimated Cost")
+    st.metric("Total Estimated Cost", f"${total_cost:,.2f}")
+
+    st.markdown("--- ")
+    st.info("**Disclaimer:** This is a simplified cost estimator. Actual costs will vary based on specific materials, labor, and market conditions. Consult with a WestProp sales representative for a detailed quote.")
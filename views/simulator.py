@@ -0,0 +1,768 @@
+"""🏠 Simulator page: ROI simulation, sensitivity analysis and project auto-fill."""
+from datetime import datetime as dt
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from core.charts import chart_png, roi_comparison_png, roi_contributions_png
+from core.config import (
+    AGENT_FEE_RATE,
+    EV_CHARGING_SAVINGS,
+    INSURANCE_RATE,
+    INTEGRATED_SECURITY_SAVINGS,
+    MAINTENANCE_RATE,
+    MONTE_CARLO_MAX_PATHS,
+    MONTE_CARLO_PATHS,
+    MONTE_CARLO_SEED,
+    PROPERTY_TAX_RATE,
+    REAL_ESTATE_DATA_PATH,
+    SMART_FEATURE_MULTIPLIER,
+    SMART_LOCKS_SAVINGS,
+    SMART_THERMOSTATS_SAVINGS,
+    SOLAR_SAVINGS,
+    WATER_RECYCLING_SAVINGS,
+)
+from core.datasets import read_csv_shared
+from core.drift import get_drift_monitor
+from core.explanations import explain_roi, top_contributions
+from core.features import CATEGORICAL_FEATURES
+from core.monte_carlo import DISTRIBUTIONS, PERCENTILES, loss_curve, simulate_roi, summarize
+from core.prediction import predict_roi
+from core.properties import properties_df
+from core.roi_surface import MAX_GRID_STEPS, SURFACE_AXES, axis_values, predict_surface
+from core.sensitivity import FULL_IMPACT, WHAT_IF, sweep, tornado
+from core.simulation_log import get_simulation_log, page_cursor
+from core.timing import timed
+
+
+# Points per variable in the spider plot
+SPIDER_POINTS = 50
+
+# Analysis mode that compares the smart features instead of sweeping (core/sensitivity.py has the others)
+FEATURE_COMPARISON = "Feature Comparison"
+
+# Simulations per page under "Load Past Simulation"
+HISTORY_PAGE_SIZE = 10
+
+
+# Axis labels of the ROI surface explorer
+SURFACE_AXIS_LABELS = {
+    "sale_price_usd": "Market Price (USD)",
+    "building_size_sqm": "Building Size (sqm)",
+    "stand_size_sqm": "Stand Size (sqm)",
+    "bedrooms": "Bedrooms",
+    "bathrooms": "Bathrooms",
+    "location_suburb": "Location Suburb",
+    "property_type": "Property Type",
+}
+
+
+def _draw_tornado(fig, labels, impacts):
+    ax = fig.subplots()
+    y_pos = np.arange(len(labels))
+    ax.barh(y_pos, impacts, align='center', color="#FFC72C")
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(labels)
+    ax.invert_yaxis()
+    ax.set_xlabel('ROI Impact (%)')
+    ax.set_title('ROI Sensitivity (Tornado Chart)')
+
+
+def _draw_surface(fig, surface, x_values, y_values, x_label, y_label, categorical_x, categorical_y, current):
+    """Heatmap of a predicted ROI surface; contours and the current scenario on numeric axes."""
+    ax = fig.subplots()
+    x_coords = np.arange(len(x_values)) if categorical_x else np.asarray(x_values)
+    y_coords = np.arange(len(y_values)) if categorical_y else np.asarray(y_values)
+    mesh = ax.pcolormesh(x_coords, y_coords, surface, shading="nearest", cmap="viridis")
+    if not (categorical_x or categorical_y) and min(surface.shape) >= 3:
+        contours = ax.contour(x_coords, y_coords, surface, levels=8, colors="white", linewidths=0.6)
+        ax.clabel(contours, fontsize=7, fmt="%.1f")
+    for categorical, values, set_ticks, set_labels in (
+        (categorical_x, x_values, ax.set_xticks, ax.set_xticklabels),
+        (categorical_y, y_values, ax.set_yticks, ax.set_yticklabels),
+    ):
+        if categorical:
+            set_ticks(np.arange(len(values)))
+            set_labels([str(v).split(",")[0] for v in values], fontsize=7)
+    if categorical_x:
+        ax.tick_params(axis="x", labelrotation=90)
+    if current is not None:
+        ax.plot(*current, marker="x", color="red", label="Current scenario")
+        ax.legend(loc="upper right", fontsize=7)
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+    ax.set_title("Predicted ROI (Model)")
+    fig.colorbar(mesh, ax=ax, label="Predicted ROI (%)")
+
+
+def _surface_axis(label, feature, base_value, real_estate_df, key):
+    """Widgets choosing the grid values of one surface axis."""
+    key = f"{key}_{feature}"  # Each input keeps its own range when the axes are swapped
+    if feature in CATEGORICAL_FEATURES:
+        options = sorted(str(v) for v in real_estate_df[feature].dropna().unique())
+        return st.multiselect(f"{label} Values", options, default=options[:MAX_GRID_STEPS], key=f"{key}_values",
+                              max_selections=MAX_GRID_STEPS)
+    data_min, data_max = float(real_estate_df[feature].min()), float(real_estate_df[feature].max())
+    default = (max(data_min, float(base_value) * 0.5), min(data_max, max(float(base_value) * 1.5, data_min + 1)))
+    col1, col2 = st.columns([3, 1])
+    low, high = col1.slider(f"{label} Range", data_min, data_max, default, key=f"{key}_range")
+    steps = col2.number_input(f"{label} Steps", min_value=2, max_value=MAX_GRID_STEPS, value=50, key=f"{key}_steps")
+    return axis_values(feature, low, high, steps)
+
+
+def render_roi_surface(input_data, real_estate_df):
+    """Predicted ROI over a grid of two inputs, scored in one batch (core/roi_surface.py)."""
+    st.markdown("### 🗺️ ROI Surface Explorer")
+    st.caption("Vary two inputs at once and see the model's predicted ROI across the whole grid.")
+    if not st.toggle("Show ROI surface", value=False, key="surface_enabled"):
+        return
+
+    col1, col2 = st.columns(2)
+    x_feature = col1.selectbox("Horizontal Axis", SURFACE_AXES, index=SURFACE_AXES.index("sale_price_usd"),
+                               format_func=SURFACE_AXIS_LABELS.get, key="surface_x")
+    y_options = [f for f in SURFACE_AXES if f != x_feature]
+    y_feature = col2.selectbox("Vertical Axis", y_options, index=y_options.index("building_size_sqm")
+                               if "building_size_sqm" in y_options else 0,
+                               format_func=SURFACE_AXIS_LABELS.get, key="surface_y")
+    x_label, y_label = SURFACE_AXIS_LABELS[x_feature], SURFACE_AXIS_LABELS[y_feature]
+    x_values = _surface_axis(x_label, x_feature, input_data[x_feature], real_estate_df, "surface_x")
+    y_values = _surface_axis(y_label, y_feature, input_data[y_feature], real_estate_df, "surface_y")
+    if len(x_values) == 0 or len(y_values) == 0:
+        st.info("Select at least one value for each axis.")
+        return
+
+    with timed("simulator.roi_surface"):
+        surface = predict_surface(input_data, x_feature, x_values, y_feature, y_values)
+
+    categorical_x, categorical_y = x_feature in CATEGORICAL_FEATURES, y_feature in CATEGORICAL_FEATURES
+    current = None if categorical_x or categorical_y else (float(input_data[x_feature]), float(input_data[y_feature]))
+    figsize = (8, max(4, min(12, len(y_values) * 0.25)) if categorical_y else 5)
+    st.image(chart_png("simulator.roi_surface", _draw_surface, surface, list(x_values), list(y_values),
+                       x_label, y_label, categorical_x, categorical_y, current, figsize=figsize),
+             use_container_width=True)
+
+    best_y, best_x = np.unravel_index(np.argmax(surface), surface.shape)
+    best_x_value = x_values[best_x] if categorical_x else f"{x_values[best_x]:,.0f}"
+    best_y_value = y_values[best_y] if categorical_y else f"{y_values[best_y]:,.0f}"
+    st.caption(
+        f"{surface.size:,} scenarios scored. Predicted ROI ranges from {surface.min():.2f} % to {surface.max():.2f} %; "
+        f"highest at {x_label} = {best_x_value}, {y_label} = {best_y_value}."
+    )
+
+
+def _history_range(label, key):
+    """Optional min/max filter for the simulation history; None when both are left at 0."""
+    low_col, high_col = st.columns(2)
+    low = low_col.number_input(f"Min {label} ($)", min_value=0, value=0, step=1000, key=f"history_{key}_min")
+    high = high_col.number_input(f"Max {label} ($)", min_value=0, value=0, step=1000, key=f"history_{key}_max",
+                                 help="Leave both at 0 for no limit.")
+    if not low and not high:
+        return None
+    return (float(low), float(high) if high else float("inf"))
+
+
+def render_simulation_history():
+    """This session's logged simulations, a page at a time, with price/rent search."""
+    price_range = _history_range("Price", "price")
+    rent_range = _history_range("Rent", "rent")
+
+    # Cursors of the pages shown so far; a new search starts again from the newest page
+    filters = (price_range, rent_range)
+    if st.session_state.get("history_filters") != filters:
+        st.session_state.history_filters = filters
+        st.session_state.history_cursors = [None]
+    cursors = st.session_state.history_cursors
+
+    # One extra row tells whether there is an older page
+    page_df = get_simulation_log().page(
+        limit=HISTORY_PAGE_SIZE + 1,
+        session_id=st.session_state.session_id,
+        cursor=cursors[-1],
+        price_range=price_range,
+        rent_range=rent_range,
+    )
+    has_older = len(page_df) > HISTORY_PAGE_SIZE
+    page_df = page_df.iloc[:HISTORY_PAGE_SIZE]
+    if page_df.empty:
+        if price_range or rent_range:
+            st.info("No simulations from this session match the search.")
+        else:
+            st.info("No saved simulations in this session yet.")
+        return
+
+    labels = [
+        f"{timestamp} - ${int(price):,} @ ${int(rent):,}/mo"
+        for timestamp, price, rent in zip(page_df["Timestamp"], page_df["Market Price"], page_df["Monthly Rent"])
+    ]
+    selected_sim = st.selectbox(
+        "Select a simulation to load:",
+        options=range(len(page_df)),
+        format_func=labels.__getitem__,
+        key="history_selected",
+    )
+
+    newer_col, page_col, older_col = st.columns([1, 2, 1])
+    if newer_col.button("◀ Newer", disabled=len(cursors) == 1, key="history_newer"):
+        cursors.pop()
+        st.rerun()
+    page_col.caption(f"Page {len(cursors)}, newest first")
+    if older_col.button("Older ▶", disabled=not has_older, key="history_older"):
+        cursors.append(page_cursor(page_df))
+        st.rerun()
+
+    if st.button("Load Selected Simulation"):
+        # Update session state with selected simulation
+        sim = page_df.iloc[selected_sim]
+        st.session_state.market_price = float(sim['Market Price'])
+        st.session_state.monthly_rent = float(sim['Monthly Rent'])
+        st.session_state.has_solar = bool(sim['Has Solar'])
+        st.session_state.has_water_recycling = bool(sim['Has Water Recycling'])
+        st.session_state.has_smart_locks = bool(sim['Has Smart Locks'])
+        st.session_state.has_smart_thermostats = bool(sim['Has Smart Thermostats'])
+        st.session_state.has_integrated_security = bool(sim['Has Integrated Security'])
+        st.session_state.has_ev_charging = bool(sim['Has EV Charging'])
+
+        st.success("Simulation loaded successfully!")
+        st.rerun()
+
+
+def render_monte_carlo(price, monthly_rent, monthly_savings):
+    """Monte Carlo risk ranges around the current simulation (core/monte_carlo.py)."""
+    st.markdown("### 🎲 Monte Carlo Risk Analysis")
+    st.caption("Simulate many possible years with uncertain rent, vacancy, expenses and smart-feature savings.")
+    if not st.toggle("Run Monte Carlo simulation", value=False, key="mc_enabled"):
+        return
+
+    with st.expander("⚙️ Simulation Assumptions", expanded=False):
+        col1, col2 = st.columns(2)
+        n_paths = col1.number_input("Simulated Paths", min_value=1000, max_value=MONTE_CARLO_MAX_PATHS,
+                                    value=MONTE_CARLO_PATHS, step=10_000, key="mc_paths")
+        seed = col2.number_input("Random Seed", min_value=0, value=MONTE_CARLO_SEED, step=1, key="mc_seed",
+                                 help="The same seed gives the same paths on every rerun")
+
+        col1, col2 = st.columns(2)
+        rent_shape = col1.selectbox("Monthly Rent Distribution", DISTRIBUTIONS, index=0, key="mc_rent_shape")
+        rent_spread = col2.slider("Monthly Rent Spread (±%)", 0, 50, 10, key="mc_rent_spread",
+                                  help="Standard deviation for Normal, half-width for Uniform/Triangular")
+        col1, col2, col3 = st.columns(3)
+        vacancy_shape = col1.selectbox("Vacancy Distribution", DISTRIBUTIONS, index=2, key="mc_vacancy_shape")
+        vacancy = col2.slider("Expected Vacancy (%)", 0, 50, 5, key="mc_vacancy")
+        vacancy_spread = col3.slider("Vacancy Spread (± points)", 0, 25, 5, key="mc_vacancy_spread")
+        col1, col2 = st.columns(2)
+        expense_shape = col1.selectbox("Expense Rate Distribution", DISTRIBUTIONS, index=1, key="mc_expense_shape")
+        expense_spread = col2.slider("Expense Rate Spread (±%)", 0, 100, 20, key="mc_expense_spread",
+                                     help=f"Around property tax {PROPERTY_TAX_RATE:.1%}, maintenance {MAINTENANCE_RATE:.1%}, "
+                                          f"insurance {INSURANCE_RATE:.1%} of price and agent fees {AGENT_FEE_RATE:.0%} of rent")
+        col1, col2 = st.columns(2)
+        savings_shape = col1.selectbox("Smart Savings Distribution", DISTRIBUTIONS, index=1, key="mc_savings_shape")
+        savings_spread = col2.slider("Smart Savings Spread (±%)", 0, 100, 25, key="mc_savings_spread")
+
+    with timed("simulator.monte_carlo"):
+        roi = simulate_roi(
+            price, monthly_rent, monthly_savings, n_paths=int(n_paths),
+            rent_spread=rent_spread / 100, rent_shape=rent_shape,
+            vacancy=vacancy / 100, vacancy_spread=vacancy_spread / 100, vacancy_shape=vacancy_shape,
+            expense_spread=expense_spread / 100, expense_shape=expense_shape,
+            savings_spread=savings_spread / 100, savings_shape=savings_shape,
+            seed=int(seed),
+        )
+        stats = summarize(roi)
+        thresholds, below = loss_curve(roi)
+    percentiles = stats["percentiles"]
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Median ROI", f"{percentiles[50]:.2f} %")
+    col2.metric("90% Range (P5–P95)", f"{percentiles[5]:.2f} – {percentiles[95]:.2f} %")
+    col3.metric("Probability of Loss", f"{stats['prob_below_target'] * 100:.1f} %",
+                help="Share of paths where net income is negative")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("#### ROI Percentiles")
+        percentile_df = pd.DataFrame({
+            "Percentile": [f"P{p:02d}" for p in PERCENTILES],
+            "ROI (%)": [percentiles[p] for p in PERCENTILES],
+        })
+        st.bar_chart(percentile_df.set_index("Percentile"))
+    with col2:
+        st.markdown("#### Probability ROI Ends Below")
+        loss_df = pd.DataFrame({"ROI Threshold (%)": thresholds.round(2), "Probability (%)": below * 100})
+        st.line_chart(loss_df.set_index("ROI Threshold (%)"))
+
+    st.markdown("#### ROI Distribution")
+    counts, edges = np.histogram(roi, bins=50)
+    histogram_df = pd.DataFrame({"ROI (%)": ((edges[:-1] + edges[1:]) / 2).round(2), "Paths": counts})
+    st.bar_chart(histogram_df.set_index("ROI (%)"))
+    st.caption(f"{len(roi):,} simulated paths, mean ROI {stats['mean']:.2f} %.")
+
+
+def render():
+    st.title("🏡 Smart Real Estate ROI Simulator")
+    st.markdown("Simulate the ROI impact of adding smart features to your property.")
+
+    real_estate_df = read_csv_shared(REAL_ESTATE_DATA_PATH)
+
+    # Initialize form key in session state if not exists
+    if 'form_key' not in st.session_state:
+        st.session_state.form_key = 0
+        
+    # Create a form with a unique key that changes when project is selected
+    with st.sidebar.form(key=f'simulator_form_{st.session_state.form_key}'):
+        st.header("⚙️ Simulate Your Property")
+        market_price = st.number_input(
+            "Market Price (USD)",
+            min_value=0.0,
+            value=float(st.session_state.get('market_price', 100000.0)),
+            step=1000.0,
+            help="The total purchase price of the property"
+        )
+        monthly_rent = st.number_input(
+            "Expected Monthly Rent (USD)",
+            min_value=0.0,
+            value=float(st.session_state.get('monthly_rent', 1000.0)),
+            step=50.0,
+            help="Expected monthly rental income"
+        )
+        st.subheader("Smart Features")
+        has_solar = st.checkbox(
+            "☀️ Has Solar",
+            value=st.session_state.has_solar,
+            help="Adds rooftop solar panels. Boosts savings and ROI."
+        )
+        has_water_recycling = st.checkbox(
+            "💧 Has Water Recycling",
+            value=st.session_state.has_water_recycling,
+            help="Includes greywater systems for irrigation or reuse."
+        )
+        has_smart_locks = st.checkbox(
+            "🔐 Has Smart Locks",
+            value=st.session_state.has_smart_locks,
+            help="Improves security with digital locks. Adds value to rentals."
+        )
+        has_smart_thermostats = st.checkbox(
+            "🌡️ Has Smart Thermostats",
+            value=st.session_state.has_smart_thermostats,
+            help="Optimizes heating/cooling for energy savings."
+        )
+        has_integrated_security = st.checkbox(
+            "🚨 Has Integrated Security",
+            value=st.session_state.has_integrated_security,
+            help="Comprehensive security systems (alarms, cameras, sensors)."
+        )
+        has_ev_charging = st.checkbox(
+            "🔌 Has EV Charging",
+            value=st.session_state.has_ev_charging,
+            help="Electric Vehicle charging infrastructure."
+        )
+
+        # Additional features needed for prediction
+        bedrooms = st.number_input("Number of Bedrooms", min_value=1, value=3, step=1)
+        bathrooms = st.number_input("Number of Bathrooms", min_value=1, value=2, step=1)
+        stand_size_sqm = st.number_input("Stand Size (sqm)", min_value=100, value=500, step=50)
+        building_size_sqm = st.number_input("Building Size (sqm)", min_value=50, value=200, step=25)
+
+        # Location and Property Type (for prediction, need to match model_features)
+        # Use unique values from your real_estate_df for selectboxes
+        location_suburb = st.selectbox("Location Suburb", real_estate_df["location_suburb"].unique(), index=0)
+        property_type = st.selectbox("Property Type", real_estate_df["property_type"].unique(), index=0)
+
+        submit_sim = st.form_submit_button("Update Simulation")
+
+    # Only update session state and save snapshot when form is submitted
+    if submit_sim:
+        st.session_state.market_price = market_price
+        st.session_state.monthly_rent = monthly_rent
+        st.session_state.has_solar = has_solar
+        st.session_state.has_water_recycling = has_water_recycling
+        st.session_state.has_smart_locks = has_smart_locks
+        st.session_state.has_smart_thermostats = has_smart_thermostats
+        st.session_state.has_integrated_security = has_integrated_security
+        st.session_state.has_ev_charging = has_ev_charging
+
+        # --- Prepare features for model prediction ---
+        input_data = {
+            "stand_size_sqm": stand_size_sqm,
+            "building_size_sqm": building_size_sqm,
+            "bedrooms": bedrooms,
+            "bathrooms": bathrooms,
+            "sale_price_usd": market_price,
+            "has_solar": int(has_solar),
+            "has_water_recycling": int(has_water_recycling),
+            "has_smart_locks": int(has_smart_locks),
+            "has_smart_thermostats": int(has_smart_thermostats),
+            "has_integrated_security": int(has_integrated_security),
+            "has_ev_charging": int(has_ev_charging),
+            "location_suburb": location_suburb,
+            "property_type": property_type
+        }
+
+        with timed("simulator.predict"):
+            # Predict ROI and inverse transform to get the original ROI percentage
+            predicted_roi_original = predict_roi(input_data)
+
+        # --- Calculate Traditional ROI and Smart ROI (for comparison) ---
+        annual_rent = st.session_state.monthly_rent * 12
+        
+        annual_property_tax_usd = st.session_state.market_price * PROPERTY_TAX_RATE
+        annual_maintenance_usd = st.session_state.market_price * MAINTENANCE_RATE
+        annual_insurance_usd = st.session_state.market_price * INSURANCE_RATE
+        annual_agent_fees_usd = annual_rent * AGENT_FEE_RATE
+
+        total_annual_expenses_usd = annual_property_tax_usd + annual_maintenance_usd + annual_insurance_usd + annual_agent_fees_usd
+        net_annual_income_usd = annual_rent - total_annual_expenses_usd
+
+        roi = (net_annual_income_usd / st.session_state.market_price) * 100 if st.session_state.market_price > 0 else 0
+
+        # Calculate Smart ROI (considering smart feature savings)
+        monthly_savings_total = (
+            (SOLAR_SAVINGS if st.session_state.has_solar else 0)
+            + (WATER_RECYCLING_SAVINGS if st.session_state.has_water_recycling else 0)
+            + (SMART_LOCKS_SAVINGS if st.session_state.has_smart_locks else 0)
+            + (SMART_THERMOSTATS_SAVINGS if st.session_state.has_smart_thermostats else 0)
+            + (INTEGRATED_SECURITY_SAVINGS if st.session_state.has_integrated_security else 0)
+            + (EV_CHARGING_SAVINGS if st.session_state.has_ev_charging else 0)
+        )
+        annual_savings_total = monthly_savings_total * 12
+
+        net_annual_income_with_smart_savings = (annual_rent + annual_savings_total) - total_annual_expenses_usd
+        smart_roi = (net_annual_income_with_smart_savings / st.session_state.market_price) * 100 if st.session_state.market_price > 0 else 0
+
+        # --- Save snapshot to server log ---
+        snapshot = {
+            "Timestamp": dt.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "Market Price": st.session_state.market_price,
+            "Monthly Rent": st.session_state.monthly_rent,
+            "Has Solar": st.session_state.has_solar,
+            "Has Water Recycling": st.session_state.has_water_recycling,
+            "Has Smart Locks": st.session_state.has_smart_locks,
+            "Has Smart Thermostats": st.session_state.has_smart_thermostats,
+            "Has Integrated Security": st.session_state.has_integrated_security,
+            "Has EV Charging": st.session_state.has_ev_charging,
+            "Predicted ROI (Model)": round(predicted_roi_original, 2),
+            "Traditional ROI (Calculated)": round(roi, 2),
+            "Smart ROI (Calculated)": round(smart_roi, 2)
+        }
+        get_simulation_log().append(snapshot, session_id=st.session_state.session_id)
+        get_drift_monitor().observe(input_data)  # Streaming input summaries for the admin page
+
+    # --- Load Past Simulation ---
+    with st.expander("💾 Load Past Simulation", expanded=False):
+        try:
+            render_simulation_history()
+        except Exception as e:
+            st.error(f"Error loading simulations: {str(e)}")
+            st.error("Please check the simulation log database.")
+
+    # --- Always use session state for calculations and display ---
+    # Recalculate for display if form was not submitted (to show current state)
+    annual_rent = st.session_state.monthly_rent * 12
+
+    annual_property_tax_usd = st.session_state.market_price * PROPERTY_TAX_RATE
+    annual_maintenance_usd = st.session_state.market_price * MAINTENANCE_RATE
+    annual_insurance_usd = st.session_state.market_price * INSURANCE_RATE
+    annual_agent_fees_usd = annual_rent * AGENT_FEE_RATE
+
+    total_annual_expenses_usd = annual_property_tax_usd + annual_maintenance_usd + annual_insurance_usd + annual_agent_fees_usd
+    net_annual_income_usd = annual_rent - total_annual_expenses_usd
+
+    roi = (net_annual_income_usd / st.session_state.market_price) * 100 if st.session_state.market_price > 0 else 0
+
+    monthly_savings_total = (
+        (SOLAR_SAVINGS if st.session_state.has_solar else 0)
+        + (WATER_RECYCLING_SAVINGS if st.session_state.has_water_recycling else 0)
+        + (SMART_LOCKS_SAVINGS if st.session_state.has_smart_locks else 0)
+        + (SMART_THERMOSTATS_SAVINGS if st.session_state.has_smart_thermostats else 0)
+        + (INTEGRATED_SECURITY_SAVINGS if st.session_state.has_integrated_security else 0)
+        + (EV_CHARGING_SAVINGS if st.session_state.has_ev_charging else 0)
+    )
+    annual_savings_total = monthly_savings_total * 12
+
+    net_annual_income_with_smart_savings = (annual_rent + annual_savings_total) - total_annual_expenses_usd
+    smart_roi = (net_annual_income_with_smart_savings / st.session_state.market_price) * 100 if st.session_state.market_price > 0 else 0
+
+    # Prepare features for model prediction (for display if form not submitted)
+    input_data = {
+        "stand_size_sqm": stand_size_sqm,
+        "building_size_sqm": building_size_sqm,
+        "bedrooms": bedrooms,
+        "bathrooms": bathrooms,
+        "sale_price_usd": market_price,
+        "has_solar": int(has_solar),
+        "has_water_recycling": int(has_water_recycling),
+        "has_smart_locks": int(has_smart_locks),
+        "has_smart_thermostats": int(has_smart_thermostats),
+        "has_integrated_security": int(has_integrated_security),
+        "has_ev_charging": int(has_ev_charging),
+        "location_suburb": location_suburb,
+        "property_type": property_type
+    }
+
+    with timed("simulator.predict"):
+        predicted_roi_original = predict_roi(input_data)
+
+    # --- ROI Calculation ---
+    roi = (net_annual_income_usd / market_price) * 100 if market_price > 0 else 0
+    smart_roi = (net_annual_income_with_smart_savings / market_price) * 100 if market_price > 0 else 0
+    
+    # Store ROI values in session state
+    st.session_state.roi = float(roi) if roi is not None else 0.0
+    st.session_state.smart_roi = float(smart_roi) if smart_roi is not None else 0.0
+    st.session_state.predicted_roi_original = float(predicted_roi_original) if 'predicted_roi_original' in locals() else 0.0
+    st.session_state.annual_savings_total = float(annual_savings_total) if 'annual_savings_total' in locals() else 0.0
+
+    st.subheader("📊 ROI Results")
+    col1, col2, col3 = st.columns(3)
+    
+    # Get ROI values from session state with fallback to 0.0
+    roi_display = st.session_state.get('roi', 0.0)
+    smart_roi_display = st.session_state.get('smart_roi', 0.0)
+    predicted_roi_display = st.session_state.get('predicted_roi_original', 0.0)
+    
+    # Display the metrics
+    col1.metric("Traditional ROI (Net)", f"{float(roi_display):.2f} %")
+    col2.metric("Smart ROI (Net)", f"{float(smart_roi_display):.2f} %")
+    col3.metric("Predicted ROI (Model)", f"{float(predicted_roi_display):.2f} %")
+
+    # Per-input contributions to the Predicted ROI (TreeSHAP, cached per input)
+    with timed("simulator.explain"):
+        explanation = explain_roi(input_data)
+    st.session_state.roi_explanation = explanation
+    with st.expander("🔎 What drives the Predicted ROI?", expanded=True):
+        st.image(roi_contributions_png(explanation), use_container_width=True)
+        (label, value), = top_contributions(explanation, 1)
+        st.caption(
+            f"Starting from the model's average prediction of {explanation['base_roi']:.2f} %, each bar is how much "
+            f"that input moves this property's Predicted ROI (Shapley values of the model); the bars add up to "
+            f"{explanation['predicted_roi'] - explanation['base_roi']:+.2f} percentage points. "
+            f"The largest effect here is {label} ({value:+.2f} pp)."
+        )
+
+    st.markdown("### 💸 Estimated Annual & Lifetime Savings")
+    st.write(f"**Annual Savings from Smart Features:** ${annual_savings_total:.2f}")
+    st.write(f"**Lifetime Savings (5 Years):** ${annual_savings_total * 5:.2f}")
+    st.write(f"**Lifetime Savings (10 Years):** ${annual_savings_total * 10:.2f}")
+
+    # --- Visual Recap ---
+    st.subheader("📊 Performance Overview")
+    st.caption("This chart compares the estimated ROI under different scenarios based on your latest simulation.")
+
+    # Rendered once per set of values (core/charts.py); the Executive Summary and its PDF
+    # re-render the same chart from these values, the PDF at export resolution
+    roi_values = (float(roi), float(smart_roi), float(predicted_roi_original))
+    st.image(roi_comparison_png(roi_values), use_container_width=True)
+    st.session_state.roi_chart_values = roi_values
+
+    st.markdown("### 💰 Financial Breakdown")
+    st.write(f"**Annual Rental Income:** ${annual_rent:.2f}")
+    st.write(f"**Annual Property Tax:** ${annual_property_tax_usd:.2f}")
+    st.write(f"**Annual Maintenance:** ${annual_maintenance_usd:.2f}")
+    st.write(f"**Annual Insurance:** ${annual_insurance_usd:.2f}")
+    st.write(f"**Annual Agent Fees:** ${annual_agent_fees_usd:.2f}")
+    st.write(f"**Total Annual Expenses:** ${total_annual_expenses_usd:.2f}")
+    st.write(f"**Net Annual Income (before smart savings):** ${net_annual_income_usd:.2f}")
+    st.write(f"**Net Annual Income (with smart savings):** ${net_annual_income_with_smart_savings:.2f}")
+
+    st.markdown("### 📈 ROI Impact of Smart Features")
+    st.write("The \"Predicted ROI (Model)\" incorporates the impact of all selected features, including smart features, as learned by the machine learning model.")
+    st.write("The \"Smart ROI (Net)\" is a calculated ROI that explicitly adds the estimated monthly savings from smart features to the rental income before subtracting expenses.")
+
+    render_monte_carlo(st.session_state.market_price, st.session_state.monthly_rent, monthly_savings_total)
+    render_roi_surface(input_data, real_estate_df)
+
+    # --- Save snapshot to server log (moved outside if submit_sim to always log current state) ---
+    # This part is already handled inside the if submit_sim block to avoid duplicate logging
+    # when the page reloads without form submission.
+
+    # --- ROI Sensitivity Analysis ---
+    st.markdown("### 🌀 ROI Sensitivity Analysis (What-If Scenarios)")
+    st.caption("Adjust the sliders to see how changes in key variables affect ROI.")
+
+    # Define ranges for sensitivity
+    rent_range = st.slider("Monthly Rent Range (USD)", 0, 5000, (int(st.session_state.monthly_rent * 0.7), int(st.session_state.monthly_rent * 1.3)))
+    price_range = st.slider("Market Price Range (USD)", 50000, 2000000, (int(st.session_state.market_price * 0.7), int(st.session_state.market_price * 1.3)))
+    
+    # Enhanced sliders with visual feedback for smart feature adoption
+    st.markdown("### 🚀 Smart Feature Impact on ROI")
+    st.caption("Adjust adoption rates to see how each smart feature affects your ROI")
+    
+    # Create two columns for better layout
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        solar_adopt = st.slider(
+            "☀️ Solar Panel Adoption", 
+            0, 100, 
+            100 if st.session_state.has_solar else 0, 
+            step=5,
+            help="Adds up to $200/month in energy savings and increases property value"
+        )
+        
+        water_recycling_adopt = st.slider(
+            "💧 Water Recycling System", 
+            0, 100, 
+            100 if st.session_state.has_water_recycling else 0, 
+            step=5,
+            help="Saves up to 30% on water bills and increases property appeal"
+        )
+        
+        smart_locks_adopt = st.slider(
+            "🔑 Smart Locks", 
+            0, 100, 
+            100 if st.session_state.has_smart_locks else 0, 
+            step=5,
+            help="Reduces insurance costs and increases rental value"
+        )
+    
+    with col2:
+        smart_thermostats_adopt = st.slider(
+            "🌡️ Smart Thermostats", 
+            0, 100, 
+            100 if st.session_state.has_smart_thermostats else 0, 
+            step=5,
+            help="Saves up to 20% on heating/cooling costs"
+        )
+        
+        integrated_security_adopt = st.slider(
+            "🚨 Integrated Security", 
+            0, 100, 
+            100 if st.session_state.has_integrated_security else 0, 
+            step=5,
+            help="Reduces insurance costs and increases property value"
+        )
+        
+        ev_charging_adopt = st.slider(
+            "🔌 EV Charging", 
+            0, 100, 
+            100 if st.session_state.has_ev_charging else 0, 
+            step=5,
+            help="Increases property value and rental income potential"
+        )
+
+    base_price = st.session_state.market_price
+    base_rent = st.session_state.monthly_rent
+
+    # Enhanced visualization options
+    st.markdown("### 📊 Analysis Mode")
+    mode = st.radio(
+        "Select Analysis Mode",
+        [FULL_IMPACT, WHAT_IF, FEATURE_COMPARISON],
+        index=0,
+        help=(
+            "• Full Impact: Shows ROI change from 0% to 100% adoption\n"
+            "• What-If: Shows ROI change from current to 100% adoption\n"
+            "• Feature Comparison: Compares individual feature impacts"
+        )
+    )
+    
+    # Add a visual separator
+    st.markdown("---")
+
+    adoption = [
+        solar_adopt, water_recycling_adopt, smart_locks_adopt,
+        smart_thermostats_adopt, integrated_security_adopt, ev_charging_adopt,
+    ]
+
+    # All low/high scenarios are evaluated in one NumPy pass (core/sensitivity.py)
+    with timed("simulator.sensitivity_sweep"):
+        if mode == FEATURE_COMPARISON:
+            # Each feature's share of the ROI at its current slider value
+            feature_savings = np.array([
+                SOLAR_SAVINGS, WATER_RECYCLING_SAVINGS, SMART_LOCKS_SAVINGS,
+                SMART_THERMOSTATS_SAVINGS, INTEGRATED_SECURITY_SAVINGS, EV_CHARGING_SAVINGS,
+            ])
+            labels = [
+                "Solar Impact", "Water Recycling Impact", "Smart Locks Impact",
+                "Smart Thermostats Impact", "Integrated Security Impact", "EV Charging Impact",
+            ]
+            impacts = (
+                feature_savings * 12 / base_price * 100 * (np.array(adoption) / 100) * SMART_FEATURE_MULTIPLIER
+                if base_price > 0 else np.zeros(len(labels))
+            )
+        else:
+            labels, _, _, impacts = tornado(base_price, base_rent, adoption, rent_range, price_range, mode)
+
+    st.image(chart_png("simulator.tornado", _draw_tornado, list(labels), np.asarray(impacts, dtype=np.float64),
+                       figsize=(6, 3)), use_container_width=True)
+
+    # --- Show ROI Impact values below the chart ---
+    impact_df = pd.DataFrame({
+    "Variable": labels,
+    "ROI Impact (%)": [f"{v:.2f}" for v in impacts]
+    })
+    st.markdown("#### ROI Impact by Variable")
+    st.dataframe(impact_df, use_container_width=True)
+
+    if mode != FEATURE_COMPARISON:
+        with st.expander("🕸️ Spider Plot: ROI across each variable's range"):
+            with timed("simulator.spider_sweep"):
+                _, spider_roi = sweep(base_price, base_rent, adoption, rent_range, price_range, mode, points=SPIDER_POINTS)
+            spider_df = pd.DataFrame(
+                spider_roi.T,
+                columns=labels,
+                index=pd.Index(np.linspace(0, 100, SPIDER_POINTS).round(1), name="Position in Range (%)"),
+            )
+            st.caption("Each line moves one variable from the low to the high end of its range with the others held at base.")
+            st.line_chart(spider_df)
+
+    # --- Project Selection Dropdown for Auto-Fill ---
+    st.markdown("#### 🔽 Select a WestProp Project to Auto-Fill Simulation")
+    project_options = [
+        f"{row['project']} – {row['property_type']}" for _, row in properties_df.iterrows()
+    ]
+    
+    # Project selection dropdown
+    selected_project_option = st.selectbox(
+        "Choose a Project & Unit Type (optional):",
+        options=["(Manual Entry)"] + project_options,
+        index=0,
+        help="Select a project/unit to auto-fill price, rent, and features. Or use manual entry.",
+        key='project_selector',
+        on_change=lambda: st.session_state.update({'project_changed': True})
+    )
+    
+    # Handle project selection changes
+    if 'project_changed' not in st.session_state:
+        st.session_state.project_changed = False
+    
+    # If a project is selected and it's a new selection
+    if selected_project_option != "(Manual Entry)" and st.session_state.project_changed:
+        selected_idx = project_options.index(selected_project_option)
+        selected_row = properties_df.iloc[selected_idx]
+        
+        # Default rents for each property type
+        default_rents = {
+            "Villa - 4 Bed": 2500,
+            "Villa - 5 Bed": 3200,
+            "Residential Stand": 0,
+            "Serviced Apartment (REIT)": 400,
+            "Apartment - Studio": 500,
+            "Apartment - 1 Bed": 900,
+            "Apartment - 2 Bed": 1400,
+            "Apartment - 3 Bed": 2000,
+            "Townhouse - Garden": 1800,
+            "Townhouse - Manor": 2200,
+            "Flat": 800
+        }
+        
+        # Update session state with selected project values
+        st.session_state.market_price = selected_row["price"]
+        st.session_state.monthly_rent = default_rents.get(selected_row["property_type"], 1000)
+        st.session_state.has_solar = "Solar" in (selected_row.get("amenities") or [])
+        st.session_state.has_water_recycling = "Water Recycling" in (selected_row.get("amenities") or [])
+        st.session_state.has_smart_locks = any(x in (selected_row.get("amenities") or []) for x in ["Smart Locks", "Lock-up Shell"])
+        st.session_state.has_smart_thermostats = "Smart Thermostats" in (selected_row.get("amenities") or [])
+        st.session_state.has_integrated_security = "Integrated Security" in (selected_row.get("amenities") or [])
+        st.session_state.has_ev_charging = "EV Charging" in (selected_row.get("amenities") or [])
+        
+        # Force form re-render by updating the form key
+        st.session_state.form_key += 1
+        st.session_state.project_changed = False
+        
+        # Rerun to apply the changes
+        st.rerun()
+    elif selected_project_option == "(Manual Entry)" and st.session_state.project_changed:
+        # Reset form key when switching to manual entry
+        st.session_state.form_key += 1
+        st.session_state.project_changed = False
+        st.rerun()
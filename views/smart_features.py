@@ -0,0 +1,28 @@
+""""♻️ Smart Feature Value Proposition" page."""
+import streamlit as st
+
+from core.config import SMART_VALUE_PATH
+from core.datasets import read_csv_shared
+
+
+def render():
+    st.title("♻️ Smart Feature Value Proposition")
+    st.markdown("Understand the financial and environmental benefits of smart features.")
+
+    st.subheader("Estimated Monthly Savings per Feature")
+    smart_value_df = read_csv_shared(SMART_VALUE_PATH)
+    st.dataframe(smart_value_df)
+    
+    st.caption("🔎 Figures are based on Zimbabwe’s energy/water context, property market trends, and smart home ROI studies.")
+
+    st.markdown("--- ")
+    st.subheader("Beyond Savings: Additional Benefits")
+    st.write("**☀️ Solar Panels:** Reduced electricity bills, lower carbon footprint, increased energy independence, potential for feed-in tariffs.")
+    st.write("**💧 Water Recycling:** Significant reduction in water consumption, lower water bills, sustainable landscaping, reduced strain on municipal water supply.")
+    st.write("**🔐 Smart Locks:** Enhanced security, remote access control, keyless entry convenience, improved property management for rentals.")
+    st.write("**🌡️ Smart Thermostats:** Optimized energy usage for heating/cooling, remote temperature control, personalized comfort, reduced utility costs.")
+    st.write("**🚨 Integrated Security:** Comprehensive home protection, remote monitoring, rapid response, peace of mind.")
+    st.write("**🔌 EV Charging:** Convenience for electric vehicle owners, increased property appeal, future-proofing, potential for higher resale value.")
+
+    st.markdown("--- ")
+    st.info("**Note:** Savings are estimates and can vary based on usage, property size, and local utility rates. Environmental benefits contribute to a sustainable lifestyle and increased property value.")